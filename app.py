@@ -1,6 +1,9 @@
-from flask import Flask, session
+import click
+from flask import Flask, session, g, request, jsonify
 from flasgger import Swagger
 from config import Config
+from utils.query_stats import query_stats, begin_request_budget, end_request_budget
+from utils.classifiers import model_registry
 from dotenv import load_dotenv
 from controllers.main import main_bp
 from controllers.upload import upload_bp
@@ -40,6 +43,23 @@ def create_app():
         if 'user_id' not in session:
             session['user_id'] = Config.DEFAULT_USER_ID
     
+    # 개발 모드: 요청당 쿼리 수 예산 검사 (N+1 패턴 탐지)
+    if Config.DEBUG and Config.QUERY_INSTRUMENTATION:
+        @app.before_request
+        def begin_query_budget():
+            g.query_budget_token = begin_request_budget()
+        
+        @app.teardown_request
+        def end_query_budget(exc=None):
+            token = g.pop('query_budget_token', None)
+            if token is not None:
+                end_request_budget(f"{request.method} {request.path}", token)
+        
+        @app.route('/api/debug/query-stats')
+        def debug_query_stats():
+            """fingerprint별 쿼리 실행 통계 (개발 모드 전용)"""
+            return jsonify({'success': True, 'data': query_stats.snapshot(limit=int(request.args.get('limit', 50)))})
+    
     # Blueprint 등록
     app.register_blueprint(main_bp)
     app.register_blueprint(upload_bp)
@@ -49,8 +69,146 @@ def create_app():
     app.register_blueprint(dashboard_bp)
     app.register_blueprint(export_bp)
 
+    # 유지보수 CLI 명령 등록 (flask --app app <command>)
+    register_commands(app)
+    
+    # 분류 모델 사전 로딩 (PRELOAD_MODELS 설정 시, 백그라운드)
+    model_registry.preload()
+    
     return app
 
+def register_commands(app):
+    """유지보수 작업용 Flask CLI 명령"""
+    
+    @app.cli.command("archive-tickets")
+    @click.option("--months", type=int, default=None, help="hot 테이블 보관 개월 수 (기본값 ARCHIVE_AFTER_MONTHS)")
+    def archive_tickets(months):
+        """보관 기간이 지난 티켓 파티션을 아카이브 테이블로 이동"""
+        from services.archive import TicketArchiveService
+        result = TicketArchiveService().roll_partitions(months)
+        click.echo(f"cutoff={result['cutoff']}, partitions={result['partitions']}, tickets={result['tickets']}")
+
+    @app.cli.command("purge-data")
+    @click.option("--dry-run", is_flag=True, help="만료 대상만 출력하고 삭제하지 않음")
+    @click.option("--max-jobs", type=int, default=None, help="이번 실행에서 처리할 최대 퍼지 작업 수")
+    def purge_data(dry_run, max_jobs):
+        """보존 정책 적용 후 소프트 삭제된 파일/배치 데이터를 청크 단위로 퍼지"""
+        from services.retention import RetentionService
+        result = RetentionService().run(dry_run=dry_run, max_jobs=max_jobs)
+        click.echo(f"expired files={result['expired']['files']}, batches={result['expired']['batches']}")
+        click.echo(f"jobs={result['purged']['jobs']}, failed={result['purged']['failed']}, deleted_rows={result['purged']['deleted_rows']}")
+    
+    @app.cli.command("retention-policy")
+    @click.option("--days", type=int, required=True, help="업로드 후 보존 일수 (0 = 무기한)")
+    @click.option("--user-id", type=int, default=None, help="사용자 단위 정책")
+    @click.option("--batch-id", type=int, default=None, help="배치 단위 정책 (사용자 정책보다 우선)")
+    def retention_policy(days, user_id, batch_id):
+        """사용자/배치 단위 보존 정책 설정"""
+        from services.db.retention_db import RetentionDB
+        RetentionDB().set_policy(days, user_id=user_id, batch_id=batch_id)
+        click.echo(f"retention policy saved: user_id={user_id}, batch_id={batch_id}, days={days}")
+
+    @app.cli.command("seed-rules")
+    @click.option("--force", is_flag=True, help="DB 규칙이 이미 있어도 코드의 기본 규칙으로 덮어쓰기")
+    def seed_rules(force):
+        """코드의 기본 분류 규칙을 DB 규칙 테이블에 저장하고 규칙 세트 컴파일"""
+        from services.rule_set import RuleSetService
+        result = RuleSetService().seed_defaults(force=force)
+        click.echo(f"seeded={result['seeded']}, rules={result['rules']}, version={result['version']}")
+    
+    @app.cli.command("reclassify-rules")
+    @click.option("--file-id", type=int, default=None, help="재분류할 파일 ID")
+    @click.option("--batch-id", type=int, default=None, help="재분류할 배치 ID")
+    @click.option("--user-id", type=int, default=None, help="분류 결과 저장 사용자 ID (기본값 DEFAULT_USER_ID)")
+    def reclassify_rules(file_id, batch_id, user_id):
+        """현재 규칙 세트와 버전이 다른 규칙 기반 분류 티켓만 재분류"""
+        from services.auto_classify import AutoClassifyService
+        result = AutoClassifyService().reclassify_rules(user_id or Config.DEFAULT_USER_ID, file_id=file_id, batch_id=batch_id)
+        click.echo(f"rule_version={result['rule_version']}, reclassified={result['reclassified']}/{result['total_tickets']}, "
+                   f"class_result_id={result['class_result_id']}")
+    
+    @app.cli.command("rebuild-rollups")
+    @click.option("--file-id", type=int, default=None, help="복구할 파일 ID (기본값: 전체)")
+    def rebuild_rollups(file_id):
+        """원본 티켓(hot + archive)으로 일별 채널×카테고리 롤업 복구"""
+        from services.db.rollup_db import TicketRollupDB
+        result = TicketRollupDB().rebuild(file_id=file_id)
+        click.echo(f"files={result['files']}, rows={result['rows']}")
+    
+    @app.cli.command("analytics-sync")
+    @click.option("--file-id", type=int, default=None, help="동기화할 파일 ID")
+    @click.option("--batch-id", type=int, default=None, help="동기화할 배치 ID (기본값: 파일 ID도 없으면 전체)")
+    def analytics_sync(file_id, batch_id):
+        """분류된 티켓을 Parquet 분석 저장소로 동기화 (최초 구축 / 누락 복구)"""
+        from services.analytics import AnalyticsService
+        service = AnalyticsService()
+        result = service.sync(file_id, batch_id) if file_id or batch_id else service.sync_all()
+        click.echo(f"files={result['files']}, tickets={result['tickets']}")
+    
+    @app.cli.command("check-cs-data-parity")
+    @click.option("--file-id", type=int, default=None, help="검사할 파일 ID")
+    @click.option("--batch-id", type=int, default=None, help="검사할 배치 ID")
+    @click.option("--seed", is_flag=True, help="SQLite 백엔드에 검사용 배치를 생성해 파일/배치 경로 모두 검사")
+    def check_cs_data_parity(file_id, batch_id, seed):
+        """롤업 단일 조회 cs_data와 원본 티켓 6개 쿼리 cs_data를 키 단위로 비교 (불일치 시 실패)"""
+        from services.cs_data_parity import CSDataParityService
+        service = CSDataParityService()
+        if seed:
+            results = service.check_seeded(Config.DEFAULT_USER_ID)
+        elif file_id or batch_id:
+            results = [service.check(file_id=file_id, batch_id=batch_id)]
+        else:
+            raise click.UsageError("--file-id, --batch-id, --seed 중 하나를 지정하세요.")
+        
+        for result in results:
+            click.echo(f"{result['target']}: tickets={result['total_tickets']}, mismatches={len(result['mismatches'])}")
+            for mismatch in result['mismatches']:
+                click.echo(f"  {mismatch}")
+        if any(result['mismatches'] for result in results):
+            raise click.ClickException("cs_data 패리티 검사 실패")
+    
+    @app.cli.command("check-onnx-parity")
+    @click.option("--checkpoint", default=None, help="작은 로컬 NLI 체크포인트 경로 (기본값 ONNX_PARITY_CHECKPOINT)")
+    @click.option("--limit", type=int, default=100, help="사용할 더미 티켓 수")
+    @click.option("--min-agreement", type=float, default=None, help="최소 카테고리 일치율 (기본값 ONNX_PARITY_MIN_AGREEMENT)")
+    @click.option("--max-confidence-diff", type=float, default=None, help="최대 평균 신뢰도 차이 (기본값 ONNX_PARITY_MAX_CONFIDENCE_DIFF)")
+    @click.option("--allow-skip", is_flag=True, help="라이브러리/체크포인트가 없으면 실패 대신 건너뜀 (종료 코드 0)")
+    def check_onnx_parity(checkpoint, limit, min_agreement, max_confidence_diff, allow_skip):
+        """더미 데이터셋으로 PyTorch/ONNX int8 정확도 일치 검사 (기준 미달 또는 실행 불가 시 실패) 및 처리량 비교"""
+        from services.db.auto_classify_db import AutoClassifyDB
+        from utils.classifiers.onnx_classifier import check_parity, ParityCheckSkipped
+        try:
+            report = check_parity(AutoClassifyDB().get_category_mapping(), checkpoint, limit,
+                                  min_agreement=min_agreement, max_confidence_diff=max_confidence_diff)
+        except ParityCheckSkipped as e:
+            if not allow_skip:
+                raise click.ClickException(f"ONNX 정확도 일치 검사를 실행할 수 없습니다: {e}")
+            click.echo(f"skipped: {e}")
+            return
+        for key, value in report.items():
+            click.echo(f"{key}={value}")
+        if not report['passed']:
+            raise click.ClickException(f"ONNX 정확도 일치 검사 실패: {', '.join(report['failures'])}")
+    
+    @app.cli.command("download-onnx-parity-checkpoint")
+    @click.option("--model", default=None, help="Hugging Face 모델 이름 (기본값 ONNX_PARITY_SOURCE_MODEL)")
+    @click.option("--output", default=None, help="저장 위치 (기본값 ONNX_PARITY_CHECKPOINT)")
+    def download_onnx_parity_checkpoint(model, output):
+        """check-onnx-parity / tests용 작은 NLI 체크포인트 다운로드"""
+        from utils.classifiers.onnx_classifier import download_parity_checkpoint
+        click.echo(f"checkpoint={download_parity_checkpoint(model, output)}")
+
+    @app.cli.command("benchmark-trend-pivot")
+    @click.option("--years", type=int, default=3, help="합성 일별 데이터 기간 (년)")
+    @click.option("--channels", type=int, default=6, help="채널 수")
+    @click.option("--categories", type=int, default=8, help="카테고리 수")
+    def benchmark_trend_pivot(years, channels, categories):
+        """여러 해 / 여러 채널 합성 데이터로 채널별 추이 피벗 처리 시간 측정"""
+        from utils.channel_trend import run_pivot_benchmark
+        report = run_pivot_benchmark(years=years, channels=channels, categories=categories)
+        for key, value in report.items():
+            click.echo(f"{key}={value}")
+
 if __name__ == "__main__":
     app = create_app()
     app.run(debug=True)
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -15,12 +16,80 @@ class Config:
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', 'password')
     DB_NAME = os.getenv('DB_NAME', 'clara_cs')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))  # MySQL Connection Pool 크기
+    DB_ASYNC_WORKERS = int(os.getenv('DB_ASYNC_WORKERS', '8'))  # 동시 쿼리 실행 스레드 수 (DB_POOL_SIZE보다 작게)
+
+    # 스토리지 백엔드 설정
+    # - mysql: 운영용 (기본값)
+    # - sqlite: 내장 DB (외부 서비스 없이 벤치마크/로컬 실행)
+    DB_BACKEND = os.getenv('DB_BACKEND', 'mysql')
+    SQLITE_PATH = os.getenv('SQLITE_PATH', ':memory:')  # ':memory:' 또는 파일 경로
+
+    # 쿼리 계측 설정
+    QUERY_INSTRUMENTATION = os.getenv('QUERY_INSTRUMENTATION', 'True').lower() == 'true'
+    SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '500'))  # 슬로우 쿼리 로그 기준 (ms)
+    QUERY_BUDGET_PER_REQUEST = int(os.getenv('QUERY_BUDGET_PER_REQUEST', '50'))  # 개발 모드 요청당 쿼리 수 경고 기준
     
     # 애플리케이션 설정
     DEFAULT_USER_ID = int(os.getenv('DEFAULT_USER_ID', '1'))  # 기본 사용자 ID
     
     # 리포트 설정
     CHART_DAYS_RANGE = int(os.getenv('CHART_DAYS_RANGE', '365'))  # 차트 조회 기간 (일)
+    CHART_MAX_POINTS = int(os.getenv('CHART_MAX_POINTS', '366'))  # 채널별 추이 채널당 최대 버킷 수 (기간에 따라 일/주/월 자동 선택, 0 = 제한 없음)
+    CHART_LINE_POINTS = int(os.getenv('CHART_LINE_POINTS', '0'))  # 전체 합계선 LTTB 다운샘플링 점 수 (0 = 사용 안 함)
+    
+    # 티켓 아카이브 설정 (접수월 기준 hot 테이블 보관 개월 수)
+    ARCHIVE_AFTER_MONTHS = int(os.getenv('ARCHIVE_AFTER_MONTHS', '12'))
+    
+    # 데이터 보존/퍼지 설정
+    RETENTION_DAYS = int(os.getenv('RETENTION_DAYS', '0'))  # 기본 보존 일수 (0 = 무기한, 정책 테이블이 우선)
+    PURGE_CHUNK_SIZE = int(os.getenv('PURGE_CHUNK_SIZE', '5000'))  # 청크당 최대 삭제 행 수
+    PURGE_THROTTLE_MS = int(os.getenv('PURGE_THROTTLE_MS', '100'))  # 청크 사이 대기 시간 (ms)
+    
+    # 분류 모델 레지스트리 설정
+    PRELOAD_MODELS = os.getenv('PRELOAD_MODELS', '')  # 시작 시 미리 로딩할 모델 (쉼표 구분, 비어있으면 최초 사용 시 로딩)
+    MODEL_MEMORY_BUDGET_MB = int(os.getenv('MODEL_MEMORY_BUDGET_MB', '4096'))  # 적재 모델 메모리 상한 (0 = 무제한)
+    
+    # AI 분류 엔진 설정
+    AI_MODEL_NAME = os.getenv('AI_MODEL_NAME', 'facebook/bart-large-mnli')  # zero-shot NLI 모델 (이름 또는 로컬 경로)
+    AI_BACKEND = os.getenv('AI_BACKEND', 'torch')  # torch: transformers pipeline, onnx: ONNX Runtime int8, embedding: 임베딩 nearest-centroid
+    ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', 'models/onnx')  # 양자화 모델 저장 위치
+    ONNX_THREADS = int(os.getenv('ONNX_THREADS', str(min(4, os.cpu_count() or 1))))  # ONNX Runtime intra-op 스레드 수
+    ONNX_PARITY_CHECKPOINT = os.getenv('ONNX_PARITY_CHECKPOINT', 'models/nli-small')  # 정확도 일치 검사용 작은 로컬 NLI 체크포인트
+    ONNX_PARITY_SOURCE_MODEL = os.getenv('ONNX_PARITY_SOURCE_MODEL', 'cross-encoder/nli-MiniLM2-L6-H768')  # 체크포인트 다운로드 원본 (Hugging Face)
+    ONNX_PARITY_MIN_AGREEMENT = float(os.getenv('ONNX_PARITY_MIN_AGREEMENT', '0.95'))  # PyTorch 대비 최소 카테고리 일치율
+    ONNX_PARITY_MAX_CONFIDENCE_DIFF = float(os.getenv('ONNX_PARITY_MAX_CONFIDENCE_DIFF', '0.05'))  # PyTorch 대비 최대 평균 신뢰도 차이
+    EMBEDDING_MODEL_NAME = os.getenv('EMBEDDING_MODEL_NAME', 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2')  # 문장 임베딩 모델
+    EMBEDDING_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', '32'))  # 임베딩 배치 크기
+    EMBEDDING_TEMPERATURE = float(os.getenv('EMBEDDING_TEMPERATURE', '0.05'))  # 유사도 → 신뢰도 softmax 온도
+    EMBEDDING_HISTORY_EXAMPLES = int(os.getenv('EMBEDDING_HISTORY_EXAMPLES', '0'))  # 카테고리별 분류 이력 프로토타입 수 (0 = 키워드만)
+    CASCADE_CONFIDENCE_THRESHOLD = float(os.getenv('CASCADE_CONFIDENCE_THRESHOLD', '0.7'))  # 단계형 분류: 이 값 미만만 AI 재분류
+    CASCADE_AI_BATCH_SIZE = int(os.getenv('CASCADE_AI_BATCH_SIZE', '64'))  # 단계형 분류: AI 단계 배치 크기
+    NEAR_DUPLICATE_CLUSTERING = os.getenv('NEAR_DUPLICATE_CLUSTERING', 'true').lower() == 'true'  # AI 분류 전 근사 중복 클러스터링
+    DEDUP_THRESHOLD = float(os.getenv('DEDUP_THRESHOLD', '0.8'))  # 근사 중복 판정 Jaccard 유사도
+    DEDUP_NUM_PERM = int(os.getenv('DEDUP_NUM_PERM', '64'))  # MinHash 서명 길이
+    DEDUP_BANDS = int(os.getenv('DEDUP_BANDS', '16'))  # LSH 밴드 수 (서명 길이의 약수)
+    DEDUP_SHINGLE_SIZE = int(os.getenv('DEDUP_SHINGLE_SIZE', '4'))  # 문자 shingle 길이
+    UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER') or (
+        os.path.join(tempfile.gettempdir(), 'clara_cs_uploads')
+        if DB_BACKEND == 'sqlite' and SQLITE_PATH == ':memory:' else 'uploads'
+    )  # 업로드 원본 저장 위치 (인메모리 SQLite는 DB와 함께 사라지므로 임시 디렉토리)
+    INLINE_CLASSIFICATION = os.getenv('INLINE_CLASSIFICATION', 'false').lower() == 'true'  # 업로드 중 규칙 기반 분류
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', '2000'))  # 업로드 중 분류 청크 크기
+    TICKET_PAGE_SIZE = int(os.getenv('TICKET_PAGE_SIZE', '10'))  # 분류 티켓 목록 기본 페이지 크기
+    TICKET_PAGE_MAX = int(os.getenv('TICKET_PAGE_MAX', '200'))  # 분류 티켓 목록 최대 페이지 크기
+    RULE_ARTIFACT_DIR = os.getenv('RULE_ARTIFACT_DIR', 'models/rules')  # 컴파일된 규칙 세트 아티팩트 저장 위치
+    RULE_SET_REFRESH_SECONDS = int(os.getenv('RULE_SET_REFRESH_SECONDS', '60'))  # DB 규칙 재조회 간격 (초)
+    REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '256'))  # 리포트 데이터 메모리 캐시 엔트리 수 (0 = 캐시 끔)
+    REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', '')  # 리포트 데이터 디스크 캐시 위치 (빈 값 = 메모리만)
+    REPORT_PIPELINE_WORKERS = int(os.getenv('REPORT_PIPELINE_WORKERS', '8'))  # 리포트 생성 단계 동시 실행 스레드 수
+    REPORT_BACKGROUND_WORKERS = int(os.getenv('REPORT_BACKGROUND_WORKERS', '2'))  # 미리보기 후 전체 리포트 백그라운드 생성 스레드 수
+    REPORT_PREVIEW_SAMPLE_RATE = float(os.getenv('REPORT_PREVIEW_SAMPLE_RATE', '0.01'))  # 미리보기 리포트 기본 표본 비율
+    REPORT_PREVIEW_MIN_SAMPLE = int(os.getenv('REPORT_PREVIEW_MIN_SAMPLE', '2000'))  # 미리보기 최소 표본 수 (부족하면 표본 비율 확대)
+    REPORT_PREVIEW_MIN_STRATUM = int(os.getenv('REPORT_PREVIEW_MIN_STRATUM', '30'))  # 층(채널 × 접수월)별 최소 표본 수
+    REPORT_PREVIEW_MAX_STRATUM_RATE = float(os.getenv('REPORT_PREVIEW_MAX_STRATUM_RATE', '0.2'))  # 층 확장 시 최대 표본 비율 (작은 층의 전체 조회 방지)
+    ANALYTICS_MIRROR = os.getenv('ANALYTICS_MIRROR', 'true').lower() == 'true'  # 분류 후 티켓을 Parquet 분석 저장소로 미러링 (duckdb / pyarrow 필요)
+    ANALYTICS_DATA_DIR = os.getenv('ANALYTICS_DATA_DIR', 'data/analytics')  # 분석 저장소(Parquet) 위치
     
     # 로깅 설정
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -1,8 +1,11 @@
 from flask import Blueprint, jsonify, request, session, current_app
 from pathlib import Path
 import json
+from datetime import datetime, timedelta
 from services.auto_classify import AutoClassifyService
 from services.db.report_db import ReportDB
+from services.report import ReportService
+from utils.classifiers import model_registry
 from utils.logger import get_logger
 from config import Config
 
@@ -25,7 +28,7 @@ def run():
     
     - file_id, batch_id 중 하나는 반드시 제공
     - 둘 다 없으면 최신 파일 자동 선택
-    - engine: 'rule' (규칙 기반) 또는 'ai' (AI 기반)
+    - engine: 'rule' (규칙 기반), 'ai' (AI 기반) 또는 'cascade' (규칙 기반 → 신뢰도 낮은 티켓만 AI)
     """
     try:
         body = request.get_json(silent=True) or {}
@@ -67,7 +70,7 @@ def run():
             user_id, 
             file_id=file_id,
             batch_id=batch_id,
-            use_ai=(engine == 'ai')
+            engine=engine
         )
         
         return jsonify(result), 200
@@ -79,6 +82,64 @@ def run():
             'error': f'자동분류 실행 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@auto_bp.route("/tickets", methods=["GET"])
+def list_tickets():
+    """
+    분류 결과 티켓 목록 조회 (keyset 페이지네이션)
+    
+    쿼리: class_result_id (필수), category, channel, min_confidence, max_confidence,
+          days (오늘 포함 최근 N일), q (검색어), sort, cursor (이전 응답의 next_cursor), limit
+    응답: { items: [...], next_cursor: int | null, total: int (첫 페이지만), limit: int }
+    """
+    try:
+        args = request.args
+        class_result_id = args.get("class_result_id", type=int)
+        
+        if not class_result_id:
+            return jsonify({
+                'success': False,
+                'error': 'class_result_id가 필요합니다.'
+            }), 400
+        
+        filters = {
+            'category': args.get("category") or None,
+            'channel': args.get("channel") or None,
+            'min_confidence': args.get("min_confidence", type=float),
+            'max_confidence': args.get("max_confidence", type=float),
+            'search': (args.get("q") or '').strip() or None
+        }
+        days = args.get("days", type=int)
+        if days:
+            filters['received_from'] = (datetime.now() - timedelta(days=days - 1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        
+        page = AutoClassifyService().list_tickets(
+            class_result_id,
+            filters=filters,
+            sort=args.get("sort", "date-desc"),
+            cursor=args.get("cursor", type=int),
+            limit=args.get("limit", type=int)
+        )
+        
+        if page is None:
+            return jsonify({
+                'success': False,
+                'error': '분류 결과를 찾을 수 없습니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': page
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"분류 티켓 목록 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'티켓 목록 조회 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
 @auto_bp.route("/stats", methods=["POST"])
 def get_classification_stats():
     """
@@ -100,8 +161,8 @@ def get_classification_stats():
         
         report_db = ReportDB()
         
-        # 1. CS 데이터 조회
-        cs_data = report_db.get_cs_analysis_data(file_id)
+        # 1. CS 데이터 조회 (분류 결과가 같으면 리포트 데이터 캐시 재사용)
+        cs_data = ReportService().get_cs_data(file_id=file_id)
         
         if not cs_data or cs_data['total_tickets'] == 0:
             return jsonify({
@@ -124,7 +185,7 @@ def get_classification_stats():
             latest_report_id = report_db.get_latest_report_id(user_id)
             
             if latest_report_id:
-                report_data = report_db.get_report_with_snapshots(latest_report_id)
+                report_data = ReportService().get_report_by_id(latest_report_id)
                 if report_data and report_data.get('insight'):
                     stats_data['latest_insight'] = report_data['insight']
                     logger.info(f"최신 인사이트 포함: report_id={latest_report_id}")
@@ -144,3 +205,25 @@ def get_classification_stats():
             'success': False,
             'error': f'통계 조회 중 오류가 발생했습니다: {str(e)}'
         }), 500
+
+
+@auto_bp.route("/models", methods=["GET"])
+def get_model_stats():
+    """
+    적재된 분류 모델 현황 조회
+    응답: 모델별 로딩 시간(초), 메모리(MB), 사용 횟수, 마지막 사용 시각
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'data': {
+                'memory_budget_mb': Config.MODEL_MEMORY_BUDGET_MB,
+                'models': model_registry.stats()
+            }
+        }), 200
+    except Exception as e:
+        logger.error(f"모델 현황 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': '모델 현황 조회 중 오류가 발생했습니다.'
+        }), 500
@@ -1,5 +1,5 @@
 # 필요한 라이브러리들을 가져옵니다.
-from flask import Blueprint, send_file, jsonify, request, after_this_request
+from flask import Blueprint, send_file, jsonify, request, session, after_this_request
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
@@ -10,8 +10,9 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.utils import ImageReader
-from services.db.report_db import ReportDB
+from services.report import ReportService
 from utils.logger import get_logger
+from config import Config
 import os
 import datetime
 import re
@@ -24,10 +25,14 @@ from io import BytesIO
 import base64
 from PIL import Image
 from utils.email_utils import send_email_with_pdf
+from utils.channel_trend import limit_points
 import traceback
 
 logger = get_logger(__name__)
 
+# PDF 채널 그래프 최대 막대 수 (10인치 폭 기준)
+PDF_CHART_MAX_POINTS = 60
+
 export_bp = Blueprint("export", __name__)
 
 # 'malgun.ttf' 폰트 파일을 코드와 같은 경로에 준비해야 합니다.
@@ -164,9 +169,9 @@ def download_pdf_file():
         
         logger.info(f"리포트 PDF 다운로드 요청: report_id={report_id}")
         
-        # 1. DB에서 리포트 데이터 조회
-        report_db = ReportDB()
-        report_data = report_db.get_report_with_snapshots(int(report_id))
+        # 1. DB에서 리포트 데이터 조회 (세션 사용자가 생성한 리포트만)
+        user_id = session.get('user_id') or Config.DEFAULT_USER_ID
+        report_data = ReportService().get_report_by_id(int(report_id), user_id=user_id)
         
         if not report_data:
             logger.warning(f"리포트를 찾을 수 없음: report_id={report_id}")
@@ -220,9 +225,9 @@ def send_pdf_email():
         if not report_id or not email_to:
             return jsonify({"error": "report_id와 email이 필요합니다."}), 400
 
-        # 1. DB에서 리포트 데이터 조회
-        report_db = ReportDB()
-        report_data = report_db.get_report_with_snapshots(int(report_id))
+        # 1. DB에서 리포트 데이터 조회 (세션 사용자가 생성한 리포트만)
+        user_id = session.get('user_id') or Config.DEFAULT_USER_ID
+        report_data = ReportService().get_report_by_id(int(report_id), user_id=user_id)
         if not report_data:
             return jsonify({"error": "해당 리포트를 찾을 수 없습니다."}), 404
 
@@ -860,6 +865,9 @@ def create_channel_chart_image(channel, trend_data):
         plt.rcParams['font.family'] = 'DejaVu Sans'
         plt.rcParams['axes.unicode_minus'] = False
         
+        # 이미지 폭에 맞게 버킷 수 제한 (인접 날짜 합산)
+        trend_data = limit_points(trend_data, PDF_CHART_MAX_POINTS)
+        
         dates = trend_data.get('dates', [])
         categories = trend_data.get('categories', [])
         data_matrix = trend_data.get('data', [])
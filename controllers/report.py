@@ -1,6 +1,10 @@
 from flask import Blueprint, request, jsonify, session
 from flasgger.utils import swag_from
 from services.report import ReportService
+from services.analytics import AnalyticsService
+from utils.analytics_store import AnalyticsMirrorStale
+from utils.report_cache import report_cache
+from utils.channel_trend import CHART_RESOLUTIONS
 from utils.logger import get_logger
 from config import Config
 import json
@@ -27,6 +31,13 @@ report_bp = Blueprint("report", __name__)
             'type': 'integer',
             'required': False,
             'description': '파일 ID (선택사항, 없으면 최신 파일 사용)'
+        },
+        {
+            'name': 'preview',
+            'in': 'body',
+            'type': 'boolean',
+            'required': False,
+            'description': '미리보기 모드 (층화 표본 추정 요약을 즉시 반환, 전체 리포트는 백그라운드 생성 - GET /api/report/<report_id>로 확인)'
         }
     ],
     'responses': {
@@ -71,12 +82,16 @@ def generate_report():
         file_id = data.get('file_id')  # 선택사항
         batch_id = data.get('batch_id')  # 선택사항
         company_name = data.get('company_name', 'ClaraCS')  # 선택된 카테고리
+        preview = bool(data.get('preview', False))  # 미리보기 모드
         
-        logger.info(f"리포트 생성 요청: user_id={user_id}, file_id={file_id}, batch_id={batch_id}, company_name={company_name}")
+        logger.info(f"리포트 생성 요청: user_id={user_id}, file_id={file_id}, batch_id={batch_id}, company_name={company_name}, preview={preview}")
         
         # 서비스를 통한 리포트 생성
         report_service = ReportService()
-        report_data = report_service.generate_report(user_id, file_id, batch_id, company_name)
+        if preview:
+            report_data = report_service.generate_preview_report(user_id, file_id, batch_id, company_name)
+        else:
+            report_data = report_service.generate_report(user_id, file_id, batch_id, company_name)
         
         logger.info(f"리포트 생성 완료 (report_id: {report_data['report_id']})")
         
@@ -101,38 +116,67 @@ def generate_report():
 @report_bp.route("/api/report/channel-trends", methods=["POST"])
 @swag_from({
     'tags': ['Report'],
-    'description': '채널별 추이 데이터 조회',
+    'description': '채널별 추이 데이터 조회 (기간에 따라 일/주/월 단위로 집계하여 채널당 점 수 제한)',
     'parameters': [
         {
-            'name': 'file_id',
+            'name': 'body',
             'in': 'body',
-            'type': 'integer',
             'required': True,
-            'description': '파일 ID'
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'file_id': {'type': 'integer', 'description': '파일 ID (file_id 또는 batch_id 필수)'},
+                    'batch_id': {'type': 'integer', 'description': '배치 ID'},
+                    'resolution': {'type': 'string', 'enum': ['auto', 'day', 'week', 'month'], 'default': 'auto',
+                                   'description': '집계 단위 (auto: 기간과 max_points로 선택)'},
+                    'max_points': {'type': 'integer', 'description': '채널당 최대 버킷 수 (기본값 CHART_MAX_POINTS, 0 = 제한 없음)'},
+                    'line_points': {'type': 'integer', 'description': '전체 합계선 LTTB 다운샘플링 점 수 (기본값 CHART_LINE_POINTS, 0 = 사용 안 함)'}
+                }
+            }
         }
     ],
     'responses': {
         200: {
             'description': '채널별 추이 데이터 조회 성공'
+        },
+        400: {
+            'description': '잘못된 요청'
         }
     }
 })
 def get_channel_trends():
     """채널별 추이 데이터 조회 API"""
     try:
-        data = request.get_json()
+        data = request.get_json() or {}
         file_id = data.get('file_id')
+        batch_id = data.get('batch_id')
+        resolution = data.get('resolution', 'auto')
         
-        if not file_id:
+        if not file_id and not batch_id:
             return jsonify({
                 'success': False,
-                'error': 'file_id가 필요합니다.'
+                'error': 'file_id 또는 batch_id가 필요합니다.'
+            }), 400
+        
+        if resolution not in CHART_RESOLUTIONS:
+            return jsonify({
+                'success': False,
+                'error': f'resolution은 {", ".join(CHART_RESOLUTIONS)} 중 하나여야 합니다.'
+            }), 400
+        
+        try:
+            max_points = int(data['max_points']) if data.get('max_points') is not None else None
+            line_points = int(data['line_points']) if data.get('line_points') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'max_points, line_points는 정수여야 합니다.'
             }), 400
         
-        logger.info(f"파일 {file_id}의 채널별 추이 데이터 조회")
+        logger.info(f"채널별 추이 데이터 조회: file_id={file_id}, batch_id={batch_id}, resolution={resolution}")
         
         report_service = ReportService()
-        channel_trends = report_service.get_channel_trends(file_id)
+        channel_trends = report_service.get_channel_trends(file_id, batch_id, resolution, max_points, line_points)
         
         return jsonify({
             'success': True,
@@ -279,6 +323,52 @@ def get_latest_report():
             'error': '리포트 조회 중 오류가 발생했습니다.'
         }), 500
 
+@report_bp.route("/api/report/<int:report_id>", methods=["GET"])
+@swag_from({
+    'tags': ['Report'],
+    'description': '저장된 리포트 조회 (미리보기 리포트는 status가 completed가 될 때까지 추정 요약 반환)',
+    'parameters': [
+        {
+            'name': 'report_id',
+            'in': 'path',
+            'type': 'integer',
+            'required': True,
+            'description': '리포트 ID'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': '리포트 조회 성공'
+        },
+        404: {
+            'description': '리포트 없음'
+        }
+    }
+})
+def get_report(report_id):
+    """저장된 리포트 조회 API (세션 사용자가 생성한 리포트만)"""
+    try:
+        user_id = session.get('user_id') or Config.DEFAULT_USER_ID
+        report = ReportService().get_report_by_id(report_id, user_id=user_id)
+        
+        if not report:
+            return jsonify({
+                'success': False,
+                'error': '리포트를 찾을 수 없습니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': report
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"리포트 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': '리포트 조회 중 오류가 발생했습니다.'
+        }), 500
+
 @report_bp.route("/api/report/solutions", methods=["POST"])
 @swag_from({
     'tags': ['Report'],
@@ -334,3 +424,147 @@ def get_solutions():
             'success': False,
             'error': f'솔루션 생성 중 오류가 발생했습니다: {str(e)}'
         }), 500
+
+@report_bp.route("/api/report/cache-stats", methods=["GET"])
+@swag_from({
+    'tags': ['Report'],
+    'description': '리포트 데이터 캐시 적중률 통계',
+    'responses': {
+        200: {
+            'description': '캐시 통계 조회 성공'
+        }
+    }
+})
+def get_cache_stats():
+    """리포트 데이터 캐시 통계 조회 API"""
+    return jsonify({
+        'success': True,
+        'data': report_cache.stats()
+    }), 200
+
+def _analytics_params():
+    """분석 저장소 조회 공통 쿼리 파라미터 (months, batch_ids)"""
+    months = request.args.get('months', 24, type=int)
+    if months is None or months < 1:
+        raise ValueError('months는 1 이상의 정수여야 합니다.')
+    
+    batch_ids = request.args.get('batch_ids', '')
+    try:
+        batch_ids = [int(value) for value in batch_ids.split(',') if value.strip()]
+    except ValueError:
+        raise ValueError('batch_ids는 쉼표로 구분한 정수여야 합니다.')
+    return months, batch_ids or None
+
+@report_bp.route("/api/report/analytics/category-share", methods=["GET"])
+@swag_from({
+    'tags': ['Report'],
+    'description': '월별 카테고리 비중 (Parquet 분석 저장소, 여러 배치 / 장기간)',
+    'parameters': [
+        {'name': 'months', 'in': 'query', 'type': 'integer', 'required': False, 'description': '조회 개월 수 (기본값 24)'},
+        {'name': 'batch_ids', 'in': 'query', 'type': 'string', 'required': False, 'description': '배치 ID 목록 (쉼표 구분, 기본값 전체)'}
+    ],
+    'responses': {
+        200: {
+            'description': '월별 카테고리 비중 조회 성공'
+        },
+        400: {
+            'description': '잘못된 요청'
+        },
+        503: {
+            'description': '분석 저장소 동기화 실패로 결과가 최신이 아님 (analytics-sync 필요)'
+        }
+    }
+})
+def get_category_share():
+    """월별 카테고리 비중 조회 API"""
+    try:
+        months, batch_ids = _analytics_params()
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        user_id = session.get('user_id') or Config.DEFAULT_USER_ID
+        logger.info(f"월별 카테고리 비중 조회: user_id={user_id}, months={months}, batch_ids={batch_ids}")
+        
+        data = AnalyticsService().category_share_by_month(user_id, months, batch_ids)
+        
+        return jsonify({
+            'success': True,
+            'data': data
+        }), 200
+    
+    except AnalyticsMirrorStale as e:
+        logger.error(f"월별 카테고리 비중 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503
+    
+    except Exception as e:
+        logger.error(f"월별 카테고리 비중 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'분석 조회 중 오류가 발생했습니다: {str(e)}'
+        }), 500
+
+@report_bp.route("/api/report/analytics/product-breakdown", methods=["GET"])
+@swag_from({
+    'tags': ['Report'],
+    'description': '제품별 문의 건수 / 해결률 / 카테고리 구성 (Parquet 분석 저장소)',
+    'parameters': [
+        {'name': 'months', 'in': 'query', 'type': 'integer', 'required': False, 'description': '조회 개월 수 (기본값 24)'},
+        {'name': 'batch_ids', 'in': 'query', 'type': 'string', 'required': False, 'description': '배치 ID 목록 (쉼표 구분, 기본값 전체)'},
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'required': False, 'description': '상위 제품 수 (기본값 20)'}
+    ],
+    'responses': {
+        200: {
+            'description': '제품별 분석 조회 성공'
+        },
+        400: {
+            'description': '잘못된 요청'
+        },
+        503: {
+            'description': '분석 저장소 동기화 실패로 결과가 최신이 아님 (analytics-sync 필요)'
+        }
+    }
+})
+def get_product_breakdown():
+    """제품별 분석 조회 API"""
+    try:
+        months, batch_ids = _analytics_params()
+        limit = request.args.get('limit', 20, type=int)
+        if limit is None or limit < 1:
+            raise ValueError('limit은 1 이상의 정수여야 합니다.')
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        user_id = session.get('user_id') or Config.DEFAULT_USER_ID
+        logger.info(f"제품별 분석 조회: user_id={user_id}, months={months}, batch_ids={batch_ids}, limit={limit}")
+        
+        data = AnalyticsService().product_breakdown(user_id, months, batch_ids, limit)
+        
+        return jsonify({
+            'success': True,
+            'data': data
+        }), 200
+    
+    except AnalyticsMirrorStale as e:
+        logger.error(f"제품별 분석 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 503
+    
+    except Exception as e:
+        logger.error(f"제품별 분석 조회 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': f'분석 조회 중 오류가 발생했습니다: {str(e)}'
+        }), 500
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, session
 from flasgger.utils import swag_from
 from services.upload import UploadService
 from services.mapping import MappingService
+from services.retention import RetentionService
 from services.db.report_db import ReportDB
 from utils.logger import get_logger
 from config import Config
@@ -11,6 +12,15 @@ logger = get_logger(__name__)
 
 upload_bp = Blueprint("upload", __name__)
 
+
+def _classify_flag():
+    """업로드 중 분류 여부 (폼 데이터 classify, 없으면 None → Config.INLINE_CLASSIFICATION)"""
+    value = request.form.get('classify')
+    if value is None:
+        return None
+    return value.lower() in ('1', 'true', 'yes')
+
+
 @upload_bp.route("/api/upload", methods=["POST"])
 def upload_file():
     """데이터 업로드 API (단일 파일)"""
@@ -25,7 +35,7 @@ def upload_file():
         user_id = int(user_id)
         
         upload_service = UploadService()
-        upload_data = upload_service.upload(file, user_id=user_id)
+        upload_data = upload_service.upload(file, user_id=user_id, classify=_classify_flag())
         
         return jsonify({
             'success': True,
@@ -60,7 +70,8 @@ def upload_batch():
         logger.info(f"배치 업로드 요청: {len(files)}개 파일, user_id={user_id}")
         
         upload_service = UploadService()
-        batch_data = upload_service.upload_batch(files, user_id=user_id, batch_name=batch_name)
+        batch_data = upload_service.upload_batch(files, user_id=user_id, batch_name=batch_name,
+                                                 classify=_classify_flag())
         
         return jsonify({
             'success': True,
@@ -130,6 +141,51 @@ def validate_file():
             'error': f'파일 검증 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
+@upload_bp.route("/api/upload/files/<int:file_id>", methods=["DELETE"])
+def delete_file(file_id):
+    """업로드 파일 삭제 API (소프트 삭제 후 퍼지 작업에서 데이터 정리)"""
+    try:
+        deleted = RetentionService().soft_delete_file(file_id)
+        
+        if not deleted:
+            return jsonify({
+                'success': False,
+                'error': '파일이 없거나 이미 삭제되었습니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'message': '파일이 삭제되었습니다.',
+            'data': {'file_id': file_id}
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"파일 삭제 실패: file_id={file_id}, {e}")
+        return jsonify({
+            'success': False,
+            'error': '파일 삭제 중 오류가 발생했습니다.'
+        }), 500
+
+
+@upload_bp.route("/api/upload/batches/<int:batch_id>", methods=["DELETE"])
+def delete_batch(batch_id):
+    """배치 삭제 API (소속 파일 포함, 소프트 삭제 후 퍼지 작업에서 데이터 정리)"""
+    try:
+        file_count = RetentionService().soft_delete_batch(batch_id)
+        
+        return jsonify({
+            'success': True,
+            'message': '배치가 삭제되었습니다.',
+            'data': {'batch_id': batch_id, 'file_count': file_count}
+        }), 200
+    
+    except Exception as e:
+        logger.error(f"배치 삭제 실패: batch_id={batch_id}, {e}")
+        return jsonify({
+            'success': False,
+            'error': '배치 삭제 중 오류가 발생했습니다.'
+        }), 500
+
 @upload_bp.route("/api/upload/latest-file", methods=["POST"])
 @swag_from({
     'tags': ['Upload'],
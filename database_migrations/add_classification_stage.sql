@@ -0,0 +1,20 @@
+-- ============================================================
+-- 단계형(cascade) 분류 마이그레이션
+-- 목적: 티켓별로 최종 분류를 결정한 단계(rule / ai) 기록
+--       (규칙 기반으로 먼저 분류하고 신뢰도가 낮은 티켓만 AI 재분류)
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. tb_ticket / tb_ticket_archive에 classification_stage 컬럼 추가
+-- ============================================================
+
+ALTER TABLE `tb_ticket`
+ADD COLUMN `classification_stage` VARCHAR(16) COMMENT '분류 결정 단계 (rule / ai)' AFTER `classified_at`;
+
+ALTER TABLE `tb_ticket_archive`
+ADD COLUMN `classification_stage` VARCHAR(16) AFTER `classified_at`;
+
+
+SELECT '단계형 분류 컬럼 추가 완료!' as message;
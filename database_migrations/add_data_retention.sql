@@ -0,0 +1,64 @@
+-- ============================================================
+-- 데이터 보존 정책 / 퍼지 마이그레이션
+-- 목적: 소프트 삭제된 파일/배치와 보존 기간이 지난 데이터를
+--       PK 범위 청크 단위로 삭제 (테이블 장시간 잠금 방지, 중단 후 재개)
+-- 실행: flask --app app purge-data (스케줄러 등록 권장)
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. 보존 정책 테이블 (배치 정책 > 사용자 정책 > RETENTION_DAYS)
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS `tb_retention_policy` (
+  `policy_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '보존 정책 ID',
+  `user_id` INT COMMENT '대상 사용자 ID (사용자 단위 정책)',
+  `batch_id` INT COMMENT '대상 배치 ID (배치 단위 정책, 사용자 정책보다 우선)',
+  `retention_days` INT NOT NULL COMMENT '업로드 후 보존 일수 (0 = 무기한)',
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_retention_policy_user_id (user_id),
+  INDEX idx_retention_policy_batch_id (batch_id)
+) COMMENT '데이터 보존 정책 - 사용자/배치 단위 보존 기간';
+
+
+-- ============================================================
+-- 2. 퍼지 작업 진행 테이블
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS `tb_purge_job` (
+  `job_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '퍼지 작업 ID',
+  `target_type` VARCHAR(20) NOT NULL COMMENT '대상 유형: file, batch',
+  `target_id` INT NOT NULL COMMENT '대상 file_id 또는 batch_id',
+  `status` VARCHAR(20) DEFAULT 'pending' COMMENT '작업 상태: pending, running, completed, failed',
+  `current_step` VARCHAR(64) COMMENT '진행 중인 테이블 (재개 지점)',
+  `last_pk` INT COMMENT '진행 중인 테이블에서 마지막으로 삭제한 PK (재개 지점)',
+  `deleted_rows` INT DEFAULT 0 COMMENT '누적 삭제 행 수',
+  `error_message` TEXT,
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  `completed_at` DATETIME,
+  UNIQUE KEY uk_purge_job_target (target_type, target_id),
+  INDEX idx_purge_job_status (status)
+) COMMENT '파일/배치 퍼지 작업 진행 상황 - 청크 단위 삭제 재개용';
+
+
+-- ============================================================
+-- 3. 스냅샷 테이블 report_id 인덱스 (리포트 단위 삭제 범위 조회용)
+-- ============================================================
+
+ALTER TABLE `tb_analysis_channel_snapshot`
+ADD INDEX idx_channel_snapshot_report_id (report_id);
+
+ALTER TABLE `tb_analysis_summary_snapshot`
+ADD INDEX idx_summary_snapshot_report_id (report_id);
+
+ALTER TABLE `tb_analysis_solution_snapshot`
+ADD INDEX idx_solution_snapshot_report_id (report_id);
+
+ALTER TABLE `tb_analysis_insight_snapshot`
+ADD INDEX idx_insight_snapshot_report_id (report_id);
+
+
+SELECT '데이터 보존 정책/퍼지 추가 완료!' as message;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- 근사 중복 티켓 클러스터링 마이그레이션
+-- 목적: MinHash/LSH로 묶인 근사 중복 티켓의 클러스터(대표 티켓 ID) 기록
+--       (클러스터당 대표 티켓만 AI 분류하고 결과를 전파)
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+ADD COLUMN `duplicate_cluster_id` INT COMMENT '근사 중복 클러스터 대표 티켓 ID' AFTER `classification_stage`;
+
+ALTER TABLE `tb_ticket_archive`
+ADD COLUMN `duplicate_cluster_id` INT AFTER `classification_stage`;
+
+
+SELECT '근사 중복 클러스터 컬럼 추가 완료!' as message;
@@ -0,0 +1,12 @@
+-- ============================================================
+-- 리포트 생성 단계별 실행 시간 마이그레이션
+-- 목적: 리포트 생성 파이프라인(데이터 조회 / GPT 분석 / 스냅샷 저장)의 단계별 소요 시간 기록
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_report`
+ADD COLUMN `stage_timings` JSON COMMENT '생성 단계별 실행 시간 (ms)' AFTER `completed_at`;
+
+
+SELECT '리포트 단계별 실행 시간 컬럼 추가 완료!' as message;
@@ -0,0 +1,14 @@
+-- ============================================================
+-- 리포트 채널 추이 해상도 마이그레이션
+-- 목적: 채널 스냅샷을 저장한 버킷 단위(일/주/월)를 리포트에 기록하여
+--       스냅샷 조회 시 새로 생성한 리포트와 같은 channel_trends(dates 형식, resolution) 복원
+-- 기존 리포트는 trend_resolution이 NULL이며 조회 시 일 단위('day')로 간주
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_report`
+ADD COLUMN `trend_resolution` VARCHAR(10) COMMENT '채널 추이 스냅샷 버킷 단위 (day, week, month)' AFTER `stage_timings`;
+
+
+SELECT '리포트 채널 추이 해상도 컬럼 추가 완료!' as message;
@@ -0,0 +1,35 @@
+-- ============================================================
+-- 일별 티켓 롤업 상태 차원 마이그레이션
+-- 목적: CS 분석 데이터(총계/채널 분포/상태 분포/해결률)를 롤업 1회 조회로 계산
+-- 상태 차원이 추가되므로 기존 롤업을 지우고 원본 티켓으로 다시 채움
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket_daily_rollup`
+ADD COLUMN `status` VARCHAR(20) COMMENT '티켓 상태' AFTER `category_id`;
+
+DELETE FROM `tb_ticket_daily_rollup`;
+
+INSERT INTO `tb_ticket_daily_rollup`
+  (file_id, stat_date, channel, category_id, status, ticket_count, resolved_count, confidence_sum, updated_at)
+SELECT
+  t.file_id,
+  DATE(t.received_at),
+  t.channel,
+  t.classified_category_id,
+  t.status,
+  COUNT(*),
+  SUM(CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END),
+  COALESCE(SUM(t.classification_confidence), 0),
+  NOW()
+FROM (
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket
+  UNION ALL
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket_archive
+) t
+WHERE t.file_id IS NOT NULL
+GROUP BY t.file_id, DATE(t.received_at), t.channel, t.classified_category_id, t.status;
+
+
+SELECT '일별 티켓 롤업 상태 컬럼 추가 및 재집계 완료!' as message;
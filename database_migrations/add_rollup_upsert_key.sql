@@ -0,0 +1,45 @@
+-- ============================================================
+-- 일별 티켓 롤업 증감 반영 키 마이그레이션
+-- 목적: 티켓 저장/재분류 시 파일 전체 재집계 대신
+--       INSERT ... ON DUPLICATE KEY UPDATE로 증감분만 반영
+-- 적용 순서: add_ticket_daily_rollup.sql → add_rollup_status.sql → 이 파일
+-- ============================================================
+
+USE clara_cs;
+
+-- upsert는 충돌 시에도 AUTO_INCREMENT 번호를 소비하므로 BIGINT로 확장
+ALTER TABLE `tb_ticket_daily_rollup`
+MODIFY COLUMN `rollup_id` BIGINT AUTO_INCREMENT COMMENT '롤업 ID (증감 upsert마다 번호 소비)';
+
+-- NULL 차원('' / NULL 채널 등)이 한 키로 합쳐지도록 비우고 키 추가 후 다시 채움
+DELETE FROM `tb_ticket_daily_rollup`;
+
+ALTER TABLE `tb_ticket_daily_rollup`
+ADD UNIQUE KEY uk_daily_rollup_key (file_id, (COALESCE(stat_date, '1000-01-01')), (COALESCE(channel, '')), (COALESCE(category_id, 0)), (COALESCE(status, '')));
+
+INSERT INTO `tb_ticket_daily_rollup`
+  (file_id, stat_date, channel, category_id, status, ticket_count, resolved_count, confidence_sum, updated_at)
+SELECT
+  t.file_id,
+  DATE(t.received_at),
+  t.channel,
+  t.classified_category_id,
+  t.status,
+  COUNT(*),
+  SUM(CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END),
+  COALESCE(SUM(t.classification_confidence), 0),
+  NOW()
+FROM (
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket
+  UNION ALL
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket_archive
+) t
+WHERE t.file_id IS NOT NULL
+GROUP BY t.file_id, DATE(t.received_at), t.channel, t.classified_category_id, t.status
+ON DUPLICATE KEY UPDATE
+  ticket_count = ticket_count + VALUES(ticket_count),
+  resolved_count = resolved_count + VALUES(resolved_count),
+  confidence_sum = confidence_sum + VALUES(confidence_sum);
+
+
+SELECT '일별 티켓 롤업 증감 반영 키 추가 완료!' as message;
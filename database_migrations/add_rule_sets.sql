@@ -0,0 +1,44 @@
+-- ============================================================
+-- 규칙 기반 분류 규칙 세트 마이그레이션
+-- 목적: 키워드 패턴 / inquiry_type 매핑 / 카테고리 우선순위를 DB에서 관리하고
+--       티켓마다 분류에 사용한 규칙 세트 버전(내용 해시)을 기록
+-- 초기 규칙: flask --app app seed-rules
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. 규칙 테이블
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS `tb_classification_rule` (
+  `rule_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '규칙 ID',
+  `rule_type` VARCHAR(16) NOT NULL COMMENT '규칙 유형: keyword (본문/제목 키워드), inquiry (문의 유형 매핑)',
+  `pattern` VARCHAR(100) NOT NULL COMMENT '매칭 문자열',
+  `category_name` VARCHAR(150) NOT NULL COMMENT '분류 카테고리명',
+  `sort_order` INT DEFAULT 0 COMMENT '검사 순서 (keyword는 카테고리 내, inquiry는 전체)',
+  `is_active` BOOLEAN DEFAULT TRUE COMMENT '사용 여부',
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_classification_rule_type (rule_type, is_active)
+) COMMENT '규칙 기반 분류 규칙 - 내용 해시가 규칙 세트 버전';
+
+CREATE TABLE IF NOT EXISTS `tb_classification_category_priority` (
+  `category_name` VARCHAR(150) PRIMARY KEY COMMENT '분류 카테고리명',
+  `priority` INT NOT NULL COMMENT '키워드 점수 동점 시 우선순위 (작을수록 우선)',
+  `updated_at` DATETIME DEFAULT (NOW())
+) COMMENT '규칙 기반 분류 카테고리 우선순위';
+
+
+-- ============================================================
+-- 2. 티켓별 규칙 세트 버전
+-- ============================================================
+
+ALTER TABLE `tb_ticket`
+ADD COLUMN `classification_rule_version` VARCHAR(16) COMMENT '분류에 사용한 규칙 세트 버전 (규칙 기반 결정 시)' AFTER `duplicate_cluster_id`;
+
+ALTER TABLE `tb_ticket_archive`
+ADD COLUMN `classification_rule_version` VARCHAR(16) AFTER `duplicate_cluster_id`;
+
+
+SELECT '분류 규칙 세트 테이블/컬럼 추가 완료!' as message;
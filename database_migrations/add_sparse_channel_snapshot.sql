@@ -0,0 +1,15 @@
+-- ============================================================
+-- 채널 스냅샷 희소 저장 마이그레이션 (압축)
+-- 목적: 기존 리포트의 채널 스냅샷에서 0 셀 행 제거
+--       (새 리포트는 0이 아닌 셀만 저장, 조회 시 0으로 채워 행렬 복원)
+-- ============================================================
+
+USE clara_cs;
+
+DELETE FROM `tb_analysis_channel_snapshot`
+WHERE `count` = 0 OR `count` IS NULL;
+
+OPTIMIZE TABLE `tb_analysis_channel_snapshot`;
+
+
+SELECT '채널 스냅샷 희소 저장 압축 완료!' as message;
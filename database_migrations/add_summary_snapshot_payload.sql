@@ -0,0 +1,14 @@
+-- ============================================================
+-- 요약 스냅샷 원본 저장 마이그레이션
+-- 목적: 리포트 요약 섹션(카테고리 건수, 채널별 처리 현황)을 생성 시점 그대로 보관하여
+--       리포트 조회(PDF/이메일) 시 티켓/롤업 재집계 없이 스냅샷만 조회
+-- 기존 리포트는 summary_payload가 NULL이며 조회 시 이전 방식으로 복원
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_summary_snapshot`
+ADD COLUMN `summary_payload` JSON COMMENT '리포트 요약 섹션 원본 (카테고리 건수, 채널별 처리 현황)' AFTER `repeat_rate`;
+
+
+SELECT '요약 스냅샷 원본 컬럼 추가 완료!' as message;
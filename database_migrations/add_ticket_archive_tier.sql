@@ -0,0 +1,62 @@
+-- ============================================================
+-- 티켓 hot/cold 티어 분리 마이그레이션
+-- 목적: 보관 기간이 지난 접수월의 티켓을 압축 아카이브 테이블로 이동하여
+--       tb_ticket(hot) 크기를 일정하게 유지
+-- 실행: flask --app app archive-tickets (월 단위 롤링, 스케줄러 등록 권장)
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. 아카이브(cold) 테이블 생성 (InnoDB 압축)
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS `tb_ticket_archive` (
+  `ticket_id` INT PRIMARY KEY COMMENT '원본 tb_ticket.ticket_id',
+  `file_id` INT,
+  `user_id` INT,
+  `received_at` DATETIME,
+  `channel` VARCHAR(64),
+  `customer_id` VARCHAR(128),
+  `product_code` VARCHAR(128),
+  `inquiry_type` VARCHAR(128),
+  `classified_category_id` INT,
+  `classification_confidence` FLOAT,
+  `classification_keywords` JSON,
+  `classified_at` DATETIME,
+  `title` VARCHAR(1000),
+  `body` TEXT,
+  `assignee` VARCHAR(128),
+  `status` VARCHAR(20),
+  `created_at` DATETIME,
+  `updated_at` DATETIME,
+  `raw_data` JSON,
+  `archived_at` DATETIME DEFAULT (NOW()) COMMENT '아카이브 이동 시각',
+  INDEX idx_ticket_archive_file_received (file_id, received_at),
+  INDEX idx_ticket_archive_user_id (user_id)
+) ROW_FORMAT=COMPRESSED COMMENT '티켓 아카이브(cold) 테이블 - 보관 기간이 지난 월 단위 파티션';
+
+
+-- ============================================================
+-- 2. 아카이브 파티션 맵 (ReportDB 쿼리 라우터가 참조)
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS `tb_ticket_archive_log` (
+  `file_id` INT NOT NULL COMMENT '파일 ID',
+  `partition_month` DATE NOT NULL COMMENT '접수월 (매월 1일)',
+  `ticket_count` INT DEFAULT 0 COMMENT '아카이브된 티켓 수',
+  `archived_at` DATETIME DEFAULT (NOW()) COMMENT '최근 아카이브 시각',
+  PRIMARY KEY (file_id, partition_month),
+  INDEX idx_archive_log_month (partition_month)
+) COMMENT '아카이브 파티션 맵 - (파일, 접수월) 단위로 cold 티어에 있는 파티션 기록';
+
+
+-- ============================================================
+-- 3. hot 테이블 파일+접수일 복합 인덱스 (월 단위 이동 범위 조회용)
+-- ============================================================
+
+ALTER TABLE `tb_ticket`
+ADD INDEX idx_ticket_file_received (file_id, received_at);
+
+
+SELECT '티켓 아카이브 티어 추가 완료!' as message;
@@ -0,0 +1,44 @@
+-- ============================================================
+-- 일별 채널×카테고리 티켓 롤업 마이그레이션
+-- 목적: 채널별 추이 / 요약 / 통계 조회를 원본 티켓 GROUP BY 대신
+--       (파일, 접수일, 채널, 카테고리) 단위 롤업에서 조회
+-- 기존 데이터는 아래 INSERT ... SELECT로 채움 (이후에는 저장/분류 시 증감 반영)
+-- ============================================================
+
+USE clara_cs;
+
+CREATE TABLE IF NOT EXISTS `tb_ticket_daily_rollup` (
+  `rollup_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '롤업 ID',
+  `file_id` INT NOT NULL COMMENT '파일 ID (배치는 tb_uploaded_file.batch_id로 합산)',
+  `stat_date` DATE COMMENT '접수일',
+  `channel` VARCHAR(64) COMMENT '채널',
+  `category_id` INT COMMENT '분류 카테고리 ID (NULL: 미분류)',
+  `ticket_count` INT DEFAULT 0 COMMENT '티켓 수',
+  `resolved_count` INT DEFAULT 0 COMMENT '처리 완료 티켓 수',
+  `confidence_sum` DOUBLE DEFAULT 0 COMMENT '분류 신뢰도 합계 (평균 = confidence_sum / ticket_count)',
+  `updated_at` DATETIME DEFAULT (NOW()) COMMENT '최근 갱신 시각',
+  INDEX idx_daily_rollup_file_date (file_id, stat_date)
+) COMMENT '일별 채널×카테고리 티켓 롤업 - 티켓 저장/분류 시 파일 단위로 갱신';
+
+-- 기존 티켓(hot + archive) 집계로 채우기
+INSERT INTO `tb_ticket_daily_rollup`
+  (file_id, stat_date, channel, category_id, ticket_count, resolved_count, confidence_sum, updated_at)
+SELECT
+  t.file_id,
+  DATE(t.received_at),
+  t.channel,
+  t.classified_category_id,
+  COUNT(*),
+  SUM(CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END),
+  COALESCE(SUM(t.classification_confidence), 0),
+  NOW()
+FROM (
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket
+  UNION ALL
+  SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status FROM tb_ticket_archive
+) t
+WHERE t.file_id IS NOT NULL
+GROUP BY t.file_id, DATE(t.received_at), t.channel, t.classified_category_id;
+
+
+SELECT '일별 티켓 롤업 테이블 추가 및 기존 데이터 집계 완료!' as message;
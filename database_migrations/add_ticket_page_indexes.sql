@@ -0,0 +1,16 @@
+-- ============================================================
+-- 분류 티켓 목록 페이지네이션 인덱스 마이그레이션
+-- 목적: GET /api/classifications/tickets 의 keyset 페이지네이션
+--       (파일별 신뢰도 정렬, 카테고리 필터 + 신뢰도 정렬) 인덱스 범위 탐색
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+ADD INDEX idx_ticket_file_confidence (file_id, classification_confidence);
+
+ALTER TABLE `tb_ticket`
+ADD INDEX idx_ticket_file_category_confidence (file_id, classified_category_id, classification_confidence);
+
+
+SELECT '분류 티켓 목록 인덱스 추가 완료!' as message;
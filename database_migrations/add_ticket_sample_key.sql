@@ -0,0 +1,22 @@
+-- ============================================================
+-- 티켓 표본 추출 키 마이그레이션
+-- 목적: 미리보기 리포트의 층화 표본을 ORDER BY RAND() 없이
+--       (file_id, sample_key) 인덱스 범위 조회로 추출
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+ADD COLUMN `sample_key` SMALLINT UNSIGNED COMMENT '표본 추출 키 (저장 시 0~9999 무작위, 미리보기 리포트 층화 표본용)' AFTER `raw_data`,
+ADD INDEX idx_ticket_file_sample (file_id, sample_key);
+
+ALTER TABLE `tb_ticket_archive`
+ADD COLUMN `sample_key` SMALLINT UNSIGNED COMMENT '표본 추출 키 (tb_ticket에서 복사)' AFTER `raw_data`,
+ADD INDEX idx_ticket_archive_file_sample (file_id, sample_key);
+
+-- 기존 티켓 키 채우기 (신규 티켓은 저장 시 애플리케이션에서 부여)
+UPDATE `tb_ticket` SET `sample_key` = FLOOR(RAND() * 10000) WHERE `sample_key` IS NULL;
+UPDATE `tb_ticket_archive` SET `sample_key` = FLOOR(RAND() * 10000) WHERE `sample_key` IS NULL;
+
+
+SELECT '티켓 표본 추출 키 추가 완료!' as message;
@@ -0,0 +1,15 @@
+-- ============================================================
+-- 단계형(cascade) 분류 롤백 스크립트
+-- 목적: add_classification_stage.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+DROP COLUMN `classification_stage`;
+
+ALTER TABLE `tb_ticket_archive`
+DROP COLUMN `classification_stage`;
+
+
+SELECT '단계형 분류 롤백 완료!' as message;
@@ -0,0 +1,33 @@
+-- ============================================================
+-- 데이터 보존 정책 / 퍼지 롤백 스크립트
+-- 목적: add_data_retention.sql 적용 내용을 되돌리기 (이미 삭제된 데이터는 복구되지 않음)
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. 스냅샷 인덱스 삭제
+-- ============================================================
+
+ALTER TABLE `tb_analysis_channel_snapshot`
+DROP INDEX idx_channel_snapshot_report_id;
+
+ALTER TABLE `tb_analysis_summary_snapshot`
+DROP INDEX idx_summary_snapshot_report_id;
+
+ALTER TABLE `tb_analysis_solution_snapshot`
+DROP INDEX idx_solution_snapshot_report_id;
+
+ALTER TABLE `tb_analysis_insight_snapshot`
+DROP INDEX idx_insight_snapshot_report_id;
+
+
+-- ============================================================
+-- 2. 테이블 삭제
+-- ============================================================
+
+DROP TABLE IF EXISTS tb_purge_job;
+DROP TABLE IF EXISTS tb_retention_policy;
+
+
+SELECT '데이터 보존 정책/퍼지 롤백 완료!' as message;
@@ -0,0 +1,15 @@
+-- ============================================================
+-- 근사 중복 티켓 클러스터링 롤백 스크립트
+-- 목적: add_duplicate_clusters.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+DROP COLUMN `duplicate_cluster_id`;
+
+ALTER TABLE `tb_ticket_archive`
+DROP COLUMN `duplicate_cluster_id`;
+
+
+SELECT '근사 중복 클러스터 롤백 완료!' as message;
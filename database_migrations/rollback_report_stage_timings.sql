@@ -0,0 +1,12 @@
+-- ============================================================
+-- 리포트 생성 단계별 실행 시간 롤백 스크립트
+-- 목적: add_report_stage_timings.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_report`
+DROP COLUMN `stage_timings`;
+
+
+SELECT '리포트 단계별 실행 시간 컬럼 롤백 완료!' as message;
@@ -0,0 +1,12 @@
+-- ============================================================
+-- 리포트 채널 추이 해상도 롤백 스크립트
+-- 목적: add_report_trend_resolution.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_report`
+DROP COLUMN `trend_resolution`;
+
+
+SELECT '리포트 채널 추이 해상도 컬럼 롤백 완료!' as message;
@@ -0,0 +1,12 @@
+-- ============================================================
+-- 일별 티켓 롤업 상태 차원 롤백 스크립트
+-- 목적: add_rollup_status.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket_daily_rollup`
+DROP COLUMN `status`;
+
+
+SELECT '일별 티켓 롤업 상태 컬럼 롤백 완료!' as message;
@@ -0,0 +1,16 @@
+-- ============================================================
+-- 일별 티켓 롤업 증감 반영 키 롤백 스크립트
+-- 목적: add_rollup_upsert_key.sql 적용 내용을 되돌리기
+-- 주의: 롤백 후 애플리케이션은 증감 upsert를 사용할 수 없음 (이전 버전으로 함께 되돌릴 것)
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket_daily_rollup`
+DROP INDEX uk_daily_rollup_key;
+
+ALTER TABLE `tb_ticket_daily_rollup`
+MODIFY COLUMN `rollup_id` INT AUTO_INCREMENT COMMENT '롤업 ID';
+
+
+SELECT '일별 티켓 롤업 증감 반영 키 롤백 완료!' as message;
@@ -0,0 +1,19 @@
+-- ============================================================
+-- 규칙 기반 분류 규칙 세트 롤백 스크립트
+-- 목적: add_rule_sets.sql 적용 내용을 되돌리기 (코드의 기본 규칙으로 동작)
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket_archive`
+DROP COLUMN `classification_rule_version`;
+
+ALTER TABLE `tb_ticket`
+DROP COLUMN `classification_rule_version`;
+
+DROP TABLE IF EXISTS `tb_classification_category_priority`;
+
+DROP TABLE IF EXISTS `tb_classification_rule`;
+
+
+SELECT '분류 규칙 세트 롤백 완료!' as message;
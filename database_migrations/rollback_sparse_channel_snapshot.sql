@@ -0,0 +1,25 @@
+-- ============================================================
+-- 채널 스냅샷 희소 저장 롤백 스크립트
+-- 목적: add_sparse_channel_snapshot.sql로 제거한 0 셀 행 복원
+--       (채널별 날짜 × 카테고리 조합 중 저장되지 않은 셀을 count = 0으로 추가)
+-- ============================================================
+
+USE clara_cs;
+
+INSERT INTO `tb_analysis_channel_snapshot` (report_id, channel, time_period, category_id, count)
+SELECT d.report_id, d.channel, d.time_period, c.category_id, 0
+FROM (
+    SELECT DISTINCT report_id, channel, time_period FROM `tb_analysis_channel_snapshot`
+) d
+INNER JOIN (
+    SELECT DISTINCT report_id, channel, category_id FROM `tb_analysis_channel_snapshot`
+) c ON c.report_id = d.report_id AND c.channel = d.channel
+LEFT JOIN `tb_analysis_channel_snapshot` s
+    ON s.report_id = d.report_id
+   AND s.channel = d.channel
+   AND s.time_period = d.time_period
+   AND s.category_id = c.category_id
+WHERE s.channel_snapshot_id IS NULL;
+
+
+SELECT '채널 스냅샷 희소 저장 롤백 완료!' as message;
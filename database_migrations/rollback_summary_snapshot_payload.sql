@@ -0,0 +1,12 @@
+-- ============================================================
+-- 요약 스냅샷 원본 저장 롤백 스크립트
+-- 목적: add_summary_snapshot_payload.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_analysis_summary_snapshot`
+DROP COLUMN `summary_payload`;
+
+
+SELECT '요약 스냅샷 원본 컬럼 롤백 완료!' as message;
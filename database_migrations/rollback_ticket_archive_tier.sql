@@ -0,0 +1,37 @@
+-- ============================================================
+-- 티켓 hot/cold 티어 분리 롤백 스크립트
+-- 목적: 아카이브된 티켓을 tb_ticket으로 복원하고 add_ticket_archive_tier.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+-- ============================================================
+-- 1. 아카이브 티켓 복원
+-- ============================================================
+
+INSERT INTO tb_ticket (
+    ticket_id, file_id, user_id, received_at, channel, customer_id, product_code,
+    inquiry_type, classified_category_id, classification_confidence,
+    classification_keywords, classified_at, title, body, assignee, status,
+    created_at, updated_at, raw_data
+)
+SELECT
+    ticket_id, file_id, user_id, received_at, channel, customer_id, product_code,
+    inquiry_type, classified_category_id, classification_confidence,
+    classification_keywords, classified_at, title, body, assignee, status,
+    created_at, updated_at, raw_data
+FROM tb_ticket_archive;
+
+
+-- ============================================================
+-- 2. 테이블/인덱스 삭제
+-- ============================================================
+
+DROP TABLE IF EXISTS tb_ticket_archive_log;
+DROP TABLE IF EXISTS tb_ticket_archive;
+
+ALTER TABLE `tb_ticket`
+DROP INDEX idx_ticket_file_received;
+
+
+SELECT '티켓 아카이브 티어 롤백 완료!' as message;
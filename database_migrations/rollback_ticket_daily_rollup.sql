@@ -0,0 +1,11 @@
+-- ============================================================
+-- 일별 채널×카테고리 티켓 롤업 롤백 스크립트
+-- 목적: add_ticket_daily_rollup.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+DROP TABLE IF EXISTS `tb_ticket_daily_rollup`;
+
+
+SELECT '일별 티켓 롤업 테이블 롤백 완료!' as message;
@@ -0,0 +1,15 @@
+-- ============================================================
+-- 분류 티켓 목록 페이지네이션 인덱스 롤백 스크립트
+-- 목적: add_ticket_page_indexes.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+DROP INDEX idx_ticket_file_confidence;
+
+ALTER TABLE `tb_ticket`
+DROP INDEX idx_ticket_file_category_confidence;
+
+
+SELECT '분류 티켓 목록 인덱스 롤백 완료!' as message;
@@ -0,0 +1,17 @@
+-- ============================================================
+-- 티켓 표본 추출 키 롤백 스크립트
+-- 목적: add_ticket_sample_key.sql 적용 내용을 되돌리기
+-- ============================================================
+
+USE clara_cs;
+
+ALTER TABLE `tb_ticket`
+DROP INDEX idx_ticket_file_sample,
+DROP COLUMN `sample_key`;
+
+ALTER TABLE `tb_ticket_archive`
+DROP INDEX idx_ticket_archive_file_sample,
+DROP COLUMN `sample_key`;
+
+
+SELECT '티켓 표본 추출 키 롤백 완료!' as message;
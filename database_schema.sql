@@ -79,6 +79,24 @@ CREATE TABLE `tb_category` (
   `created_at` DATETIME DEFAULT (NOW())
 );
 
+CREATE TABLE `tb_classification_rule` (
+  `rule_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '규칙 ID',
+  `rule_type` VARCHAR(16) NOT NULL COMMENT '규칙 유형: keyword (본문/제목 키워드), inquiry (문의 유형 매핑)',
+  `pattern` VARCHAR(100) NOT NULL COMMENT '매칭 문자열',
+  `category_name` VARCHAR(150) NOT NULL COMMENT '분류 카테고리명',
+  `sort_order` INT DEFAULT 0 COMMENT '검사 순서 (keyword는 카테고리 내, inquiry는 전체)',
+  `is_active` BOOLEAN DEFAULT TRUE COMMENT '사용 여부',
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_classification_rule_type (rule_type, is_active)
+) COMMENT '규칙 기반 분류 규칙 - 내용 해시가 규칙 세트 버전';
+
+CREATE TABLE `tb_classification_category_priority` (
+  `category_name` VARCHAR(150) PRIMARY KEY COMMENT '분류 카테고리명',
+  `priority` INT NOT NULL COMMENT '키워드 점수 동점 시 우선순위 (작을수록 우선)',
+  `updated_at` DATETIME DEFAULT (NOW())
+) COMMENT '규칙 기반 분류 카테고리 우선순위';
+
 CREATE TABLE `tb_ticket` (
   `ticket_id` INT PRIMARY KEY AUTO_INCREMENT,
   `file_id` INT,
@@ -92,6 +110,9 @@ CREATE TABLE `tb_ticket` (
   `classification_confidence` FLOAT COMMENT '분류 신뢰도 (0.0~1.0)',
   `classification_keywords` JSON COMMENT '추출된 키워드 배열',
   `classified_at` DATETIME COMMENT '분류 수행 시각',
+  `classification_stage` VARCHAR(16) COMMENT '분류 결정 단계 (rule / ai)',
+  `duplicate_cluster_id` INT COMMENT '근사 중복 클러스터 대표 티켓 ID',
+  `classification_rule_version` VARCHAR(16) COMMENT '분류에 사용한 규칙 세트 버전 (규칙 기반 결정 시)',
   `title` VARCHAR(1000),
   `body` TEXT,
   `assignee` VARCHAR(128),
@@ -99,14 +120,73 @@ CREATE TABLE `tb_ticket` (
   `created_at` DATETIME DEFAULT (NOW()),
   `updated_at` DATETIME,
   `raw_data` JSON,
+  `sample_key` SMALLINT UNSIGNED COMMENT '표본 추출 키 (저장 시 0~9999 무작위, 미리보기 리포트 층화 표본용)',
   INDEX idx_ticket_file_id (file_id),
   INDEX idx_ticket_user_id (user_id),
   INDEX idx_ticket_received_at (received_at),
   INDEX idx_ticket_channel (channel),
   INDEX idx_ticket_classified_category (classified_category_id),
-  INDEX idx_ticket_status (status)
+  INDEX idx_ticket_status (status),
+  INDEX idx_ticket_file_received (file_id, received_at),
+  INDEX idx_ticket_file_confidence (file_id, classification_confidence),
+  INDEX idx_ticket_file_category_confidence (file_id, classified_category_id, classification_confidence),
+  INDEX idx_ticket_file_sample (file_id, sample_key)
 );
 
+CREATE TABLE `tb_ticket_archive` (
+  `ticket_id` INT PRIMARY KEY COMMENT '원본 tb_ticket.ticket_id',
+  `file_id` INT,
+  `user_id` INT,
+  `received_at` DATETIME,
+  `channel` VARCHAR(64),
+  `customer_id` VARCHAR(128),
+  `product_code` VARCHAR(128),
+  `inquiry_type` VARCHAR(128),
+  `classified_category_id` INT,
+  `classification_confidence` FLOAT,
+  `classification_keywords` JSON,
+  `classified_at` DATETIME,
+  `classification_stage` VARCHAR(16),
+  `duplicate_cluster_id` INT,
+  `classification_rule_version` VARCHAR(16),
+  `title` VARCHAR(1000),
+  `body` TEXT,
+  `assignee` VARCHAR(128),
+  `status` VARCHAR(20),
+  `created_at` DATETIME,
+  `updated_at` DATETIME,
+  `raw_data` JSON,
+  `sample_key` SMALLINT UNSIGNED COMMENT '표본 추출 키 (tb_ticket에서 복사)',
+  `archived_at` DATETIME DEFAULT (NOW()) COMMENT '아카이브 이동 시각',
+  INDEX idx_ticket_archive_file_received (file_id, received_at),
+  INDEX idx_ticket_archive_user_id (user_id),
+  INDEX idx_ticket_archive_file_sample (file_id, sample_key)
+) ROW_FORMAT=COMPRESSED COMMENT '티켓 아카이브(cold) 테이블 - 보관 기간이 지난 월 단위 파티션';
+
+CREATE TABLE `tb_ticket_archive_log` (
+  `file_id` INT NOT NULL COMMENT '파일 ID',
+  `partition_month` DATE NOT NULL COMMENT '접수월 (매월 1일)',
+  `ticket_count` INT DEFAULT 0 COMMENT '아카이브된 티켓 수',
+  `archived_at` DATETIME DEFAULT (NOW()) COMMENT '최근 아카이브 시각',
+  PRIMARY KEY (file_id, partition_month),
+  INDEX idx_archive_log_month (partition_month)
+) COMMENT '아카이브 파티션 맵 - (파일, 접수월) 단위로 cold 티어에 있는 파티션 기록';
+
+CREATE TABLE `tb_ticket_daily_rollup` (
+  `rollup_id` BIGINT PRIMARY KEY AUTO_INCREMENT COMMENT '롤업 ID (증감 upsert마다 번호 소비)',
+  `file_id` INT NOT NULL COMMENT '파일 ID (배치는 tb_uploaded_file.batch_id로 합산)',
+  `stat_date` DATE COMMENT '접수일',
+  `channel` VARCHAR(64) COMMENT '채널',
+  `category_id` INT COMMENT '분류 카테고리 ID (NULL: 미분류)',
+  `status` VARCHAR(20) COMMENT '티켓 상태',
+  `ticket_count` INT DEFAULT 0 COMMENT '티켓 수',
+  `resolved_count` INT DEFAULT 0 COMMENT '처리 완료 티켓 수',
+  `confidence_sum` DOUBLE DEFAULT 0 COMMENT '분류 신뢰도 합계 (평균 = confidence_sum / ticket_count)',
+  `updated_at` DATETIME DEFAULT (NOW()) COMMENT '최근 갱신 시각',
+  INDEX idx_daily_rollup_file_date (file_id, stat_date),
+  UNIQUE KEY uk_daily_rollup_key (file_id, (COALESCE(stat_date, '1000-01-01')), (COALESCE(channel, '')), (COALESCE(category_id, 0)), (COALESCE(status, '')))
+) COMMENT '일별 채널×카테고리×상태 티켓 롤업 - 티켓 저장/분류 시 증감분만 반영 (ON DUPLICATE KEY UPDATE)';
+
 CREATE TABLE `tb_classification_result` (
   `class_result_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '분류 결과 ID',
   `file_id` INT COMMENT '분류 대상 파일 ID (단일 파일)',
@@ -166,6 +246,8 @@ CREATE TABLE `tb_analysis_report` (
   `file_path` VARCHAR(1024),
   `created_at` DATETIME DEFAULT (NOW()),
   `completed_at` DATETIME,
+  `stage_timings` JSON COMMENT '생성 단계별 실행 시간 (ms)',
+  `trend_resolution` VARCHAR(10) COMMENT '채널 추이 스냅샷 버킷 단위 (day, week, month)',
   INDEX idx_report_file_id (file_id),
   INDEX idx_report_batch_id (batch_id),
   INDEX idx_report_created_by (created_by),
@@ -178,7 +260,8 @@ CREATE TABLE `tb_analysis_channel_snapshot` (
   `channel` VARCHAR(64),
   `time_period` DATE,
   `category_id` INT,
-  `count` INT
+  `count` INT,
+  INDEX idx_channel_snapshot_report_id (report_id)
 );
 
 CREATE TABLE `tb_analysis_summary_snapshot` (
@@ -188,19 +271,50 @@ CREATE TABLE `tb_analysis_summary_snapshot` (
   `resolved_count` JSON,
   `category_ratios` JSON,
   `repeat_rate` FLOAT,
-  `created_at` DATETIME DEFAULT (NOW())
+  `summary_payload` JSON COMMENT '리포트 요약 섹션 원본 (카테고리 건수, 채널별 처리 현황)',
+  `created_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_summary_snapshot_report_id (report_id)
 );
 
 CREATE TABLE `tb_analysis_solution_snapshot` (
   `solution_id` INT PRIMARY KEY AUTO_INCREMENT,
   `report_id` INT,
   `solution_payload` JSON,
-  `created_at` DATETIME DEFAULT (NOW())
+  `created_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_solution_snapshot_report_id (report_id)
 );
 
 CREATE TABLE `tb_analysis_insight_snapshot` (
   `insight_id` INT PRIMARY KEY AUTO_INCREMENT,
   `report_id` INT,
   `insight_payload` JSON,
-  `created_at` DATETIME DEFAULT (NOW())
-);
\ No newline at end of file
+  `created_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_insight_snapshot_report_id (report_id)
+);
+
+CREATE TABLE `tb_retention_policy` (
+  `policy_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '보존 정책 ID',
+  `user_id` INT COMMENT '대상 사용자 ID (사용자 단위 정책)',
+  `batch_id` INT COMMENT '대상 배치 ID (배치 단위 정책, 사용자 정책보다 우선)',
+  `retention_days` INT NOT NULL COMMENT '업로드 후 보존 일수 (0 = 무기한)',
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  INDEX idx_retention_policy_user_id (user_id),
+  INDEX idx_retention_policy_batch_id (batch_id)
+) COMMENT '데이터 보존 정책 - 사용자/배치 단위 보존 기간';
+
+CREATE TABLE `tb_purge_job` (
+  `job_id` INT PRIMARY KEY AUTO_INCREMENT COMMENT '퍼지 작업 ID',
+  `target_type` VARCHAR(20) NOT NULL COMMENT '대상 유형: file, batch',
+  `target_id` INT NOT NULL COMMENT '대상 file_id 또는 batch_id',
+  `status` VARCHAR(20) DEFAULT 'pending' COMMENT '작업 상태: pending, running, completed, failed',
+  `current_step` VARCHAR(64) COMMENT '진행 중인 테이블 (재개 지점)',
+  `last_pk` INT COMMENT '진행 중인 테이블에서 마지막으로 삭제한 PK (재개 지점)',
+  `deleted_rows` INT DEFAULT 0 COMMENT '누적 삭제 행 수',
+  `error_message` TEXT,
+  `created_at` DATETIME DEFAULT (NOW()),
+  `updated_at` DATETIME DEFAULT (NOW()),
+  `completed_at` DATETIME,
+  UNIQUE KEY uk_purge_job_target (target_type, target_id),
+  INDEX idx_purge_job_status (status)
+) COMMENT '파일/배치 퍼지 작업 진행 상황 - 청크 단위 삭제 재개용';
\ No newline at end of file
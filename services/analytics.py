@@ -0,0 +1,212 @@
+from services.db.analytics_db import AnalyticsDB
+from services.db.archive_db import add_months
+from services.db.rollup_db import TicketRollupDB
+from utils.analytics_store import analytics_store, AnalyticsMirrorStale
+from utils.logger import get_logger
+from utils.task_graph import get_background_executor
+from config import Config
+from datetime import date
+from typing import Any, Dict, List
+import threading
+
+logger = get_logger(__name__)
+
+# 백그라운드 미러 갱신 직렬화 (같은 파일의 Parquet 임시 파일/교체가 겹치지 않도록 - 나중에 실행된 작업이 최신 DB 상태를 반영)
+_mirror_lock = threading.Lock()
+
+
+class AnalyticsService:
+    """컬럼형 분석 저장소 서비스 (Parquet 미러 동기화 + DuckDB 장기 분석)
+    
+    Note:
+        - 분류가 끝난 파일의 티켓을 파일 단위로 미러링 (재분류 시 해당 파일만 교체)
+        - 분석 쿼리는 Parquet만 읽으므로 MySQL에 부하를 주지 않음
+        - 분류 직후 미러 갱신은 백그라운드 스레드 풀에서 실행
+        - 조회 범위(사용자, 배치)에 미러 갱신 실패 대상이 남아 있으면 분석 조회는 AnalyticsMirrorStale 발생
+          (빈 결과 / 누락된 결과를 정상 응답처럼 반환하지 않음)
+    """
+    
+    def __init__(self):
+        self.analytics_db = AnalyticsDB()
+        self.store = analytics_store
+    
+    # ========================================
+    # 동기화
+    # ========================================
+    
+    def sync(self, file_id: int = None, batch_id: int = None) -> dict:
+        """
+        파일 또는 배치(소속 파일 전체)의 분류된 티켓을 분석 저장소로 동기화
+        
+        Returns:
+            dict: {'files': int, 'tickets': int}
+        """
+        if not file_id and not batch_id:
+            raise ValueError("file_id 또는 batch_id 중 하나는 반드시 제공되어야 합니다.")
+        
+        file_ids = TicketRollupDB().get_batch_file_ids(batch_id) if batch_id else [file_id]
+        result = self._sync_files(file_ids)
+        if batch_id:
+            self.store.clear_stale(f'batch_{batch_id}')
+        return result
+    
+    def sync_all(self) -> dict:
+        """분류된 티켓이 있는 모든 파일 동기화 (최초 구축 / 재구축용)"""
+        result = self._sync_files(self.analytics_db.get_classified_file_ids())
+        self.store.clear_stale()
+        return result
+    
+    def _sync_files(self, file_ids: List[int]) -> dict:
+        tickets = 0
+        for file_id in file_ids:
+            rows = self.analytics_db.get_file_tickets(file_id)
+            if rows:
+                tickets += self.store.write_file_tickets(file_id, rows)
+            else:
+                self.store.remove_file(file_id)
+            self.store.clear_stale(f'file_{file_id}')
+        return {'files': len(file_ids), 'tickets': tickets}
+    
+    def mirror_classification(self, user_id: int, file_id: int = None, batch_id: int = None):
+        """분류 실행 직후 미러 갱신을 백그라운드 스레드 풀에 제출 (분류 응답을 기다리게 하지 않음)
+        
+        Note:
+            실패해도 분류 결과에는 영향 없음. 대신 대상을 갱신 실패로 표시하여
+            analytics-sync로 복구할 때까지 해당 사용자/배치의 분석 조회가 오류를 반환하도록 함
+        """
+        if not Config.ANALYTICS_MIRROR:
+            return
+        get_background_executor().submit(self._mirror, user_id, file_id, batch_id)
+    
+    def _mirror(self, user_id: int, file_id: int = None, batch_id: int = None):
+        try:
+            with _mirror_lock:
+                self.sync(file_id, batch_id)
+        except Exception as e:
+            target = f'batch_{batch_id}' if batch_id else f'file_{file_id}'
+            logger.error(f"분석 저장소 동기화 실패: {target} (analytics-sync로 복구 필요): {e}", exc_info=True)
+            # 파일 단위 분류는 소속 배치를 모르므로 batch_id 없이 표시 (해당 사용자의 모든 배치 조회에 적용)
+            self.store.mark_stale(target, user_id=user_id, batch_id=batch_id)
+    
+    def _ensure_fresh(self, user_id: int, batch_ids: List[int] = None):
+        """조회 범위(사용자, 배치)에 미러 갱신 실패 대상이 있으면 AnalyticsMirrorStale 발생"""
+        stale = [
+            target for target, marker in self.store.stale_markers().items()
+            if marker.get('user_id') in (None, user_id)
+            and (not batch_ids or marker.get('batch_id') is None or marker.get('batch_id') in batch_ids)
+        ]
+        if stale:
+            raise AnalyticsMirrorStale(
+                f"분석 저장소 동기화에 실패한 대상이 있습니다: {', '.join(stale)} (analytics-sync 실행 필요)"
+            )
+    
+    def remove_file(self, file_id: int):
+        """삭제된 파일의 미러 제거"""
+        self.store.remove_file(file_id)
+    
+    # ========================================
+    # 분석
+    # ========================================
+    
+    @staticmethod
+    def _filters(user_id: int, months: int, batch_ids: List[int] = None, today: date = None):
+        """공통 WHERE 조건 (month 파티션 조건으로 읽을 파일을 먼저 제한)"""
+        since = add_months(today or date.today(), -(months - 1))
+        where = "user_id = ? AND month >= ? AND month <> 'none' AND received_at >= ?"
+        params: List[Any] = [user_id, since.strftime('%Y-%m'), since]
+        
+        if batch_ids:
+            where += f" AND batch_id IN ({', '.join(['?'] * len(batch_ids))})"
+            params.extend(batch_ids)
+        return where, params
+    
+    def category_share_by_month(self, user_id: int, months: int = 24,
+                                batch_ids: List[int] = None, today: date = None) -> Dict[str, Any]:
+        """
+        월별 카테고리 비중 (여러 배치 / 장기간)
+        
+        Returns:
+            dict: {
+                'months': ['2024-11', ...],
+                'categories': ['배송', ...],  # 전체 건수 내림차순
+                'counts': [[월별 건수], ...],  # categories 순서
+                'percentages': [[월별 비중], ...],
+                'totals': [월별 전체 건수]
+            }
+        """
+        self._ensure_fresh(user_id, batch_ids)
+        where, params = self._filters(user_id, months, batch_ids, today)
+        rows = self.store.query(f"""
+            SELECT
+                month,
+                COALESCE(category_name, '기타') as category_name,
+                COUNT(*) as count,
+                ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (PARTITION BY month), 1) as percentage
+            FROM tickets
+            WHERE {where}
+            GROUP BY month, COALESCE(category_name, '기타')
+            ORDER BY month
+        """, params)
+        
+        month_list = sorted({row['month'] for row in rows})
+        totals_by_category: Dict[str, int] = {}
+        for row in rows:
+            totals_by_category[row['category_name']] = totals_by_category.get(row['category_name'], 0) + row['count']
+        categories = sorted(totals_by_category, key=lambda name: (-totals_by_category[name], name))
+        
+        month_index = {month: i for i, month in enumerate(month_list)}
+        category_index = {name: i for i, name in enumerate(categories)}
+        counts = [[0] * len(month_list) for _ in categories]
+        percentages = [[0.0] * len(month_list) for _ in categories]
+        totals = [0] * len(month_list)
+        
+        for row in rows:
+            i, j = category_index[row['category_name']], month_index[row['month']]
+            counts[i][j] = row['count']
+            percentages[i][j] = float(row['percentage'])
+            totals[j] += row['count']
+        
+        return {
+            'months': month_list,
+            'categories': categories,
+            'counts': counts,
+            'percentages': percentages,
+            'totals': totals
+        }
+    
+    def product_breakdown(self, user_id: int, months: int = 24, batch_ids: List[int] = None,
+                          limit: int = 20, today: date = None) -> List[Dict[str, Any]]:
+        """
+        제품별 문의 건수 / 해결률 / 카테고리 구성
+        
+        Returns:
+            list: [{'product_code', 'total', 'resolved', 'resolution_rate',
+                    'categories': [{'category_name', 'count'}, ...]}, ...]  # 건수 내림차순 상위 limit개
+        """
+        self._ensure_fresh(user_id, batch_ids)
+        where, params = self._filters(user_id, months, batch_ids, today)
+        rows = self.store.query(f"""
+            SELECT
+                COALESCE(NULLIF(product_code, ''), '미지정') as product_code,
+                COALESCE(category_name, '기타') as category_name,
+                COUNT(*) as count,
+                SUM(CASE WHEN status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END) as resolved
+            FROM tickets
+            WHERE {where}
+            GROUP BY 1, 2
+        """, params)
+        
+        products: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            product = products.setdefault(row['product_code'], {
+                'product_code': row['product_code'], 'total': 0, 'resolved': 0, 'categories': []
+            })
+            product['total'] += row['count']
+            product['resolved'] += int(row['resolved'])
+            product['categories'].append({'category_name': row['category_name'], 'count': row['count']})
+        
+        result = sorted(products.values(), key=lambda p: (-p['total'], p['product_code']))[:limit]
+        for product in result:
+            product['resolution_rate'] = round(product['resolved'] / product['total'] * 100, 1)
+            product['categories'].sort(key=lambda c: (-c['count'], c['category_name']))
+        return result
@@ -0,0 +1,55 @@
+from services.db.archive_db import ArchiveDB, month_start, next_month, add_months
+from utils.logger import get_logger
+from config import Config
+from datetime import date
+
+logger = get_logger(__name__)
+
+
+class TicketArchiveService:
+    """티켓 hot/cold 티어 유지보수 서비스
+    
+    Note:
+        - 접수월(received_at) 기준 월 단위 파티션으로 관리
+        - 보관 기간(ARCHIVE_AFTER_MONTHS)이 지난 파티션을 tb_ticket_archive로 이동
+        - 이동 내역은 tb_ticket_archive_log에 기록되어 ReportDB 쿼리 라우터가 참조
+    """
+    
+    def __init__(self):
+        self.archive_db = ArchiveDB()
+    
+    def roll_partitions(self, archive_after_months: int = None, today: date = None) -> dict:
+        """보관 기간이 지난 파티션을 아카이브로 롤링
+        
+        Args:
+            archive_after_months: hot 테이블 보관 개월 수 (기본값 Config.ARCHIVE_AFTER_MONTHS)
+            today: 기준일 (기본값 오늘)
+        
+        Returns:
+            dict: {'cutoff': str, 'partitions': int, 'tickets': int}
+        """
+        months = archive_after_months if archive_after_months is not None else Config.ARCHIVE_AFTER_MONTHS
+        cutoff = add_months(today or date.today(), -months)
+        logger.info(f"티켓 아카이브 롤링 시작: {months}개월 보관, cutoff={cutoff}")
+        
+        partitions = 0
+        tickets = 0
+        
+        for candidate in self.archive_db.get_archive_candidates(cutoff):
+            file_id = candidate['file_id']
+            current = month_start(candidate['first_received'])
+            
+            # 월 단위로 이동 (트랜잭션 크기 제한)
+            while current < cutoff:
+                moved = self.archive_db.archive_partition(file_id, current)
+                if moved:
+                    partitions += 1
+                    tickets += moved
+                current = next_month(current)
+        
+        logger.info(f"티켓 아카이브 롤링 완료: 파티션 {partitions}개, 티켓 {tickets}건")
+        return {
+            'cutoff': cutoff.isoformat(),
+            'partitions': partitions,
+            'tickets': tickets
+        }
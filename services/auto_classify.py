@@ -1,5 +1,9 @@
-from services.db.auto_classify_db import AutoClassifyDB
-from utils.classifiers import RuleBasedClassifier, AIClassifier
+from services.db.auto_classify_db import AutoClassifyDB, TICKET_SORT_KEYS
+from services.analytics import AnalyticsService
+from services.rule_set import RuleSetService
+from utils.classifiers import RuleBasedClassifier, AIClassifier, ONNXClassifier, EmbeddingClassifier, CascadeClassifier, DedupClassifier
+from config import Config
+from utils.classification_stats import ClassificationAggregator
 from utils.logger import get_logger
 from datetime import datetime
 from collections import defaultdict
@@ -15,7 +19,8 @@ class AutoClassifyService:
         self.db = AutoClassifyDB()
         self.classifier = None  # 지연 초기화
     
-    def run_classification(self, user_id: int, file_id: int = None, batch_id: int = None, use_ai: bool = False) -> dict:
+    def run_classification(self, user_id: int, file_id: int = None, batch_id: int = None, use_ai: bool = False,
+                           engine: str = None) -> dict:
         """
         자동분류 실행 (단일 파일 또는 배치)
         
@@ -23,7 +28,8 @@ class AutoClassifyService:
             user_id: 사용자 ID
             file_id: 파일 ID (단일 파일 분류)
             batch_id: 배치 ID (배치 분류)
-            use_ai: AI 분류 엔진 사용 여부
+            use_ai: AI 분류 엔진 사용 여부 (engine 미지정 시)
+            engine: 'rule' | 'ai' | 'cascade' (규칙 기반 → 신뢰도 낮은 티켓만 AI)
             
         Note:
             file_id와 batch_id 중 하나는 반드시 제공되어야 함
@@ -50,23 +56,36 @@ class AutoClassifyService:
             # ============================================================
             # 분류기 초기화 (사용자 선택에 따라 분기)
             # ============================================================
-            if use_ai:
+            if engine is None:
+                engine = 'ai' if use_ai else 'rule'
+            
+            # 규칙 세트 (DB 규칙, 재조회 간격마다 갱신 / 버전은 engine_name과 티켓에 기록)
+            rule_set = RuleSetService().get_active()
+            
+            if engine in ('ai', 'cascade'):
                 # AI 기반 분류기
-                logger.info("🤖 AI 기반 분류 엔진 사용 (Hugging Face)")
                 try:
-                    self.classifier = AIClassifier(
-                        model_name='facebook/bart-large-mnli',  # 경량화 모델 (메모리 효율적)
-                        category_mapping=category_mapping
-                    )
+                    ai_classifier = self._create_ai_classifier(category_mapping)
+                    if Config.NEAR_DUPLICATE_CLUSTERING:
+                        # 근사 중복 클러스터당 대표 티켓만 AI 분류
+                        ai_classifier = DedupClassifier(ai_classifier)
                 except (ImportError, OSError) as e:
                     logger.error(f"AI 모델 로딩 실패: {e}")
                     logger.info("📝 규칙 기반 분류 엔진으로 대체")
-                    self.classifier = RuleBasedClassifier(category_mapping)
-                    use_ai = False  # 실제로는 규칙 기반 사용
+                    ai_classifier = None
+                
+                if ai_classifier is None:
+                    self.classifier = RuleBasedClassifier(category_mapping, rule_set)  # 실제로는 규칙 기반 사용
+                elif engine == 'cascade':
+                    # 규칙 기반으로 전체 분류 후 신뢰도 낮은 티켓만 AI 재분류
+                    logger.info("🔀 단계형 분류 엔진 사용 (규칙 기반 → AI)")
+                    self.classifier = CascadeClassifier(RuleBasedClassifier(category_mapping, rule_set), ai_classifier)
+                else:
+                    self.classifier = ai_classifier
             else:
                 # 규칙 기반 분류기
                 logger.info("📝 규칙 기반 분류 엔진 사용")
-                self.classifier = RuleBasedClassifier(category_mapping)
+                self.classifier = RuleBasedClassifier(category_mapping, rule_set)
             # ============================================================
             
             # 2. 티켓 조회 (파일 또는 배치)
@@ -81,56 +100,35 @@ class AutoClassifyService:
             
             logger.info(f"티켓 {len(tickets)}건 조회 완료")
             
-            # 3. 티켓 분류 및 DB 저장
-            classification_results = []
-            for ticket in tickets:
-                result = self.classifier.classify_ticket(ticket)
-                classification_results.append({
-                    'ticket_id': ticket['ticket_id'],
-                    'classification': result
-                })
+            # 3. 티켓 분류 및 DB 저장 (집계는 같은 루프에서 단일 패스로 누적)
+            # (규칙 기반 엔진은 classify_frame으로 컬럼 단위 일괄 분류)
+            aggregate = ClassificationAggregator()
+            batch_results = self.classifier.classify_batch(tickets)
+            updates = []
+            for ticket, result in zip(tickets, batch_results):
+                aggregate.add(ticket, result)
+                updates.append((ticket['ticket_id'], result))
                 
-                # 티켓 테이블에 분류 결과 업데이트
-                self.db.update_ticket_classification(ticket['ticket_id'], result)
-            
-            logger.info(f"티켓 분류 완료: {len(classification_results)}건")
+            # 티켓 테이블에 분류 결과 업데이트 (일별 롤업 증감 포함)
+            self.db.update_ticket_classifications(updates)
             
-            # 4. 기간 계산
-            dates = [t['received_at'] for t in tickets if t.get('received_at')]
-            period_from = min(dates).date() if dates else None
-            period_to = max(dates).date() if dates else None
-            
-            # 5. 분류 결과 메타 정보 저장 (배치 지원)
-            class_result_id = self.db.insert_classification_result({
-                'file_id': file_id,
-                'batch_id': batch_id,  # 배치 ID 추가
-                'user_id': user_id,
-                'engine_name': self.classifier.get_engine_name(),
-                'total_tickets': len(tickets),
-                'period_from': period_from,
-                'period_to': period_to,
-                'classified_at': datetime.now(),
-                'needs_review': False
-            })
+            logger.info(f"티켓 분류 완료: {aggregate.total}건")
             
-            # 6. 집계 데이터 계산
-            category_stats = self._calculate_category_stats(tickets, classification_results, category_mapping)
-            channel_stats = self._calculate_channel_stats(tickets, classification_results)
-            reliability_stats = self._calculate_reliability_stats(classification_results)
+            # 일별 롤업은 티켓 갱신 시 증감 반영됨 - 분석 미러만 갱신
+            AnalyticsService().mirror_classification(user_id, file_id, batch_id)
             
-            # 7. 집계 데이터 DB 저장
-            self.db.insert_category_results(class_result_id, category_stats)
-            self.db.insert_channel_results(class_result_id, channel_stats)
-            self.db.insert_reliability_result(class_result_id, reliability_stats)
+            # 4~7. 분류 결과 메타 정보/집계 저장
+            saved = self.save_classification(
+                user_id, file_id, batch_id, aggregate,
+                category_mapping, self.classifier.get_engine_name()
+            )
             
             # 8. 프론트엔드 응답 생성 (배치 지원)
             response = self._build_response(
-                class_result_id, user_id, file_id, batch_id,
-                period_from, period_to,
-                tickets, classification_results,
-                category_stats, channel_stats, reliability_stats,
-                category_mapping
+                saved['class_result_id'], user_id, file_id, batch_id,
+                aggregate, saved, category_mapping
             )
+            class_result_id = saved['class_result_id']
             
             logger.info(f"자동분류 완료: user_id={user_id}, {target_type}_id={target_id}, class_result_id={class_result_id}")
             return response
@@ -139,121 +137,148 @@ class AutoClassifyService:
             logger.error(f"자동분류 실행 실패: {e}", exc_info=True)
             raise
     
-    def _calculate_category_stats(self, tickets: List[Dict], classifications: List[Dict], 
-                                   category_mapping: Dict[int, str]) -> List[Dict[str, Any]]:
-        """카테고리별 집계 계산"""
-        category_counts = defaultdict(int)
-        category_keywords = defaultdict(set)
-        
-        for item in classifications:
-            cls = item['classification']
-            cat_id = cls['category_id']
-            category_counts[cat_id] += 1
-            
-            # 키워드 수집
-            for kw in cls.get('keywords', []):
-                category_keywords[cat_id].add(kw)
-        
-        total = len(tickets)
-        results = []
-        
-        for cat_id, count in category_counts.items():
-            results.append({
-                'category_id': cat_id,
-                'category_name': category_mapping.get(cat_id, '알 수 없음'),
-                'count': count,
-                'ratio': round(count / total, 6) if total > 0 else 0,
-                'keywords': list(category_keywords[cat_id])[:10]  # 상위 10개
-            })
+    def reclassify_rules(self, user_id: int, file_id: int = None, batch_id: int = None) -> dict:
+        """
+        규칙 세트 변경 후 선택적 재분류 (규칙 기반으로 결정된 티켓 중 버전이 다른 것만)
         
-        # count 기준 내림차순 정렬
-        results.sort(key=lambda x: x['count'], reverse=True)
+        Args:
+            user_id: 사용자 ID
+            file_id / batch_id: 재분류 대상 (둘 중 하나)
         
-        return results
-    
-    def _calculate_channel_stats(self, tickets: List[Dict], classifications: List[Dict]) -> List[Dict[str, Any]]:
-        """채널별 카테고리 분포 집계"""
-        # channel + category_id 조합별 카운트
-        channel_category_counts = defaultdict(lambda: defaultdict(int))
-        channel_totals = defaultdict(int)
-        
-        ticket_map = {t['ticket_id']: t for t in tickets}
-        
-        for item in classifications:
-            ticket_id = item['ticket_id']
-            ticket = ticket_map.get(ticket_id)
-            if not ticket:
-                continue
-            
-            channel = ticket.get('channel') or '알 수 없음'
-            cat_id = item['classification']['category_id']
-            
-            channel_category_counts[channel][cat_id] += 1
-            channel_totals[channel] += 1
+        Returns:
+            dict: {'class_result_id', 'rule_version', 'total_tickets', 'reclassified'}
+        
+        Note:
+            - AI 단계에서 결정된 티켓은 규칙 변경의 영향을 받지 않으므로 그대로 유지
+            - 집계는 저장된 분류 결과 전체로 다시 계산하여 새 분류 결과로 저장
+        """
+        if not file_id and not batch_id:
+            raise ValueError("file_id 또는 batch_id 중 하나는 반드시 제공되어야 합니다.")
         
-        # 결과 리스트 생성
-        results = []
-        total_all = sum(channel_totals.values())
+        category_mapping = self.db.get_category_mapping()
+        rule_set = RuleSetService().get_active(force=True)
+        self.classifier = RuleBasedClassifier(category_mapping, rule_set)
         
-        for channel, category_counts in channel_category_counts.items():
-            channel_total = channel_totals[channel]
-            
-            for cat_id, count in category_counts.items():
-                results.append({
-                    'channel': channel,
-                    'category_id': cat_id,
-                    'count': count,
-                    'ratio': round(count / channel_total, 6) if channel_total > 0 else 0
-                })
-        
-        return results
+        tickets = self.db.get_tickets_with_classification(file_id, batch_id)
+        stale = [
+            ticket for ticket in tickets
+            if ticket['classification_stage'] in (None, 'rule')
+            and ticket['classification_rule_version'] != rule_set.version
+        ]
+        logger.info(f"규칙 재분류 대상: {len(stale)}/{len(tickets)}건 (rule_version={rule_set.version})")
+        
+        results = {}
+        for ticket, result in zip(stale, self.classifier.classify_batch(stale)):
+            results[ticket['ticket_id']] = result
+        self.db.update_ticket_classifications(list(results.items()))
+        
+        if stale:
+            AnalyticsService().mirror_classification(user_id, file_id, batch_id)
+        
+        aggregate = ClassificationAggregator()
+        for ticket in tickets:
+            classification = results.get(ticket['ticket_id'])
+            if classification is None:
+                if ticket['classified_category_id'] is None:
+                    continue
+                classification = {
+                    'category_id': ticket['classified_category_id'],
+                    'category_name': category_mapping.get(ticket['classified_category_id']),
+                    'confidence': ticket['classification_confidence'],
+                    'keywords': ticket['classification_keywords'] or [],
+                    'stage': ticket['classification_stage'] or 'rule'
+                }
+                if ticket['duplicate_cluster_id'] is not None:
+                    classification['cluster_id'] = ticket['duplicate_cluster_id']
+            aggregate.add(ticket, classification)
+        
+        saved = self.save_classification(
+            user_id, file_id, batch_id, aggregate,
+            category_mapping, self.classifier.get_engine_name()
+        )
+        
+        return {
+            'class_result_id': saved['class_result_id'],
+            'rule_version': rule_set.version,
+            'total_tickets': aggregate.total,
+            'reclassified': len(stale)
+        }
     
-    def _calculate_reliability_stats(self, classifications: List[Dict]) -> Dict[str, Any]:
-        """신뢰도 통계 계산 (규칙 기반에 맞는 실제 지표)"""
-        confidences = [item['classification']['confidence'] for item in classifications]
-        total = len(confidences)
-        
-        if total == 0:
-            return {
-                'total_tickets': 0,
-                'average_confidence': 0.0,
-                'high_confidence_count': 0,
-                'medium_confidence_count': 0,
-                'low_confidence_count': 0,
-                'needs_review_count': 0
-            }
+    def save_classification(self, user_id: int, file_id: int, batch_id: int,
+                            aggregate: ClassificationAggregator,
+                            category_mapping: Dict[int, str], engine_name: str) -> Dict[str, Any]:
+        """
+        분류 결과 메타 정보와 집계 저장 (자동분류 실행 / 업로드 중 분류 공용)
+        
+        Args:
+            aggregate: 분류 결과를 누적한 집계기 (샤드별 집계기는 merge 후 전달)
+        
+        Returns:
+            dict: class_result_id, period_from, period_to, category_stats, channel_stats, reliability_stats
+        """
+        # 4. 기간 계산
+        period_from, period_to = aggregate.period()
+        
+        # 5. 분류 결과 메타 정보 저장 (배치 지원)
+        class_result_id = self.db.insert_classification_result({
+            'file_id': file_id,
+            'batch_id': batch_id,  # 배치 ID 추가
+            'user_id': user_id,
+            'engine_name': engine_name,
+            'total_tickets': aggregate.total,
+            'period_from': period_from,
+            'period_to': period_to,
+            'classified_at': datetime.now(),
+            'needs_review': False
+        })
         
-        # 평균 신뢰도
-        avg_confidence = sum(confidences) / total
+        # 6. 집계 데이터 계산
+        category_stats = aggregate.category_stats(category_mapping)
+        channel_stats = aggregate.channel_stats()
+        reliability_stats = aggregate.reliability_stats()
         
-        # 신뢰도 분포 계산
-        high_conf = sum(1 for c in confidences if c >= 0.8)      # 80% 이상: 높음
-        medium_conf = sum(1 for c in confidences if 0.7 <= c < 0.8)  # 70~80%: 중간
-        low_conf = sum(1 for c in confidences if c < 0.7)        # 70% 미만: 낮음
+        # 7. 집계 데이터 DB 저장
+        self.db.insert_category_results(class_result_id, category_stats)
+        self.db.insert_channel_results(class_result_id, channel_stats)
+        self.db.insert_reliability_result(class_result_id, reliability_stats)
         
         return {
-            'total_tickets': total,
-            'average_confidence': round(avg_confidence, 3),
-            'high_confidence_count': high_conf,
-            'high_confidence_ratio': round(high_conf / total, 3),
-            'medium_confidence_count': medium_conf,
-            'medium_confidence_ratio': round(medium_conf / total, 3),
-            'low_confidence_count': low_conf,
-            'low_confidence_ratio': round(low_conf / total, 3),
-            'needs_review_count': low_conf  # 재검토 필요 (신뢰도 낮은 것)
+            'class_result_id': class_result_id,
+            'period_from': period_from,
+            'period_to': period_to,
+            'category_stats': category_stats,
+            'channel_stats': channel_stats,
+            'reliability_stats': reliability_stats
         }
     
+    def _create_ai_classifier(self, category_mapping: Dict[int, str]):
+        """AI 분류기 생성 (AI_BACKEND: torch(기본) | onnx(ONNX Runtime int8) | embedding(임베딩 nearest-centroid))"""
+        logger.info(f"🤖 AI 기반 분류 엔진 사용 (Hugging Face, backend={Config.AI_BACKEND})")
+        
+        if Config.AI_BACKEND == 'embedding':
+            examples = (self.db.get_labelled_examples(Config.EMBEDDING_HISTORY_EXAMPLES)
+                        if Config.EMBEDDING_HISTORY_EXAMPLES > 0 else None)
+            return EmbeddingClassifier(
+                model_name=Config.EMBEDDING_MODEL_NAME,
+                category_mapping=category_mapping,
+                examples=examples
+            )
+        
+        ai_classifier_class = ONNXClassifier if Config.AI_BACKEND == 'onnx' else AIClassifier
+        return ai_classifier_class(
+            model_name=Config.AI_MODEL_NAME,  # 기본값: facebook/bart-large-mnli
+            category_mapping=category_mapping
+        )
+    
     def _build_response(self, class_result_id: int, user_id: int, file_id: int, batch_id: int,
-                       period_from, period_to,
-                       tickets: List[Dict], classifications: List[Dict],
-                       category_stats: List[Dict], channel_stats: List[Dict],
-                       reliability_stats: Dict[str, Any],
+                       aggregate: ClassificationAggregator, saved: Dict[str, Any],
                        category_mapping: Dict[int, str]) -> Dict[str, Any]:
         """프론트엔드 응답 JSON 생성 (배치 지원)"""
+        period_from, period_to = saved['period_from'], saved['period_to']
         
         # 카테고리 정보
         category_info = []
-        for stat in category_stats:
+        for stat in saved['category_stats']:
             category_info.append({
                 'category': stat['category_name'],
                 'count': stat['count'],
@@ -262,12 +287,7 @@ class AutoClassifyService:
             })
         
         # 채널별 정보
-        channel_info = self._build_channel_info(channel_stats, category_mapping)
-        
-        # 티켓 샘플 (카테고리별 상위 3개)
-        tickets_by_category = self._get_top_tickets_by_category(
-            tickets, classifications, category_mapping
-        )
+        channel_info = self._build_channel_info(saved['channel_stats'], category_mapping)
         
         return {
             'return_code': 1,
@@ -280,7 +300,7 @@ class AutoClassifyService:
                 'user_id': user_id,
                 'file_id': file_id,
                 'batch_id': batch_id,  # 배치 ID 추가
-                'total_tickets': len(tickets),
+                'total_tickets': aggregate.total,
                 'classified_at': datetime.now().isoformat(),
                 'engine_name': self.classifier.get_engine_name()
             },
@@ -298,9 +318,11 @@ class AutoClassifyService:
             },
             'category_info': category_info,
             'channel_info': channel_info,
-            'reliability_info': reliability_stats,
+            'reliability_info': saved['reliability_stats'],
             'tickets': {
-                'all_by_category': tickets_by_category  # top3 → all로 변경
+                # 티켓 목록은 GET /api/classifications/tickets?class_result_id= 로 페이지 단위 조회
+                'total': aggregate.total,
+                'page_size': Config.TICKET_PAGE_SIZE
             }
         }
     
@@ -335,39 +357,61 @@ class AutoClassifyService:
         
         return result
     
-    def _get_top_tickets_by_category(self, tickets: List[Dict], classifications: List[Dict],
-                                     category_mapping: Dict[int, str]) -> Dict[str, List[Dict]]:
-        """카테고리별 모든 티켓 반환 (전체 표시)"""
-        ticket_map = {t['ticket_id']: t for t in tickets}
-        
-        # 카테고리별 티켓 그룹화
-        by_category = defaultdict(list)
-        
-        for item in classifications:
-            ticket_id = item['ticket_id']
-            ticket = ticket_map.get(ticket_id)
-            if not ticket:
-                continue
-            
-            cls = item['classification']
-            cat_name = category_mapping.get(cls['category_id'], '알 수 없음')
-            
-            by_category[cat_name].append({
-                'received_at': ticket.get('received_at').strftime('%Y-%m-%d') if ticket.get('received_at') else '-',
-                'channel': ticket.get('channel') or '-',
-                'content': ticket.get('body') or '',
-                'preview': (ticket.get('body') or '')[:15] + '...' if ticket.get('body') else '',
-                'category': cat_name,
-                'keywords': cls.get('keywords', [])[:3],
-                'confidence': self._calculate_importance(cls['confidence'])
-            })
+    def list_tickets(self, class_result_id: int, filters: Dict[str, Any] = None, sort: str = 'date-desc',
+                     cursor: int = None, limit: int = None) -> Dict[str, Any]:
+        """
+        분류 결과의 티켓 목록 페이지 조회 (keyset 페이지네이션)
         
-        # 모든 티켓 반환 (상위 3개 제한 제거)
-        result = {}
-        for cat_name, ticket_list in by_category.items():
-            result[cat_name] = ticket_list  # [:3] 제거 - 전체 표시
+        Args:
+            class_result_id: 분류 결과 ID
+            filters: category(이름) 또는 category_id, channel, min_confidence, max_confidence,
+                     received_from, search
+            sort: 'date-desc' | 'date-asc' | 'confidence-desc' | 'confidence-asc' | 'category' | 'channel'
+            cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+            limit: 페이지 크기 (기본값 Config.TICKET_PAGE_SIZE, 최대 Config.TICKET_PAGE_MAX)
         
-        return result
+        Returns:
+            {'items', 'next_cursor', 'total'(첫 페이지만), 'limit'} / 분류 결과가 없으면 None
+        """
+        target = self.db.get_classification_target(class_result_id)
+        if not target:
+            return None
+        
+        filters = dict(filters or {})
+        if filters.get('category') and filters.get('category_id') is None:
+            reverse_mapping = {name: cat_id for cat_id, name in self.db.get_category_mapping().items()}
+            filters['category_id'] = reverse_mapping.get(filters['category'], -1)
+        
+        limit = min(limit or Config.TICKET_PAGE_SIZE, Config.TICKET_PAGE_MAX)
+        if sort not in TICKET_SORT_KEYS:
+            sort = 'date-desc'
+        
+        # limit + 1건 조회로 다음 페이지 존재 여부 판단
+        rows = self.db.get_classified_tickets_page(
+            target['file_id'], target['batch_id'], filters, sort, cursor, limit + 1
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        items = [{
+            'ticket_id': row['ticket_id'],
+            'received_at': row['received_at'].strftime('%Y-%m-%d') if row['received_at'] else '-',
+            'channel': row['channel'] or '-',
+            'preview': row['preview'] or '',
+            'category': row['category_name'] or '알 수 없음',
+            'keywords': row['keywords'],
+            'confidence': self._calculate_importance(row['confidence'])
+        } for row in rows]
+        
+        page = {
+            'items': items,
+            'next_cursor': rows[-1]['ticket_id'] if has_more else None,
+            'limit': limit
+        }
+        if not cursor:
+            page['total'] = self.db.count_classified_tickets(target['file_id'], target['batch_id'], filters)
+        
+        return page
     
     def _calculate_importance(self, confidence: float) -> str:
         """신뢰도 기반 중요도 계산"""
@@ -391,5 +435,5 @@ class AutoClassifyService:
             'category_info': [],
             'channel_info': [],
             'reliability_info': {},
-            'tickets': {'top3_by_category': {}}
+            'tickets': {'total': 0, 'page_size': Config.TICKET_PAGE_SIZE}
         }
@@ -0,0 +1,165 @@
+from services.db.report_db import ReportDB
+from services.db.upload_db import UploadDB
+from services.auto_classify import AutoClassifyService
+from services.archive import TicketArchiveService
+from utils.database import db_manager
+from utils.logger import get_logger
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+import decimal
+import math
+import random
+
+logger = get_logger(__name__)
+
+# 검사용 시드 데이터 구성 (채널 미기재는 업로드와 같이 NULL로 저장)
+PARITY_CHANNELS = ['전화', '이메일', '채팅', '게시판', None]
+PARITY_STATUSES = ['완료', 'closed', 'resolved', 'new', 'pending', None]
+PARITY_INQUIRY_TYPES = ['배송', '환불', '불량', '']
+PARITY_BODIES = ['택배 배송 지연 문의', '결제 취소 환불 요청', '제품 불량 파손', '쿠폰 할인 이벤트', '기타 문의']
+
+
+def diff_cs_data(expected: Any, actual: Any, path: str = 'cs_data') -> List[str]:
+    """
+    cs_data 두 개를 키 단위로 비교
+    
+    Note:
+        - 숫자는 값으로 비교 (int/float/Decimal 구분 없음, 부동소수 오차 허용)
+        - 채널 항목 리스트(channel_distribution 등)는 동률 정렬 순서가 쿼리마다 다르므로 채널명 순으로 맞춘 뒤 비교
+    
+    Returns:
+        List[str]: 불일치 항목 ('경로: 기존값 != 새 값'), 일치하면 빈 리스트
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        mismatches = []
+        for key in sorted(set(expected) | set(actual), key=str):
+            if key not in actual:
+                mismatches.append(f"{path}.{key}: 새 결과에 없음")
+            elif key not in expected:
+                mismatches.append(f"{path}.{key}: 기존 결과에 없음")
+            else:
+                mismatches.extend(diff_cs_data(expected[key], actual[key], f"{path}.{key}"))
+        return mismatches
+    
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: 항목 수 {len(expected)} != {len(actual)}"]
+        if all(isinstance(item, dict) and 'channel' in item for item in expected + actual):
+            expected = sorted(expected, key=lambda item: str(item['channel']))
+            actual = sorted(actual, key=lambda item: str(item['channel']))
+        mismatches = []
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            mismatches.extend(diff_cs_data(left, right, f"{path}[{index}]"))
+        return mismatches
+    
+    numbers = (int, float, decimal.Decimal)
+    if isinstance(expected, numbers) and isinstance(actual, numbers) \
+            and not isinstance(expected, bool) and not isinstance(actual, bool):
+        if math.isclose(float(expected), float(actual), rel_tol=1e-9, abs_tol=1e-9):
+            return []
+    elif expected == actual:
+        return []
+    
+    return [f"{path}: {expected!r} != {actual!r}"]
+
+
+class CSDataParityService:
+    """CS 분석 데이터 패리티 검사
+    
+    일별 롤업 단일 조회 빌더(_build_cs_analysis_data)와 원본 티켓(hot + archive) 6개 쿼리 빌더
+    (_build_cs_analysis_data_legacy)의 cs_data를 파일/배치 경로별로 비교
+    """
+    
+    def __init__(self):
+        self.report_db = ReportDB()
+    
+    def check(self, file_id: int = None, batch_id: int = None) -> Dict[str, Any]:
+        """
+        파일 또는 배치의 cs_data 비교
+        
+        Returns:
+            dict: {'target': 'file 1' | 'batch 1', 'total_tickets': int, 'mismatches': [...]}
+        """
+        if not file_id and not batch_id:
+            raise ValueError("file_id 또는 batch_id 중 하나는 반드시 제공되어야 합니다.")
+        
+        if batch_id:
+            target = f"batch {batch_id}"
+            class_result_id = self.report_db.get_latest_batch_classification_result(batch_id)
+        else:
+            target = f"file {file_id}"
+            class_result_id = self.report_db.get_latest_classification_result(file_id)
+        
+        if not class_result_id:
+            raise ValueError(f"{target}의 분류 결과가 없습니다.")
+        
+        expected = self.report_db._build_cs_analysis_data_legacy(class_result_id, file_id=file_id, batch_id=batch_id)
+        actual = self.report_db._build_cs_analysis_data(class_result_id, file_id=file_id, batch_id=batch_id)
+        mismatches = diff_cs_data(expected, actual)
+        
+        if mismatches:
+            logger.error(f"cs_data 패리티 불일치: {target}, {len(mismatches)}건")
+        return {'target': target, 'total_tickets': expected['total_tickets'], 'mismatches': mismatches}
+    
+    def seed_fixture(self, user_id: int, tickets_per_file: int = 300, seed: int = 43) -> Dict[str, Any]:
+        """
+        검사용 배치(파일 2개) 생성 → 규칙 기반 분류 → 오래된 접수월 아카이브
+        
+        Note:
+            - 채널 미기재(NULL), 처리 완료·미처리·NULL 상태, 아카이브 티어를 모두 포함
+            - 임베디드 SQLite 백엔드에서만 실행 (운영 DB에 검사 데이터를 쓰지 않음)
+        
+        Returns:
+            dict: {'batch_id': int, 'file_ids': [int, int]}
+        """
+        if db_manager.backend_name != 'sqlite':
+            raise RuntimeError("검사용 시드 데이터는 DB_BACKEND=sqlite 에서만 생성할 수 있습니다.")
+        
+        rng = random.Random(seed)
+        upload_db = UploadDB()
+        batch_id = upload_db.create_batch(user_id, 'cs_data parity fixture')
+        start = datetime(2023, 1, 1, 9, 0, 0)
+        
+        file_ids = []
+        for index in range(2):
+            file_id = upload_db.insert_file({
+                'user_id': user_id,
+                'original_filename': f'parity_{index + 1}.csv',
+                'storage_path': '',
+                'row_count': tickets_per_file,
+                'batch_id': batch_id
+            })
+            upload_db.insert_tickets([
+                {
+                    'file_id': file_id,
+                    'user_id': user_id,
+                    'received_at': start + timedelta(days=rng.randrange(900), minutes=rng.randrange(600)),
+                    'channel': rng.choice(PARITY_CHANNELS),
+                    'inquiry_type': rng.choice(PARITY_INQUIRY_TYPES),
+                    'body': rng.choice(PARITY_BODIES),
+                    'status': rng.choice(PARITY_STATUSES)
+                }
+                for _ in range(tickets_per_file)
+            ])
+            upload_db.update_file_status(file_id, 'processed')
+            file_ids.append(file_id)
+        
+        upload_db.complete_batch(batch_id)
+        
+        # 파일 경로는 파일별 분류 결과, 배치 경로는 배치 분류 결과 사용
+        classify_service = AutoClassifyService()
+        for file_id in file_ids:
+            classify_service.run_classification(user_id, file_id=file_id)
+        classify_service.run_classification(user_id, batch_id=batch_id)
+        
+        # 1년 이전 접수월은 아카이브 티어로 이동 (원본 티켓 상태 분포가 UNION 경로를 거치도록)
+        TicketArchiveService().roll_partitions(12, today=date(2025, 6, 1))
+        
+        return {'batch_id': batch_id, 'file_ids': file_ids}
+    
+    def check_seeded(self, user_id: int) -> List[Dict[str, Any]]:
+        """시드 데이터로 파일 경로(파일별)와 배치 경로 모두 비교"""
+        fixture = self.seed_fixture(user_id)
+        results = [self.check(file_id=file_id) for file_id in fixture['file_ids']]
+        results.append(self.check(batch_id=fixture['batch_id']))
+        return results
@@ -0,0 +1,80 @@
+from utils.database import db_manager
+from utils.logger import get_logger
+from services.db.archive_db import ACTIVE_FILE_CONDITION
+from typing import Dict, List, Any
+
+logger = get_logger(__name__)
+
+# 분석 저장소로 내보내는 티켓 컬럼 (hot/archive 티어 공통)
+_EXPORT_COLUMNS = """ticket_id, file_id, user_id, received_at, channel, product_code, inquiry_type, status,
+                classified_category_id, classification_confidence, classification_stage, classified_at"""
+
+
+class AnalyticsDB:
+    """분석 저장소(Parquet) 동기화용 티켓 조회 클래스"""
+    
+    def __init__(self):
+        self.db_manager = db_manager
+    
+    def get_file_tickets(self, file_id: int) -> List[Dict[str, Any]]:
+        """파일의 분류된 티켓 조회 (hot + archive, 배치 ID / 카테고리명 포함, 소프트 삭제된 파일은 빈 목록)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute(f"""
+                SELECT
+                    t.ticket_id,
+                    t.file_id,
+                    f.batch_id,
+                    t.user_id,
+                    t.received_at,
+                    t.channel,
+                    t.product_code,
+                    t.inquiry_type,
+                    t.status,
+                    t.classified_category_id as category_id,
+                    c.category_name,
+                    t.classification_confidence,
+                    t.classification_stage,
+                    t.classified_at
+                FROM (
+                    SELECT {_EXPORT_COLUMNS} FROM tb_ticket WHERE file_id = %s
+                    UNION ALL
+                    SELECT {_EXPORT_COLUMNS} FROM tb_ticket_archive WHERE file_id = %s
+                ) t
+                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
+                LEFT JOIN tb_category c ON c.category_id = t.classified_category_id
+                WHERE t.classified_category_id IS NOT NULL
+                  AND (f.is_deleted IS NULL OR f.is_deleted = FALSE)
+                ORDER BY t.ticket_id
+            """, (file_id, file_id))
+            return cursor.fetchall()
+        
+        except Exception as e:
+            logger.error(f"분석 저장소 티켓 조회 실패: file_id={file_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def get_classified_file_ids(self) -> List[int]:
+        """분류된 티켓이 있는 파일 ID 목록 (전체 동기화용, 소프트 삭제된 파일 제외)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute(f"""
+                SELECT file_id FROM tb_uploaded_file
+                WHERE {ACTIVE_FILE_CONDITION}
+                  AND (file_id IN (SELECT file_id FROM tb_ticket WHERE classified_category_id IS NOT NULL)
+                       OR file_id IN (SELECT file_id FROM tb_ticket_archive WHERE classified_category_id IS NOT NULL))
+            """)
+            return sorted(row['file_id'] for row in cursor.fetchall() if row['file_id'])
+        
+        except Exception as e:
+            logger.error(f"분석 저장소 동기화 대상 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
@@ -0,0 +1,241 @@
+from utils.database import db_manager
+from utils.logger import get_logger
+from typing import Dict, List, Any, Tuple
+from datetime import datetime, date
+
+logger = get_logger(__name__)
+
+# hot/archive 테이블 공통 컬럼 (archived_at 제외)
+TICKET_COLUMNS = """ticket_id, file_id, user_id, received_at, channel, customer_id, product_code,
+                inquiry_type, classified_category_id, classification_confidence,
+                classification_keywords, classified_at, classification_stage, duplicate_cluster_id,
+                classification_rule_version, title, body, assignee, status, created_at, updated_at, raw_data, sample_key"""
+
+# 소프트 삭제되지 않은 업로드 파일 조건 (tb_uploaded_file, 퍼지 전까지 조회에서 제외)
+ACTIVE_FILE_CONDITION = "(is_deleted IS NULL OR is_deleted = FALSE)"
+
+
+def to_date(value) -> date:
+    """date/datetime/'YYYY-MM-DD...' 문자열을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(str(value)[:10]).date()
+
+
+def month_start(value) -> date:
+    """해당 월의 1일"""
+    return to_date(value).replace(day=1)
+
+
+def next_month(value) -> date:
+    """다음 달 1일"""
+    current = month_start(value)
+    if current.month == 12:
+        return current.replace(year=current.year + 1, month=1)
+    return current.replace(month=current.month + 1)
+
+
+def add_months(value, months: int) -> date:
+    """월 단위 이동 (음수 허용, 결과는 해당 월 1일)"""
+    current = month_start(value)
+    index = current.year * 12 + (current.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def active_file_scope(file_id: int = None, batch_id: int = None, user_id: int = None) -> Tuple[str, List[Any]]:
+    """티켓 테이블(tb_ticket / tb_ticket_archive) WHERE 절용 조회 대상 조건 - 소프트 삭제된 파일 제외
+    
+    Returns:
+        tuple: (조건식, 파라미터)
+    """
+    if batch_id:
+        return (f"file_id IN (SELECT file_id FROM tb_uploaded_file WHERE batch_id = %s AND {ACTIVE_FILE_CONDITION})",
+                [batch_id])
+    if file_id:
+        return (f"file_id IN (SELECT file_id FROM tb_uploaded_file WHERE file_id = %s AND {ACTIVE_FILE_CONDITION})",
+                [file_id])
+    if user_id:
+        return (f"user_id = %s AND file_id IN (SELECT file_id FROM tb_uploaded_file WHERE {ACTIVE_FILE_CONDITION})",
+                [user_id])
+    return f"file_id IN (SELECT file_id FROM tb_uploaded_file WHERE {ACTIVE_FILE_CONDITION})", []
+
+
+def ticket_source(cursor, file_id: int = None, batch_id: int = None, user_id: int = None,
+                  start_date=None, end_date=None) -> Tuple[str, List[Any]]:
+    """조회 범위에 필요한 티켓 티어만 포함하는 FROM 절 테이블 표현식 반환
+    
+    - 아카이브 파티션 맵(tb_ticket_archive_log)에 해당 범위의 파티션이 없으면 tb_ticket(hot)만 조회
+    - 있으면 hot + 필요한 접수월 범위의 tb_ticket_archive를 UNION ALL
+    - 소프트 삭제된 파일의 티켓은 두 티어 모두 제외 (active_file_scope)
+    
+    Args:
+        cursor: dictionary 커서 (호출 측 연결 재사용)
+        file_id / batch_id / user_id: 조회 대상 (하나만 사용, 모두 없으면 전체)
+        start_date, end_date: 접수일 범위 (선택)
+    
+    Returns:
+        tuple: (테이블 표현식, 파라미터)
+            - tb_ticket 파생 테이블 또는 UNION ALL 파생 테이블 (별칭은 호출 측에서 지정)
+            - 파생 테이블은 두 티어 모두 조회 대상 조건을 포함 (외부 조건 push-down에 의존하지 않음)
+            - 파라미터는 FROM 절 위치이므로 호출 측 WHERE 파라미터보다 앞에 둠
+    """
+    query = """
+        SELECT MIN(l.partition_month) AS first_month, MAX(l.partition_month) AS last_month
+        FROM tb_ticket_archive_log l
+    """
+    conditions = []
+    params = []
+    
+    if batch_id:
+        query += " INNER JOIN tb_uploaded_file f ON f.file_id = l.file_id"
+        conditions.append("f.batch_id = %s")
+        params.append(batch_id)
+    elif file_id:
+        conditions.append("l.file_id = %s")
+        params.append(file_id)
+    elif user_id:
+        query += " INNER JOIN tb_uploaded_file f ON f.file_id = l.file_id"
+        conditions.append("f.user_id = %s")
+        params.append(user_id)
+    
+    if start_date:
+        conditions.append("l.partition_month >= %s")
+        params.append(month_start(start_date))
+    
+    if end_date:
+        conditions.append("l.partition_month <= %s")
+        params.append(to_date(end_date))
+    
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    
+    cursor.execute(query, params)
+    row = cursor.fetchone()
+    
+    scope, scope_params = active_file_scope(file_id=file_id, batch_id=batch_id, user_id=user_id)
+    
+    if not row or not row['first_month']:
+        return f"(SELECT {TICKET_COLUMNS} FROM tb_ticket WHERE {scope})", scope_params
+    
+    # 아카이브 파티션이 있는 접수월 범위만 cold 티어에서 조회
+    archive_from = month_start(row['first_month'])
+    archive_to = next_month(row['last_month'])
+    logger.debug(f"아카이브 티어 포함 조회: {archive_from} ~ {archive_to}")
+    
+    source = f"""(
+            SELECT {TICKET_COLUMNS} FROM tb_ticket
+            WHERE {scope}
+            UNION ALL
+            SELECT {TICKET_COLUMNS} FROM tb_ticket_archive
+            WHERE {scope} AND received_at >= %s AND received_at < %s
+        )"""
+    return source, scope_params + scope_params + [archive_from, archive_to]
+
+
+class ArchiveDB:
+    """티켓 아카이브(hot/cold 티어) 관련 데이터베이스 작업 클래스"""
+    
+    def __init__(self):
+        self.db_manager = db_manager
+    
+    def get_archive_candidates(self, cutoff: date) -> List[Dict[str, Any]]:
+        """아카이브 대상 파일 조회 (접수일이 cutoff 이전인 티켓이 hot 테이블에 남아있는 파일)
+        
+        Args:
+            cutoff: 이 날짜(월 1일) 이전 접수 티켓이 아카이브 대상
+        
+        Returns:
+            List[Dict]: [{'file_id': int, 'first_received': datetime}, ...]
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            query = """
+                SELECT file_id, MIN(received_at) AS first_received
+                FROM tb_ticket
+                WHERE received_at < %s
+                GROUP BY file_id
+                ORDER BY file_id
+            """
+            
+            cursor.execute(query, (cutoff,))
+            results = cursor.fetchall()
+            
+            logger.info(f"아카이브 대상 파일 {len(results)}개 조회 완료 (cutoff={cutoff})")
+            return results
+        
+        except Exception as e:
+            logger.error(f"아카이브 대상 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def archive_partition(self, file_id: int, partition_month: date) -> int:
+        """(파일, 접수월) 파티션 하나를 hot → archive로 이동 (단일 트랜잭션)
+        
+        Args:
+            file_id: 파일 ID
+            partition_month: 접수월 (매월 1일)
+        
+        Returns:
+            int: 이동된 티켓 수
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        range_start = month_start(partition_month)
+        range_end = next_month(partition_month)
+        
+        try:
+            # 1. archive로 복사
+            cursor.execute(f"""
+                INSERT INTO tb_ticket_archive ({TICKET_COLUMNS})
+                SELECT {TICKET_COLUMNS}
+                FROM tb_ticket
+                WHERE file_id = %s
+                  AND received_at >= %s
+                  AND received_at < %s
+            """, (file_id, range_start, range_end))
+            moved_count = cursor.rowcount
+            
+            if moved_count <= 0:
+                connection.rollback()
+                return 0
+            
+            # 2. hot에서 삭제
+            cursor.execute("""
+                DELETE FROM tb_ticket
+                WHERE file_id = %s
+                  AND received_at >= %s
+                  AND received_at < %s
+            """, (file_id, range_start, range_end))
+            
+            # 3. 파티션 맵 갱신 (UPDATE 후 없으면 INSERT)
+            cursor.execute("""
+                UPDATE tb_ticket_archive_log
+                SET ticket_count = ticket_count + %s, archived_at = %s
+                WHERE file_id = %s AND partition_month = %s
+            """, (moved_count, datetime.now(), file_id, range_start))
+            
+            if cursor.rowcount == 0:
+                cursor.execute("""
+                    INSERT INTO tb_ticket_archive_log
+                    (file_id, partition_month, ticket_count, archived_at)
+                    VALUES (%s, %s, %s, %s)
+                """, (file_id, range_start, moved_count, datetime.now()))
+            
+            connection.commit()
+            logger.info(f"파티션 아카이브 완료: file_id={file_id}, month={range_start}, {moved_count}건")
+            return moved_count
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"파티션 아카이브 실패: file_id={file_id}, month={range_start}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
@@ -1,34 +1,56 @@
 from utils.database import db_manager
 from utils.logger import get_logger
-from typing import Dict, List, Any, Optional
+from utils.report_cache import report_cache
+from services.db.archive_db import ticket_source
+from services.db.rollup_db import get_ticket_rollup_keys, add_reclassify_delta, apply_rollup_deltas
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 
 logger = get_logger(__name__)
 
+# 분류 결과 갱신 트랜잭션 1회당 티켓 수 (롤업 증감도 이 단위로 한 번에 반영)
+CLASSIFICATION_UPDATE_BATCH_SIZE = 500
+
+# 분류 티켓 목록 정렬 키: {이름: (정렬식, 방향)} - {t}는 테이블 별칭 자리 (NULL 가능한 컬럼은 COALESCE)
+TICKET_SORT_KEYS = {
+    'date-desc': ("COALESCE({t}received_at, '1000-01-01 00:00:00')", 'DESC'),
+    'date-asc': ("COALESCE({t}received_at, '1000-01-01 00:00:00')", 'ASC'),
+    'confidence-desc': ('{t}classification_confidence', 'DESC'),
+    'confidence-asc': ('{t}classification_confidence', 'ASC'),
+    'category': ('{t}classified_category_id', 'ASC'),
+    'channel': ("COALESCE({t}channel, '')", 'ASC')
+}
+
 class AutoClassifyDB:
-    """자동분류 관련 데이터베이스 작업 클래스"""
+    """자동분류 관련 데이터베이스 작업 클래스
+    
+    Note:
+        티켓 조회는 ticket_source로 hot + archive 티어를 함께 읽고, 분류 결과 갱신도 두 티어 모두에 적용
+        (롤업 / cs_data 합계와 분류·목록 대상 티켓이 일치하도록)
+    """
     
     def __init__(self):
         self.db_manager = db_manager
     
     def get_tickets_by_file(self, file_id: int) -> List[Dict[str, Any]]:
-        """파일 ID로 티켓 조회"""
+        """파일 ID로 티켓 조회 (hot + archive)"""
         connection = self.db_manager.get_connection()
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
+            source, source_params = ticket_source(cursor, file_id=file_id)
+            query = f"""
                 SELECT 
-                    ticket_id, file_id, user_id, received_at, channel,
-                    customer_id, product_code, inquiry_type, title, body,
-                    assignee, status, created_at
-                FROM tb_ticket
-                WHERE file_id = %s
-                ORDER BY received_at DESC
+                    t.ticket_id, t.file_id, t.user_id, t.received_at, t.channel,
+                    t.customer_id, t.product_code, t.inquiry_type, t.title, t.body,
+                    t.assignee, t.status, t.created_at
+                FROM {source} t
+                WHERE t.file_id = %s
+                ORDER BY t.received_at DESC
             """
             
-            cursor.execute(query, (file_id,))
+            cursor.execute(query, (*source_params, file_id))
             tickets = cursor.fetchall()
             
             logger.info(f"티켓 조회 완료: file_id={file_id}, {len(tickets)}건")
@@ -42,23 +64,24 @@ class AutoClassifyDB:
             connection.close()
     
     def get_tickets_by_batch(self, batch_id: int) -> List[Dict[str, Any]]:
-        """배치 ID로 티켓 조회 (배치에 속한 모든 파일의 티켓)"""
+        """배치 ID로 티켓 조회 (배치에 속한 모든 파일의 티켓, hot + archive)"""
         connection = self.db_manager.get_connection()
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
+            source, source_params = ticket_source(cursor, batch_id=batch_id)
+            query = f"""
                 SELECT 
                     t.ticket_id, t.file_id, t.user_id, t.received_at, t.channel,
                     t.customer_id, t.product_code, t.inquiry_type, t.title, t.body,
                     t.assignee, t.status, t.created_at
-                FROM tb_ticket t
+                FROM {source} t
                 INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
                 WHERE f.batch_id = %s
                 ORDER BY t.received_at DESC
             """
             
-            cursor.execute(query, (batch_id,))
+            cursor.execute(query, (*source_params, batch_id))
             tickets = cursor.fetchall()
             
             logger.info(f"배치 티켓 조회 완료: batch_id={batch_id}, {len(tickets)}건")
@@ -71,6 +94,45 @@ class AutoClassifyDB:
             cursor.close()
             connection.close()
     
+    def get_tickets_with_classification(self, file_id: int = None, batch_id: int = None) -> List[Dict[str, Any]]:
+        """파일/배치 티켓과 저장된 분류 결과 조회 (규칙 버전 기반 선택적 재분류용, hot + archive)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            source, source_params = ticket_source(cursor, file_id=file_id, batch_id=batch_id)
+            if batch_id:
+                where, target_id = "t.file_id IN (SELECT file_id FROM tb_uploaded_file WHERE batch_id = %s)", batch_id
+            else:
+                where, target_id = "t.file_id = %s", file_id
+            
+            query = f"""
+                SELECT 
+                    t.ticket_id, t.file_id, t.received_at, t.channel, t.inquiry_type, t.title, t.body,
+                    t.classified_category_id, t.classification_confidence, t.classification_keywords,
+                    t.classification_stage, t.duplicate_cluster_id, t.classification_rule_version
+                FROM {source} t
+                WHERE {where}
+                ORDER BY t.received_at DESC
+            """
+            
+            cursor.execute(query, (*source_params, target_id))
+            tickets = cursor.fetchall()
+            
+            for ticket in tickets:
+                keywords = ticket['classification_keywords']
+                if isinstance(keywords, (str, bytes)):
+                    ticket['classification_keywords'] = json.loads(keywords)
+            
+            return tickets
+        
+        except Exception as e:
+            logger.error(f"분류 결과 포함 티켓 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
     def get_latest_batch_id(self, user_id: int) -> Optional[int]:
         """사용자의 최신 배치 ID 조회"""
         connection = self.db_manager.get_connection()
@@ -158,6 +220,41 @@ class AutoClassifyDB:
             cursor.close()
             connection.close()
     
+    def get_labelled_examples(self, per_category: int, min_confidence: float = 0.9) -> Dict[str, List[str]]:
+        """과거 고신뢰 분류 티켓 본문 조회 (카테고리명별 최신순 최대 per_category건, hot + archive)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            source, source_params = ticket_source(cursor)
+            query = f"""
+                SELECT c.category_name, t.title, t.body
+                FROM {source} t
+                JOIN tb_category c ON t.classified_category_id = c.category_id
+                WHERE t.classification_confidence >= %s
+                  AND t.body IS NOT NULL
+                ORDER BY t.classified_at DESC
+                LIMIT %s
+            """
+            
+            cursor.execute(query, (*source_params, min_confidence, per_category * 50))
+            
+            examples = {}
+            for row in cursor.fetchall():
+                texts = examples.setdefault(row['category_name'], [])
+                if len(texts) < per_category:
+                    texts.append(f"{row['title'] or ''} {row['body']}".strip()[:500])
+            
+            logger.info(f"분류 이력 예시 조회 완료: {sum(len(v) for v in examples.values())}건")
+            return examples
+        
+        except Exception as e:
+            logger.error(f"분류 이력 예시 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
     def insert_classification_result(self, result_data: Dict[str, Any]) -> int:
         """분류 결과 메타 정보 저장 (tb_classification_result) - 배치 지원"""
         connection = self.db_manager.get_connection()
@@ -186,6 +283,9 @@ class AutoClassifyDB:
             connection.commit()
             class_result_id = cursor.lastrowid
             
+            # 이전 분류 결과 기준 리포트 데이터 캐시 제거
+            report_cache.invalidate(result_data.get('file_id'), result_data.get('batch_id'))
+            
             batch_info = f", batch_id={result_data.get('batch_id')}" if result_data.get('batch_id') else ""
             logger.info(f"분류 결과 저장 완료: class_result_id={class_result_id}{batch_info}")
             return class_result_id
@@ -199,37 +299,77 @@ class AutoClassifyDB:
             connection.close()
     
     def update_ticket_classification(self, ticket_id: int, classification: Dict[str, Any]):
-        """티켓에 분류 결과 업데이트"""
-        connection = self.db_manager.get_connection()
-        cursor = connection.cursor()
+        """티켓 1건에 분류 결과 업데이트 (update_ticket_classifications 참고)"""
+        self.update_ticket_classifications([(ticket_id, classification)])
         
-        try:
-            query = """
-                UPDATE tb_ticket
-                SET classified_category_id = %s,
-                    classification_confidence = %s,
-                    classification_keywords = %s,
-                    classified_at = %s
-                WHERE ticket_id = %s
-            """
-            
-            cursor.execute(query, (
-                classification.get('category_id'),
-                classification.get('confidence'),
-                json.dumps(classification.get('keywords', []), ensure_ascii=False),
-                datetime.now(),
-                ticket_id
-            ))
-            
-            connection.commit()
-            
-        except Exception as e:
-            connection.rollback()
-            logger.error(f"티켓 분류 업데이트 실패: ticket_id={ticket_id}, {e}")
-            raise
-        finally:
-            cursor.close()
-            connection.close()
+    def update_ticket_classifications(self, updates: List[Tuple[int, Dict[str, Any]]]):
+        """티켓들에 분류 결과 업데이트 (티켓이 있는 티어에 적용: tb_ticket 또는 tb_ticket_archive)
+            
+        Args:
+            updates: (ticket_id, 분류 결과) 목록
+            
+        Note:
+            - CLASSIFICATION_UPDATE_BATCH_SIZE건씩 한 트랜잭션
+            - 일별 롤업은 갱신 전 키를 일괄 조회해 카테고리 이동분만 모아서 반영 (같은 트랜잭션)
+        """
+        query = """
+            UPDATE {table}
+            SET classified_category_id = %s,
+                classification_confidence = %s,
+                classification_keywords = %s,
+                classified_at = %s,
+                classification_stage = %s,
+                duplicate_cluster_id = %s,
+                classification_rule_version = %s
+            WHERE ticket_id = %s
+        """
+            
+        for start in range(0, len(updates), CLASSIFICATION_UPDATE_BATCH_SIZE):
+            batch = dict(updates[start:start + CLASSIFICATION_UPDATE_BATCH_SIZE])
+            connection = self.db_manager.get_connection()
+            cursor = connection.cursor()
+            
+            try:
+                deltas = {}
+                remaining = list(batch)
+            
+                # 대부분 hot 티어에 있으므로 hot 먼저 찾고, 없는 티켓만 archive에서 찾음
+                for table in ('tb_ticket', 'tb_ticket_archive'):
+                    previous = get_ticket_rollup_keys(cursor, table, remaining)
+                    for ticket_id, key in previous.items():
+                        classification = batch[ticket_id]
+                        
+                        # 단계형 분류가 아니면 분류 방법으로 단계 결정
+                        stage = classification.get('stage') or (
+                            'ai' if str(classification.get('method', '')).startswith('ai') else 'rule'
+                        )
+                        
+                        cursor.execute(query.format(table=table), (
+                            classification.get('category_id'),
+                            classification.get('confidence'),
+                            json.dumps(classification.get('keywords', []), ensure_ascii=False),
+                            datetime.now(),
+                            stage,
+                            classification.get('cluster_id'),
+                            classification.get('rule_version'),
+                            ticket_id
+                        ))
+                        add_reclassify_delta(deltas, key, classification.get('category_id'), classification.get('confidence'))
+                    
+                    remaining = [ticket_id for ticket_id in remaining if ticket_id not in previous]
+                    if not remaining:
+                        break
+                
+                apply_rollup_deltas(cursor, deltas)
+                connection.commit()
+            
+            except Exception as e:
+                connection.rollback()
+                logger.error(f"티켓 분류 업데이트 실패: {len(batch)}건, {e}")
+                raise
+            finally:
+                cursor.close()
+                connection.close()
     
     def insert_category_results(self, class_result_id: int, category_results: List[Dict[str, Any]]):
         """카테고리별 집계 저장 (tb_classification_category_result)"""
@@ -391,3 +531,174 @@ class AutoClassifyDB:
         finally:
             cursor.close()
             connection.close()
+
+    # ========================================
+    # 분류 티켓 목록 (keyset 페이지네이션)
+    # ========================================
+    
+    def get_classification_target(self, class_result_id: int) -> Optional[Dict[str, Any]]:
+        """분류 결과의 대상 파일/배치 조회"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            query = """
+                SELECT class_result_id, file_id, batch_id, user_id, total_tickets
+                FROM tb_classification_result
+                WHERE class_result_id = %s
+            """
+            
+            cursor.execute(query, (class_result_id,))
+            return cursor.fetchone()
+        
+        except Exception as e:
+            logger.error(f"분류 결과 대상 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def _ticket_page_filters(self, file_id: int = None, batch_id: int = None, filters: Dict[str, Any] = None) -> tuple:
+        """티켓 목록 WHERE 조건/파라미터 생성"""
+        filters = filters or {}
+        
+        if batch_id:
+            conditions = ["t.file_id IN (SELECT file_id FROM tb_uploaded_file WHERE batch_id = %s)"]
+            params = [batch_id]
+        else:
+            conditions = ["t.file_id = %s"]
+            params = [file_id]
+        conditions.append("t.classified_category_id IS NOT NULL")
+        
+        if filters.get('category_id') is not None:
+            conditions.append("t.classified_category_id = %s")
+            params.append(filters['category_id'])
+        if filters.get('channel'):
+            conditions.append("t.channel = %s")
+            params.append(filters['channel'])
+        if filters.get('min_confidence') is not None:
+            conditions.append("t.classification_confidence >= %s")
+            params.append(filters['min_confidence'])
+        if filters.get('max_confidence') is not None:
+            conditions.append("t.classification_confidence < %s")
+            params.append(filters['max_confidence'])
+        if filters.get('received_from'):
+            conditions.append("t.received_at >= %s")
+            params.append(filters['received_from'])
+        if filters.get('search'):
+            conditions.append("(t.body LIKE %s OR t.channel LIKE %s OR c.category_name LIKE %s)")
+            params.extend([f"%{filters['search']}%"] * 3)
+        
+        return conditions, params
+    
+    def get_classified_tickets_page(self, file_id: int = None, batch_id: int = None,
+                                    filters: Dict[str, Any] = None, sort: str = 'date-desc',
+                                    after_ticket_id: int = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        분류된 티켓 한 페이지 조회 (keyset 페이지네이션)
+        
+        Args:
+            file_id / batch_id: 조회 대상 (둘 중 하나)
+            filters: category_id, channel, min_confidence, max_confidence, received_from, search
+            sort: TICKET_SORT_KEYS 중 하나
+            after_ticket_id: 이전 페이지 마지막 티켓 ID (없으면 첫 페이지)
+            limit: 페이지 크기
+        
+        Returns:
+            티켓 목록 (본문은 SQL에서 앞 15자 미리보기만 조회)
+        
+        Note:
+            커서 위치는 커서 티켓 행의 정렬 키를 DB에서 직접 읽어 비교 (OFFSET 없이 인덱스 범위 탐색)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            sort_expr, direction = TICKET_SORT_KEYS.get(sort, TICKET_SORT_KEYS['date-desc'])
+            key = sort_expr.format(t='t.')
+            op = '<' if direction == 'DESC' else '>'
+            
+            source, source_params = ticket_source(cursor, file_id=file_id, batch_id=batch_id)
+            conditions, params = self._ticket_page_filters(file_id, batch_id, filters)
+            
+            keyset_join = ""
+            if after_ticket_id:
+                # 커서 티켓은 어느 티어에 있을지 모르므로 두 티어에서 PK 조회
+                keyset_join = f"""
+                CROSS JOIN (
+                    SELECT {sort_expr.format(t='')} AS sort_key, ticket_id
+                    FROM tb_ticket
+                    WHERE ticket_id = %s
+                    UNION ALL
+                    SELECT {sort_expr.format(t='')} AS sort_key, ticket_id
+                    FROM tb_ticket_archive
+                    WHERE ticket_id = %s
+                ) cur"""
+                params[:0] = [after_ticket_id, after_ticket_id]
+                conditions.append(
+                    f"({key} {op} cur.sort_key OR ({key} = cur.sort_key AND t.ticket_id {op} cur.ticket_id))"
+                )
+            
+            query = f"""
+                SELECT
+                    t.ticket_id, t.received_at, t.channel,
+                    t.classified_category_id AS category_id, c.category_name,
+                    t.classification_confidence AS confidence,
+                    t.classification_keywords AS keywords,
+                    SUBSTRING(t.body, 1, 15) AS preview,
+                    CHAR_LENGTH(t.body) > 15 AS truncated
+                FROM {source} t
+                LEFT JOIN tb_category c ON c.category_id = t.classified_category_id{keyset_join}
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {key} {direction}, t.ticket_id {direction}
+                LIMIT %s
+            """
+            
+            cursor.execute(query, (*source_params, *params, limit))
+            rows = cursor.fetchall()
+            
+            for row in rows:
+                keywords = row['keywords']
+                if isinstance(keywords, (str, bytes)):
+                    keywords = json.loads(keywords)
+                row['keywords'] = (keywords or [])[:3]
+                if row['truncated']:
+                    row['preview'] = f"{row['preview']}..."
+                del row['truncated']
+            
+            return rows
+        
+        except Exception as e:
+            logger.error(f"분류 티켓 목록 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def count_classified_tickets(self, file_id: int = None, batch_id: int = None,
+                                 filters: Dict[str, Any] = None) -> int:
+        """필터 조건에 맞는 분류 티켓 수"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            source, source_params = ticket_source(cursor, file_id=file_id, batch_id=batch_id)
+            conditions, params = self._ticket_page_filters(file_id, batch_id, filters)
+            join = "LEFT JOIN tb_category c ON c.category_id = t.classified_category_id" if (filters or {}).get('search') else ""
+            
+            query = f"""
+                SELECT COUNT(*) AS total
+                FROM {source} t
+                {join}
+                WHERE {' AND '.join(conditions)}
+            """
+            
+            cursor.execute(query, (*source_params, *params))
+            return cursor.fetchone()['total']
+        
+        except Exception as e:
+            logger.error(f"분류 티켓 수 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
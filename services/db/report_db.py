@@ -1,19 +1,62 @@
 from utils.database import db_manager
+from utils.async_db import fetch_concurrently
+from utils.channel_trend import build_channel_trends, choose_resolution, downsample_channel_trends, RESOLUTION_LABEL_FORMATS
 from utils.logger import get_logger
+from services.db.archive_db import ACTIVE_FILE_CONDITION, ticket_source, to_date, month_start, next_month
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 import decimal
 
 logger = get_logger(__name__)
 
+# 채널 스냅샷 다중 행 INSERT 1회당 행 수
+CHANNEL_SNAPSHOT_BATCH_SIZE = 500
+
+# 채널별 추이 버킷 시작일 SQL 식: 해상도 -> (식, 파라미터) - SQLite는 WEEKDAY/SUBDATE/DATE_FORMAT 함수 등록
+TREND_BUCKET_EXPRESSIONS = {
+    'day': ("r.stat_date", []),
+    'week': ("SUBDATE(r.stat_date, WEEKDAY(r.stat_date))", []),
+    'month': ("DATE_FORMAT(r.stat_date, %s)", ['%Y-%m-01']),
+}
+
+# 리포트(별칭 r) 대상 파일/배치가 소프트 삭제되지 않은 조건 (퍼지 전까지 리포트 조회에서 제외)
+_ACTIVE_REPORT_TARGET = f"""(r.file_id IS NULL OR r.file_id IN (SELECT file_id FROM tb_uploaded_file WHERE {ACTIVE_FILE_CONDITION}))
+                  AND (r.batch_id IS NULL OR r.batch_id NOT IN (SELECT batch_id FROM tb_file_batch WHERE status = 'deleted'))"""
+
 class ReportDB:
     """리포트 관련 데이터베이스 작업 클래스 (실제 스키마 기반)"""
     
     def __init__(self):
         self.db_manager = db_manager
     
+    # ========================================
+    # 티켓 테이블 라우팅 (hot/archive)
+    # ========================================
+    
+    def _ticket_source(self, cursor, file_id: int = None, batch_id: int = None, user_id: int = None,
+                       start_date=None, end_date=None) -> Tuple[str, List[Any]]:
+        """조회 범위에 필요한 티켓 티어만 포함하는 FROM 절 테이블 표현식 반환 (archive_db.ticket_source 참고)
+        
+        Returns:
+            tuple: (테이블 표현식, 파라미터) - 파라미터는 호출 측 WHERE 파라미터보다 앞에 둠
+        """
+        return ticket_source(cursor, file_id=file_id, batch_id=batch_id, user_id=user_id,
+                             start_date=start_date, end_date=end_date)
+    
+    def _rollup_scope(self, file_id: int = None, batch_id: int = None) -> tuple:
+        """일별 롤업(tb_ticket_daily_rollup, 별칭 r) 조회 범위 JOIN/WHERE 절과 파라미터 반환
+        
+        Returns:
+            tuple: (join_clause, where_clause, params)
+        """
+        join_clause = "INNER JOIN tb_uploaded_file f ON f.file_id = r.file_id"
+        active = "(f.is_deleted IS NULL OR f.is_deleted = FALSE)"  # 소프트 삭제된 파일 제외
+        if batch_id:
+            return join_clause, f"f.batch_id = %s AND {active}", [batch_id]
+        return join_clause, f"r.file_id = %s AND {active}", [file_id]
+    
     # ========================================
     # 파일 관련 조회
     # ========================================
@@ -26,12 +69,13 @@ class ReportDB:
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
-                SELECT report_id
-                FROM tb_analysis_report
-                WHERE created_by = %s
-                  AND status = 'completed'
-                ORDER BY created_at DESC
+            query = f"""
+                SELECT r.report_id
+                FROM tb_analysis_report r
+                WHERE r.created_by = %s
+                  AND r.status = 'completed'
+                  AND {_ACTIVE_REPORT_TARGET}
+                ORDER BY r.created_at DESC
                 LIMIT 1
             """
             
@@ -140,15 +184,17 @@ class ReportDB:
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
+            ticket_source, source_params = self._ticket_source(cursor, file_id=file_id, start_date=start_date, end_date=end_date)
+            
+            query = f"""
                 SELECT 
                     t.ticket_id, t.file_id, t.user_id, t.received_at, t.channel,
                     t.customer_id, t.product_code, t.inquiry_type, t.title, t.body,
                     t.status, t.created_at, t.updated_at
-                FROM tb_ticket t
+                FROM {ticket_source} t
                 WHERE t.file_id = %s
             """
-            params = [file_id]
+            params = source_params + [file_id]
             
             if start_date:
                 query += " AND t.received_at >= %s"
@@ -183,17 +229,19 @@ class ReportDB:
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
+            ticket_source, source_params = self._ticket_source(cursor, user_id=user_id)
+            
+            query = f"""
                 SELECT 
                     t.ticket_id, t.file_id, t.user_id, t.received_at, t.channel,
                     t.customer_id, t.product_code, t.inquiry_type, t.title, t.body,
                     t.status
-                FROM tb_ticket t
+                FROM {ticket_source} t
                 WHERE t.user_id = %s
                 ORDER BY t.received_at DESC
             """
             
-            cursor.execute(query, [user_id])
+            cursor.execute(query, source_params + [user_id])
             results = cursor.fetchall()
             
             df = pd.DataFrame(results)
@@ -247,6 +295,43 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
+    def get_report_data_version(self, file_id: int = None, batch_id: int = None) -> Optional[int]:
+        """리포트 데이터 캐시 버전 = 대상에 영향을 주는 최신 분류 결과 ID
+        
+        - 배치: 배치 분류 결과 + 배치에 속한 파일별 분류 결과
+        - 파일: 파일 분류 결과 + 파일이 속한 배치의 분류 결과
+        (어느 쪽으로 재분류해도 티켓/롤업이 바뀌므로 둘 다 포함)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            if batch_id:
+                cursor.execute("""
+                    SELECT MAX(class_result_id) as version
+                    FROM tb_classification_result
+                    WHERE batch_id = %s
+                       OR file_id IN (SELECT file_id FROM tb_uploaded_file WHERE batch_id = %s)
+                """, [batch_id, batch_id])
+            else:
+                cursor.execute("""
+                    SELECT MAX(class_result_id) as version
+                    FROM tb_classification_result
+                    WHERE file_id = %s
+                       OR batch_id IN (SELECT batch_id FROM tb_uploaded_file WHERE file_id = %s)
+                """, [file_id, file_id])
+            
+            row = cursor.fetchone()
+            return row['version'] if row else None
+        
+        except Exception as e:
+            logger.error(f"리포트 데이터 버전 조회 실패: {e}")
+            return None
+        finally:
+            cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+    
     def get_category_results(self, class_result_id: int) -> List[Dict]:
         """카테고리별 분류 결과 조회"""
         logger.info(f"분류 결과 {class_result_id}의 카테고리별 데이터 조회")
@@ -288,6 +373,33 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
+    def get_duplicate_cluster_stats(self, class_result_id: int) -> Dict:
+        """근사 중복 클러스터 통계 조회 (신뢰도 상세 정보에 저장, 클러스터링하지 않았으면 빈 dict)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT details
+                FROM tb_classification_reliability_result
+                WHERE class_result_id = %s
+                LIMIT 1
+            """, [class_result_id])
+            row = cursor.fetchone()
+            
+            details = row['details'] if row else None
+            if isinstance(details, str):
+                details = json.loads(details)
+            return (details or {}).get('duplicate_clusters') or {}
+        
+        except Exception as e:
+            logger.error(f"근사 중복 클러스터 통계 조회 실패: {e}")
+            return {}
+        finally:
+            cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+    
     def get_channel_results(self, class_result_id: int) -> List[Dict]:
         """채널별 분류 결과 조회"""
         logger.info(f"분류 결과 {class_result_id}의 채널별 데이터 조회")
@@ -328,75 +440,25 @@ class ReportDB:
     # 리포트 데이터 조회 (프론트엔드용)
     # ========================================
     
-    def get_channel_trend_data_by_batch(self, batch_id: int, days: int = 365) -> dict:
-        """배치 기반 채널별 추이 데이터 조회"""
+    def get_channel_trend_data_by_batch(self, batch_id: int, days: int = 365, resolution: str = 'day',
+                                        max_points: int = 0, line_points: int = 0) -> dict:
+        """배치 기반 채널별 추이 데이터 조회
+        
+        Args:
+            resolution / max_points / line_points: _query_channel_trends 참고
+        """
         logger.info(f"배치 {batch_id}의 채널별 추이 데이터 조회")
         
         connection = self.db_manager.get_connection()
         cursor = connection.cursor(dictionary=True)
         
         try:
-            # 채널별, 카테고리별, 날짜별 집계 (배치에 속한 모든 파일)
-            query = """
-                SELECT 
-                    t.channel,
-                    c.category_name,
-                    DATE(t.received_at) as date,
-                    COUNT(*) as count
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                LEFT JOIN tb_category c ON t.classified_category_id = c.category_id
-                WHERE f.batch_id = %s
-                  AND t.classified_category_id IS NOT NULL
-                GROUP BY t.channel, c.category_name, DATE(t.received_at)
-                ORDER BY DATE(t.received_at), t.channel, c.category_name
-            """
+            channel_trends = self._query_channel_trends(cursor, resolution, max_points, line_points, batch_id=batch_id)
             
-            cursor.execute(query, [batch_id])
-            results = cursor.fetchall()
-            
-            if not results:
+            if not channel_trends:
                 logger.warning(f"배치 {batch_id}의 채널별 추이 데이터가 없습니다")
                 return {}
             
-            logger.debug(f"채널별 추이 원본 데이터 {len(results)}건 조회")
-            
-            # 데이터 구조 변환
-            channel_trends = {}
-            for row in results:
-                channel = row['channel'] or '미분류'
-                category = row['category_name'] or '미분류'
-                date_full = row['date'].strftime('%Y-%m-%d') if row['date'] else ''
-                date_display = row['date'].strftime('%m-%d') if row['date'] else ''
-                count = row['count']
-                
-                if channel not in channel_trends:
-                    channel_trends[channel] = {
-                        'categories': [],
-                        'dates': [],
-                        'dates_full': [],
-                        'data': []
-                    }
-                
-                if category not in channel_trends[channel]['categories']:
-                    channel_trends[channel]['categories'].append(category)
-                
-                if date_display not in channel_trends[channel]['dates']:
-                    channel_trends[channel]['dates'].append(date_display)
-                    channel_trends[channel]['dates_full'].append(date_full)
-                
-                date_idx = channel_trends[channel]['dates'].index(date_display)
-                cat_idx = channel_trends[channel]['categories'].index(category)
-                
-                while len(channel_trends[channel]['data']) <= date_idx:
-                    channel_trends[channel]['data'].append([0] * len(channel_trends[channel]['categories']))
-                
-                for data_row in channel_trends[channel]['data']:
-                    while len(data_row) < len(channel_trends[channel]['categories']):
-                        data_row.append(0)
-                
-                channel_trends[channel]['data'][date_idx][cat_idx] = count
-            
             logger.info(f"배치 채널별 추이 데이터 조회 완료: {len(channel_trends)}개 채널")
             return channel_trends
             
@@ -408,8 +470,13 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
-    def get_channel_trend_data(self, file_id: int, days: int = 365) -> dict:
-        """채널별 추이 데이터 조회 (기본 365일, 전체 기간 포함)"""
+    def get_channel_trend_data(self, file_id: int, days: int = 365, resolution: str = 'day',
+                               max_points: int = 0, line_points: int = 0) -> dict:
+        """채널별 추이 데이터 조회 (기본 365일, 전체 기간 포함)
+        
+        Args:
+            resolution / max_points / line_points: _query_channel_trends 참고
+        """
         logger.info(f"파일 {file_id}의 채널별 추이 데이터 조회 (최근 {days}일)")
         
         connection = self.db_manager.get_connection()
@@ -422,73 +489,12 @@ class ReportDB:
                 logger.warning(f"파일 {file_id}의 분류 결과가 없습니다")
                 return {}
             
-            # 채널별, 카테고리별, 날짜별 집계
-            # tb_ticket.classified_category_id를 직접 사용
-            query = """
-                SELECT 
-                    t.channel,
-                    c.category_name,
-                    DATE(t.received_at) as date,
-                    COUNT(*) as count
-                FROM tb_ticket t
-                LEFT JOIN tb_category c ON t.classified_category_id = c.category_id
-                WHERE t.file_id = %s
-                  AND t.classified_category_id IS NOT NULL
-                GROUP BY t.channel, c.category_name, DATE(t.received_at)
-                ORDER BY DATE(t.received_at), t.channel, c.category_name
-            """
-            
-            cursor.execute(query, [file_id])
-            results = cursor.fetchall()
+            channel_trends = self._query_channel_trends(cursor, resolution, max_points, line_points, file_id=file_id)
             
-            if not results:
+            if not channel_trends:
                 logger.warning(f"파일 {file_id}의 채널별 추이 데이터가 없습니다. 분류 실행 여부를 확인하세요.")
                 return {}
             
-            logger.debug(f"채널별 추이 원본 데이터 {len(results)}건 조회")
-            
-            # 데이터 구조 변환
-            channel_trends = {}
-            for row in results:
-                channel = row['channel'] or '미분류'
-                category = row['category_name'] or '미분류'
-                
-                # 날짜 형식: YYYY-MM-DD (DB 저장용 전체 날짜)
-                date_full = row['date'].strftime('%Y-%m-%d') if row['date'] else ''
-                # 표시용 날짜: MM-DD (프론트엔드용)
-                date_display = row['date'].strftime('%m-%d') if row['date'] else ''
-                
-                count = row['count']
-                
-                if channel not in channel_trends:
-                    channel_trends[channel] = {
-                        'categories': [],
-                        'dates': [],  # 표시용 (MM-DD)
-                        'dates_full': [],  # DB 저장용 (YYYY-MM-DD)
-                        'data': []
-                    }
-                
-                if category not in channel_trends[channel]['categories']:
-                    channel_trends[channel]['categories'].append(category)
-                
-                if date_display not in channel_trends[channel]['dates']:
-                    channel_trends[channel]['dates'].append(date_display)
-                    channel_trends[channel]['dates_full'].append(date_full)
-                
-                date_idx = channel_trends[channel]['dates'].index(date_display)
-                cat_idx = channel_trends[channel]['categories'].index(category)
-                
-                # data 배열 초기화
-                while len(channel_trends[channel]['data']) <= date_idx:
-                    channel_trends[channel]['data'].append([0] * len(channel_trends[channel]['categories']))
-                
-                # 카테고리 개수 증가 시 배열 확장
-                for data_row in channel_trends[channel]['data']:
-                    while len(data_row) < len(channel_trends[channel]['categories']):
-                        data_row.append(0)
-                
-                channel_trends[channel]['data'][date_idx][cat_idx] = count
-            
             logger.info(f"채널별 추이 데이터 조회 완료: {len(channel_trends)}개 채널")
             return channel_trends
             
@@ -500,58 +506,131 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
+    def _query_channel_trends(self, cursor, resolution: str = 'day', max_points: int = 0, line_points: int = 0,
+                              file_id: int = None, batch_id: int = None) -> dict:
+        """일별 롤업을 버킷 단위로 합산하여 채널 × 날짜 × 카테고리 행렬 생성
+        
+        Args:
+            cursor: dictionary 커서 (호출 측 연결 재사용)
+            resolution: 'day' | 'week' | 'month' | 'auto' (auto: 기간과 max_points로 선택)
+            max_points: 채널당 최대 버킷 수 (0 = 제한 없음, 초과 시 인접 버킷 합산)
+            line_points: 전체 합계선 LTTB 점 수 (0 = 사용 안 함)
+        
+        Returns:
+            dict: {channel: {categories, dates, dates_full, data, resolution[, total_line]}} (데이터 없으면 {})
+        """
+        join_clause, where_clause, params = self._rollup_scope(file_id, batch_id)
+        
+        if resolution == 'auto':
+            cursor.execute(f"""
+                SELECT MIN(r.stat_date) as first_date, MAX(r.stat_date) as last_date
+                FROM tb_ticket_daily_rollup r
+                {join_clause}
+                WHERE {where_clause}
+                  AND r.category_id IS NOT NULL
+            """, params)
+            span = cursor.fetchone()
+            if not span or not span['first_date']:
+                return {}
+            resolution = choose_resolution(to_date(span['first_date']), to_date(span['last_date']), max_points)
+        
+        if resolution not in TREND_BUCKET_EXPRESSIONS:
+            raise ValueError(f"지원하지 않는 추이 해상도: {resolution} (auto, day, week, month 중 선택)")
+        bucket_expr, bucket_params = TREND_BUCKET_EXPRESSIONS[resolution]
+        
+        # 채널별, 카테고리별, 버킷별 집계 (일별 롤업 합산, 버킷 날짜는 버킷 시작일)
+        query = f"""
+            SELECT 
+                r.channel,
+                c.category_name,
+                {bucket_expr} as bucket_date,
+                SUM(r.ticket_count) as count
+            FROM tb_ticket_daily_rollup r
+            {join_clause}
+            LEFT JOIN tb_category c ON r.category_id = c.category_id
+            WHERE {where_clause}
+              AND r.category_id IS NOT NULL
+            GROUP BY r.channel, c.category_name, bucket_date
+            ORDER BY bucket_date, r.channel, c.category_name
+        """
+        
+        cursor.execute(query, bucket_params + params)
+        results = cursor.fetchall()
+        
+        if not results:
+            return {}
+        
+        logger.debug(f"채널별 추이 원본 데이터 {len(results)}건 조회 (해상도: {resolution})")
+        
+        for row in results:
+            row['date'] = to_date(row.pop('bucket_date'))
+        
+        # 채널 × 날짜 × 카테고리 행렬로 변환 후 응답 크기 제한
+        channel_trends = build_channel_trends(results, RESOLUTION_LABEL_FORMATS[resolution])
+        return downsample_channel_trends(channel_trends, resolution, max_points, line_points)
+    
     def get_summary_data(self, file_id: int) -> dict:
         """데이터 요약 정보 조회"""
         logger.info(f"파일 {file_id}의 요약 데이터 조회")
         
-        connection = self.db_manager.get_connection()
-        cursor = connection.cursor(dictionary=True)
-        
         try:
-            # 1. 총 티켓 수
-            cursor.execute("""
-                SELECT COUNT(*) as total_tickets
-                FROM tb_ticket
-                WHERE file_id = %s
-            """, [file_id])
-            total_tickets = cursor.fetchone()['total_tickets']
-            
-            # 2. 최신 분류 결과의 평균 신뢰도
             class_result_id = self.get_latest_classification_result(file_id)
-            classification_accuracy = 0.0
             
+            join_clause, where_clause, params = self._rollup_scope(file_id=file_id)
+            
+            queries = {
+                # 1. 총 티켓 수 (일별 롤업)
+                'total': (f"""
+                    SELECT COALESCE(SUM(r.ticket_count), 0) as total_tickets
+                    FROM tb_ticket_daily_rollup r
+                    {join_clause}
+                    WHERE {where_clause}
+                """, params, 'one'),
+                # 3. 채널별 티켓 수 (일별 롤업)
+                'channels': (f"""
+                    SELECT r.channel, SUM(r.ticket_count) as count
+                    FROM tb_ticket_daily_rollup r
+                    {join_clause}
+                    WHERE {where_clause}
+                    GROUP BY r.channel
+                    ORDER BY count DESC
+                """, params),
+                # 4. 상태별 티켓 수 (일별 롤업)
+                'statuses': (f"""
+                    SELECT r.status, SUM(r.ticket_count) as count
+                    FROM tb_ticket_daily_rollup r
+                    {join_clause}
+                    WHERE {where_clause}
+                    GROUP BY r.status
+                """, params)
+            }
+            
+            # 2. 최신 분류 결과의 평균 신뢰도
             if class_result_id:
-                cursor.execute("""
+                queries['reliability'] = ("""
                     SELECT AVG(metric_value) as avg_reliability
                     FROM tb_classification_reliability_result
                     WHERE class_result_id = %s
                     AND metric_name IN ('accuracy', 'f1_score')
-                """, [class_result_id])
-                result = cursor.fetchone()
+                """, [class_result_id], 'one')
+            
+            # 독립 집계 쿼리 동시 실행
+            results = fetch_concurrently(queries)
+            
+            total_tickets = int(results['total']['total_tickets'])
+            
+            classification_accuracy = 0.0
+            if class_result_id:
+                result = results['reliability']
                 classification_accuracy = result['avg_reliability'] if result['avg_reliability'] else 0.0
             
-            # 3. 채널별 티켓 수
-            cursor.execute("""
-                SELECT channel, COUNT(*) as count
-                FROM tb_ticket
-                WHERE file_id = %s
-                GROUP BY channel
-                ORDER BY count DESC
-            """, [file_id])
             channels = {}
-            for row in cursor.fetchall():
-                channels[row['channel'] or '미분류'] = row['count']
+            for row in results['channels']:
+                channels[row['channel'] or '미분류'] = int(row['count'])
             
-            # 4. 상태별 티켓 수
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM tb_ticket
-                WHERE file_id = %s
-                GROUP BY status
-            """, [file_id])
             status_distribution = {}
-            for row in cursor.fetchall():
-                status_distribution[row['status']] = row['count']
+            for row in results['statuses']:
+                status_distribution[row['status']] = int(row['count'])
             
             summary = {
                 'total_tickets': total_tickets,
@@ -573,54 +652,124 @@ class ReportDB:
                 'channels': {},
                 'status_distribution': {}
             }
-        finally:
-            cursor.close()
-            if connection and connection.is_connected():
-                connection.close()
     
-    def get_cs_analysis_data_by_batch(self, batch_id: int) -> dict:
-        """배치 기반 CS 분석용 데이터 조회 - GPT 프롬프트에 사용할 데이터"""
-        logger.info(f"배치 {batch_id}의 CS 분석 데이터 조회")
+    def _build_cs_analysis_data(self, class_result_id: int, file_id: int = None, batch_id: int = None) -> dict:
+        """CS 분석 데이터 생성 (파일/배치 공용)
+        
+        - 티켓 통계는 일별 롤업 1회 조회(채널 × 상태 GROUP BY)에서 총계/채널 분포/상태 분포/
+          채널별 해결률/처리 완료·미처리 건수를 모두 계산
+        - 카테고리 분포와 중복 클러스터 통계는 분류 결과 테이블에서 동시에 조회
+        """
+        join_clause, where_clause, params = self._rollup_scope(file_id=file_id, batch_id=batch_id)
+        
+        # 독립 조회 동시 실행 (각각 별도 pooled connection, 지연 시간 ≈ 가장 느린 쿼리)
+        results = fetch_concurrently({
+            # 1. 채널 × 상태별 티켓 수 / 처리 완료 수 (일별 롤업 단일 조회)
+            'tickets': (f"""
+                SELECT 
+                    r.channel,
+                    r.status,
+                    SUM(r.ticket_count) as count,
+                    SUM(r.resolved_count) as resolved
+                FROM tb_ticket_daily_rollup r
+                {join_clause}
+                WHERE {where_clause}
+                GROUP BY r.channel, r.status
+                ORDER BY r.channel, r.status
+            """, params),
+            # 2. 카테고리별 분포 (분류 결과 기반)
+            'categories': lambda: self.get_category_results(class_result_id),
+            # 근사 중복 클러스터 통계
+            'duplicate_clusters': lambda: self.get_duplicate_cluster_stats(class_result_id)
+        })
+        
+        channel_counts = {}
+        channel_resolved = {}
+        status_counts = {}
+        for row in results['tickets']:
+            channel = row['channel'] or '미분류'
+            count, resolved = int(row['count']), int(row['resolved'])
+            channel_counts[channel] = channel_counts.get(channel, 0) + count
+            channel_resolved[channel] = channel_resolved.get(channel, 0) + resolved
+            status_counts[row['status']] = status_counts.get(row['status'], 0) + count
+        
+        total_tickets = sum(channel_counts.values())
+        total_resolved = sum(channel_resolved.values())
+        
+        def percentage(count):
+            return round((count / total_tickets * 100), 1) if total_tickets > 0 else 0
+        
+        category_distribution = []
+        for cat_result in results['categories']:
+            category_distribution.append({
+                'category_id': cat_result['category_id'],
+                'category_name': cat_result['category_name'],
+                'count': cat_result['count'],
+                'ratio': cat_result['ratio'],
+                'percentage': round(cat_result['ratio'] * 100, 1),
+                'keywords': cat_result.get('example_keywords', [])[:5]
+            })
+        
+        # 채널별 분포 (건수 내림차순)
+        channel_distribution = [
+            {'channel': channel, 'count': count, 'percentage': percentage(count)}
+            for channel, count in sorted(channel_counts.items(), key=lambda item: item[1], reverse=True)
+        ]
+        
+        status_distribution = {
+            status: {'count': count, 'percentage': percentage(count)}
+            for status, count in status_counts.items()
+        }
+        
+        channel_resolution_rates = []
+        for channel, total in channel_counts.items():
+            resolved = channel_resolved[channel]
+            channel_resolution_rates.append({
+                'channel': channel,
+                'total': total,
+                'resolved': resolved,
+                'resolution_rate': round((resolved / total * 100), 1) if total > 0 else 0
+            })
+        
+        return {
+            'total_tickets': total_tickets,
+            'total_resolved': total_resolved,
+            'total_unresolved': total_tickets - total_resolved,
+            'category_distribution': category_distribution,
+            'channel_distribution': channel_distribution,
+            'status_distribution': status_distribution,
+            'channel_resolution_rates': channel_resolution_rates,
+            'duplicate_clusters': results['duplicate_clusters'],
+            'class_result_id': class_result_id
+        }
+    
+    def _build_cs_analysis_data_legacy(self, class_result_id: int, file_id: int = None, batch_id: int = None) -> dict:
+        """CS 분석 데이터 생성 - 기존 원본 티켓 6개 집계 쿼리 방식 (패리티 검사 기준값)
         
+        Note:
+            - 일별 롤업을 거치지 않고 원본 티켓(hot + archive)을 직접 집계
+            - 리포트 생성에는 사용하지 않음 (_build_cs_analysis_data와 결과 비교용)
+        """
         connection = self.db_manager.get_connection()
         cursor = connection.cursor(dictionary=True)
         
         try:
-            # 최신 분류 결과 조회 (배치 기반)
-            cursor.execute("""
-                SELECT class_result_id
-                FROM tb_classification_result
-                WHERE batch_id = %s
-                ORDER BY classified_at DESC
-                LIMIT 1
-            """, [batch_id])
-            
-            result = cursor.fetchone()
-            class_result_id = result['class_result_id'] if result else None
+            # 파생 테이블이 조회 범위(파일/배치, 소프트 삭제 제외)를 포함
+            source, params = self._ticket_source(cursor, file_id=file_id, batch_id=batch_id)
             
-            if not class_result_id:
-                logger.warning(f"배치 {batch_id}의 분류 결과가 없습니다")
-                return {
-                    'total_tickets': 0,
-                    'category_distribution': [],
-                    'channel_distribution': [],
-                    'status_distribution': {}
-                }
-            
-            # 1. 총 티켓 수 (배치에 속한 모든 파일)
-            cursor.execute("""
+            # 1. 총 티켓 수
+            cursor.execute(f"""
                 SELECT COUNT(*) as total_tickets
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                WHERE f.batch_id = %s
-            """, [batch_id])
+                FROM {source} t
+            """, params)
             total_tickets = cursor.fetchone()['total_tickets']
             
+            def percentage(count):
+                return round((count / total_tickets * 100), 1) if total_tickets > 0 else 0
+            
             # 2. 카테고리별 분포 (분류 결과 기반)
             category_distribution = []
-            category_results = self.get_category_results(class_result_id)
-            
-            for cat_result in category_results:
+            for cat_result in self.get_category_results(class_result_id):
                 category_distribution.append({
                     'category_id': cat_result['category_id'],
                     'category_name': cat_result['category_name'],
@@ -631,88 +780,116 @@ class ReportDB:
                 })
             
             # 3. 채널별 분포
-            cursor.execute("""
-                SELECT channel, COUNT(*) as count
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                WHERE f.batch_id = %s
-                GROUP BY channel
+            cursor.execute(f"""
+                SELECT t.channel, COUNT(*) as count
+                FROM {source} t
+                GROUP BY t.channel
                 ORDER BY count DESC
-            """, [batch_id])
-            channel_rows = cursor.fetchall()
-            
+            """, params)
             channel_distribution = []
-            for row in channel_rows:
+            for row in cursor.fetchall():
                 channel_distribution.append({
                     'channel': row['channel'] or '미분류',
                     'count': row['count'],
-                    'percentage': round((row['count'] / total_tickets * 100), 1) if total_tickets > 0 else 0
+                    'percentage': percentage(row['count'])
                 })
             
             # 4. 상태별 분포
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT t.status, COUNT(*) as count
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                WHERE f.batch_id = %s
+                FROM {source} t
                 GROUP BY t.status
-            """, [batch_id])
-            status_rows = cursor.fetchall()
-            
+            """, params)
             status_distribution = {}
-            for row in status_rows:
+            for row in cursor.fetchall():
                 status_distribution[row['status']] = {
                     'count': row['count'],
-                    'percentage': round((row['count'] / total_tickets * 100), 1) if total_tickets > 0 else 0
+                    'percentage': percentage(row['count'])
                 }
             
             # 5. 채널별 해결률
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
                     t.channel,
                     COUNT(*) as total,
                     SUM(CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END) as resolved
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                WHERE f.batch_id = %s
+                FROM {source} t
                 GROUP BY t.channel
-            """, [batch_id])
-            channel_resolution = cursor.fetchall()
-            
+            """, params)
             channel_resolution_rates = []
-            for row in channel_resolution:
-                resolution_rate = round((row['resolved'] / row['total'] * 100), 1) if row['total'] > 0 else 0
+            for row in cursor.fetchall():
                 channel_resolution_rates.append({
                     'channel': row['channel'] or '미분류',
                     'total': row['total'],
                     'resolved': row['resolved'],
-                    'resolution_rate': resolution_rate
+                    'resolution_rate': round((row['resolved'] / row['total'] * 100), 1) if row['total'] > 0 else 0
                 })
             
             # 6. 처리 완료/미처리 건수
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
                     COUNT(CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 END) as resolved,
                     COUNT(CASE WHEN t.status NOT IN ('closed', 'resolved', 'completed', '완료') OR t.status IS NULL THEN 1 END) as unresolved
-                FROM tb_ticket t
-                INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
-                WHERE f.batch_id = %s
-            """, [batch_id])
+                FROM {source} t
+            """, params)
             status_count = cursor.fetchone()
             
-            total_resolved = status_count['resolved'] or 0
-            total_unresolved = status_count['unresolved'] or 0
-            
-            cs_analysis_data = {
+            return {
                 'total_tickets': total_tickets,
-                'total_resolved': total_resolved,
-                'total_unresolved': total_unresolved,
+                'total_resolved': status_count['resolved'] or 0,
+                'total_unresolved': status_count['unresolved'] or 0,
                 'category_distribution': category_distribution,
                 'channel_distribution': channel_distribution,
                 'status_distribution': status_distribution,
                 'channel_resolution_rates': channel_resolution_rates,
+                'duplicate_clusters': self.get_duplicate_cluster_stats(class_result_id),
                 'class_result_id': class_result_id
             }
+        finally:
+            cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+    
+    def get_latest_batch_classification_result(self, batch_id: int) -> Optional[int]:
+        """배치의 최신 분류 결과 ID 조회"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT class_result_id
+                FROM tb_classification_result
+                WHERE batch_id = %s
+                ORDER BY classified_at DESC
+                LIMIT 1
+            """, [batch_id])
+            
+            result = cursor.fetchone()
+            return result['class_result_id'] if result else None
+        finally:
+            cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+    
+    def get_cs_analysis_data_by_batch(self, batch_id: int) -> dict:
+        """배치 기반 CS 분석용 데이터 조회 - GPT 프롬프트에 사용할 데이터"""
+        logger.info(f"배치 {batch_id}의 CS 분석 데이터 조회")
+        
+        try:
+            # 최신 분류 결과 조회 (배치 기반)
+            class_result_id = self.get_latest_batch_classification_result(batch_id)
+            
+            if not class_result_id:
+                logger.warning(f"배치 {batch_id}의 분류 결과가 없습니다")
+                return {
+                    'total_tickets': 0,
+                    'category_distribution': [],
+                    'channel_distribution': [],
+                    'status_distribution': {}
+                }
+            
+            cs_analysis_data = self._build_cs_analysis_data(class_result_id, batch_id=batch_id)
+            total_tickets = cs_analysis_data['total_tickets']
             
             logger.info(f"배치 CS 분석 데이터 조회 완료: 총 {total_tickets}건")
             return cs_analysis_data
@@ -725,18 +902,11 @@ class ReportDB:
                 'channel_distribution': [],
                 'status_distribution': {}
             }
-        finally:
-            cursor.close()
-            if connection and connection.is_connected():
-                connection.close()
     
     def get_cs_analysis_data(self, file_id: int) -> dict:
         """CS 분석용 데이터 조회 - GPT 프롬프트에 사용할 데이터"""
         logger.info(f"파일 {file_id}의 CS 분석 데이터 조회")
         
-        connection = self.db_manager.get_connection()
-        cursor = connection.cursor(dictionary=True)
-        
         try:
             class_result_id = self.get_latest_classification_result(file_id)
             
@@ -749,107 +919,8 @@ class ReportDB:
                     'status_distribution': {}
                 }
             
-            # 1. 총 티켓 수
-            cursor.execute("""
-                SELECT COUNT(*) as total_tickets
-                FROM tb_ticket
-                WHERE file_id = %s
-            """, [file_id])
-            total_tickets = cursor.fetchone()['total_tickets']
-            
-            # 2. 카테고리별 분포 (분류 결과 기반)
-            category_distribution = []
-            category_results = self.get_category_results(class_result_id)
-            
-            for cat_result in category_results:
-                category_distribution.append({
-                    'category_id': cat_result['category_id'],  # ✅ category_id 추가
-                    'category_name': cat_result['category_name'],
-                    'count': cat_result['count'],
-                    'ratio': cat_result['ratio'],
-                    'percentage': round(cat_result['ratio'] * 100, 1),  # % 변환
-                    'keywords': cat_result.get('example_keywords', [])[:5]  # 상위 5개 키워드
-                })
-            
-            # 3. 채널별 분포
-            cursor.execute("""
-                SELECT channel, COUNT(*) as count
-                FROM tb_ticket
-                WHERE file_id = %s
-                GROUP BY channel
-                ORDER BY count DESC
-            """, [file_id])
-            channel_rows = cursor.fetchall()
-            
-            channel_distribution = []
-            for row in channel_rows:
-                channel_distribution.append({
-                    'channel': row['channel'] or '미분류',
-                    'count': row['count'],
-                    'percentage': round((row['count'] / total_tickets * 100), 1) if total_tickets > 0 else 0
-                })
-            
-            # 4. 상태별 분포 (해결률 계산용)
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM tb_ticket
-                WHERE file_id = %s
-                GROUP BY status
-            """, [file_id])
-            status_rows = cursor.fetchall()
-            
-            status_distribution = {}
-            for row in status_rows:
-                status_distribution[row['status']] = {
-                    'count': row['count'],
-                    'percentage': round((row['count'] / total_tickets * 100), 1) if total_tickets > 0 else 0
-                }
-            
-            # 5. 채널별 해결률 계산 (status='closed', 'resolved', 'completed', '완료' 기준)
-            cursor.execute("""
-                SELECT 
-                    channel,
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END) as resolved
-                FROM tb_ticket
-                WHERE file_id = %s
-                GROUP BY channel
-            """, [file_id])
-            channel_resolution = cursor.fetchall()
-            
-            channel_resolution_rates = []
-            for row in channel_resolution:
-                resolution_rate = round((row['resolved'] / row['total'] * 100), 1) if row['total'] > 0 else 0
-                channel_resolution_rates.append({
-                    'channel': row['channel'] or '미분류',
-                    'total': row['total'],
-                    'resolved': row['resolved'],
-                    'resolution_rate': resolution_rate
-                })
-            
-            # 6. 처리 완료/미처리 건수 계산 (status 기준)
-            cursor.execute("""
-                SELECT 
-                    COUNT(CASE WHEN status IN ('closed', 'resolved', 'completed', '완료') THEN 1 END) as resolved,
-                    COUNT(CASE WHEN status NOT IN ('closed', 'resolved', 'completed', '완료') OR status IS NULL THEN 1 END) as unresolved
-                FROM tb_ticket
-                WHERE file_id = %s
-            """, [file_id])
-            status_count = cursor.fetchone()
-            
-            total_resolved = status_count['resolved'] or 0
-            total_unresolved = status_count['unresolved'] or 0
-            
-            cs_analysis_data = {
-                'total_tickets': total_tickets,
-                'total_resolved': total_resolved,
-                'total_unresolved': total_unresolved,
-                'category_distribution': category_distribution,
-                'channel_distribution': channel_distribution,
-                'status_distribution': status_distribution,
-                'channel_resolution_rates': channel_resolution_rates,
-                'class_result_id': class_result_id
-            }
+            cs_analysis_data = self._build_cs_analysis_data(class_result_id, file_id=file_id)
+            total_tickets = cs_analysis_data['total_tickets']
             
             logger.info(f"CS 분석 데이터 조회 완료: 총 {total_tickets}건")
             return cs_analysis_data
@@ -864,6 +935,72 @@ class ReportDB:
                 'channel_resolution_rates': [],
                 'class_result_id': None
             }
+    
+    def get_ticket_sample(self, file_id: int = None, batch_id: int = None, key_from: int = 0, key_to: int = 0,
+                          strata: Dict[Tuple[Optional[str], Optional[str]], int] = None) -> List[Dict]:
+        """sample_key 범위 [key_from, key_to)의 티켓 표본 조회 (미리보기 리포트용)
+        
+        Args:
+            strata: 층별 추가 추출 {(채널, 접수월 'YYYY-MM'): 층 임계값} - 지정 시 해당 층의 티켓만
+                    [key_from, 층 임계값) 범위로 조회 (key_to는 층 임계값 최댓값, None은 채널/접수일 미기재)
+        
+        Note:
+            - (file_id, sample_key) 인덱스 범위 조회 (무작위 정렬 없음)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            source, source_params = self._ticket_source(cursor, file_id=file_id, batch_id=batch_id)
+            
+            if batch_id:
+                query = f"""
+                    SELECT t.channel, t.received_at, t.status, t.sample_key,
+                           t.classified_category_id as category_id, c.category_name,
+                           CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END as resolved
+                    FROM {source} t
+                    INNER JOIN tb_uploaded_file f ON f.file_id = t.file_id
+                    LEFT JOIN tb_category c ON c.category_id = t.classified_category_id
+                    WHERE f.batch_id = %s AND t.sample_key >= %s AND t.sample_key < %s
+                """
+                params = source_params + [batch_id, key_from, key_to]
+            else:
+                query = f"""
+                    SELECT t.channel, t.received_at, t.status, t.sample_key,
+                           t.classified_category_id as category_id, c.category_name,
+                           CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END as resolved
+                    FROM {source} t
+                    LEFT JOIN tb_category c ON c.category_id = t.classified_category_id
+                    WHERE t.file_id = %s AND t.sample_key >= %s AND t.sample_key < %s
+                """
+                params = source_params + [file_id, key_from, key_to]
+            
+            if strata is not None:
+                conditions = []
+                for (channel, month), stratum_key_to in strata.items():
+                    condition = ["t.sample_key < %s"]
+                    stratum_params = [stratum_key_to]
+                    if channel is None:
+                        condition.append("t.channel IS NULL")
+                    else:
+                        condition.append("t.channel = %s")
+                        stratum_params.append(channel)
+                    if month is None:
+                        condition.append("t.received_at IS NULL")
+                    else:
+                        start = month_start(f"{month}-01")
+                        condition.append("t.received_at >= %s AND t.received_at < %s")
+                        stratum_params.extend([start, next_month(start)])
+                    conditions.append(f"({' AND '.join(condition)})")
+                    params.extend(stratum_params)
+                query += f" AND ({' OR '.join(conditions) or 'FALSE'})"
+            
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        
+        except Exception as e:
+            logger.error(f"티켓 표본 조회 실패: {e}")
+            raise
         finally:
             cursor.close()
             if connection and connection.is_connected():
@@ -906,7 +1043,13 @@ class ReportDB:
                 connection.close()
     
     def save_channel_snapshot(self, report_id: int, channel_trends: Dict) -> bool:
-        """채널 스냅샷 저장 - 채널별 추이 데이터를 평면화하여 저장"""
+        """채널 스냅샷 저장 - 채널별 추이 행렬의 0이 아닌 셀만 평면화하여 저장
+        
+        Note:
+            - 0 셀은 저장하지 않음 (조회 시 get_report_with_snapshots에서 0으로 채워 행렬 복원)
+            - CHANNEL_SNAPSHOT_BATCH_SIZE 행씩 다중 행 INSERT
+            - 버킷 단위(resolution)는 tb_analysis_report.trend_resolution에 기록
+        """
         logger.info(f"채널 스냅샷 저장: report_id={report_id}")
         
         connection = self.db_manager.get_connection()
@@ -917,13 +1060,7 @@ class ReportDB:
             cursor.execute("SELECT category_id, category_name FROM tb_category")
             category_map = {row[1]: row[0] for row in cursor.fetchall()}
             
-            query = """
-                INSERT INTO tb_analysis_channel_snapshot
-                (report_id, channel, time_period, category_id, count)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            
-            snapshot_count = 0
+            rows = []
             current_year = datetime.now().year
             
             # channel_trends 구조: {channel: {categories: [...], dates: [...], dates_full: [...], data: [[...]]}}
@@ -933,42 +1070,55 @@ class ReportDB:
                 dates_full = trend_data.get('dates_full', [])  # DB 저장용 (YYYY-MM-DD)
                 data_matrix = trend_data.get('data', [])
                 
+                category_ids = [category_map.get(category) for category in categories]
+                for category, category_id in zip(categories, category_ids):
+                    if not category_id:
+                        logger.warning(f"카테고리 '{category}' ID를 찾을 수 없습니다. 건너뜀")
+                
                 # 날짜별, 카테고리별 데이터 저장
                 for date_idx, date_display in enumerate(dates):
-                    if date_idx < len(data_matrix):
-                        # DB 저장용 전체 날짜 가져오기
-                        full_date = dates_full[date_idx] if date_idx < len(dates_full) else None
+                    if date_idx >= len(data_matrix):
+                        break
                         
-                        if not full_date:
-                            # 혹시 dates_full이 없으면 현재 연도로 변환
-                            if date_display and '-' in date_display and len(date_display.split('-')) == 2:
-                                month, day = date_display.split('-')
-                                full_date = f"{current_year}-{month}-{day}"
-                            else:
-                                logger.warning(f"날짜 형식 오류: {date_display}, 건너뜀")
-                                continue
+                    counts = data_matrix[date_idx]
+                    if not any(counts):
+                        continue
                         
-                        for cat_idx, category in enumerate(categories):
-                            count = data_matrix[date_idx][cat_idx] if cat_idx < len(data_matrix[date_idx]) else 0
+                    # DB 저장용 전체 날짜 가져오기
+                    full_date = dates_full[date_idx] if date_idx < len(dates_full) else None
                             
-                            # 카테고리 ID 조회
-                            category_id = category_map.get(category)
+                    if not full_date:
+                        # 혹시 dates_full이 없으면 현재 연도로 변환
+                        if date_display and '-' in date_display and len(date_display.split('-')) == 2:
+                            month, day = date_display.split('-')
+                            full_date = f"{current_year}-{month}-{day}"
+                        else:
+                            logger.warning(f"날짜 형식 오류: {date_display}, 건너뜀")
+                            continue
                             
-                            if not category_id:
-                                logger.warning(f"카테고리 '{category}' ID를 찾을 수 없습니다. 건너뜀")
-                                continue
+                    for category_id, count in zip(category_ids, counts):
+                        if category_id and count:
+                            rows.append((report_id, channel, full_date, category_id, int(count)))
                             
-                            cursor.execute(query, (
-                                report_id,
-                                channel,
-                                full_date,  # YYYY-MM-DD 형식
-                                category_id,
-                                int(count) if count else 0
-                            ))
-                            snapshot_count += 1
+            for start in range(0, len(rows), CHANNEL_SNAPSHOT_BATCH_SIZE):
+                chunk = rows[start:start + CHANNEL_SNAPSHOT_BATCH_SIZE]
+                query = """
+                    INSERT INTO tb_analysis_channel_snapshot
+                    (report_id, channel, time_period, category_id, count)
+                    VALUES 
+                """ + ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+                cursor.execute(query, [value for row in chunk for value in row])
+            
+            # 버킷 단위 기록 (조회 시 dates 표시 형식 / resolution 복원용)
+            resolutions = {trend_data.get('resolution') for trend_data in channel_trends.values()} - {None}
+            if resolutions:
+                cursor.execute(
+                    "UPDATE tb_analysis_report SET trend_resolution = %s WHERE report_id = %s",
+                    (resolutions.pop(), report_id)
+                )
             
             connection.commit()
-            logger.info(f"채널 스냅샷 {snapshot_count}건 저장 완료")
+            logger.info(f"채널 스냅샷 {len(rows)}건 저장 완료")
             return True
             
         except Exception as e:
@@ -982,7 +1132,12 @@ class ReportDB:
                 connection.close()
     
     def save_summary_snapshot(self, report_id: int, summary_data: Dict) -> bool:
-        """요약 스냅샷 저장"""
+        """요약 스냅샷 저장
+        
+        Args:
+            summary_data: total_tickets, resolved_count, category_ratios, repeat_rate,
+                          summary_payload (리포트 요약 섹션 원본 - 조회 시 그대로 반환)
+        """
         logger.info(f"요약 스냅샷 저장: report_id={report_id}")
         
         connection = self.db_manager.get_connection()
@@ -1002,20 +1157,22 @@ class ReportDB:
             
             query = """
                 INSERT INTO tb_analysis_summary_snapshot
-                (report_id, total_tickets, resolved_count, category_ratios, repeat_rate, created_at)
-                VALUES (%s, %s, %s, %s, %s, NOW())
+                (report_id, total_tickets, resolved_count, category_ratios, repeat_rate, summary_payload, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, NOW())
             """
             
             # Decimal 변환 적용
             resolved_count = convert_decimals(summary_data.get('resolved_count', {}))
             category_ratios = convert_decimals(summary_data.get('category_ratios', {}))
+            summary_payload = summary_data.get('summary_payload')
             
             cursor.execute(query, (
                 report_id,
                 int(summary_data.get('total_tickets', 0)),
                 json.dumps(resolved_count, ensure_ascii=False),
                 json.dumps(category_ratios, ensure_ascii=False),
-                float(summary_data.get('repeat_rate', 0.0))
+                float(summary_data.get('repeat_rate', 0.0)),
+                json.dumps(convert_decimals(summary_payload), ensure_ascii=False) if summary_payload is not None else None
             ))
             
             connection.commit()
@@ -1089,8 +1246,12 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
-    def complete_report(self, report_id: int, file_path: str = None) -> bool:
-        """리포트 완료 처리"""
+    def complete_report(self, report_id: int, file_path: str = None, stage_timings: Dict = None) -> bool:
+        """리포트 완료 처리
+        
+        Args:
+            stage_timings: 생성 단계별 실행 시간 {단계: ms} (선택)
+        """
         logger.info(f"리포트 완료 처리: report_id={report_id}")
         
         connection = self.db_manager.get_connection()
@@ -1101,12 +1262,17 @@ class ReportDB:
                 UPDATE tb_analysis_report
                 SET status = 'completed', completed_at = NOW()
             """
+            params = []
             
             if file_path:
                 query += ", file_path = %s"
-                cursor.execute(query + " WHERE report_id = %s", (file_path, report_id))
-            else:
-                cursor.execute(query + " WHERE report_id = %s", (report_id,))
+                params.append(file_path)
+            
+            if stage_timings:
+                query += ", stage_timings = %s"
+                params.append(json.dumps(stage_timings, ensure_ascii=False))
+            
+            cursor.execute(query + " WHERE report_id = %s", params + [report_id])
             
             connection.commit()
             logger.info(f"리포트 완료 처리 성공")
@@ -1121,118 +1287,114 @@ class ReportDB:
             if connection and connection.is_connected():
                 connection.close()
     
+    def fail_report(self, report_id: int) -> bool:
+        """리포트 실패 처리 (백그라운드 생성 실패 시)"""
+        logger.info(f"리포트 실패 처리: report_id={report_id}")
+        
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            cursor.execute("""
+                UPDATE tb_analysis_report
+                SET status = 'failed', completed_at = NOW()
+                WHERE report_id = %s
+            """, (report_id,))
+            
+            connection.commit()
+            return True
+        
+        except Exception as e:
+            logger.error(f"리포트 실패 처리 실패: {e}")
+            connection.rollback()
+            return False
+        finally:
+            cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+    
     def _get_current_timestamp(self) -> str:
         """현재 타임스탬프 반환"""
         return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    def get_report_with_snapshots(self, report_id: int) -> Optional[Dict]:
-        """리포트 ID로 리포트 및 스냅샷 데이터 조회"""
-        logger.info(f"리포트 조회: report_id={report_id}")
+    def get_report_with_snapshots(self, report_id: int, line_points: int = 0) -> Optional[Dict]:
+        """리포트 ID로 리포트 및 스냅샷 데이터 조회
         
-        connection = self.db_manager.get_connection()
-        cursor = connection.cursor(dictionary=True)
+        Args:
+            line_points: 전체 합계선 LTTB 점 수 (0 = 사용 안 함, 생성 시와 같은 CHART_LINE_POINTS 전달)
+        
+        Note:
+            - 리포트 + 요약/인사이트/솔루션 스냅샷 1회, 채널 스냅샷 1회 (report_id 인덱스 조회 2개를 동시 실행)
+            - 요약 섹션은 생성 시점에 저장한 summary_payload 그대로 반환 (티켓/롤업 재집계 없음)
+            - summary_payload가 없는 이전 리포트만 _build_legacy_summary로 복원 (최초 1회 복원 후 스냅샷에 저장)
+            - channel_trends는 생성 시 응답과 같은 구조 (categories, dates, dates_full, data, resolution)
+        """
+        logger.info(f"리포트 조회: report_id={report_id}")
         
         try:
-            # 1. 리포트 기본 정보 조회
-            report_query = """
-                SELECT 
-                    r.report_id,
-                    r.file_id,
-                    r.created_by,
-                    r.report_type,
-                    r.title,
-                    r.status,
-                    r.created_at,
-                    r.completed_at
-                FROM tb_analysis_report r
-                WHERE r.report_id = %s
-            """
-            cursor.execute(report_query, [report_id])
-            report = cursor.fetchone()
-            
-            if not report:
+            # 1. 리포트 기본 정보 + 최신 요약/인사이트/솔루션 스냅샷, 2. 채널 스냅샷 (동시 조회)
+            results = fetch_concurrently({
+                'report': (f"""
+                    SELECT 
+                        r.report_id,
+                        r.file_id,
+                        r.batch_id,
+                        r.created_by,
+                        r.report_type,
+                        r.title,
+                        r.status,
+                        r.created_at,
+                        r.completed_at,
+                        r.trend_resolution,
+                        s.summary_snapshot_id,
+                        s.total_tickets,
+                        s.resolved_count,
+                        s.category_ratios,
+                        s.summary_payload,
+                        i.insight_payload,
+                        so.solution_payload
+                    FROM tb_analysis_report r
+                    LEFT JOIN tb_analysis_summary_snapshot s ON s.summary_snapshot_id = (
+                        SELECT MAX(summary_snapshot_id) FROM tb_analysis_summary_snapshot WHERE report_id = r.report_id
+                    )
+                    LEFT JOIN tb_analysis_insight_snapshot i ON i.insight_id = (
+                        SELECT MAX(insight_id) FROM tb_analysis_insight_snapshot WHERE report_id = r.report_id
+                    )
+                    LEFT JOIN tb_analysis_solution_snapshot so ON so.solution_id = (
+                        SELECT MAX(solution_id) FROM tb_analysis_solution_snapshot WHERE report_id = r.report_id
+                    )
+                    WHERE r.report_id = %s
+                      AND {_ACTIVE_REPORT_TARGET}
+                """, [report_id], 'one'),
+                'channels': ("""
+                    SELECT 
+                        cs.channel,
+                        cs.time_period,
+                        c.category_name,
+                        cs.count
+                    FROM tb_analysis_channel_snapshot cs
+                    LEFT JOIN tb_category c ON cs.category_id = c.category_id
+                    WHERE cs.report_id = %s
+                    ORDER BY cs.channel_snapshot_id
+                """, [report_id])
+            })
+            row = results['report']
+            channel_results = results['channels']
+        
+            if not row:
                 logger.warning(f"리포트를 찾을 수 없음: report_id={report_id}")
                 return None
             
-            # 2. Summary 스냅샷 조회
-            summary_query = """
-                SELECT 
-                    total_tickets,
-                    resolved_count,
-                    category_ratios,
-                    repeat_rate
-                FROM tb_analysis_summary_snapshot
-                WHERE report_id = %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """
-            cursor.execute(summary_query, [report_id])
-            summary_result = cursor.fetchone()
-            
-            if summary_result:
-                # JSON 컬럼은 문자열로 반환될 수 있으므로 파싱 필요
-                resolved_count = summary_result.get('resolved_count', {})
-                if isinstance(resolved_count, str):
-                    resolved_count = json.loads(resolved_count)
-                
-                category_ratios = summary_result.get('category_ratios', {})
-                if isinstance(category_ratios, str):
-                    category_ratios = json.loads(category_ratios)
-                
-                # 새 구조로 변환
-                total_cs = summary_result.get('total_tickets', 0)
-                
-                # categories 배열로 변환
-                categories = []
-                for cat_name, percentage in category_ratios.items():
-                    count = int(total_cs * float(percentage) / 100) if total_cs > 0 else 0
-                    categories.append({
-                        'category_name': cat_name,
-                        'count': count,
-                        'percentage': float(percentage)
-                    })
-                
-                # channels 배열로 변환 (file_id로 실제 데이터 조회)
-                channels = []
-                file_id = report.get('file_id')
-                
-                if file_id:
-                    # 실제 채널별 해결률 데이터 조회
-                    channel_query_real = """
-                        SELECT 
-                            channel,
-                            COUNT(*) as total,
-                            SUM(CASE WHEN status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END) as resolved
-                        FROM tb_ticket
-                        WHERE file_id = %s
-                        GROUP BY channel
-                    """
-                    cursor.execute(channel_query_real, [file_id])
-                    channel_rows = cursor.fetchall()
-                    
-                    for row in channel_rows:
-                        resolution_rate = round((row['resolved'] / row['total'] * 100), 1) if row['total'] > 0 else 0
-                        channels.append({
-                            'channel': row['channel'] or '미분류',
-                            'total': row['total'],
-                            'resolved': row['resolved'],
-                            'resolution_rate': resolution_rate
-                        })
-                else:
-                    # file_id가 없으면 스냅샷 데이터만 사용
-                    for channel_name, resolution_rate in resolved_count.items():
-                        channels.append({
-                            'channel': channel_name,
-                            'total': 0,
-                            'resolved': 0,
-                            'resolution_rate': float(resolution_rate)
-                        })
-                
-                summary = {
-                    'total_cs_count': total_cs,
-                    'categories': categories,
-                    'channels': channels
-                }
+            report = {key: row[key] for key in (
+                'report_id', 'file_id', 'batch_id', 'created_by', 'report_type',
+                'title', 'status', 'created_at', 'completed_at'
+            )}
+            
+            # 요약 스냅샷 (생성 시점의 리포트 요약 섹션)
+            if row['summary_payload']:
+                summary = self._load_json(row['summary_payload'])
+            elif row['summary_snapshot_id']:
+                summary = self._build_legacy_summary(row)
             else:
                 summary = {
                     'total_cs_count': 0,
@@ -1240,103 +1402,22 @@ class ReportDB:
                     'channels': []
                 }
             
-            # 3. Insight 스냅샷 조회
-            insight_query = """
-                SELECT insight_payload
-                FROM tb_analysis_insight_snapshot
-                WHERE report_id = %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """
-            cursor.execute(insight_query, [report_id])
-            insight_result = cursor.fetchone()
-            
-            if insight_result:
-                insight_payload = insight_result.get('insight_payload', {})
-                if isinstance(insight_payload, str):
-                    insight = json.loads(insight_payload)
-                else:
-                    insight = insight_payload
-            else:
-                insight = {}
-            
-            # 4. Solution 스냅샷 조회
-            solution_query = """
-                SELECT solution_payload
-                FROM tb_analysis_solution_snapshot
-                WHERE report_id = %s
-                ORDER BY created_at DESC
-                LIMIT 1
-            """
-            cursor.execute(solution_query, [report_id])
-            solution_result = cursor.fetchone()
-            
-            if solution_result:
-                solution_payload = solution_result.get('solution_payload', {})
-                if isinstance(solution_payload, str):
-                    solution = json.loads(solution_payload)
-                else:
-                    solution = solution_payload
-            else:
-                solution = {}
-            
-            # 5. Channel 스냅샷 조회 (여러 행을 그룹화)
-            channel_query = """
-                SELECT 
-                    cs.channel,
-                    cs.time_period,
-                    cs.category_id,
-                    c.category_name,
-                    cs.count
-                FROM tb_analysis_channel_snapshot cs
-                LEFT JOIN tb_category c ON cs.category_id = c.category_id
-                WHERE cs.report_id = %s
-                ORDER BY cs.channel, cs.time_period, cs.category_id
-            """
-            cursor.execute(channel_query, [report_id])
-            channel_results = cursor.fetchall()
+            insight = self._load_json(row['insight_payload']) if row['insight_payload'] else {}
+            solution = self._load_json(row['solution_payload']) if row['solution_payload'] else {}
             
-            # 채널별로 데이터 그룹화 및 변환
-            channel_trends = {}
+            # 채널별 추이 행렬 복원 (희소 저장: 없는 날짜×카테고리 셀은 0으로 채움)
+            # 저장 순서(채널 → 날짜 → 카테고리, 생성 시 행렬 순서)로 피벗하므로 채널/카테고리/날짜 순서도 동일
             if channel_results:
-                from collections import defaultdict
-                
-                # 채널별로 그룹화
-                grouped = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-                dates_set = set()
-                categories_by_channel = defaultdict(set)
-                
-                for row in channel_results:
-                    channel = row['channel']
-                    time_period = row['time_period']
-                    category_name = row.get('category_name', '미분류')
-                    count = row['count']
-                    
-                    grouped[channel][time_period][category_name] = count
-                    dates_set.add(time_period)
-                    categories_by_channel[channel].add(category_name)
-                
-                # 날짜 정렬
-                dates_sorted = sorted(list(dates_set))
-                
-                # 채널별로 데이터 구조 생성
-                for channel in grouped.keys():
-                    categories = sorted(list(categories_by_channel[channel]))
-                    
-                    # 데이터 매트릭스 생성
-                    data_matrix = []
-                    for date in dates_sorted:
-                        row_data = []
-                        for category in categories:
-                            row_data.append(grouped[channel][date].get(category, 0))
-                        data_matrix.append(row_data)
-                    
-                    channel_trends[channel] = {
-                        'dates': dates_sorted,
-                        'categories': categories,
-                        'data': data_matrix
-                    }
-                
+                resolution = row['trend_resolution'] or 'day'
+                trend_rows = [
+                    {'channel': snapshot['channel'], 'category_name': snapshot['category_name'],
+                     'date': to_date(snapshot['time_period']), 'count': snapshot['count']}
+                    for snapshot in channel_results
+                ]
+                channel_trends = downsample_channel_trends(
+                    build_channel_trends(trend_rows, RESOLUTION_LABEL_FORMATS.get(resolution, '%m-%d')),
+                    resolution, line_points=line_points
+                )
                 logger.info(f"채널별 추이 데이터 구성 완료: {len(channel_trends)}개 채널")
             else:
                 channel_trends = {}
@@ -1357,7 +1438,69 @@ class ReportDB:
         except Exception as e:
             logger.error(f"리포트 조회 실패: {e}")
             return None
+    
+    @staticmethod
+    def _load_json(value):
+        """JSON 컬럼 값 파싱 (드라이버에 따라 문자열로 반환될 수 있음)"""
+        return json.loads(value) if isinstance(value, str) else value
+    
+    def _build_legacy_summary(self, row: Dict) -> Dict:
+        """summary_payload 없이 저장된 이전 리포트의 요약 섹션 복원 (1회성 백필)
+        
+        Note:
+            - 생성 시점에 저장된 스냅샷 컬럼(category_ratios, resolved_count)만 사용
+              (현재 티켓/롤업을 읽지 않으므로 복원 결과를 summary_payload로 저장해도 생성 시점 값이 유지됨)
+            - 카테고리 건수는 비율로 역산
+        """
+        resolved_count = self._load_json(row.get('resolved_count') or {})
+        category_ratios = self._load_json(row.get('category_ratios') or {})
+        total_cs = row.get('total_tickets', 0)
+        
+        # categories 배열로 변환
+        categories = []
+        for cat_name, percentage in category_ratios.items():
+            count = int(total_cs * float(percentage) / 100) if total_cs > 0 else 0
+            categories.append({
+                'category_name': cat_name,
+                'count': count,
+                'percentage': float(percentage)
+            })
+        
+        # channels 배열로 변환 (스냅샷에는 채널별 해결률만 저장되어 있음 - 건수는 0)
+        channels = []
+        for channel_name, resolution_rate in resolved_count.items():
+            channels.append({
+                'channel': channel_name,
+                'total': 0,
+                'resolved': 0,
+                'resolution_rate': float(resolution_rate)
+            })
+        
+        summary = {
+            'total_cs_count': total_cs,
+            'categories': categories,
+            'channels': channels
+        }
+        self._backfill_summary_payload(row['summary_snapshot_id'], summary)
+        return summary
+
+    def _backfill_summary_payload(self, summary_snapshot_id: int, summary: Dict):
+        """복원한 요약 섹션을 이전 리포트의 요약 스냅샷에 저장 (실패해도 조회 결과에는 영향 없음)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            cursor.execute("""
+                UPDATE tb_analysis_summary_snapshot
+                SET summary_payload = %s
+                WHERE summary_snapshot_id = %s AND summary_payload IS NULL
+            """, (json.dumps(summary, ensure_ascii=False), summary_snapshot_id))
+            connection.commit()
+            logger.info(f"이전 리포트 요약 스냅샷 백필: summary_snapshot_id={summary_snapshot_id}")
+        except Exception as e:
+            logger.warning(f"이전 리포트 요약 스냅샷 백필 실패: {e}")
+            connection.rollback()
         finally:
             cursor.close()
             if connection and connection.is_connected():
-                connection.close()
\ No newline at end of file
+                connection.close()
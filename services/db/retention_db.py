@@ -0,0 +1,420 @@
+from utils.database import db_manager
+from utils.logger import get_logger
+from utils.report_cache import report_cache
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+
+logger = get_logger(__name__)
+
+# 퍼지 단계 정의: (테이블, PK 컬럼, 대상 조건)
+# - 자식 테이블 → 부모 테이블 순서 (중단 후 재개해도 고아 행이 남지 않도록)
+# - PK 컬럼이 None이면 소규모 테이블로 보고 한 번에 삭제
+_CLASS_RESULT_IDS = "class_result_id IN (SELECT class_result_id FROM tb_classification_result WHERE {key} = %s)"
+_REPORT_IDS = "report_id IN (SELECT report_id FROM tb_analysis_report WHERE {key} = %s)"
+
+_RESULT_STEPS = [
+    ('tb_classification_category_result', 'cat_result_id', _CLASS_RESULT_IDS),
+    ('tb_classification_channel_result', 'ch_result_id', _CLASS_RESULT_IDS),
+    ('tb_classification_reliability_result', 'reliability_id', _CLASS_RESULT_IDS),
+    ('tb_analysis_channel_snapshot', 'channel_snapshot_id', _REPORT_IDS),
+    ('tb_analysis_summary_snapshot', 'summary_snapshot_id', _REPORT_IDS),
+    ('tb_analysis_solution_snapshot', 'solution_id', _REPORT_IDS),
+    ('tb_analysis_insight_snapshot', 'insight_id', _REPORT_IDS),
+    ('tb_classification_result', 'class_result_id', "{key} = %s"),
+    ('tb_analysis_report', 'report_id', "{key} = %s"),
+]
+
+PURGE_STEPS = {
+    'file': [
+        ('tb_ticket', 'ticket_id', "file_id = %s"),
+        ('tb_ticket_archive', 'ticket_id', "file_id = %s"),
+        ('tb_ticket_archive_log', None, "file_id = %s"),
+        ('tb_ticket_daily_rollup', 'rollup_id', "file_id = %s"),
+        ('tb_column_mapping', 'mapping_id', "file_id = %s"),
+    ] + [(table, pk, where.format(key='file_id')) for table, pk, where in _RESULT_STEPS],
+    'batch': [(table, pk, where.format(key='batch_id')) for table, pk, where in _RESULT_STEPS],
+}
+
+
+class RetentionDB:
+    """데이터 보존 정책 / 소프트 삭제 / 퍼지 관련 데이터베이스 작업 클래스"""
+    
+    def __init__(self):
+        self.db_manager = db_manager
+    
+    # ========================================
+    # 소프트 삭제
+    # ========================================
+    
+    def _enqueue_purge_job(self, cursor, target_type: str, target_id: int):
+        """퍼지 작업 등록 (이미 있으면 유지)"""
+        cursor.execute("""
+            SELECT job_id FROM tb_purge_job
+            WHERE target_type = %s AND target_id = %s
+        """, (target_type, target_id))
+        
+        if cursor.fetchone() is None:
+            cursor.execute("""
+                INSERT INTO tb_purge_job (target_type, target_id, status, deleted_rows, created_at, updated_at)
+                VALUES (%s, %s, 'pending', 0, %s, %s)
+            """, (target_type, target_id, datetime.now(), datetime.now()))
+    
+    def soft_delete_file(self, file_id: int) -> bool:
+        """파일 소프트 삭제 + 퍼지 작업 등록
+        
+        Returns:
+            bool: 새로 삭제 처리되었으면 True (이미 삭제된 파일이면 False)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                UPDATE tb_uploaded_file
+                SET is_deleted = TRUE, deleted_at = %s
+                WHERE file_id = %s
+                  AND (is_deleted IS NULL OR is_deleted = FALSE)
+            """, (datetime.now(), file_id))
+            
+            deleted = cursor.rowcount > 0
+            if deleted:
+                self._enqueue_purge_job(cursor, 'file', file_id)
+            
+            connection.commit()
+            logger.info(f"파일 소프트 삭제: file_id={file_id}, 처리={deleted}")
+            return deleted
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"파일 소프트 삭제 실패: file_id={file_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def soft_delete_batch(self, batch_id: int) -> List[int]:
+        """배치 소프트 삭제 (소속 파일 포함) + 퍼지 작업 등록
+        
+        Note:
+            파일 작업을 먼저 등록하여 배치 작업(배치 단위 분류/리포트)이 마지막에 처리됨
+        
+        Returns:
+            list: 새로 삭제 처리된 파일 ID 목록
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT file_id FROM tb_uploaded_file
+                WHERE batch_id = %s
+                  AND (is_deleted IS NULL OR is_deleted = FALSE)
+                ORDER BY file_id
+            """, (batch_id,))
+            file_ids = [row['file_id'] for row in cursor.fetchall()]
+            
+            now = datetime.now()
+            for file_id in file_ids:
+                cursor.execute("""
+                    UPDATE tb_uploaded_file
+                    SET is_deleted = TRUE, deleted_at = %s
+                    WHERE file_id = %s
+                """, (now, file_id))
+                self._enqueue_purge_job(cursor, 'file', file_id)
+            
+            cursor.execute("""
+                UPDATE tb_file_batch SET status = 'deleted'
+                WHERE batch_id = %s
+            """, (batch_id,))
+            self._enqueue_purge_job(cursor, 'batch', batch_id)
+            
+            connection.commit()
+            logger.info(f"배치 소프트 삭제: batch_id={batch_id}, 파일 {len(file_ids)}개")
+            return file_ids
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"배치 소프트 삭제 실패: batch_id={batch_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    # ========================================
+    # 보존 정책
+    # ========================================
+    
+    def get_policies(self) -> List[Dict[str, Any]]:
+        """보존 정책 전체 조회"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT policy_id, user_id, batch_id, retention_days
+                FROM tb_retention_policy
+                ORDER BY policy_id
+            """)
+            return cursor.fetchall()
+        
+        except Exception as e:
+            logger.error(f"보존 정책 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def set_policy(self, retention_days: int, user_id: int = None, batch_id: int = None):
+        """사용자 또는 배치 단위 보존 정책 저장 (UPDATE 후 없으면 INSERT)"""
+        if (user_id is None) == (batch_id is None):
+            raise ValueError("user_id와 batch_id 중 하나만 지정해야 합니다")
+        
+        column, target_id = ('batch_id', batch_id) if batch_id is not None else ('user_id', user_id)
+        other = 'user_id' if column == 'batch_id' else 'batch_id'
+        
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            cursor.execute(f"""
+                UPDATE tb_retention_policy
+                SET retention_days = %s, updated_at = %s
+                WHERE {column} = %s AND {other} IS NULL
+            """, (retention_days, datetime.now(), target_id))
+            
+            if cursor.rowcount == 0:
+                cursor.execute(f"""
+                    INSERT INTO tb_retention_policy ({column}, retention_days, created_at, updated_at)
+                    VALUES (%s, %s, %s, %s)
+                """, (target_id, retention_days, datetime.now(), datetime.now()))
+            
+            connection.commit()
+            logger.info(f"보존 정책 저장: {column}={target_id}, {retention_days}일")
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"보존 정책 저장 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def get_active_files(self) -> List[Dict[str, Any]]:
+        """삭제되지 않은 파일 목록 (보존 기간 판정용)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT file_id, user_id, batch_id, created_at
+                FROM tb_uploaded_file
+                WHERE (is_deleted IS NULL OR is_deleted = FALSE)
+                ORDER BY file_id
+            """)
+            return cursor.fetchall()
+        
+        except Exception as e:
+            logger.error(f"활성 파일 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    # ========================================
+    # 퍼지 작업
+    # ========================================
+    
+    def get_resumable_jobs(self, limit: int = None) -> List[Dict[str, Any]]:
+        """처리할 퍼지 작업 조회 (pending + 중단된 running + failed, 등록 순)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            query = """
+                SELECT job_id, target_type, target_id, status, current_step, last_pk, deleted_rows
+                FROM tb_purge_job
+                WHERE status IN ('pending', 'running', 'failed')
+                ORDER BY job_id
+            """
+            if limit:
+                query += f" LIMIT {int(limit)}"
+            
+            cursor.execute(query)
+            return cursor.fetchall()
+        
+        except Exception as e:
+            logger.error(f"퍼지 작업 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def update_job_status(self, job_id: int, status: str, error_message: str = None):
+        """퍼지 작업 상태 변경 (completed면 완료 시각 기록)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            now = datetime.now()
+            cursor.execute("""
+                UPDATE tb_purge_job
+                SET status = %s, error_message = %s, updated_at = %s,
+                    completed_at = %s
+                WHERE job_id = %s
+            """, (status, error_message, now, now if status == 'completed' else None, job_id))
+            connection.commit()
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"퍼지 작업 상태 변경 실패: job_id={job_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def purge_chunk(self, job_id: int, table: str, pk: Optional[str], where: str,
+                    target_id: int, last_pk: Optional[int], chunk_size: int) -> Tuple[int, Optional[int]]:
+        """한 청크 삭제 + 진행 상황 기록 (단일 트랜잭션)
+        
+        PK 오름차순으로 last_pk 다음부터 최대 chunk_size행의 PK 상한을 먼저 찾고
+        (last_pk, 상한] 범위만 삭제하여 잠금 범위를 제한함
+        
+        Args:
+            job_id: 퍼지 작업 ID
+            table: 대상 테이블
+            pk: PK 컬럼 (None이면 조건에 맞는 행을 한 번에 삭제)
+            where: 대상 조건 (%s 하나 = target_id)
+            target_id: file_id 또는 batch_id
+            last_pk: 이전 청크까지 삭제한 PK (처음이면 None)
+            chunk_size: 청크 크기
+        
+        Returns:
+            Tuple[int, Optional[int]]: (삭제 행 수, 다음 재개 PK - 테이블 완료 시 None)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            if pk is None:
+                cursor.execute(f"DELETE FROM {table} WHERE {where}", (target_id,))
+                deleted, next_pk = cursor.rowcount, None
+            else:
+                start = last_pk if last_pk is not None else -1
+                cursor.execute(f"""
+                    SELECT {pk} FROM {table}
+                    WHERE {where} AND {pk} > %s
+                    ORDER BY {pk}
+                    LIMIT 1 OFFSET %s
+                """, (target_id, start, chunk_size - 1))
+                row = cursor.fetchone()
+                upper = row[0] if row else None
+                
+                if upper is None:
+                    # 마지막 청크 (chunk_size 미만)
+                    cursor.execute(f"DELETE FROM {table} WHERE {where} AND {pk} > %s",
+                                   (target_id, start))
+                    next_pk = None
+                else:
+                    cursor.execute(f"DELETE FROM {table} WHERE {where} AND {pk} > %s AND {pk} <= %s",
+                                   (target_id, start, upper))
+                    next_pk = upper
+                deleted = cursor.rowcount
+            
+            cursor.execute("""
+                UPDATE tb_purge_job
+                SET status = 'running', current_step = %s, last_pk = %s,
+                    deleted_rows = deleted_rows + %s, updated_at = %s
+                WHERE job_id = %s
+            """, (table, next_pk, max(deleted, 0), datetime.now(), job_id))
+            
+            connection.commit()
+            return max(deleted, 0), next_pk
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"청크 삭제 실패: job_id={job_id}, {table}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def get_report_file_paths(self, target_type: str, target_id: int) -> List[str]:
+        """대상 파일/배치의 리포트 산출물 경로 조회"""
+        column = 'file_id' if target_type == 'file' else 'batch_id'
+        
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute(f"""
+                SELECT file_path FROM tb_analysis_report
+                WHERE {column} = %s AND file_path IS NOT NULL
+            """, (target_id,))
+            return [row['file_path'] for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"리포트 파일 경로 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def get_storage_path(self, file_id: int) -> Optional[str]:
+        """업로드 파일 저장 경로 조회"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT storage_path FROM tb_uploaded_file WHERE file_id = %s
+            """, (file_id,))
+            row = cursor.fetchone()
+            return row['storage_path'] if row else None
+        
+        except Exception as e:
+            logger.error(f"저장 경로 조회 실패: file_id={file_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def complete_purge(self, job_id: int, target_type: str, target_id: int):
+        """퍼지 완료 처리 (파일/배치 행은 'purged' 상태로 남겨 이력 유지)"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            now = datetime.now()
+            if target_type == 'file':
+                cursor.execute("""
+                    UPDATE tb_uploaded_file
+                    SET status = 'purged', storage_path = NULL
+                    WHERE file_id = %s
+                """, (target_id,))
+            else:
+                cursor.execute("""
+                    UPDATE tb_file_batch SET status = 'purged'
+                    WHERE batch_id = %s
+                """, (target_id,))
+            
+            cursor.execute("""
+                UPDATE tb_purge_job
+                SET status = 'completed', current_step = NULL, last_pk = NULL,
+                    error_message = NULL, updated_at = %s, completed_at = %s
+                WHERE job_id = %s
+            """, (now, now, job_id))
+            
+            connection.commit()
+        
+            if target_type == 'file':
+                report_cache.invalidate(file_id=target_id)
+            else:
+                report_cache.invalidate(batch_id=target_id)
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"퍼지 완료 처리 실패: job_id={job_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
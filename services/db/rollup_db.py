@@ -0,0 +1,277 @@
+from utils.database import db_manager
+from utils.logger import get_logger
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+
+logger = get_logger(__name__)
+
+# 롤업 컬럼 (hot/archive 티어 모두에서 집계)
+_ROLLUP_SOURCE = """
+    SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status
+    FROM tb_ticket WHERE file_id IN ({ids})
+    UNION ALL
+    SELECT file_id, received_at, channel, classified_category_id, classification_confidence, status
+    FROM tb_ticket_archive WHERE file_id IN ({ids})
+"""
+
+_ROLLUP_COLUMNS = """(file_id, stat_date, channel, category_id, status, ticket_count, resolved_count, confidence_sum, updated_at)"""
+
+# 처리 완료 티켓 판정 (별칭 t)
+_RESOLVED_CASE = "CASE WHEN t.status IN ('closed', 'resolved', 'completed', '완료') THEN 1 ELSE 0 END"
+
+# 롤업 키(uk_daily_rollup_key)가 이미 있으면 증감분 합산
+_ROLLUP_UPSERT = """
+    ON DUPLICATE KEY UPDATE
+        ticket_count = ticket_count + VALUES(ticket_count),
+        resolved_count = resolved_count + VALUES(resolved_count),
+        confidence_sum = confidence_sum + VALUES(confidence_sum),
+        updated_at = VALUES(updated_at)
+"""
+
+
+def refresh_ticket_rollup(cursor, file_ids: List[int]) -> int:
+    """파일 단위 일별 롤업 재계산 (호출 측 트랜잭션에서 실행, 커밋은 호출 측)
+    
+    Note:
+        원본 티켓 전체를 다시 집계하므로 복구(rebuild)용 - 저장/분류 시에는 증감분만 반영
+        (add_tickets_to_rollup, apply_rollup_deltas)
+    
+    Args:
+        cursor: 호출 측 연결의 커서
+        file_ids: 재계산할 파일 ID 목록
+    
+    Returns:
+        int: 저장한 롤업 행 수
+    """
+    file_ids = sorted({file_id for file_id in file_ids if file_id})
+    if not file_ids:
+        return 0
+    
+    placeholders = ', '.join(['%s'] * len(file_ids))
+    cursor.execute(f"DELETE FROM tb_ticket_daily_rollup WHERE file_id IN ({placeholders})", file_ids)
+    
+    cursor.execute(f"""
+        INSERT INTO tb_ticket_daily_rollup {_ROLLUP_COLUMNS}
+        SELECT
+            t.file_id,
+            DATE(t.received_at),
+            t.channel,
+            t.classified_category_id,
+            t.status,
+            COUNT(*),
+            SUM({_RESOLVED_CASE}),
+            COALESCE(SUM(t.classification_confidence), 0),
+            %s
+        FROM ({_ROLLUP_SOURCE.format(ids=placeholders)}) t
+        WHERE t.file_id IS NOT NULL
+        GROUP BY t.file_id, DATE(t.received_at), t.channel, t.classified_category_id, t.status
+        {_ROLLUP_UPSERT}
+    """, [datetime.now()] + file_ids + file_ids)
+    
+    return cursor.rowcount
+
+
+def add_tickets_to_rollup(cursor, file_ids: List[int], after_ticket_id: int) -> int:
+    """방금 저장한 티켓(tb_ticket, ticket_id > after_ticket_id)을 일별 롤업에 더함 (호출 측 트랜잭션)
+    
+    Args:
+        cursor: 티켓을 저장한 연결의 커서
+        file_ids: 저장한 티켓의 파일 ID 목록
+        after_ticket_id: 저장 전 해당 파일들의 최대 ticket_id
+    
+    Returns:
+        int: 영향받은 롤업 행 수
+    """
+    file_ids = sorted({file_id for file_id in file_ids if file_id})
+    if not file_ids:
+        return 0
+    
+    placeholders = ', '.join(['%s'] * len(file_ids))
+    cursor.execute(f"""
+        INSERT INTO tb_ticket_daily_rollup {_ROLLUP_COLUMNS}
+        SELECT
+            t.file_id,
+            DATE(t.received_at),
+            t.channel,
+            t.classified_category_id,
+            t.status,
+            COUNT(*),
+            SUM({_RESOLVED_CASE}),
+            COALESCE(SUM(t.classification_confidence), 0),
+            %s
+        FROM tb_ticket t
+        WHERE t.file_id IN ({placeholders})
+          AND t.ticket_id > %s
+        GROUP BY t.file_id, DATE(t.received_at), t.channel, t.classified_category_id, t.status
+        {_ROLLUP_UPSERT}
+    """, [datetime.now()] + file_ids + [after_ticket_id])
+    
+    return cursor.rowcount
+
+
+def get_ticket_rollup_keys(cursor, table: str, ticket_ids: List[int]) -> Dict[int, tuple]:
+    """티켓별 롤업 키와 기여분 일괄 조회 (분류 갱신 전 호출)
+    
+    Returns:
+        dict: {ticket_id: (file_id, stat_date, channel, category_id, status, resolved, confidence)} - 테이블에 있는 티켓만
+    """
+    if not ticket_ids:
+        return {}
+    
+    cursor.execute(f"""
+        SELECT t.ticket_id, t.file_id, DATE(t.received_at), t.channel, t.classified_category_id, t.status,
+               {_RESOLVED_CASE}, t.classification_confidence
+        FROM {table} t
+        WHERE t.ticket_id IN ({', '.join(['%s'] * len(ticket_ids))})
+    """, list(ticket_ids))
+    return {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+
+
+def add_reclassify_delta(deltas: Dict[tuple, List], previous: tuple,
+                         category_id: Optional[int], confidence: Optional[float]):
+    """재분류된 티켓 1건의 증감을 누적 (이전 카테고리 -1, 새 카테고리 +1, 신뢰도 합계 차이)
+    
+    Args:
+        deltas: {(file_id, stat_date, channel, category_id, status): [티켓 수, 처리 완료 수, 신뢰도 합계]} 누적 대상
+        previous: get_ticket_rollup_keys 값 (갱신 전)
+        category_id, confidence: 새 분류 결과
+    """
+    file_id, stat_date, channel, old_category_id, status, resolved, old_confidence = previous
+    
+    old = deltas.setdefault((file_id, stat_date, channel, old_category_id, status), [0, 0, 0.0])
+    old[0] -= 1
+    old[1] -= resolved
+    old[2] -= old_confidence or 0
+    
+    new = deltas.setdefault((file_id, stat_date, channel, category_id, status), [0, 0, 0.0])
+    new[0] += 1
+    new[1] += resolved
+    new[2] += confidence or 0
+
+
+def apply_rollup_deltas(cursor, deltas: Dict[tuple, List]) -> int:
+    """누적한 증감을 일별 롤업에 한 번에 반영 (호출 측 트랜잭션)
+    
+    Args:
+        cursor: 티켓을 갱신한 연결의 커서
+        deltas: add_reclassify_delta로 누적한 증감
+    
+    Returns:
+        int: 반영한 롤업 키 수
+    """
+    rows = [key + tuple(delta) for key, delta in deltas.items() if any(delta)]
+    if not rows:
+        return 0
+    
+    now = datetime.now()
+    cursor.execute(
+        f"INSERT INTO tb_ticket_daily_rollup {_ROLLUP_COLUMNS} VALUES "
+        + ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+        + _ROLLUP_UPSERT,
+        [value for row in rows for value in row + (now,)]
+    )
+    
+    # 티켓이 모두 빠진 키는 삭제 (0건 행이 분포/추이에 빈 카테고리로 나타나지 않도록)
+    emptied_file_ids = sorted({row[0] for row in rows if row[5] < 0})
+    if emptied_file_ids:
+        cursor.execute(f"""
+            DELETE FROM tb_ticket_daily_rollup
+            WHERE file_id IN ({', '.join(['%s'] * len(emptied_file_ids))})
+              AND ticket_count <= 0
+        """, emptied_file_ids)
+    
+    return len(rows)
+
+
+class TicketRollupDB:
+    """일별 채널×카테고리 티켓 롤업(tb_ticket_daily_rollup) 관련 데이터베이스 작업 클래스
+    
+    Note:
+        - (파일, 접수일, 채널, 카테고리, 상태) 단위로 티켓 수 / 처리 완료 수 / 신뢰도 합계 보관
+        - 티켓 저장 시 저장한 청크만, 재분류 시 갱신한 티켓만 증감 반영 (키: uk_daily_rollup_key)
+        - refresh_files / rebuild는 원본 티켓 전체 재집계 (복구용)
+        - 배치 조회는 tb_uploaded_file.batch_id로 파일 행을 합산
+    """
+    
+    def __init__(self):
+        self.db_manager = db_manager
+    
+    def refresh_files(self, file_ids: List[int]) -> int:
+        """파일 단위 롤업 재계산
+        
+        Returns:
+            int: 저장한 롤업 행 수
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            rows = refresh_ticket_rollup(cursor, file_ids)
+            connection.commit()
+            logger.debug(f"일별 롤업 갱신: 파일 {len(file_ids)}개, {rows}행")
+            return rows
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"일별 롤업 갱신 실패: file_ids={file_ids}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def get_batch_file_ids(self, batch_id: int) -> List[int]:
+        """배치에 속한 파일 ID 목록"""
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("SELECT file_id FROM tb_uploaded_file WHERE batch_id = %s", [batch_id])
+            return [row['file_id'] for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"배치 파일 목록 조회 실패: batch_id={batch_id}, {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def rebuild(self, file_id: int = None, chunk_size: int = 50) -> Dict[str, Any]:
+        """원본 티켓(hot + archive)으로 롤업 복구
+        
+        Args:
+            file_id: 특정 파일만 복구 (기본값: 전체)
+            chunk_size: 한 트랜잭션에서 재계산할 파일 수
+        
+        Returns:
+            dict: {'files': int, 'rows': int}
+        """
+        if file_id:
+            file_ids = [file_id]
+        else:
+            connection = self.db_manager.get_connection()
+            cursor = connection.cursor(dictionary=True)
+            
+            try:
+                cursor.execute("""
+                    SELECT file_id FROM tb_ticket
+                    UNION
+                    SELECT file_id FROM tb_ticket_archive
+                    UNION
+                    SELECT file_id FROM tb_ticket_daily_rollup
+                """)
+                file_ids = sorted(row['file_id'] for row in cursor.fetchall() if row['file_id'])
+            
+            except Exception as e:
+                logger.error(f"롤업 복구 대상 조회 실패: {e}")
+                raise
+            finally:
+                cursor.close()
+                connection.close()
+        
+        # 티켓이 모두 삭제된 파일은 DELETE만 수행되어 롤업 행이 정리됨
+        rows = 0
+        for start in range(0, len(file_ids), chunk_size):
+            rows += self.refresh_files(file_ids[start:start + chunk_size])
+        
+        logger.info(f"일별 롤업 복구 완료: 파일 {len(file_ids)}개, {rows}행")
+        return {'files': len(file_ids), 'rows': rows}
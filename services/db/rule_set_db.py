@@ -0,0 +1,102 @@
+from utils.database import db_manager
+from utils.logger import get_logger
+from typing import Dict, List, Any
+from datetime import datetime
+
+logger = get_logger(__name__)
+
+
+class RuleSetDB:
+    """규칙 기반 분류 규칙 세트 관련 데이터베이스 작업 클래스"""
+    
+    def __init__(self):
+        self.db_manager = db_manager
+    
+    def get_rules(self) -> Dict[str, List[Any]]:
+        """
+        활성 규칙 조회
+        
+        Returns:
+            {'keyword': [(pattern, category_name), ...], 'inquiry': [(pattern, category_name), ...],
+             'priority': [category_name, ...]} - 모두 검사 순서대로
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor(dictionary=True)
+        
+        try:
+            cursor.execute("""
+                SELECT rule_type, pattern, category_name
+                FROM tb_classification_rule
+                WHERE is_active = TRUE
+                ORDER BY rule_type, sort_order, rule_id
+            """)
+            
+            rules = {'keyword': [], 'inquiry': [], 'priority': []}
+            for row in cursor.fetchall():
+                if row['rule_type'] in ('keyword', 'inquiry'):
+                    rules[row['rule_type']].append((row['pattern'], row['category_name']))
+            
+            cursor.execute("""
+                SELECT category_name
+                FROM tb_classification_category_priority
+                ORDER BY priority, category_name
+            """)
+            rules['priority'] = [row['category_name'] for row in cursor.fetchall()]
+            
+            return rules
+        
+        except Exception as e:
+            logger.error(f"분류 규칙 조회 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
+    
+    def replace_rules(self, keyword_patterns: Dict[str, List[str]], inquiry_rules: Dict[str, str],
+                      category_priority: List[str]) -> int:
+        """
+        규칙 전체 교체 (한 트랜잭션)
+        
+        Returns:
+            저장한 규칙 수 (키워드 + inquiry_type)
+        """
+        connection = self.db_manager.get_connection()
+        cursor = connection.cursor()
+        
+        try:
+            now = datetime.now()
+            cursor.execute("DELETE FROM tb_classification_rule")
+            cursor.execute("DELETE FROM tb_classification_category_priority")
+            
+            rows = [
+                ('keyword', keyword, category, position, now, now)
+                for category, keywords in keyword_patterns.items()
+                for position, keyword in enumerate(keywords)
+            ]
+            rows.extend(
+                ('inquiry', pattern, category, position, now, now)
+                for position, (pattern, category) in enumerate(inquiry_rules.items())
+            )
+            
+            cursor.executemany("""
+                INSERT INTO tb_classification_rule
+                (rule_type, pattern, category_name, sort_order, is_active, created_at, updated_at)
+                VALUES (%s, %s, %s, %s, TRUE, %s, %s)
+            """, rows)
+            
+            cursor.executemany("""
+                INSERT INTO tb_classification_category_priority (category_name, priority, updated_at)
+                VALUES (%s, %s, %s)
+            """, [(category, priority, now) for priority, category in enumerate(category_priority, start=1)])
+            
+            connection.commit()
+            logger.info(f"분류 규칙 저장 완료: 규칙 {len(rows)}건, 우선순위 {len(category_priority)}건")
+            return len(rows)
+        
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"분류 규칙 저장 실패: {e}")
+            raise
+        finally:
+            cursor.close()
+            connection.close()
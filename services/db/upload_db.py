@@ -1,12 +1,24 @@
 from utils.database import db_manager
+from services.db.rollup_db import add_tickets_to_rollup
+from services.db.archive_db import ticket_source
+from utils.sampling import new_sample_key
 from utils.logger import get_logger
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from datetime import datetime
 import json
 
 logger = get_logger(__name__)
 
+# 티켓 다중 행 INSERT 1회당 행 수 (행당 20개 파라미터, SQLite 변수 수 제한 이내)
+TICKET_INSERT_BATCH_SIZE = 500
+
+_TICKET_INSERT_COLUMNS = """(file_id, user_id, received_at, channel, customer_id,
+                 product_code, inquiry_type, title, body, assignee, status, raw_data, created_at,
+                 classified_category_id, classification_confidence, classification_keywords,
+                 classified_at, classification_stage, classification_rule_version, sample_key)"""
+_TICKET_INSERT_ROW = "(" + ", ".join(["%s"] * 20) + ")"
+
 class UploadDB:
     """업로드 관련 데이터베이스 작업 클래스"""
     
@@ -249,19 +261,28 @@ class UploadDB:
             cursor.close()
             connection.close()
     
-    def update_file_status(self, file_id: int, status: str):
-        """파일 상태 업데이트"""
+    def update_file_status(self, file_id: int, status: str, row_count: int = None):
+        """파일 상태 업데이트 (row_count가 주어지면 행 수도 갱신 - 스트리밍 업로드는 저장 후에 행 수 확정)"""
         connection = self.db_manager.get_connection()
         cursor = connection.cursor()
         
         try:
-            query = """
-                UPDATE tb_uploaded_file
-                SET status = %s, processed_at = %s
-                WHERE file_id = %s
-            """
+            if row_count is None:
+                query = """
+                    UPDATE tb_uploaded_file
+                    SET status = %s, processed_at = %s
+                    WHERE file_id = %s
+                """
+                params = (status, datetime.now(), file_id)
+            else:
+                query = """
+                    UPDATE tb_uploaded_file
+                    SET status = %s, processed_at = %s, row_count = %s
+                    WHERE file_id = %s
+                """
+                params = (status, datetime.now(), row_count, file_id)
             
-            cursor.execute(query, (status, datetime.now(), file_id))
+            cursor.execute(query, params)
             connection.commit()
             
             logger.info(f"파일 상태 업데이트 완료: file_id={file_id}, status={status}")
@@ -275,36 +296,77 @@ class UploadDB:
             connection.close()
     
     def insert_tickets(self, tickets: List[Dict[str, Any]]) -> int:
-        """티켓 데이터 일괄 저장"""
+        """티켓 데이터 일괄 저장 (insert_ticket_chunks 참고)"""
+        return self.insert_ticket_chunks([tickets])
+    
+    def insert_ticket_chunks(self, chunks: Iterable[List[Dict[str, Any]]]) -> int:
+        """청크 단위 티켓 데이터 저장 (전체가 하나의 트랜잭션)
+        
+        Args:
+            chunks: 티켓 딕셔너리 리스트의 iterable (제너레이터면 파싱/분류와 저장이 청크 단위로 번갈아 진행)
+        
+        Note:
+            - 업로드 중 분류한 경우 classified_* 컬럼까지 함께 저장 (없으면 NULL)
+            - TICKET_INSERT_BATCH_SIZE 행씩 다중 행 INSERT
+            - 청크 생성 중 예외가 나면 이미 저장한 청크까지 롤백
+            - 일별 롤업은 청크마다 저장한 티켓만 증감 반영
+        """
         connection = self.db_manager.get_connection()
         cursor = connection.cursor()
         
         try:
-            query = """
-                INSERT INTO tb_ticket 
-                (file_id, user_id, received_at, channel, customer_id, 
-                 product_code, inquiry_type, title, body, assignee, status, raw_data, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
             inserted_count = 0
-            for ticket in tickets:
-                cursor.execute(query, (
-                    ticket.get('file_id'),
-                    ticket.get('user_id'),
-                    ticket.get('received_at'),
-                    ticket.get('channel'),
-                    ticket.get('customer_id'),
-                    ticket.get('product_code'),
-                    ticket.get('inquiry_type'),
-                    ticket.get('title'),
-                    ticket.get('body'),
-                    ticket.get('assignee'),
-                    ticket.get('status', 'new'),
-                    ticket.get('raw_data'),
-                    datetime.now()
-                ))
-                inserted_count += 1
+            
+            for tickets in chunks:
+                if not tickets:
+                    continue
+                
+                # 청크 저장 전 최대 ticket_id - 이후 번호가 이번 청크 (롤업 증감 대상)
+                file_ids = sorted({ticket.get('file_id') for ticket in tickets if ticket.get('file_id')})
+                after_ticket_id = 0
+                if file_ids:
+                    cursor.execute(
+                        f"SELECT COALESCE(MAX(ticket_id), 0) FROM tb_ticket WHERE file_id IN ({', '.join(['%s'] * len(file_ids))})",
+                        file_ids
+                    )
+                    after_ticket_id = cursor.fetchone()[0]
+                
+                created_at = datetime.now()
+                for start in range(0, len(tickets), TICKET_INSERT_BATCH_SIZE):
+                    batch = tickets[start:start + TICKET_INSERT_BATCH_SIZE]
+                    params = []
+                    for ticket in batch:
+                        params.extend((
+                            ticket.get('file_id'),
+                            ticket.get('user_id'),
+                            ticket.get('received_at'),
+                            ticket.get('channel'),
+                            ticket.get('customer_id'),
+                            ticket.get('product_code'),
+                            ticket.get('inquiry_type'),
+                            ticket.get('title'),
+                            ticket.get('body'),
+                            ticket.get('assignee'),
+                            ticket.get('status', 'new'),
+                            ticket.get('raw_data'),
+                            created_at,
+                            ticket.get('classified_category_id'),
+                            ticket.get('classification_confidence'),
+                            ticket.get('classification_keywords'),
+                            ticket.get('classified_at'),
+                            ticket.get('classification_stage'),
+                            ticket.get('classification_rule_version'),
+                            new_sample_key()
+                        ))
+                    cursor.execute(
+                        f"INSERT INTO tb_ticket {_TICKET_INSERT_COLUMNS} VALUES "
+                        + ", ".join([_TICKET_INSERT_ROW] * len(batch)),
+                        params
+                    )
+                
+                # 일별 롤업에 이번 청크만 더함 (같은 트랜잭션)
+                add_tickets_to_rollup(cursor, file_ids, after_ticket_id)
+                inserted_count += len(tickets)
             
             connection.commit()
             logger.info(f"티켓 데이터 {inserted_count}건 저장 완료")
@@ -320,20 +382,21 @@ class UploadDB:
             connection.close()
     
     def get_tickets_by_file(self, file_id: int, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        """파일 ID로 티켓 데이터 조회"""
+        """파일 ID로 티켓 데이터 조회 (hot + archive)"""
         connection = self.db_manager.get_connection()
         cursor = connection.cursor(dictionary=True)
         
         try:
-            query = """
+            source, source_params = ticket_source(cursor, file_id=file_id, start_date=start_date, end_date=end_date)
+            query = f"""
                 SELECT 
                     t.ticket_id, t.file_id, t.user_id, t.received_at, t.channel,
                     t.customer_id, t.product_code, t.inquiry_type, t.title, t.body,
                     t.status, t.created_at, t.updated_at
-                FROM tb_ticket t
+                FROM {source} t
                 WHERE t.file_id = %s
             """
-            params = [file_id]
+            params = source_params + [file_id]
             
             if start_date:
                 query += " AND t.received_at >= %s"
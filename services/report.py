@@ -1,7 +1,14 @@
 from services.db.report_db import ReportDB
 from utils.ai_service import ai_service
+from utils.report_cache import report_cache
+from utils.task_graph import run_task_graph, get_background_executor
+from utils.sampling import (StratifiedSample, SAMPLE_KEY_RANGE, rate_to_threshold, required_threshold,
+                            stratum_of, to_percentage)
 from utils.logger import get_logger
+from config import Config
 from datetime import datetime
+from collections import Counter
+import time
 
 logger = get_logger(__name__)
 
@@ -32,86 +39,174 @@ class ReportService:
         logger.info(f"리포트 생성 시작 (user_id: {user_id}, file_id: {file_id}, batch_id: {batch_id})")
         
         try:
-            # 1. file_id와 batch_id 둘 다 없으면 최신 배치 우선 선택
-            if not file_id and not batch_id:
-                # 1순위: 최신 배치 선택
-                batch_id = self.report_db.get_latest_batch_id(user_id)
-                
-                if batch_id:
-                    logger.info(f"🎯 최신 배치 자동 선택: batch_id={batch_id}")
-                else:
-                    # 2순위: 배치가 없으면 최신 파일 선택
-                    file_id = self.report_db.get_latest_file_id(user_id)
-                    
-                    if not file_id:
-                        raise ValueError("분석할 데이터가 없습니다. 먼저 파일을 업로드하고 자동 분류를 실행하세요.")
-                    
-                    logger.info(f"📄 최신 파일 자동 선택: file_id={file_id}")
-            
-            # 2. 리포트 레코드 생성 (배치 지원)
-            report_title = f"AI 분석 리포트_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            report_id = self.report_db.create_report(file_id, user_id, 'ai_analysis', report_title, batch_id)
-            
-            if not report_id:
-                raise Exception("리포트 레코드 생성 실패")
-            
-            logger.info(f"리포트 레코드 생성 완료: report_id={report_id}")
-            
-            # 3. CS 데이터 조회 (분류 결과 기반 - 배치 지원)
-            logger.info("CS 데이터 조회 중...")
-            if batch_id:
-                cs_data = self.report_db.get_cs_analysis_data_by_batch(batch_id)
-            else:
-                cs_data = self.report_db.get_cs_analysis_data(file_id)
+            file_id, batch_id = self._resolve_report_target(user_id, file_id, batch_id)
+            report_id = self._create_report_record(user_id, file_id, batch_id)
+            return self._run_report_pipeline(report_id, file_id, batch_id, company_name)
             
-            if not cs_data or cs_data['total_tickets'] == 0:
-                raise ValueError("분류된 CS 데이터가 없습니다. 먼저 자동 분류를 실행하세요.")
+        except Exception as e:
+            logger.error(f"리포트 생성 실패: {e}")
+            raise
+    
+    def generate_preview_report(self, user_id: int = 1, file_id: int = None, batch_id: int = None, company_name: str = 'ClaraCS') -> dict:
+        """미리보기 리포트 생성 - 층화 표본 추정 요약을 즉시 반환하고 전체 리포트는 백그라운드에서 생성
+        
+        Returns:
+            dict: 미리보기 데이터 (summary: 추정 건수 / 비율 + 95% 신뢰구간, status: 'processing')
+        
+        Note:
+            - 미리보기 요약은 요약 스냅샷으로 먼저 저장되고, 전체 리포트가 완료되면 최신 스냅샷으로 대체
+            - 완료 여부는 get_report_by_id의 status로 확인 ('completed' / 'failed')
+        """
+        logger.info(f"미리보기 리포트 생성 시작 (user_id: {user_id}, file_id: {file_id}, batch_id: {batch_id})")
+        report_id = None
+        
+        try:
+            file_id, batch_id = self._resolve_report_target(user_id, file_id, batch_id)
+            report_id = self._create_report_record(user_id, file_id, batch_id)
             
-            # 4. 채널별 추이 데이터 조회 (그래프용 - 배치 지원)
-            logger.info("채널별 추이 데이터 조회 중...")
-            if batch_id:
-                channel_trends = self.report_db.get_channel_trend_data_by_batch(batch_id)
-            else:
-                channel_trends = self.report_db.get_channel_trend_data(file_id)
+            version = self.report_db.get_report_data_version(file_id, batch_id)
+            cs_data = self.get_preview_cs_data(file_id, batch_id, version)
             
-            # 5. GPT 기반 통합 분석 (한 번의 호출로 모든 섹션 생성)
-            logger.info("GPT 기반 통합 분석 시작...")
-            analysis_result = self.ai_service.generate_comprehensive_report(cs_data)
+            if cs_data['total_tickets'] == 0:
+                raise ValueError("분류된 CS 데이터가 없습니다. 먼저 자동 분류를 실행하세요.")
             
-            # 6. 스냅샷 저장 (DB에 영구 보관 - 3개 테이블)
-            logger.info("분석 결과 스냅샷 저장 중...")
-            self._save_analysis_snapshot(report_id, analysis_result, channel_trends)
+            summary = self._build_preview_summary(cs_data)
+            self._save_summary_snapshot(report_id, {'summary': summary})
             
-            # 7. 리포트 완료 처리
-            self.report_db.complete_report(report_id)
+            # 전체 정밀도 리포트는 백그라운드에서 생성 (완료 시 미리보기 스냅샷 대체)
+            get_background_executor().submit(
+                self._complete_report_in_background, report_id, file_id, batch_id, company_name
+            )
             
-            # 8. 응답 데이터 구성 (배치 지원)
-            report_data = {
+            logger.info(f"미리보기 리포트 응답 (report_id: {report_id}, 표본 {cs_data['sampling']['sample_size']}건)")
+            return {
                 'report_id': report_id,
                 'file_id': file_id,
-                'batch_id': batch_id,  # 배치 ID 추가
-                'company_name': company_name,  # 선택된 카테고리 추가
-                'channel_trends': channel_trends,  # 그래프 데이터 추가
-                'summary': analysis_result.get('summary', {}),
-                'insight': analysis_result.get('insight', {}),
-                'solution': analysis_result.get('solution', {}),
-                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'is_ai_generated': analysis_result.get('_is_ai_generated', False),  # AI 생성 여부
-                'data_source': analysis_result.get('_data_source', 'fallback')  # 데이터 출처
+                'batch_id': batch_id,
+                'company_name': company_name,
+                'status': 'processing',
+                'is_preview': True,
+                'summary': summary,
+                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
-            
-            target_info = f"batch_id: {batch_id}" if batch_id else f"file_id: {file_id}"
-            logger.info(f"리포트 생성 완료 (report_id: {report_id}, {target_info})")
-            return report_data
-            
+        
         except Exception as e:
-            logger.error(f"리포트 생성 실패: {e}")
+            logger.error(f"미리보기 리포트 생성 실패: {e}")
+            if report_id:
+                self.report_db.fail_report(report_id)
             raise
     
-    def _save_analysis_snapshot(self, report_id: int, analysis_result: dict, channel_trends: dict = None):
-        """GPT 분석 결과를 스냅샷으로 저장 (4개 테이블)"""
+    def _resolve_report_target(self, user_id: int, file_id: int = None, batch_id: int = None) -> tuple:
+        """리포트 대상 결정 - file_id와 batch_id 둘 다 없으면 최신 배치 우선 선택
+        
+        Returns:
+            tuple: (file_id, batch_id)
+        """
+        if not file_id and not batch_id:
+            # 1순위: 최신 배치 선택
+            batch_id = self.report_db.get_latest_batch_id(user_id)
+            
+            if batch_id:
+                logger.info(f"🎯 최신 배치 자동 선택: batch_id={batch_id}")
+            else:
+                # 2순위: 배치가 없으면 최신 파일 선택
+                file_id = self.report_db.get_latest_file_id(user_id)
+                
+                if not file_id:
+                    raise ValueError("분석할 데이터가 없습니다. 먼저 파일을 업로드하고 자동 분류를 실행하세요.")
+                
+                logger.info(f"📄 최신 파일 자동 선택: file_id={file_id}")
+        
+        return file_id, batch_id
+    
+    def _create_report_record(self, user_id: int, file_id: int = None, batch_id: int = None) -> int:
+        """리포트 레코드 생성 (배치 지원)"""
+        report_title = f"AI 분석 리포트_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        report_id = self.report_db.create_report(file_id, user_id, 'ai_analysis', report_title, batch_id)
+        
+        if not report_id:
+            raise Exception("리포트 레코드 생성 실패")
+        
+        logger.info(f"리포트 레코드 생성 완료: report_id={report_id}")
+        return report_id
+    
+    def _run_report_pipeline(self, report_id: int, file_id: int = None, batch_id: int = None, company_name: str = 'ClaraCS') -> dict:
+        """리포트 생성 단계 실행 (데이터 조회 / GPT 분석 / 스냅샷 저장 / 완료 처리)"""
+        # 1. 리포트 생성 단계 의존성 그래프 실행
+        #    - 채널별 추이 조회는 CS 데이터 조회 / GPT 분석과 동시에 실행
+        #    - 스냅샷 4종은 각자 필요한 데이터가 준비되는 즉시 병렬 저장
+        started = time.perf_counter()
+        version = self.report_db.get_report_data_version(file_id, batch_id)
+        version_ms = round((time.perf_counter() - started) * 1000, 1)
+        
+        results, stage_timings = run_task_graph({
+            # CS 데이터 조회 (분류 결과 기반 - 배치 지원, 분류 결과가 같으면 캐시 재사용)
+            'cs_data': ((), lambda: self._load_report_cs_data(file_id, batch_id, version)),
+            # 채널별 추이 데이터 조회 (그래프용 - 배치 지원)
+            'channel_trends': ((), lambda: self.get_channel_trend_data(file_id, batch_id, version)),
+            # GPT 기반 통합 분석 (한 번의 호출로 모든 섹션 생성)
+            'analysis': (('cs_data',), lambda cs_data: self.ai_service.generate_comprehensive_report(cs_data)),
+            # 스냅샷 저장 (DB에 영구 보관 - 4개 테이블)
+            'summary_snapshot': (('analysis',), lambda analysis: self._save_summary_snapshot(report_id, analysis)),
+            'insight_snapshot': (('analysis',), lambda analysis: self._save_insight_snapshot(report_id, analysis)),
+            'solution_snapshot': (('analysis',), lambda analysis: self._save_solution_snapshot(report_id, analysis)),
+            'channel_snapshot': (('channel_trends',),
+                                 lambda channel_trends: self._save_channel_snapshot(report_id, channel_trends))
+        })
+        analysis_result = results['analysis']
+        channel_trends = results['channel_trends']
+        
+        stage_timings['data_version'] = version_ms
+        stage_timings['total'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"리포트 {report_id} 단계별 실행 시간(ms): {stage_timings}")
+        
+        # 2. 리포트 완료 처리 (단계별 실행 시간 기록)
+        self.report_db.complete_report(report_id, stage_timings=stage_timings)
+        
+        # 3. 응답 데이터 구성 (배치 지원)
+        report_data = {
+            'report_id': report_id,
+            'file_id': file_id,
+            'batch_id': batch_id,  # 배치 ID 추가
+            'company_name': company_name,  # 선택된 카테고리 추가
+            'channel_trends': channel_trends,  # 그래프 데이터 추가
+            'summary': analysis_result.get('summary', {}),
+            'insight': analysis_result.get('insight', {}),
+            'solution': analysis_result.get('solution', {}),
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'is_ai_generated': analysis_result.get('_is_ai_generated', False),  # AI 생성 여부
+            'data_source': analysis_result.get('_data_source', 'fallback')  # 데이터 출처
+        }
+        
+        target_info = f"batch_id: {batch_id}" if batch_id else f"file_id: {file_id}"
+        logger.info(f"리포트 생성 완료 (report_id: {report_id}, {target_info})")
+        return report_data
+    
+    def _complete_report_in_background(self, report_id: int, file_id: int = None, batch_id: int = None, company_name: str = 'ClaraCS'):
+        """미리보기 이후 전체 리포트 생성 (실패 시 리포트 상태를 failed로 기록)"""
+        try:
+            self._run_report_pipeline(report_id, file_id, batch_id, company_name)
+        except Exception as e:
+            logger.error(f"백그라운드 리포트 생성 실패: report_id={report_id}, {e}", exc_info=True)
+            self.report_db.fail_report(report_id)
+    
+    def _load_report_cs_data(self, file_id: int = None, batch_id: int = None, version: int = None) -> dict:
+        """리포트용 CS 데이터 조회 (분류된 데이터가 없으면 ValueError)"""
+        logger.info("CS 데이터 조회 중...")
+        cs_data = self.get_cs_data(file_id, batch_id, version)
+        
+        if not cs_data or cs_data['total_tickets'] == 0:
+            raise ValueError("분류된 CS 데이터가 없습니다. 먼저 자동 분류를 실행하세요.")
+        
+        return cs_data
+    
+    # ========================================
+    # 분석 결과 스냅샷 저장 (실패해도 리포트 생성은 계속 진행)
+    # ========================================
+    
+    def _save_summary_snapshot(self, report_id: int, analysis_result: dict) -> bool:
+        """요약 스냅샷 저장 (tb_analysis_summary_snapshot)"""
         try:
-            # 1. Summary 스냅샷 저장 (tb_analysis_summary_snapshot)
             summary = analysis_result.get('summary', {})
             
             # 개선된 구조에서 데이터 추출
@@ -132,49 +227,260 @@ class ReportService:
                 'total_tickets': summary.get('total_cs_count', 0),
                 'resolved_count': resolved_count,
                 'category_ratios': category_ratios,
-                'repeat_rate': 0.0  # TODO: 반복 문의율 계산
+                'repeat_rate': 0.0,  # TODO: 반복 문의율 계산
+                'summary_payload': summary  # 조회 시 그대로 반환 (재집계 없음)
             }
-            self.report_db.save_summary_snapshot(report_id, summary_snapshot)
-            logger.info(f"요약 스냅샷 저장 완료")
-            
-            # 2. Insight 스냅샷 저장 (tb_analysis_insight_snapshot)
-            insight_snapshot = analysis_result.get('insight', {})
-            self.report_db.save_insight_snapshot(report_id, insight_snapshot)
-            logger.info(f"인사이트 스냅샷 저장 완료")
-            
-            # 3. Solution 스냅샷 저장 (tb_analysis_solution_snapshot)
-            solution = analysis_result.get('solution', {})
-            self.report_db.save_solution_snapshot(report_id, solution)
-            logger.info(f"솔루션 스냅샷 저장 완료")
-            
-            # 4. Channel 스냅샷 저장 (tb_analysis_channel_snapshot)
-            if channel_trends and len(channel_trends) > 0:
-                saved = self.report_db.save_channel_snapshot(report_id, channel_trends)
-                if saved:
-                    logger.info(f"채널 스냅샷 저장 완료")
-                else:
-                    logger.warning(f"채널 스냅샷 저장 실패 (데이터는 있으나 저장 오류)")
-            else:
-                logger.warning(f"채널 추이 데이터가 없어 스냅샷 저장을 건너뜁니다")
-            
-            logger.info(f"리포트 {report_id}의 모든 스냅샷 저장 완료")
+            return self.report_db.save_summary_snapshot(report_id, summary_snapshot)
             
         except Exception as e:
-            logger.error(f"스냅샷 저장 실패: {e}", exc_info=True)
-            # 스냅샷 저장 실패해도 리포트 생성은 계속 진행
+            logger.error(f"요약 스냅샷 저장 실패: {e}", exc_info=True)
+            return False
+    
+    def _save_insight_snapshot(self, report_id: int, analysis_result: dict) -> bool:
+        """인사이트 스냅샷 저장 (tb_analysis_insight_snapshot)"""
+        try:
+            return self.report_db.save_insight_snapshot(report_id, analysis_result.get('insight', {}))
+        except Exception as e:
+            logger.error(f"인사이트 스냅샷 저장 실패: {e}", exc_info=True)
+            return False
+    
+    def _save_solution_snapshot(self, report_id: int, analysis_result: dict) -> bool:
+        """솔루션 스냅샷 저장 (tb_analysis_solution_snapshot)"""
+        try:
+            return self.report_db.save_solution_snapshot(report_id, analysis_result.get('solution', {}))
+        except Exception as e:
+            logger.error(f"솔루션 스냅샷 저장 실패: {e}", exc_info=True)
+            return False
+    
+    def _save_channel_snapshot(self, report_id: int, channel_trends: dict = None) -> bool:
+        """채널 스냅샷 저장 (tb_analysis_channel_snapshot)"""
+        if not channel_trends:
+            logger.warning(f"채널 추이 데이터가 없어 스냅샷 저장을 건너뜁니다")
+            return False
+        
+        try:
+            saved = self.report_db.save_channel_snapshot(report_id, channel_trends)
+            if not saved:
+                logger.warning(f"채널 스냅샷 저장 실패 (데이터는 있으나 저장 오류)")
+            return saved
+        except Exception as e:
+            logger.error(f"채널 스냅샷 저장 실패: {e}", exc_info=True)
+            return False
+    
+    # ========================================
+    # 리포트 데이터 조회 (캐시)
+    # ========================================
+    
+    def get_cs_data(self, file_id: int = None, batch_id: int = None, version: int = None) -> dict:
+        """CS 분석 데이터 조회 (대상 + 최신 분류 결과 ID 단위 캐시)
+        
+        Args:
+            version: get_report_data_version 결과 (여러 데이터를 함께 조회할 때 재사용, 생략 시 조회)
+        """
+        if version is None:
+            version = self.report_db.get_report_data_version(file_id, batch_id)
+        
+        if batch_id:
+            loader = lambda: self.report_db.get_cs_analysis_data_by_batch(batch_id)
+        else:
+            loader = lambda: self.report_db.get_cs_analysis_data(file_id)
+        
+        return report_cache.get_or_load(
+            'cs_data', version, loader, file_id=file_id, batch_id=batch_id,
+            cacheable=lambda data: bool(data) and data.get('total_tickets', 0) > 0
+        )
+    
+    def get_preview_cs_data(self, file_id: int = None, batch_id: int = None, version: int = None) -> dict:
+        """층화 표본 기반 CS 분석 데이터 추정 (미리보기 리포트용, get_cs_data와 같은 구조)
+        
+        Note:
+            - sample_key 인덱스 범위 조회로 표본 추출 (전체 집계 / 무작위 정렬 없음)
+            - 전체 표본이 REPORT_PREVIEW_MIN_SAMPLE보다 적으면 표본 비율 확대
+            - 표본이 REPORT_PREVIEW_MIN_STRATUM보다 적은 층(채널 × 접수월)은 해당 층만 추가 추출
+              (층 표본 비율 상한 REPORT_PREVIEW_MAX_STRATUM_RATE)
+            - 건수는 추정치, 각 비율에 95% 신뢰구간(*_ci, %) 포함
+        """
+        if version is None:
+            version = self.report_db.get_report_data_version(file_id, batch_id)
+        
+        return report_cache.get_or_load(
+            'cs_data_preview', version, lambda: self._load_preview_cs_data(file_id, batch_id, version),
+            file_id=file_id, batch_id=batch_id,
+            cacheable=lambda data: data.get('total_tickets', 0) > 0
+        )
+    
+    def _load_preview_cs_data(self, file_id: int = None, batch_id: int = None, class_result_id: int = None) -> dict:
+        """표본 추출 + 추정"""
+        threshold = rate_to_threshold(Config.REPORT_PREVIEW_SAMPLE_RATE)
+        rows = self.report_db.get_ticket_sample(file_id, batch_id, 0, threshold)
+        
+        # 1. 전체 표본이 작으면 키 범위 확장
+        expanded = required_threshold(len(rows), threshold, Config.REPORT_PREVIEW_MIN_SAMPLE)
+        if expanded > threshold:
+            rows += self.report_db.get_ticket_sample(file_id, batch_id, threshold, expanded)
+            threshold = expanded
+        
+        # 2. 표본이 적은 층만 해당 층(채널 × 접수월)의 키 범위 확장 (층별 포함 확률이 달라지므로 가중 추정)
+        #    층 임계값은 REPORT_PREVIEW_MAX_STRATUM_RATE 이하로 제한 (작은 층 하나가 전체 조회로 번지지 않도록)
+        max_stratum_threshold = max(threshold, rate_to_threshold(Config.REPORT_PREVIEW_MAX_STRATUM_RATE))
+        strata = Counter(stratum_of(row) for row in rows)
+        thresholds = {
+            stratum: min(required_threshold(count, threshold, Config.REPORT_PREVIEW_MIN_STRATUM), max_stratum_threshold)
+            for stratum, count in strata.items()
+        }
+        boosted = {stratum: value for stratum, value in thresholds.items() if value > threshold}
+        if boosted:
+            rows += self.report_db.get_ticket_sample(
+                file_id, batch_id, threshold, max(boosted.values()), strata=boosted
+            )
+        
+        sample = StratifiedSample(rows, thresholds, threshold)
+        logger.info(f"미리보기 표본 추출: {len(rows)}건, 층 {len(strata)}개 (확장 {len(boosted)}개), "
+                    f"기본 비율 {threshold / SAMPLE_KEY_RANGE:.2%}")
+        
+        cs_data = self._estimate_cs_data(sample, class_result_id)
+        cs_data['sampling'] = {
+            'method': 'stratified',
+            'strata': 'channel x received_month',
+            'sample_size': len(rows),
+            'strata_count': len(strata),
+            'boosted_strata': len(boosted),
+            'sample_rate': round(threshold / SAMPLE_KEY_RANGE, 4),
+            'confidence_level': 0.95
+        }
+        return cs_data
+    
+    def _estimate_cs_data(self, sample: StratifiedSample, class_result_id: int = None) -> dict:
+        """표본 → CS 분석 데이터 추정 (_build_cs_analysis_data와 같은 키 + 신뢰구간)"""
+        channel_of = lambda row: row['channel'] or '미분류'
+        classified = lambda row: row['category_id'] is not None
+        resolved = lambda row: bool(row['resolved'])
+        
+        total_tickets = round(sample.total())
+        total_resolved = round(sample.total(resolved))
+        
+        category_distribution = []
+        categories = {(row['category_id'], row['category_name']) for row in sample.rows if classified(row)}
+        for category_id, category_name in categories:
+            in_category = lambda row, category_id=category_id: row['category_id'] == category_id
+            interval = sample.ratio(in_category, classified)
+            percentage, percentage_ci = to_percentage(interval)
+            category_distribution.append({
+                'category_id': category_id,
+                'category_name': category_name,
+                'count': round(sample.total(in_category)),
+                'ratio': round(interval[0], 4),
+                'percentage': percentage,
+                'percentage_ci': percentage_ci,
+                'keywords': []
+            })
+        category_distribution.sort(key=lambda item: item['count'], reverse=True)
+        
+        channel_distribution = []
+        channel_resolution_rates = []
+        for channel in {channel_of(row) for row in sample.rows}:
+            in_channel = lambda row, channel=channel: channel_of(row) == channel
+            count = round(sample.total(in_channel))
+            percentage, percentage_ci = to_percentage(sample.ratio(in_channel))
+            channel_distribution.append({
+                'channel': channel,
+                'count': count,
+                'percentage': percentage,
+                'percentage_ci': percentage_ci
+            })
+            
+            resolution_rate, resolution_rate_ci = to_percentage(sample.ratio(resolved, in_channel))
+            channel_resolution_rates.append({
+                'channel': channel,
+                'total': count,
+                'resolved': round(sample.total(lambda row, channel=channel: in_channel(row) and resolved(row))),
+                'resolution_rate': resolution_rate,
+                'resolution_rate_ci': resolution_rate_ci
+            })
+        channel_distribution.sort(key=lambda item: item['count'], reverse=True)
+        
+        status_distribution = {}
+        for status in {row['status'] for row in sample.rows}:
+            has_status = lambda row, status=status: row['status'] == status
+            percentage, percentage_ci = to_percentage(sample.ratio(has_status))
+            status_distribution[status] = {
+                'count': round(sample.total(has_status)),
+                'percentage': percentage,
+                'percentage_ci': percentage_ci
+            }
+        
+        return {
+            'total_tickets': total_tickets,
+            'total_resolved': total_resolved,
+            'total_unresolved': total_tickets - total_resolved,
+            'category_distribution': category_distribution,
+            'channel_distribution': channel_distribution,
+            'status_distribution': status_distribution,
+            'channel_resolution_rates': channel_resolution_rates,
+            'duplicate_clusters': self.report_db.get_duplicate_cluster_stats(class_result_id) if class_result_id else {},
+            'class_result_id': class_result_id
+        }
+    
+    @staticmethod
+    def _build_preview_summary(cs_data: dict) -> dict:
+        """미리보기 요약 섹션 (전체 리포트 요약과 같은 구조 + 신뢰구간 / 표본 정보)"""
+        return {
+            'total_cs_count': cs_data['total_tickets'],
+            'categories': [
+                {key: category[key] for key in ('category_id', 'category_name', 'count', 'percentage', 'percentage_ci')}
+                for category in cs_data['category_distribution']
+            ],
+            'channels': [
+                {key: channel[key] for key in ('channel', 'total', 'resolved', 'resolution_rate', 'resolution_rate_ci')}
+                for channel in cs_data['channel_resolution_rates']
+            ],
+            'is_preview': True,
+            'sampling': cs_data['sampling']
+        }
     
-    def get_channel_trends(self, file_id: int) -> dict:
-        """채널별 추이 데이터 조회"""
-        logger.info(f"파일 {file_id}의 채널별 추이 데이터 조회")
+    def get_channel_trend_data(self, file_id: int = None, batch_id: int = None, version: int = None,
+                               resolution: str = 'auto', max_points: int = None, line_points: int = None) -> dict:
+        """채널별 추이 데이터 조회 (대상 + 최신 분류 결과 ID + 해상도 단위 캐시)
         
-        channel_trends = self.report_db.get_channel_trend_data(file_id)
+        Args:
+            resolution: 'auto' | 'day' | 'week' | 'month' (auto: 기간에 따라 선택)
+            max_points: 채널당 최대 버킷 수 (기본값 CHART_MAX_POINTS)
+            line_points: 전체 합계선 LTTB 점 수 (기본값 CHART_LINE_POINTS, 0 = 사용 안 함)
+        """
+        if version is None:
+            version = self.report_db.get_report_data_version(file_id, batch_id)
+        
+        max_points = Config.CHART_MAX_POINTS if max_points is None else max_points
+        line_points = Config.CHART_LINE_POINTS if line_points is None else line_points
+        options = {'resolution': resolution, 'max_points': max_points, 'line_points': line_points}
+        
+        if batch_id:
+            loader = lambda: self.report_db.get_channel_trend_data_by_batch(batch_id, **options)
+        else:
+            loader = lambda: self.report_db.get_channel_trend_data(file_id, **options)
+        
+        kind = f"channel_trends-{resolution}-{max_points}-{line_points}"
+        return report_cache.get_or_load(kind, version, loader, file_id=file_id, batch_id=batch_id)
+    
+    def get_channel_trends(self, file_id: int = None, batch_id: int = None, resolution: str = 'auto',
+                           max_points: int = None, line_points: int = None) -> dict:
+        """채널별 추이 데이터 조회 (차트용 해상도 지정)"""
+        target_info = f"배치 {batch_id}" if batch_id else f"파일 {file_id}"
+        logger.info(f"{target_info}의 채널별 추이 데이터 조회 (해상도: {resolution})")
+        
+        channel_trends = self.get_channel_trend_data(file_id=file_id, batch_id=batch_id, resolution=resolution,
+                                                     max_points=max_points, line_points=line_points)
         return channel_trends
     
     def get_summary(self, file_id: int) -> dict:
         """데이터 요약 조회"""
         logger.info(f"파일 {file_id}의 데이터 요약 조회")
         
-        summary = self.report_db.get_summary_data(file_id)
+        summary = report_cache.get_or_load(
+            'summary', self.report_db.get_report_data_version(file_id=file_id),
+            lambda: self.report_db.get_summary_data(file_id), file_id=file_id,
+            cacheable=lambda data: data.get('total_tickets', 0) > 0
+        )
         return summary
     
     def get_insights(self, file_id: int) -> dict:
@@ -201,13 +507,23 @@ class ReportService:
         solutions = self.ai_service.generate_solution_recommendations(insights)
         return solutions
     
-    def get_report_by_id(self, report_id: int) -> dict:
-        """저장된 리포트 조회 (스냅샷에서)"""
-        logger.info(f"리포트 {report_id} 조회")
+    def get_report_by_id(self, report_id: int, user_id: int = None) -> dict:
+        """저장된 리포트 조회 (스냅샷에서, report_id 단위 캐시)
+        
+        Args:
+            user_id: 지정 시 해당 사용자가 생성한(created_by) 리포트만 반환 (아니면 None - 존재 여부도 노출하지 않음)
         
-        # TODO: 스냅샷 테이블에서 리포트 데이터 조회
-        # tb_analysis_insight_snapshot, tb_analysis_solution_snapshot 등에서 조회
-        pass
+        Note:
+            완료된 리포트의 스냅샷은 변경되지 않으므로 반복되는 PDF 다운로드/이메일 발송은 캐시에서 응답
+        """
+        logger.info(f"리포트 {report_id} 조회")
+        report = report_cache.get_or_load_report(
+            report_id, lambda: self.report_db.get_report_with_snapshots(report_id, line_points=Config.CHART_LINE_POINTS)
+        )
+        if report and user_id is not None and report.get('created_by') != user_id:
+            logger.warning(f"다른 사용자의 리포트 조회 차단: report_id={report_id}, user_id={user_id}")
+            return None
+        return report
     
     def get_latest_report(self, user_id: int) -> dict:
         """사용자의 마지막 생성된 리포트 조회"""
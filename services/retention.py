@@ -0,0 +1,185 @@
+import os
+import time
+from datetime import datetime, timedelta
+from services.db.retention_db import RetentionDB, PURGE_STEPS
+from services.analytics import AnalyticsService
+from utils.logger import get_logger
+from config import Config
+
+logger = get_logger(__name__)
+
+
+class RetentionService:
+    """데이터 보존 정책 적용 및 퍼지 서비스
+    
+    Note:
+        - 삭제 요청/보존 기간 만료 시 즉시 지우지 않고 소프트 삭제 + 퍼지 작업 등록
+        - 퍼지는 PK 범위 청크 단위로 삭제하고 청크마다 진행 상황을 기록 (중단 후 재개 가능)
+        - 보존 기간 우선순위: 배치 정책 > 사용자 정책 > Config.RETENTION_DAYS (0 = 무기한)
+    """
+    
+    def __init__(self):
+        self.retention_db = RetentionDB()
+    
+    def soft_delete_file(self, file_id: int) -> bool:
+        """파일 삭제 요청 (퍼지는 purge 작업에서 처리, 분석 저장소 미러는 즉시 제거)"""
+        deleted = self.retention_db.soft_delete_file(file_id)
+        if deleted:
+            self._remove_analytics_mirror(file_id)
+        return deleted
+    
+    def soft_delete_batch(self, batch_id: int) -> int:
+        """배치 삭제 요청 (소속 파일 포함, 퍼지는 purge 작업에서 처리, 분석 저장소 미러는 즉시 제거)"""
+        file_ids = self.retention_db.soft_delete_batch(batch_id)
+        for file_id in file_ids:
+            self._remove_analytics_mirror(file_id)
+        return len(file_ids)
+    
+    def apply_retention_policies(self, now: datetime = None, dry_run: bool = False) -> dict:
+        """보존 기간이 지난 파일/배치를 소프트 삭제
+        
+        Note:
+            배치의 모든 활성 파일이 만료되면 배치 단위로 삭제 (배치 분류/리포트 결과 포함)
+        
+        Returns:
+            dict: {'files': [file_id, ...], 'batches': [batch_id, ...]}
+        """
+        now = now or datetime.now()
+        user_days = {}
+        batch_days = {}
+        for policy in self.retention_db.get_policies():
+            if policy['batch_id'] is not None:
+                batch_days[policy['batch_id']] = policy['retention_days']
+            elif policy['user_id'] is not None:
+                user_days[policy['user_id']] = policy['retention_days']
+        
+        expired_by_batch = {}
+        active_by_batch = {}
+        expired_files = []
+        
+        for file in self.retention_db.get_active_files():
+            days = batch_days.get(file['batch_id'],
+                                  user_days.get(file['user_id'], Config.RETENTION_DAYS))
+            expired = bool(days) and file['created_at'] is not None \
+                and file['created_at'] < now - timedelta(days=days)
+            
+            if file['batch_id'] is None:
+                if expired:
+                    expired_files.append(file['file_id'])
+                continue
+            
+            active_by_batch[file['batch_id']] = active_by_batch.get(file['batch_id'], 0) + 1
+            if expired:
+                expired_by_batch.setdefault(file['batch_id'], []).append(file['file_id'])
+        
+        expired_batches = []
+        for batch_id, file_ids in expired_by_batch.items():
+            if len(file_ids) == active_by_batch[batch_id]:
+                expired_batches.append(batch_id)
+            else:
+                expired_files.extend(file_ids)
+        
+        logger.info(f"보존 기간 만료: 파일 {len(expired_files)}개, 배치 {len(expired_batches)}개 (dry_run={dry_run})")
+        
+        if not dry_run:
+            for batch_id in expired_batches:
+                self.soft_delete_batch(batch_id)
+            for file_id in expired_files:
+                self.soft_delete_file(file_id)
+        
+        return {'files': sorted(expired_files), 'batches': sorted(expired_batches)}
+    
+    def process_purge_jobs(self, max_jobs: int = None, chunk_size: int = None, throttle_ms: int = None) -> dict:
+        """등록된 퍼지 작업 처리 (중단된 작업은 기록된 지점부터 재개)
+        
+        Args:
+            max_jobs: 이번 실행에서 처리할 최대 작업 수
+            chunk_size: 청크당 최대 삭제 행 수 (기본값 Config.PURGE_CHUNK_SIZE)
+            throttle_ms: 청크 사이 대기 시간 (기본값 Config.PURGE_THROTTLE_MS)
+        
+        Returns:
+            dict: {'jobs': int, 'failed': int, 'deleted_rows': int}
+        """
+        chunk_size = chunk_size or Config.PURGE_CHUNK_SIZE
+        throttle_ms = Config.PURGE_THROTTLE_MS if throttle_ms is None else throttle_ms
+        
+        summary = {'jobs': 0, 'failed': 0, 'deleted_rows': 0}
+        
+        for job in self.retention_db.get_resumable_jobs(max_jobs):
+            try:
+                summary['deleted_rows'] += self._run_job(job, chunk_size, throttle_ms)
+                summary['jobs'] += 1
+            except Exception as e:
+                summary['failed'] += 1
+                logger.error(f"퍼지 작업 실패: job_id={job['job_id']}, {e}")
+                self.retention_db.update_job_status(job['job_id'], 'failed', str(e)[:1000])
+        
+        logger.info(f"퍼지 완료: 작업 {summary['jobs']}개, 실패 {summary['failed']}개, "
+                    f"삭제 {summary['deleted_rows']}행")
+        return summary
+    
+    def _run_job(self, job: dict, chunk_size: int, throttle_ms: int) -> int:
+        """퍼지 작업 1건 실행"""
+        job_id = job['job_id']
+        target_type = job['target_type']
+        target_id = job['target_id']
+        steps = PURGE_STEPS[target_type]
+        
+        # 재개 지점 결정
+        tables = [table for table, _, _ in steps]
+        start_index = tables.index(job['current_step']) if job['current_step'] in tables else 0
+        last_pk = job['last_pk'] if job['current_step'] in tables else None
+        
+        logger.info(f"퍼지 작업 시작: job_id={job_id}, {target_type}={target_id}, "
+                    f"재개 지점={job['current_step'] or '처음'}")
+        self.retention_db.update_job_status(job_id, 'running')
+        
+        # 리포트 산출물 파일은 리포트 행보다 먼저 삭제 (행 삭제 후 재개되면 경로를 알 수 없음)
+        for path in self.retention_db.get_report_file_paths(target_type, target_id):
+            self._remove_stored_file(path)
+        
+        deleted_rows = 0
+        for table, pk, where in steps[start_index:]:
+            while True:
+                deleted, last_pk = self.retention_db.purge_chunk(
+                    job_id, table, pk, where, target_id, last_pk, chunk_size
+                )
+                deleted_rows += deleted
+                
+                if last_pk is None:
+                    break
+                if throttle_ms:
+                    time.sleep(throttle_ms / 1000)
+        
+        # 업로드 원본 삭제 (경로는 tb_uploaded_file에 남아 있음 - 실패해도 재실행 시 다시 시도)
+        if target_type == 'file':
+            self._remove_stored_file(self.retention_db.get_storage_path(target_id))
+            self._remove_analytics_mirror(target_id)
+        
+        self.retention_db.complete_purge(job_id, target_type, target_id)
+        logger.info(f"퍼지 작업 완료: job_id={job_id}, {deleted_rows}행 삭제")
+        return deleted_rows
+    
+    def _remove_stored_file(self, path: str):
+        """업로드/리포트 파일 삭제 (없으면 무시)"""
+        if not path:
+            return
+        try:
+            if os.path.isfile(path):
+                os.remove(path)
+                logger.info(f"저장 파일 삭제: {path}")
+        except OSError as e:
+            logger.warning(f"저장 파일 삭제 실패: {path}, {e}")
+    
+    def _remove_analytics_mirror(self, file_id: int):
+        """분석 저장소(Parquet)의 파일 데이터 삭제 (실패해도 삭제/퍼지는 계속 진행)"""
+        try:
+            AnalyticsService().remove_file(file_id)
+        except Exception as e:
+            logger.warning(f"분석 저장소 파일 삭제 실패: file_id={file_id}, {e}")
+    
+    def run(self, dry_run: bool = False, max_jobs: int = None) -> dict:
+        """보존 정책 적용 후 퍼지 작업 처리"""
+        expired = self.apply_retention_policies(dry_run=dry_run)
+        purged = {'jobs': 0, 'failed': 0, 'deleted_rows': 0} if dry_run else self.process_purge_jobs(max_jobs)
+        return {'expired': expired, 'purged': purged}
@@ -0,0 +1,92 @@
+from services.db.rule_set_db import RuleSetDB
+from utils.classifiers.rule_set import (
+    CompiledRuleSet, compile_rule_set, default_rule_set, get_active_rule_set, set_active_rule_set,
+    DEFAULT_KEYWORD_PATTERNS, DEFAULT_INQUIRY_RULES, DEFAULT_CATEGORY_PRIORITY
+)
+from utils.logger import get_logger
+from config import Config
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# DB 규칙 마지막 조회 시각 (프로세스 단위, RULE_SET_REFRESH_SECONDS 간격으로 재조회)
+_last_loaded_at = 0.0
+_load_lock = threading.Lock()
+
+
+class RuleSetService:
+    """규칙 기반 분류 규칙 세트 관리 서비스
+    
+    Note:
+        - 규칙은 DB(tb_classification_rule, tb_classification_category_priority)에 저장
+        - 규칙 내용 해시가 버전이며, 같은 버전의 컴파일 결과는 디스크 아티팩트로 재사용
+        - DB 규칙이 비어 있거나 테이블이 없으면 코드의 기본 규칙 사용
+    """
+    
+    def __init__(self):
+        self.db = RuleSetDB()
+    
+    def get_active(self, force: bool = False) -> CompiledRuleSet:
+        """
+        활성 규칙 세트 조회 (재조회 간격이 지났거나 force면 DB에서 다시 읽음)
+        
+        Returns:
+            CompiledRuleSet (이후 생성되는 RuleBasedClassifier의 기본 규칙 세트로도 설정됨)
+        """
+        global _last_loaded_at
+        
+        if not force and time.monotonic() - _last_loaded_at < Config.RULE_SET_REFRESH_SECONDS:
+            return get_active_rule_set()
+        
+        with _load_lock:
+            if not force and time.monotonic() - _last_loaded_at < Config.RULE_SET_REFRESH_SECONDS:
+                return get_active_rule_set()
+            
+            rule_set = self.load()
+            set_active_rule_set(rule_set)
+            _last_loaded_at = time.monotonic()
+            return rule_set
+    
+    def load(self) -> CompiledRuleSet:
+        """DB 규칙을 읽어 컴파일 (같은 내용이면 캐시/아티팩트 재사용)"""
+        try:
+            rules = self.db.get_rules()
+        except Exception as e:
+            logger.warning(f"DB 분류 규칙 조회 실패, 기본 규칙 사용: {e}")
+            return default_rule_set()
+        
+        if not rules['keyword'] and not rules['inquiry']:
+            return default_rule_set()
+        
+        # 우선순위 카테고리를 먼저 두어 키워드가 없는 카테고리('기타' 등)도 유지
+        category_priority = rules['priority']
+        keyword_patterns = {category: [] for category in category_priority}
+        for pattern, category in rules['keyword']:
+            keyword_patterns.setdefault(category, []).append(pattern)
+        
+        inquiry_rules = {}
+        for pattern, category in rules['inquiry']:
+            inquiry_rules.setdefault(pattern, category)
+        
+        return compile_rule_set(keyword_patterns, inquiry_rules, category_priority)
+    
+    def seed_defaults(self, force: bool = False) -> dict:
+        """
+        코드의 기본 규칙을 DB에 저장
+        
+        Args:
+            force: 이미 DB 규칙이 있어도 기본 규칙으로 덮어쓰기
+        
+        Returns:
+            dict: {'seeded': bool, 'rules': int, 'version': str}
+        """
+        rules = self.db.get_rules()
+        if (rules['keyword'] or rules['inquiry']) and not force:
+            rule_set = self.get_active(force=True)
+            logger.info(f"DB 분류 규칙이 이미 있어 기본 규칙 저장을 건너뜁니다: version={rule_set.version}")
+            return {'seeded': False, 'rules': len(rules['keyword']) + len(rules['inquiry']), 'version': rule_set.version}
+        
+        count = self.db.replace_rules(DEFAULT_KEYWORD_PATTERNS, DEFAULT_INQUIRY_RULES, DEFAULT_CATEGORY_PRIORITY)
+        rule_set = self.get_active(force=True)
+        return {'seeded': True, 'rules': count, 'version': rule_set.version}
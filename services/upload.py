@@ -1,8 +1,14 @@
 from services.db.upload_db import UploadDB
 from services.mapping import MappingService
+from services.auto_classify import AutoClassifyService
+from services.rule_set import RuleSetService
+from utils.classifiers import RuleBasedClassifier
+from utils.classification_stats import ClassificationAggregator
 from utils.logger import get_logger
+from config import Config
 from datetime import datetime
 import pandas as pd
+import json
 import os
 import re
 from werkzeug.utils import secure_filename
@@ -17,13 +23,13 @@ class UploadService:
         self.upload_db = UploadDB()
         self.mapping_service = MappingService()
         self.allowed_extensions = {'csv', 'xlsx', 'xls'}
-        self.upload_folder = 'uploads'
+        self.upload_folder = Config.UPLOAD_FOLDER
         
         # 업로드 폴더가 없으면 생성
         if not os.path.exists(self.upload_folder):
             os.makedirs(self.upload_folder)
     
-    def upload_batch(self, files, user_id=1, batch_name=None):
+    def upload_batch(self, files, user_id=1, batch_name=None, classify=None):
         """
         여러 파일을 배치로 업로드 및 처리
         
@@ -31,6 +37,7 @@ class UploadService:
             files: 파일 리스트
             user_id: 사용자 ID
             batch_name: 배치 이름 (선택)
+            classify: 업로드 중 규칙 기반 분류 여부 (기본값 Config.INLINE_CLASSIFICATION)
             
         Returns:
             dict: 배치 업로드 결과
@@ -45,6 +52,8 @@ class UploadService:
             batch_id = self.upload_db.create_batch(user_id, batch_name)
             logger.info(f"파일 배치 생성: batch_id={batch_id}")
             
+            inline = self._start_inline_classification(classify)
+            
             # 2. 각 파일 업로드 처리
             uploaded_files = []
             total_row_count = 0
@@ -53,7 +62,7 @@ class UploadService:
             for file in files:
                 try:
                     # 파일 업로드 (batch_id 포함)
-                    result = self._upload_single_file(file, user_id, batch_id)
+                    result = self._upload_single_file(file, user_id, batch_id, inline)
                     uploaded_files.append(result)
                     total_row_count += result['row_count']
                     
@@ -75,6 +84,11 @@ class UploadService:
             if len(uploaded_files) > 0:
                 self.upload_db.complete_batch(batch_id)
             
+            # 5. 업로드 중 분류한 경우 배치 분류 결과/집계 저장
+            classification = None
+            if inline and len(uploaded_files) > 0:
+                classification = self._save_inline_classification(inline, user_id, batch_id=batch_id)
+            
             logger.info(f"배치 업로드 완료: batch_id={batch_id}, {len(uploaded_files)}/{len(files)} 성공")
             
             return {
@@ -86,6 +100,7 @@ class UploadService:
                 'total_rows': total_row_count,
                 'uploaded_files': uploaded_files,
                 'errors': errors,
+                'classification': classification,
                 'created_at': datetime.now().isoformat()
             }
             
@@ -93,7 +108,7 @@ class UploadService:
             logger.error(f"배치 업로드 실패: {e}")
             raise
     
-    def _upload_single_file(self, file, user_id, batch_id=None):
+    def _upload_single_file(self, file, user_id, batch_id=None, inline=None):
         """
         단일 파일 업로드 (내부용 - 배치 지원)
         
@@ -101,6 +116,7 @@ class UploadService:
             file: 업로드 파일
             user_id: 사용자 ID
             batch_id: 배치 ID (선택)
+            inline: 업로드 중 분류 상태 (_start_inline_classification 반환값, 선택)
             
         Returns:
             dict: 업로드 결과
@@ -122,18 +138,14 @@ class UploadService:
         file.save(storage_path)
         logger.info(f"파일 저장 완료: {storage_path}")
         
-        # 3. 파일 데이터 읽기
-        df = self._read_file(storage_path, file_extension)
-        row_count = len(df)
-        
-        # 4. 파일 정보 DB 저장 (batch_id 포함)
+        # 3. 파일 정보 DB 저장 (batch_id 포함, 행 수는 티켓 저장 후 확정)
         extension_code_id = self.upload_db.get_extension_code_id(file_extension)
         file_data = {
             'user_id': user_id,
             'original_filename': original_filename,
             'storage_path': storage_path,
             'extension_code_id': extension_code_id,
-            'row_count': row_count,
+            'row_count': 0,
             'status': 'uploaded',
             'batch_id': batch_id  # 배치 ID 추가
         }
@@ -141,14 +153,16 @@ class UploadService:
         file_id = self.upload_db.insert_file(file_data)
         logger.info(f"파일 정보 DB 저장 완료: file_id={file_id}, batch_id={batch_id}")
         
-        # 5. 컬럼 매핑 조회
+        # 4. 컬럼 매핑 조회
         mapping_dict = self.mapping_service.get_active_mappings_dict()
         
-        # 6. 티켓 데이터 파싱 및 저장
-        tickets_inserted = self._parse_and_save_tickets(df, file_id, user_id, mapping_dict)
+        # 5. 청크 단위 읽기 → 파싱 → (분류) → 저장
+        chunks = self._read_file_chunks(storage_path, file_extension)
+        tickets_inserted = self._parse_and_save_tickets(chunks, file_id, user_id, mapping_dict, inline)
+        row_count = tickets_inserted
         
-        # 7. 파일 상태 업데이트
-        self.upload_db.update_file_status(file_id, 'processed')
+        # 6. 파일 상태/행 수 업데이트
+        self.upload_db.update_file_status(file_id, 'processed', row_count=row_count)
         
         return {
             'file_id': file_id,
@@ -163,74 +177,100 @@ class UploadService:
         return '.' in filename and \
                filename.rsplit('.', 1)[1].lower() in self.allowed_extensions
     
-    def upload(self, file, user_id=1):
+    def upload(self, file, user_id=1, classify=None):
         """
         단일 파일 업로드 및 처리 (기존 API 호환성 유지)
         배치 없이 개별 파일로 업로드
+        
+        classify: 업로드 중 규칙 기반 분류 여부 (기본값 Config.INLINE_CLASSIFICATION)
         """
         try:
-            return self._upload_single_file(file, user_id, batch_id=None)
+            inline = self._start_inline_classification(classify)
+            result = self._upload_single_file(file, user_id, batch_id=None, inline=inline)
+            
+            if inline:
+                result['classification'] = self._save_inline_classification(
+                    inline, user_id, file_id=result['file_id']
+                )
+            return result
         except Exception as e:
             logger.error(f"파일 업로드 실패: {e}")
             raise
     
-    def _read_file(self, file_path, file_extension):
-        """파일 읽기 (CSV 또는 Excel)"""
+    def _read_file_chunks(self, file_path, file_extension):
+        """파일을 Config.UPLOAD_CHUNK_SIZE 행 단위 DataFrame으로 읽기 (CSV는 스트리밍, Excel은 전체 로딩 후 분할)"""
+        chunk_size = Config.UPLOAD_CHUNK_SIZE
         try:
             if file_extension == 'csv':
-                df = pd.read_csv(file_path, encoding='utf-8')
+                yield from pd.read_csv(file_path, encoding='utf-8', chunksize=chunk_size)
             elif file_extension in ['xlsx', 'xls']:
                 df = pd.read_excel(file_path)
+                logger.info(f"파일 읽기 완료: {len(df)}행, {len(df.columns)}컬럼")
+                for start in range(0, len(df), chunk_size):
+                    yield df.iloc[start:start + chunk_size]
             else:
                 raise ValueError(f'지원되지 않는 파일 형식: {file_extension}')
             
-            logger.info(f"파일 읽기 완료: {len(df)}행, {len(df.columns)}컬럼")
-            return df
-            
         except Exception as e:
             logger.error(f"파일 읽기 실패: {e}")
             raise
     
-    def _parse_and_save_tickets(self, df, file_id, user_id, mapping_dict):
+    def _parse_and_save_tickets(self, chunks, file_id, user_id, mapping_dict, inline=None):
         """
-        데이터프레임을 파싱하여 티켓 데이터로 변환 및 저장
+        청크 단위 데이터프레임을 파싱하여 티켓 데이터로 변환 및 저장
+        chunks: DataFrame iterable (_read_file_chunks)
         mapping_dict: {원본컬럼명: 매핑코드명}
+        inline: 주어지면 저장 전에 청크 단위로 분류하여 분류 컬럼까지 함께 저장
+        
+        청크마다 파싱 → 분류 → 다중 행 INSERT를 진행하므로 파일 전체 티켓을 메모리에 올리지 않음
+        (저장은 파일 단위 하나의 트랜잭션)
         """
-        try:
-            tickets = []
-            
-            # 역매핑 딕셔너리 생성 (매핑코드명: 원본컬럼명)
-            reverse_mapping = {v: k for k, v in mapping_dict.items()}
-            
-            # 대소문자 무시 매핑 생성
-            file_columns_lower = {col.lower(): col for col in df.columns}
-            case_insensitive_reverse = {}
-            for code_name, mapped_column in reverse_mapping.items():
-                mapped_lower = mapped_column.lower()
-                if mapped_lower in file_columns_lower:
-                    # 실제 파일의 컬럼명 사용
-                    case_insensitive_reverse[code_name] = file_columns_lower[mapped_lower]
-            
-            for index, row in df.iterrows():
-                ticket = {
-                    'file_id': file_id,
-                    'user_id': user_id,
-                    'received_at': self._get_mapped_value(row, case_insensitive_reverse, '접수일'),
-                    'channel': self._get_mapped_value(row, case_insensitive_reverse, '채널'),
-                    'customer_id': self._get_mapped_value(row, case_insensitive_reverse, '고객ID'),
-                    'product_code': self._get_mapped_value(row, case_insensitive_reverse, '상품코드'),
-                    'inquiry_type': self._get_mapped_value(row, case_insensitive_reverse, '문의 유형'),
-                    'title': self._get_mapped_value(row, case_insensitive_reverse, '제목'),  # 제목 매핑 추가
-                    'body': self._get_mapped_value(row, case_insensitive_reverse, '본문'),
-                    'assignee': self._get_mapped_value(row, case_insensitive_reverse, '담당자'),  # 담당자 추가
-                    'status': self._get_mapped_value(row, case_insensitive_reverse, '처리 상태', default='new'),
-                    'raw_data': row.to_json()
-                }
+        # 역매핑 딕셔너리 생성 (매핑코드명: 원본컬럼명)
+        reverse_mapping = {v: k for k, v in mapping_dict.items()}
+        classified = {'count': 0}
+        
+        def parsed_chunks():
+            case_insensitive_reverse = None
+            for df in chunks:
+                if case_insensitive_reverse is None:
+                    # 대소문자 무시 매핑 생성 (실제 파일의 컬럼명 사용)
+                    file_columns_lower = {col.lower(): col for col in df.columns}
+                    case_insensitive_reverse = {
+                        code_name: file_columns_lower[mapped_column.lower()]
+                        for code_name, mapped_column in reverse_mapping.items()
+                        if mapped_column.lower() in file_columns_lower
+                    }
                 
-                tickets.append(ticket)
-            
+                tickets = []
+                for index, row in df.iterrows():
+                    ticket = {
+                        'file_id': file_id,
+                        'user_id': user_id,
+                        'received_at': self._get_mapped_value(row, case_insensitive_reverse, '접수일'),
+                        'channel': self._get_mapped_value(row, case_insensitive_reverse, '채널'),
+                        'customer_id': self._get_mapped_value(row, case_insensitive_reverse, '고객ID'),
+                        'product_code': self._get_mapped_value(row, case_insensitive_reverse, '상품코드'),
+                        'inquiry_type': self._get_mapped_value(row, case_insensitive_reverse, '문의 유형'),
+                        'title': self._get_mapped_value(row, case_insensitive_reverse, '제목'),  # 제목 매핑 추가
+                        'body': self._get_mapped_value(row, case_insensitive_reverse, '본문'),
+                        'assignee': self._get_mapped_value(row, case_insensitive_reverse, '담당자'),  # 담당자 추가
+                        'status': self._get_mapped_value(row, case_insensitive_reverse, '처리 상태', default='new'),
+                        'raw_data': row.to_json()
+                    }
+                    
+                    tickets.append(ticket)
+                
+                # 업로드 중 분류 (저장과 같은 패스에서 분류 컬럼 채움)
+                if inline:
+                    classified['count'] += self._classify_inline(tickets, inline)
+                
+                yield tickets
+        
+        try:
             # 티켓 DB 저장
-            inserted_count = self.upload_db.insert_tickets(tickets)
+            inserted_count = self.upload_db.insert_ticket_chunks(parsed_chunks())
+            if inline:
+                logger.info(f"업로드 중 분류 완료: {classified['count']}건")
             logger.info(f"티켓 데이터 {inserted_count}건 저장 완료")
             
             return inserted_count
@@ -239,6 +279,63 @@ class UploadService:
             logger.error(f"티켓 파싱 및 저장 실패: {e}")
             raise
     
+    def _start_inline_classification(self, classify=None):
+        """업로드 중 분류 준비 (비활성화면 None)"""
+        if classify is None:
+            classify = Config.INLINE_CLASSIFICATION
+        if not classify:
+            return None
+        
+        category_mapping = AutoClassifyService().db.get_category_mapping()
+        if not category_mapping:
+            logger.warning("카테고리 데이터가 없어 업로드 중 분류를 건너뜁니다.")
+            return None
+        
+        return {
+            'classifier': RuleBasedClassifier(category_mapping, RuleSetService().get_active()),
+            'category_mapping': category_mapping,
+            'aggregate': ClassificationAggregator()
+        }
+    
+    def _classify_inline(self, tickets, inline):
+        """파싱된 티켓 청크를 분류하고 분류 컬럼을 채움 (청크 부분 집계를 병합)
+        
+        Returns:
+            int: 분류한 티켓 수
+        """
+        classified_at = datetime.now()
+        chunk_aggregate = ClassificationAggregator()
+        for ticket, result in zip(tickets, inline['classifier'].classify_batch(tickets)):
+            ticket['classified_category_id'] = result['category_id']
+            ticket['classification_confidence'] = result['confidence']
+            ticket['classification_keywords'] = json.dumps(result.get('keywords', []), ensure_ascii=False)
+            ticket['classified_at'] = classified_at
+            ticket['classification_stage'] = result.get('stage', 'rule')
+            ticket['classification_rule_version'] = result.get('rule_version')
+            chunk_aggregate.add(ticket, result)
+        
+        inline['aggregate'].merge(chunk_aggregate)
+        return chunk_aggregate.total
+    
+    def _save_inline_classification(self, inline, user_id, file_id=None, batch_id=None):
+        """업로드 중 분류한 결과로 분류 결과 메타 정보/집계 저장 (티켓 재조회 없음)"""
+        aggregate = inline['aggregate']
+        if not aggregate.total:
+            return None
+        
+        saved = AutoClassifyService().save_classification(
+            user_id, file_id, batch_id, aggregate,
+            inline['category_mapping'], inline['classifier'].get_engine_name()
+        )
+        logger.info(f"업로드 중 분류 결과 저장: class_result_id={saved['class_result_id']}")
+        
+        return {
+            'class_result_id': saved['class_result_id'],
+            'engine_name': inline['classifier'].get_engine_name(),
+            'total_tickets': aggregate.total,
+            'reliability': saved['reliability_stats']
+        }
+    
     def _get_mapped_value(self, row, reverse_mapping, code_name, default=None):
         """
         매핑된 컬럼에서 값 가져오기 (대소문자 무시)
@@ -25,35 +25,10 @@ function setLastRunLabel(ts) {
 }
 
 // ---------- 유틸 ----------
-function truncate15(s) {
-  if (!s) return "";
-  return [...s].length > 15 ? [...s].slice(0, 15).join("") + "..." : s;
-}
 function joinKeywords(arr) {
   if (!Array.isArray(arr)) return "";
   return arr.join(", ");
 }
-function flatAllByCategory(all_by_category) {
-  if (!all_by_category) return [];
-  // 모든 카테고리의 모든 티켓 (우선순위 기반 정렬)
-  const order = ["품질/하자", "서비스", "배송", "AS/수리", "결제", "이벤트", "일반", "기타"];
-  const rows = [];
-  for (const cat of order) {
-    const items = all_by_category[cat] || [];
-    for (const it of items) {
-      rows.push({
-        received_at: it.received_at || "-",
-        channel: it.channel || "-",
-        content: it.content || "",
-        preview: it.preview || truncate15(it.content || ""),
-        category: cat,
-        keywords: Array.isArray(it.keywords) ? it.keywords : [],
-        confidence: it.confidence || "-"
-      });
-    }
-  }
-  return rows;
-}
 
 
 // ---------- 렌더 ----------
@@ -381,30 +356,30 @@ function renderReliability(r, ui) {
   `;
 }
 
-// 티켓 데이터 저장 (페이지네이션/검색용)
-let allTickets = [];
-let filteredTickets = [];
+// 티켓 목록 상태 (서버 keyset 페이지네이션)
+// pageCursors[i] = i+1 페이지 요청에 쓸 cursor (1페이지는 null)
+let ticketClassResultId = null;
+let pageCursors = [null];
 let currentPage = 1;
+let ticketTotal = 0;
+let ticketHasNext = false;
+let ticketRequestSeq = 0;
+let searchTimer = null;
 const ITEMS_PER_PAGE = 10;
+const DATE_FILTER_DAYS = { today: 1, week: 7, month: 30, quarter: 90 };
 
-function renderTicketTableFromAll(all_by_category) {
+function loadTicketTable(classResultId) {
   const tbody = document.getElementById("ticketTableBody");
-  if (!tbody) return;
-  
-  // 전체 티켓 저장
-  allTickets = flatAllByCategory(all_by_category);
-  filteredTickets = [...allTickets];
-  currentPage = 1;
+  if (!tbody || !classResultId) return;
   
-  // 티켓 카운트 업데이트
-  updateTicketCount(allTickets.length);
+  ticketClassResultId = classResultId;
   
   // 검색 및 필터 이벤트 바인딩
   bindSearchEvent();
   bindFilterEvents();
   
-  // 첫 페이지 렌더링
-  renderTicketTable();
+  // 첫 페이지 조회
+  resetTicketPaging();
 }
 
 function updateTicketCount(count) {
@@ -422,8 +397,10 @@ function bindSearchEvent() {
   if (searchInput.dataset.bound) return;
   searchInput.dataset.bound = 'true';
   
+  // 입력마다 요청하지 않도록 디바운스
   searchInput.addEventListener('input', function(e) {
-    applyFilters();
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(applyFilters, 300);
   });
 }
 
@@ -435,6 +412,10 @@ function bindFilterEvents() {
   const sortSelect = document.getElementById('sort-select');
   const clearFilters = document.getElementById('clear-filters');
   
+  // 이미 바인딩 되었으면 스킵
+  if (sortSelect?.dataset.bound) return;
+  if (sortSelect) sortSelect.dataset.bound = 'true';
+  
   if (dateFilter) {
     dateFilter.addEventListener('change', applyFilters);
   }
@@ -466,120 +447,91 @@ function bindFilterEvents() {
   }
 }
 
-function applyFilters() {
-  const searchKeyword = document.getElementById('ticket-search')?.value.toLowerCase().trim() || '';
+function buildTicketQuery(cursor) {
+  const params = new URLSearchParams({
+    class_result_id: ticketClassResultId,
+    sort: document.getElementById('sort-select')?.value || 'date-desc',
+    limit: ITEMS_PER_PAGE
+  });
+  
+  const searchKeyword = document.getElementById('ticket-search')?.value.trim() || '';
   const dateFilter = document.getElementById('date-filter')?.value || '';
   const channelFilter = document.getElementById('channel-filter')?.value || '';
   const categoryFilter = document.getElementById('category-filter')?.value || '';
   
-  filteredTickets = allTickets.filter(ticket => {
-    // 검색어 필터링
-    if (searchKeyword) {
-      const matchesSearch = (
-        (ticket.content && ticket.content.toLowerCase().includes(searchKeyword)) ||
-        (ticket.channel && ticket.channel.toLowerCase().includes(searchKeyword)) ||
-        (ticket.category && ticket.category.toLowerCase().includes(searchKeyword))
-      );
-      if (!matchesSearch) return false;
-    }
-    
-    // 날짜 필터링
-    if (dateFilter) {
-      const ticketDate = new Date(ticket.received_at);
-      const now = new Date();
-      const daysDiff = Math.floor((now - ticketDate) / (1000 * 60 * 60 * 24));
-      
-      switch (dateFilter) {
-        case 'today':
-          if (daysDiff > 0) return false;
-          break;
-        case 'week':
-          if (daysDiff > 7) return false;
-          break;
-        case 'month':
-          if (daysDiff > 30) return false;
-          break;
-        case 'quarter':
-          if (daysDiff > 90) return false;
-          break;
-      }
-    }
-    
-    // 채널 필터링
-    if (channelFilter && ticket.channel !== channelFilter) {
-      return false;
-    }
-    
-    // 카테고리 필터링
-    if (categoryFilter && ticket.category !== categoryFilter) {
-      return false;
-    }
-    
-    return true;
-  });
+  if (searchKeyword) params.set('q', searchKeyword);
+  if (DATE_FILTER_DAYS[dateFilter]) params.set('days', DATE_FILTER_DAYS[dateFilter]);
+  if (channelFilter) params.set('channel', channelFilter);
+  if (categoryFilter) params.set('category', categoryFilter);
+  if (cursor) params.set('cursor', cursor);
   
-  // 정렬 적용
-  applySorting();
-    
-    // 첫 페이지로 리셋
-    currentPage = 1;
-    updateTicketCount(filteredTickets.length);
-    renderTicketTable();
+  return params.toString();
+}
+
+function applyFilters() {
+  // 필터가 바뀌면 커서를 버리고 첫 페이지부터 다시 조회
+  resetTicketPaging();
 }
 
 function applySorting() {
-  const sortSelect = document.getElementById('sort-select');
-  if (!sortSelect || !filteredTickets.length) return;
-  
-  const sortValue = sortSelect.value;
-  
-  filteredTickets.sort((a, b) => {
-    switch (sortValue) {
-      case 'date-desc':
-        return new Date(b.received_at) - new Date(a.received_at);
-      case 'date-asc':
-        return new Date(a.received_at) - new Date(b.received_at);
-      case 'confidence-desc':
-        return getConfidenceValue(b.confidence) - getConfidenceValue(a.confidence);
-      case 'confidence-asc':
-        return getConfidenceValue(a.confidence) - getConfidenceValue(b.confidence);
-      case 'category':
-        return (a.category || '').localeCompare(b.category || '');
-      case 'channel':
-        return (a.channel || '').localeCompare(b.channel || '');
-      default:
-        return 0;
-    }
-  });
-  
-  // 정렬 후 테이블 다시 렌더링
-  renderTicketTable();
+  // 정렬이 바뀌면 keyset 기준이 달라지므로 첫 페이지부터 다시 조회
+  resetTicketPaging();
 }
 
-function getConfidenceValue(confidence) {
-  const confidenceMap = {
-    '상': 3,
-    '중': 2,
-    '하': 1
-  };
-  return confidenceMap[confidence] || 0;
+function resetTicketPaging() {
+  pageCursors = [null];
+  currentPage = 1;
+  fetchTicketPage(1);
+}
+
+async function fetchTicketPage(page) {
+  if (!ticketClassResultId) return;
+  
+  // 늦게 도착한 이전 요청 응답은 무시
+  const seq = ++ticketRequestSeq;
+  
+  try {
+    const res = await fetch(`/api/classifications/tickets?${buildTicketQuery(pageCursors[page - 1])}`);
+    const body = await res.json();
+    if (!res.ok || !body.success) {
+      throw new Error(body.error || `HTTP ${res.status}`);
+    }
+    if (seq !== ticketRequestSeq) return;
+    
+    const data = body.data;
+    currentPage = page;
+    ticketHasNext = data.next_cursor != null;
+    pageCursors[page] = data.next_cursor;
+    
+    if (data.total != null) {
+      ticketTotal = data.total;
+      updateTicketCount(ticketTotal);
+    }
+    
+    renderTicketTable(data.items || []);
+  } catch (e) {
+    console.error('티켓 목록 조회 실패:', e);
+    if (seq !== ticketRequestSeq) return;
+    const tbody = document.getElementById("ticketTableBody");
+    if (tbody) {
+      tbody.innerHTML = `<tr><td colspan="6" style="text-align:center; padding:40px; color:var(--muted);">
+        티켓 목록을 불러오지 못했습니다.
+      </td></tr>`;
+    }
+  }
 }
 
 
-function renderTicketTable() {
+function renderTicketTable(pageTickets) {
   const tbody = document.getElementById("ticketTableBody");
   if (!tbody) return;
   
-  // 페이지네이션 계산
-  const totalPages = Math.ceil(filteredTickets.length / ITEMS_PER_PAGE);
-  const startIdx = (currentPage - 1) * ITEMS_PER_PAGE;
-  const endIdx = startIdx + ITEMS_PER_PAGE;
-  const pageTickets = filteredTickets.slice(startIdx, endIdx);
+  const totalPages = Math.ceil(ticketTotal / ITEMS_PER_PAGE);
   
   // 티켓이 없을 때
   if (pageTickets.length === 0) {
     tbody.innerHTML = `<tr><td colspan="6" style="text-align:center; padding:40px; color:var(--muted);">
-      ${filteredTickets.length === 0 && allTickets.length > 0 ? '검색 결과가 없습니다.' : '티켓 데이터가 없습니다.'}
+      ${hasActiveTicketFilters() ? '검색 결과가 없습니다.' : '티켓 데이터가 없습니다.'}
     </td></tr>`;
     renderPagination(0, 0);
     return;
@@ -590,7 +542,7 @@ function renderTicketTable() {
     <tr>
       <td>${t.received_at}</td>
       <td>${t.channel}</td>
-      <td>${truncate15(t.content)}</td>
+      <td>${t.preview}</td>
       <td>${t.category}</td>
       <td>${joinKeywords(t.keywords)}</td>
       <td class="right">${t.confidence}</td>
@@ -601,6 +553,11 @@ function renderTicketTable() {
   renderPagination(currentPage, totalPages);
 }
 
+function hasActiveTicketFilters() {
+  return ['ticket-search', 'date-filter', 'channel-filter', 'category-filter']
+    .some(id => (document.getElementById(id)?.value || '').trim() !== '');
+}
+
 function renderPagination(current, total) {
   const paginationEl = document.getElementById("ticket-pagination");
   if (!paginationEl) return;
@@ -615,10 +572,12 @@ function renderPagination(current, total) {
   // 이전 버튼
   html += `<button onclick="goToPage(${current - 1})" ${current <= 1 ? 'disabled' : ''}>‹ 이전</button>`;
   
-  // 페이지 번호
+  // 페이지 번호 (커서를 알고 있는 페이지 = 이미 지나온 페이지 + 다음 페이지)
+  let reachable = 1;
+  while (pageCursors[reachable] != null) reachable++;
   const maxButtons = 5;
   let startPage = Math.max(1, current - Math.floor(maxButtons / 2));
-  let endPage = Math.min(total, startPage + maxButtons - 1);
+  let endPage = Math.min(reachable, startPage + maxButtons - 1);
   
   // 시작 페이지 조정
   if (endPage - startPage < maxButtons - 1) {
@@ -638,16 +597,8 @@ function renderPagination(current, total) {
     html += `<button onclick="goToPage(${i})" class="${i === current ? 'active' : ''}">${i}</button>`;
   }
   
-  // 마지막 페이지
-  if (endPage < total) {
-    if (endPage < total - 1) {
-      html += `<span class="page-info">...</span>`;
-    }
-    html += `<button onclick="goToPage(${total})">${total}</button>`;
-  }
-  
   // 다음 버튼
-  html += `<button onclick="goToPage(${current + 1})" ${current >= total ? 'disabled' : ''}>다음 ›</button>`;
+  html += `<button onclick="goToPage(${current + 1})" ${!ticketHasNext ? 'disabled' : ''}>다음 ›</button>`;
   
   // 페이지 정보
   html += `<span class="page-info">${current} / ${total} 페이지</span>`;
@@ -656,12 +607,10 @@ function renderPagination(current, total) {
 }
 
 function goToPage(page) {
-  const totalPages = Math.ceil(filteredTickets.length / ITEMS_PER_PAGE);
+  // keyset 페이지네이션: 커서를 알고 있는 페이지로만 이동 가능
+  if (page < 1 || page > pageCursors.length || (page > 1 && pageCursors[page - 1] == null)) return;
   
-  if (page < 1 || page > totalPages) return;
-  
-  currentPage = page;
-  renderTicketTable();
+  fetchTicketPage(page);
   
   // 테이블 상단으로 스크롤
   const ticketCard = document.querySelector('.card--tickets');
@@ -834,9 +783,7 @@ window.runClassification = async function runClassification() {
     renderCategoryTable(data.category_info || []);
     renderChannelCards(data.channel_info || []);
     renderReliability(data.reliability_info || {}, data.ui || {});
-    if (data.tickets?.all_by_category) {
-      renderTicketTableFromAll(data.tickets.all_by_category);
-    }
+    loadTicketTable(data.class_result_id);
     requestAnimationFrame(syncChannelsHeight);
 
     // --- 마지막 분류 시각 갱신 & 저장 ---
@@ -880,10 +827,12 @@ function clearUIToInitial() {
   if (pagination) pagination.innerHTML = '';
   if (searchInput) searchInput.value = '';
   
-  // 티켓 데이터 초기화
-  allTickets = [];
-  filteredTickets = [];
+  // 티켓 목록 상태 초기화
+  ticketClassResultId = null;
+  pageCursors = [null];
   currentPage = 1;
+  ticketTotal = 0;
+  ticketRequestSeq++;
   updateTicketCount(0);
   
   setLastRunLabel("-"); // 라벨도 초기화
@@ -909,9 +858,7 @@ window.resetClassification = function resetClassification() {
       renderCategoryTable(data.category_info || []);
       renderChannelCards(data.channel_info || []);
       renderReliability(data.reliability_info || {}, data.ui || {});
-      if (data.tickets?.all_by_category) {
-        renderTicketTableFromAll(data.tickets.all_by_category);
-      }
+      loadTicketTable(data.class_result_id);
       requestAnimationFrame(syncChannelsHeight);
     } else {
       // 데이터가 없으면 초기 상태로 표시
@@ -227,9 +227,7 @@ class ReportManager {
         const categoryColors = this.getCategoryColors();
         
         // 2. 전체 합계 꺾은선 그래프 (먼저 추가 → 막대 위에 표시)
-        const totalData = dataMatrix.map(row => 
-            row.reduce((sum, val) => sum + (val || 0), 0)
-        );
+        const totalData = this.getTotalLineData(trendData, dataMatrix);
         
         datasets.push({
             type: 'line',
@@ -355,6 +353,20 @@ class ReportManager {
         this.chartInstances[channel] = new Chart(ctx, config);
     }
     
+    getTotalLineData(trendData, dataMatrix) {
+        // 서버에서 LTTB로 축소한 합계선이 있으면 해당 점만 그림 (x = 날짜 라벨)
+        if (trendData.total_line) {
+            return trendData.total_line.dates.map((date, idx) => ({
+                x: date,
+                y: trendData.total_line.values[idx]
+            }));
+        }
+        
+        return dataMatrix.map(row => 
+            row.reduce((sum, val) => sum + (val || 0), 0)
+        );
+    }
+    
     sanitizeId(str) {
         return str.replace(/[^a-zA-Z0-9가-힣]/g, '-');
     }
@@ -1125,9 +1137,7 @@ class ReportManager {
         const categoryColors = this.getCategoryColors();
         
         // 전체 합계 꺾은선 그래프
-        const totalData = dataMatrix.map(row => 
-            row.reduce((sum, val) => sum + (val || 0), 0)
-        );
+        const totalData = this.getTotalLineData(trendData, dataMatrix);
         
         datasets.push({
             type: 'line',
@@ -0,0 +1,24 @@
+"""
+pytest 공통 설정
+
+- 인메모리 SQLite 백엔드로 실행 (MySQL 불필요)
+- 규칙/분석 저장소/업로드/ONNX 산출물은 테스트 전용 임시 디렉터리에 저장
+- 환경 변수는 config 모듈 import 전에 설정해야 하므로 모듈 최상단에서 지정 (이미 지정된 값은 유지)
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+_WORK_DIR = tempfile.mkdtemp(prefix='clara_cs_tests_')
+
+os.environ.setdefault('DB_BACKEND', 'sqlite')
+os.environ.setdefault('SQLITE_PATH', ':memory:')
+os.environ.setdefault('ANALYTICS_MIRROR', 'false')
+os.environ.setdefault('ANALYTICS_DATA_DIR', os.path.join(_WORK_DIR, 'analytics'))
+os.environ.setdefault('RULE_ARTIFACT_DIR', os.path.join(_WORK_DIR, 'rules'))
+os.environ.setdefault('UPLOAD_FOLDER', os.path.join(_WORK_DIR, 'uploads'))
+os.environ.setdefault('ONNX_MODEL_DIR', os.path.join(_WORK_DIR, 'onnx'))
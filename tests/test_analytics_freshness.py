@@ -0,0 +1,48 @@
+"""
+분석 저장소 미러 갱신 실패 표시 범위 테스트
+
+갱신 실패 표시는 해당 사용자 / 배치의 분석 조회만 막아야 함
+"""
+import pytest
+
+from services.analytics import AnalyticsService
+from utils.analytics_store import AnalyticsMirrorStale, AnalyticsStore
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = AnalyticsService()
+    service.store = AnalyticsStore(str(tmp_path))
+    return service
+
+
+def test_batch_marker_blocks_only_its_user_and_batch(service):
+    service.store.mark_stale('batch_5', user_id=1, batch_id=5)
+    
+    with pytest.raises(AnalyticsMirrorStale):
+        service._ensure_fresh(1)
+    with pytest.raises(AnalyticsMirrorStale):
+        service._ensure_fresh(1, [5, 6])
+    service._ensure_fresh(1, [6])
+    service._ensure_fresh(2)
+
+
+def test_file_marker_without_batch_blocks_all_batches_of_user(service):
+    service.store.mark_stale('file_9', user_id=1)
+    
+    with pytest.raises(AnalyticsMirrorStale):
+        service._ensure_fresh(1, [6])
+    service._ensure_fresh(2, [6])
+
+
+def test_failed_background_mirror_marks_target(service, monkeypatch):
+    def fail(file_id=None, batch_id=None):
+        raise RuntimeError('db down')
+    monkeypatch.setattr(service, 'sync', fail)
+    
+    service._mirror(7, batch_id=42)
+    
+    assert service.store.stale_markers()['batch_42']['user_id'] == 7
+    with pytest.raises(AnalyticsMirrorStale):
+        service._ensure_fresh(7, [42])
+    service._ensure_fresh(8)
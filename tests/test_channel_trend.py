@@ -0,0 +1,36 @@
+"""
+채널별 추이 합계선(LTTB) 테스트
+
+추이 행렬은 건수가 있는 날짜만 담는 희소 구조이므로
+합계선 축소가 인덱스가 아닌 실제 날짜 간격을 x 좌표로 쓰는지 확인
+"""
+from utils.channel_trend import attach_total_line, lttb
+
+
+def test_lttb_default_positions_are_evenly_spaced():
+    values = [2, 8, 9, 2, 1, 8, 4, 0]
+    assert lttb(values, 4) == lttb(values, 4, list(range(len(values))))
+
+
+def test_lttb_uses_real_positions():
+    values = [2, 8, 9, 2, 1, 8, 4, 0]
+    positions = [0, 1, 4, 5, 28, 43, 53, 55]
+    assert lttb(values, 4) == [0, 2, 4, 7]
+    assert lttb(values, 4, positions) == [0, 2, 5, 7]
+
+
+def test_total_line_uses_bucket_dates():
+    days = [0, 1, 4, 5, 28, 43, 53, 55]
+    values = [2, 8, 9, 2, 1, 8, 4, 0]
+    dates_full = [f"2024-01-{day + 1:02d}" if day < 31 else f"2024-02-{day - 30:02d}" for day in days]
+    trend = {
+        'categories': ['배송'],
+        'dates': [value[5:] for value in dates_full],
+        'dates_full': dates_full,
+        'data': [[value] for value in values]
+    }
+    
+    line = attach_total_line(trend, 4)['total_line']
+    
+    assert line['dates'] == [trend['dates'][i] for i in (0, 2, 5, 7)]
+    assert line['values'] == [2, 9, 8, 0]
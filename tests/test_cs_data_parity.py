@@ -0,0 +1,52 @@
+"""
+CS 분석 데이터 패리티 테스트
+
+일별 롤업 단일 조회 빌더의 cs_data가 원본 티켓(hot + archive) 6개 쿼리 기준값과
+파일/배치 경로 모두 같은지 확인 (채널 NULL, 상태 NULL, 아카이브 티어 포함 시드 데이터)
+"""
+import pytest
+
+from config import Config
+from services.cs_data_parity import CSDataParityService
+from services.db.upload_db import UploadDB
+
+
+@pytest.fixture(scope='module')
+def seeded():
+    service = CSDataParityService()
+    return service, service.seed_fixture(Config.DEFAULT_USER_ID)
+
+
+def test_file_cs_data_matches_raw_tickets(seeded):
+    service, fixture = seeded
+    for file_id in fixture['file_ids']:
+        result = service.check(file_id=file_id)
+        assert result['total_tickets'] > 0
+        assert result['mismatches'] == []
+
+
+def test_batch_cs_data_matches_raw_tickets(seeded):
+    service, fixture = seeded
+    result = service.check(batch_id=fixture['batch_id'])
+    assert result['total_tickets'] > 0
+    assert result['mismatches'] == []
+
+
+def test_rollup_drift_is_detected(seeded):
+    service, fixture = seeded
+    file_id = fixture['file_ids'][0]
+    
+    # 기준값은 원본 티켓에서 집계하므로 롤업만 어긋나도 불일치로 드러나야 함
+    connection = UploadDB().db_manager.get_connection()
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            UPDATE tb_ticket_daily_rollup SET ticket_count = ticket_count + 1
+            WHERE rollup_id = (SELECT MIN(rollup_id) FROM tb_ticket_daily_rollup WHERE file_id = %s)
+        """, [file_id])
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+    
+    assert service.check(file_id=file_id)['mismatches']
@@ -0,0 +1,50 @@
+"""
+PyTorch / ONNX int8 AI 분류 정확도 일치 테스트
+
+실행 조건: onnxruntime / torch / transformers 설치 + 작은 로컬 NLI 체크포인트
+    flask --app app download-onnx-parity-checkpoint   # ONNX_PARITY_CHECKPOINT(기본 models/nli-small)에 저장
+조건이 없으면 사유와 함께 skip 처리
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from config import Config
+
+MISSING_LIBRARIES = [name for name in ('onnxruntime', 'torch', 'transformers')
+                     if importlib.util.find_spec(name) is None]
+
+
+@pytest.mark.skipif(not Path(Config.ONNX_PARITY_CHECKPOINT).is_dir(),
+                    reason=f"로컬 체크포인트가 없습니다: {Config.ONNX_PARITY_CHECKPOINT} "
+                           f"(flask --app app download-onnx-parity-checkpoint로 다운로드)")
+@pytest.mark.skipif(bool(MISSING_LIBRARIES),
+                    reason=f"라이브러리가 설치되지 않았습니다: {', '.join(MISSING_LIBRARIES)}")
+def test_onnx_int8_matches_pytorch():
+    from services.db.auto_classify_db import AutoClassifyDB
+    from utils.classifiers.onnx_classifier import check_parity
+    
+    report = check_parity(AutoClassifyDB().get_category_mapping())
+    
+    assert report['passed'], report['failures']
+
+
+@pytest.fixture
+def cli_runner():
+    from app import create_app
+    return create_app().test_cli_runner()
+
+
+def test_cli_fails_when_parity_check_cannot_run(cli_runner, tmp_path):
+    result = cli_runner.invoke(args=['check-onnx-parity', '--checkpoint', str(tmp_path / 'missing')])
+    
+    assert result.exit_code != 0
+    assert '실행할 수 없습니다' in result.output
+
+
+def test_cli_allow_skip_exits_zero(cli_runner, tmp_path):
+    result = cli_runner.invoke(args=['check-onnx-parity', '--checkpoint', str(tmp_path / 'missing'), '--allow-skip'])
+    
+    assert result.exit_code == 0
+    assert result.output.startswith('skipped:')
@@ -0,0 +1,40 @@
+"""
+저장된 리포트 조회 권한 테스트
+
+GET /api/report/<report_id>는 세션 사용자가 생성한 리포트만 반환
+"""
+import pytest
+
+from services.db.report_db import ReportDB
+
+
+@pytest.fixture
+def client():
+    from app import create_app
+    return create_app().test_client()
+
+
+@pytest.fixture
+def report_id():
+    return ReportDB().create_report(None, 7, 'summary', 'access test')
+
+
+def _login(client, user_id):
+    with client.session_transaction() as session:
+        session['user_id'] = user_id
+
+
+def test_owner_can_read_report(client, report_id):
+    _login(client, 7)
+    response = client.get(f'/api/report/{report_id}')
+    
+    assert response.status_code == 200
+    assert response.get_json()['data']['report_id'] == report_id
+
+
+def test_other_user_gets_not_found(client, report_id):
+    _login(client, 8)
+    response = client.get(f'/api/report/{report_id}')
+    
+    assert response.status_code == 404
+    assert response.get_json()['success'] is False
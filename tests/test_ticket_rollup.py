@@ -0,0 +1,98 @@
+"""
+일별 티켓 롤업 증감 반영 테스트
+
+저장(청크) / 분류 / 재분류 / archive 이동 후 증감으로 유지한 롤업이
+원본 티켓 전체 재집계(rebuild)와 같은지 확인
+"""
+from datetime import date
+
+import pytest
+
+from services.db.auto_classify_db import AutoClassifyDB
+from services.db.rollup_db import TicketRollupDB
+from services.db.upload_db import UploadDB
+
+
+def _rollup_rows(file_id):
+    connection = UploadDB().db_manager.get_connection()
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT stat_date, COALESCE(channel, ''), COALESCE(category_id, 0), COALESCE(status, ''),
+                   ticket_count, resolved_count, ROUND(confidence_sum, 6)
+            FROM tb_ticket_daily_rollup
+            WHERE file_id = %s
+            ORDER BY 1, 2, 3, 4
+        """, [file_id])
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def _ticket_ids(table, file_id):
+    connection = UploadDB().db_manager.get_connection()
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT ticket_id FROM {table} WHERE file_id = %s ORDER BY ticket_id", [file_id])
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def _assert_matches_rebuild(file_id):
+    incremental = _rollup_rows(file_id)
+    TicketRollupDB().rebuild(file_id=file_id)
+    assert incremental == _rollup_rows(file_id)
+    assert all(row[4] > 0 for row in incremental)
+
+
+@pytest.fixture
+def file_id():
+    upload_db = UploadDB()
+    batch_id = upload_db.create_batch(1, 'rollup-test')
+    file_id = upload_db.insert_file({'user_id': 1, 'original_filename': 'rollup.csv', 'storage_path': 'x',
+                                     'row_count': 0, 'batch_id': batch_id})
+    tickets = [{
+        'file_id': file_id,
+        'user_id': 1,
+        'received_at': f'202{3 + i % 3}-0{i % 9 + 1}-0{i % 7 + 1} 10:00:00',
+        'channel': [None, '', '전화', '이메일'][i % 4],
+        'body': '배송 지연 문의',
+        'status': ['완료', 'new'][i % 2],
+        'classified_category_id': [None, 1, 2][i % 3],
+        'classification_confidence': [None, 0.8, 0.6][i % 3]
+    } for i in range(120)]
+    # 청크마다 증감 반영
+    upload_db.insert_ticket_chunks([tickets[:50], tickets[50:]])
+    return file_id
+
+
+def test_inserted_chunks_match_rebuild(file_id):
+    assert sum(row[4] for row in _rollup_rows(file_id)) == 120
+    _assert_matches_rebuild(file_id)
+
+
+def test_reclassified_tickets_match_rebuild(file_id):
+    ticket_ids = _ticket_ids('tb_ticket', file_id)
+    AutoClassifyDB().update_ticket_classifications([
+        (ticket_id, {'category_id': None if i % 5 == 0 else i % 3 + 1, 'confidence': 0.5})
+        for i, ticket_id in enumerate(ticket_ids[:60])
+    ])
+    _assert_matches_rebuild(file_id)
+
+
+def test_reclassified_archive_tickets_match_rebuild(file_id):
+    from services.archive import TicketArchiveService
+
+    TicketArchiveService().roll_partitions(12, today=date(2025, 6, 15))
+    archived = _ticket_ids('tb_ticket_archive', file_id)
+    assert archived
+
+    AutoClassifyDB().update_ticket_classifications([
+        (ticket_id, {'category_id': 3, 'confidence': 0.9}) for ticket_id in archived[:20]
+    ] + [
+        (ticket_id, {'category_id': 3, 'confidence': 0.9}) for ticket_id in _ticket_ids('tb_ticket', file_id)[:20]
+    ])
+    _assert_matches_rebuild(file_id)
@@ -0,0 +1,239 @@
+"""
+컬럼형 분석 저장소 (Parquet + DuckDB)
+분류된 티켓을 파일 단위 Parquet으로 미러링하고 DuckDB로 여러 배치 / 장기간 분석 쿼리 실행 (MySQL 부하 없음)
+
+디렉토리 구조 (hive 파티션)
+    {ANALYTICS_DATA_DIR}/tickets/user_id={user_id}/month={YYYY-MM}/file_{file_id}.parquet
+- 파일을 다시 분류하면 해당 파일의 Parquet만 교체
+- 접수일이 없는 티켓은 month=none 파티션
+- 미러 갱신에 실패한 대상은 {ANALYTICS_DATA_DIR}/stale/ 에 표시 (다시 동기화할 때까지 분석 조회 거부)
+"""
+from typing import Any, Dict, List
+from collections import defaultdict
+from datetime import date, datetime, time
+from utils.logger import get_logger
+from config import Config
+import glob
+import json
+import os
+
+logger = get_logger(__name__)
+
+# Parquet 컬럼 (user_id, month는 파티션 경로로 저장)
+TICKET_FIELDS = [
+    ('ticket_id', 'int64'),
+    ('file_id', 'int64'),
+    ('batch_id', 'int64'),
+    ('received_at', 'timestamp'),
+    ('channel', 'string'),
+    ('product_code', 'string'),
+    ('inquiry_type', 'string'),
+    ('status', 'string'),
+    ('category_id', 'int64'),
+    ('category_name', 'string'),
+    ('classification_confidence', 'float64'),
+    ('classification_stage', 'string'),
+    ('classified_at', 'timestamp'),
+]
+TIMESTAMP_FIELDS = [name for name, kind in TICKET_FIELDS if kind == 'timestamp']
+
+
+class AnalyticsMirrorStale(Exception):
+    """미러 갱신에 실패한 대상이 있어 분석 결과가 최신이 아님 (analytics-sync로 복구 필요)"""
+
+
+def _to_datetime(value):
+    """timestamp 컬럼 값 변환 (DB 백엔드에 따라 date / 문자열로 조회되는 값을 datetime으로 통일)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    return datetime.fromisoformat(str(value))
+
+
+def _import_engines():
+    try:
+        import duckdb
+        import pyarrow
+        import pyarrow.parquet
+        return duckdb, pyarrow
+    except ImportError:
+        logger.error("duckdb / pyarrow 라이브러리가 설치되지 않았습니다.")
+        logger.error("pip install duckdb pyarrow 를 실행하세요.")
+        raise
+
+
+class AnalyticsStore:
+    """Parquet 티켓 미러 + DuckDB 쿼리"""
+    
+    def __init__(self, data_dir: str = None):
+        self.data_dir = data_dir or Config.ANALYTICS_DATA_DIR
+        self.tickets_dir = os.path.join(self.data_dir, 'tickets')
+        self.stale_dir = os.path.join(self.data_dir, 'stale')
+    
+    def _file_paths(self, file_id: int) -> List[str]:
+        return glob.glob(os.path.join(self.tickets_dir, '*', '*', f'file_{file_id}.parquet'))
+    
+    def _schema(self, pa):
+        types = {
+            'int64': pa.int64(),
+            'float64': pa.float64(),
+            'string': pa.string(),
+            'timestamp': pa.timestamp('us'),
+        }
+        return pa.schema([(name, types[kind]) for name, kind in TICKET_FIELDS])
+    
+    def write_file_tickets(self, file_id: int, tickets: List[Dict[str, Any]]) -> int:
+        """
+        파일의 분류된 티켓을 파티션별 Parquet으로 저장 (기존 파일 데이터 교체)
+        
+        Returns:
+            int: 저장한 티켓 수
+        """
+        _, pa = _import_engines()
+        import pyarrow.parquet as pq
+        
+        partitions = defaultdict(list)
+        for ticket in tickets:
+            ticket = {**ticket, **{name: _to_datetime(ticket.get(name)) for name in TIMESTAMP_FIELDS}}
+            received_at = ticket['received_at']
+            month = received_at.strftime('%Y-%m') if received_at else 'none'
+            partitions[(ticket['user_id'], month)].append(ticket)
+        
+        schema = self._schema(pa)
+        old_paths = set(self._file_paths(file_id))
+        written = []
+        
+        try:
+            # 새 파티션 파일을 임시 파일로 모두 쓴 뒤 교체 (중간 실패 시 기존 데이터 유지)
+            for (user_id, month), rows in partitions.items():
+                directory = os.path.join(self.tickets_dir, f'user_id={user_id}', f'month={month}')
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, f'file_{file_id}.parquet')
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                
+                columns = {name: [row.get(name) for row in rows] for name, _ in TICKET_FIELDS}
+                pq.write_table(pa.table(columns, schema=schema), tmp_path, compression='zstd')
+                written.append((tmp_path, path))
+            
+            for tmp_path, path in written:
+                os.replace(tmp_path, path)
+                old_paths.discard(path)
+        
+        except Exception:
+            for tmp_path, _ in written:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+        
+        # 더 이상 해당하지 않는 파티션의 이전 파일 제거
+        for path in old_paths:
+            os.remove(path)
+        
+        logger.info(f"분석 저장소 동기화: file_id={file_id}, 티켓 {len(tickets)}건, 파티션 {len(partitions)}개")
+        return len(tickets)
+    
+    def remove_file(self, file_id: int) -> int:
+        """파일의 Parquet 제거 (퍼지 시)
+        
+        Returns:
+            int: 삭제한 Parquet 파일 수
+        """
+        paths = self._file_paths(file_id)
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"분석 저장소 파일 삭제 실패: {path}, {e}")
+        
+        if paths:
+            logger.info(f"분석 저장소에서 파일 제거: file_id={file_id}, {len(paths)}개")
+        return len(paths)
+    
+    def mark_stale(self, target: str, user_id: int = None, batch_id: int = None):
+        """미러 갱신 실패 표시
+        
+        Args:
+            target: 'file_{id}' / 'batch_{id}'
+            user_id, batch_id: 분석 조회 범위 판단용 (모르면 None - 모든 사용자/배치 조회를 막음)
+        """
+        os.makedirs(self.stale_dir, exist_ok=True)
+        with open(os.path.join(self.stale_dir, target), 'w', encoding='utf-8') as f:
+            json.dump({'user_id': user_id, 'batch_id': batch_id, 'marked_at': datetime.now().isoformat()}, f)
+    
+    def clear_stale(self, target: str = None):
+        """미러 갱신 실패 표시 해제 (target 없으면 전체)"""
+        targets = [target] if target else self.stale_targets()
+        for name in targets:
+            path = os.path.join(self.stale_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def stale_targets(self) -> List[str]:
+        """미러 갱신에 실패한 대상 목록"""
+        if not os.path.isdir(self.stale_dir):
+            return []
+        return sorted(os.listdir(self.stale_dir))
+    
+    def stale_markers(self) -> Dict[str, Dict[str, Any]]:
+        """미러 갱신 실패 대상별 표시 내용 {target: {'user_id', 'batch_id', 'marked_at'}}
+        
+        Note:
+            이전 형식(시각만 기록) 표시는 user_id / batch_id가 None (모든 조회 범위에 해당)
+        """
+        markers = {}
+        for target in self.stale_targets():
+            try:
+                with open(os.path.join(self.stale_dir, target), encoding='utf-8') as f:
+                    marker = json.load(f)
+            except (OSError, ValueError):
+                marker = None
+            markers[target] = marker if isinstance(marker, dict) else {'user_id': None, 'batch_id': None}
+        return markers
+    
+    def query(self, sql: str, params: List[Any] = None) -> List[Dict[str, Any]]:
+        """
+        tickets 뷰(전체 Parquet)에 DuckDB 쿼리 실행
+        
+        Args:
+            sql: DuckDB SQL (tickets 뷰 사용, 파라미터는 ?)
+            params: 바인딩 파라미터
+        
+        Returns:
+            List[Dict]: 결과 행 (저장된 데이터가 없으면 빈 리스트)
+        """
+        duckdb, _ = _import_engines()
+        
+        pattern = os.path.join(self.tickets_dir, '*', '*', '*.parquet')
+        if not glob.glob(pattern):
+            return []
+        
+        connection = duckdb.connect()
+        try:
+            connection.execute(f"""
+                CREATE VIEW tickets AS
+                SELECT * FROM read_parquet(
+                    '{pattern.replace("'", "''")}',
+                    hive_partitioning = true,
+                    hive_types = {{'user_id': INTEGER, 'month': VARCHAR}}
+                )
+            """)
+            result = connection.execute(sql, params or [])
+            columns = [column[0] for column in result.description]
+            return [dict(zip(columns, row)) for row in result.fetchall()]
+        finally:
+            connection.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        """저장된 Parquet 파일 수 / 파티션 수 / 크기 / 갱신 실패 대상"""
+        paths = glob.glob(os.path.join(self.tickets_dir, '*', '*', '*.parquet'))
+        return {
+            'files': len(paths),
+            'partitions': len({os.path.dirname(path) for path in paths}),
+            'bytes': sum(os.path.getsize(path) for path in paths),
+            'stale': self.stale_targets()
+        }
+
+
+# 전역 싱글톤 인스턴스
+analytics_store = AnalyticsStore()
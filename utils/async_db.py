@@ -0,0 +1,109 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, Union
+from utils.database import db_manager
+from utils.logger import get_logger
+from config import Config
+
+logger = get_logger(__name__)
+
+# 쿼리 정의: (SQL, 파라미터) 또는 (SQL, 파라미터, 'one' | 'all')
+QuerySpec = Union[Tuple[str, Any], Tuple[str, Any, str], Callable[[], Any]]
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """DB I/O 전용 스레드 풀 (지연 생성, Connection Pool보다 작게 유지)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.DB_ASYNC_WORKERS,
+                    thread_name_prefix='db-io'
+                )
+                logger.info(f"DB I/O 스레드 풀 생성 (workers={Config.DB_ASYNC_WORKERS})")
+    return _executor
+
+
+def _run_query(spec: QuerySpec):
+    """쿼리 1개를 별도 pooled connection에서 실행"""
+    if callable(spec):
+        return spec()
+    
+    query, params = spec[0], spec[1]
+    fetch = spec[2] if len(spec) > 2 else 'all'
+    
+    connection = db_manager.get_connection()
+    cursor = connection.cursor(dictionary=True)
+    
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchone() if fetch == 'one' else cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+
+def _submit(spec: QuerySpec):
+    # 요청 컨텍스트(쿼리 예산 집계 등)를 작업 스레드로 전달
+    context = contextvars.copy_context()
+    return get_executor().submit(context.run, _run_query, spec)
+
+
+def fetch_concurrently(queries: Dict[str, QuerySpec]) -> Dict[str, Any]:
+    """서로 독립적인 쿼리를 동시에 실행하고 결과를 모아서 반환 (동기 API)
+    
+    Args:
+        queries: {이름: (SQL, 파라미터[, 'one'|'all'])} 또는 {이름: 인자 없는 callable}
+    
+    Returns:
+        Dict[str, Any]: {이름: fetchall 결과 | fetchone 결과 | callable 반환값}
+    
+    Raises:
+        첫 번째로 실패한 쿼리의 예외 (나머지 쿼리는 완료까지 대기)
+    """
+    if len(queries) <= 1:
+        return {name: _run_query(spec) for name, spec in queries.items()}
+    
+    futures = {name: _submit(spec) for name, spec in queries.items()}
+    
+    results = {}
+    error = None
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.error(f"동시 쿼리 실패: {name}, {e}")
+            error = error or e
+    
+    if error:
+        raise error
+    return results
+
+
+async def fetch_async(query: str, params=None, fetch: str = 'all'):
+    """asyncio 코루틴에서 쿼리 1개 실행 (이벤트 루프를 막지 않음)"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.wrap_future(_submit((query, params, fetch)), loop=loop)
+
+
+async def gather_async(queries: Dict[str, QuerySpec]) -> Dict[str, Any]:
+    """asyncio 코루틴에서 독립 쿼리들을 동시에 실행 (fetch_concurrently의 비동기 버전)"""
+    loop = asyncio.get_running_loop()
+    names = list(queries)
+    results = await asyncio.gather(
+        *(asyncio.wrap_future(_submit(queries[name]), loop=loop) for name in names)
+    )
+    return dict(zip(names, results))
+
+
+async def run_async(func: Callable, *args, **kwargs):
+    """기존 동기 DB 메서드를 asyncio에서 호출 (예: await run_async(report_db.get_summary_data, file_id))"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_executor(), lambda: context.run(func, *args, **kwargs))
@@ -0,0 +1,280 @@
+"""
+채널별 추이 피벗 빌더
+(channel, category_name, date, count) 집계 행을 한 번만 순회하여
+{channel: {categories, dates, dates_full, data}} 행렬 구조로 변환 (파일/배치 조회 공용)
+
+차트 해상도
+- 기간에 따라 일/주/월 단위 버킷 자동 선택 (choose_resolution)
+- 버킷 수가 여전히 많으면 인접 버킷 합산 (limit_points)
+- 전체 합계 꺾은선은 LTTB로 추가 축소 가능 (attach_total_line)
+"""
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import date, timedelta
+import math
+from utils.logger import get_logger
+import random
+import time
+
+logger = get_logger(__name__)
+
+
+# 해상도별 표시용 날짜 형식 (dates_full은 항상 버킷 시작일 YYYY-MM-DD)
+RESOLUTION_LABEL_FORMATS = {
+    'day': '%m-%d',
+    'week': '%Y-%m-%d',
+    'month': '%Y-%m',
+}
+
+# 추이 API에서 받는 해상도 값
+CHART_RESOLUTIONS = ('auto',) + tuple(RESOLUTION_LABEL_FORMATS)
+
+# 해상도별 버킷 길이 (일, 자동 선택 기준)
+_RESOLUTION_DAYS = [('day', 1), ('week', 7), ('month', 31)]
+
+
+def build_channel_trends(rows: Iterable[Dict[str, Any]], label_format: str = '%m-%d') -> Dict[str, Dict[str, Any]]:
+    """
+    채널별 추이 행렬 생성 (입력 행 수에 선형)
+    
+    Args:
+        rows: channel, category_name, date, count 키를 가진 집계 행 (날짜 오름차순)
+        label_format: 표시용 날짜 형식 (기본값 MM-DD)
+    
+    Returns:
+        {channel: {'categories': [...], 'dates': ['MM-DD', ...], 'dates_full': ['YYYY-MM-DD', ...],
+                   'data': [[날짜별 카테고리 건수, ...], ...]}}
+    
+    Note:
+        - 카테고리/날짜 순서는 처음 등장한 순서 (날짜는 입력 정렬 순서)
+        - 날짜는 전체 날짜 기준으로 구분 (여러 해에 걸친 같은 MM-DD도 별도 행)
+        - 같은 (채널, 날짜, 카테고리)가 여러 번 나오면 합산 (NULL/빈 채널 → '미분류')
+    """
+    # 채널별 (카테고리 인덱스, 날짜 인덱스, {(날짜 idx, 카테고리 idx): 건수})
+    pivots = {}
+    for row in rows:
+        channel = row['channel'] or '미분류'
+        category = row['category_name'] or '미분류'
+        
+        pivot = pivots.get(channel)
+        if pivot is None:
+            pivot = pivots[channel] = ({}, {}, {})
+        category_index, date_index, cells = pivot
+        
+        cat_idx = category_index.setdefault(category, len(category_index))
+        date_idx = date_index.setdefault(row['date'], len(date_index))
+        cells[(date_idx, cat_idx)] = cells.get((date_idx, cat_idx), 0) + int(row['count'])
+    
+    channel_trends = {}
+    for channel, (category_index, date_index, cells) in pivots.items():
+        data = [[0] * len(category_index) for _ in range(len(date_index))]
+        for (date_idx, cat_idx), count in cells.items():
+            data[date_idx][cat_idx] = count
+        
+        channel_trends[channel] = {
+            'categories': list(category_index),
+            'dates': [day.strftime(label_format) if day else '' for day in date_index],  # 표시용 (기본 MM-DD)
+            'dates_full': [day.strftime('%Y-%m-%d') if day else '' for day in date_index],  # DB 저장용 (YYYY-MM-DD)
+            'data': data
+        }
+    
+    return channel_trends
+
+
+def choose_resolution(first_date: Optional[date], last_date: Optional[date], max_points: int) -> str:
+    """
+    기간에 맞는 버킷 단위 선택 (버킷 수가 max_points 이하인 가장 세밀한 단위)
+    
+    Returns:
+        'day' | 'week' | 'month' (월 단위로도 넘치면 'month' - limit_points로 추가 축소)
+    """
+    if not first_date or not last_date or max_points <= 0:
+        return 'day'
+    
+    span_days = (last_date - first_date).days + 1
+    for resolution, bucket_days in _RESOLUTION_DAYS:
+        if math.ceil(span_days / bucket_days) <= max_points:
+            return resolution
+    return 'month'
+
+
+def limit_points(trend: Dict[str, Any], max_points: int) -> Dict[str, Any]:
+    """
+    버킷 수가 max_points를 넘으면 인접 버킷을 합산하여 max_points 이하로 축소
+    
+    Note:
+        - 합산된 버킷의 날짜는 첫 버킷의 날짜 사용
+        - 카테고리별 건수 합계는 유지
+    """
+    dates = trend.get('dates', [])
+    if max_points <= 0 or len(dates) <= max_points:
+        return trend
+    
+    group = math.ceil(len(dates) / max_points)
+    data = trend.get('data', [])
+    dates_full = trend.get('dates_full', [])
+    
+    merged = dict(trend)
+    merged['dates'] = dates[::group]
+    if dates_full:
+        merged['dates_full'] = dates_full[::group]
+    merged['data'] = [
+        [sum(column) for column in zip(*data[start:start + group])]
+        for start in range(0, len(data), group)
+    ]
+    return merged
+
+
+def lttb(values: List[float], threshold: int, positions: Optional[List[float]] = None) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+    
+    Args:
+        values: 시계열 값
+        threshold: 남길 점 수 (3 미만이거나 값 개수 이상이면 전체 사용)
+        positions: 각 값의 x 좌표 (오름차순, 기본값: 인덱스 - 같은 간격으로 간주)
+    
+    Returns:
+        List[int]: 남길 점의 인덱스 (오름차순, 첫 점/마지막 점 포함)
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    
+    xs = positions if positions is not None else range(n)
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    
+    for i in range(threshold - 2):
+        # 다음 버킷의 평균점 (삼각형의 세 번째 꼭짓점)
+        next_start = int(math.floor((i + 1) * bucket_size)) + 1
+        next_end = min(int(math.floor((i + 2) * bucket_size)) + 1, n)
+        count = max(next_end - next_start, 1)
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(values[next_start:next_end]) / count
+        
+        # 현재 버킷에서 삼각형 넓이가 가장 큰 점 선택
+        start = int(math.floor(i * bucket_size)) + 1
+        end = int(math.floor((i + 1) * bucket_size)) + 1
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((xs[a] - avg_x) * (values[j] - values[a]) - (xs[a] - xs[j]) * (avg_y - values[a]))
+            if area > best_area:
+                best, best_area = j, area
+        
+        selected.append(best)
+        a = best
+    
+    selected.append(n - 1)
+    return selected
+
+
+def _bucket_positions(dates_full: List[str]) -> Optional[List[int]]:
+    """
+    버킷 시작일(YYYY-MM-DD)을 첫 버킷 기준 경과 일수로 변환 (LTTB x 좌표)
+    
+    Note:
+        - 추이 행렬은 건수가 있는 버킷만 담으므로 인덱스 간격 ≠ 실제 기간
+        - 날짜 없는 버킷(접수일 NULL)은 직전 버킷과 같은 위치, 변환할 수 없으면 None (인덱스 사용)
+    """
+    positions = []
+    origin = None
+    for value in dates_full:
+        try:
+            day = date.fromisoformat(value)
+        except (TypeError, ValueError):
+            if value:
+                return None
+            positions.append(positions[-1] if positions else 0)
+            continue
+        if origin is None:
+            origin = day
+        positions.append((day - origin).days)
+    return positions
+
+
+def attach_total_line(trend: Dict[str, Any], line_points: int) -> Dict[str, Any]:
+    """
+    전체 합계 꺾은선 시리즈를 LTTB로 축소하여 'total_line'으로 추가
+    
+    Note:
+        건수 없는 날짜가 빠진 희소 행렬이므로 버킷 시작일(dates_full)의 실제 간격을 x 좌표로 사용
+    
+    Returns:
+        trend + {'total_line': {'dates': [...], 'values': [...]}}
+    """
+    totals = [sum(row) for row in trend.get('data', [])]
+    dates_full = trend.get('dates_full')
+    positions = _bucket_positions(dates_full) if dates_full and len(dates_full) == len(totals) else None
+    indexes = lttb(totals, line_points, positions)
+    
+    result = dict(trend)
+    result['total_line'] = {
+        'dates': [trend['dates'][i] for i in indexes],
+        'values': [totals[i] for i in indexes]
+    }
+    return result
+
+
+def downsample_channel_trends(channel_trends: Dict[str, Dict[str, Any]], resolution: str,
+                              max_points: int = 0, line_points: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    채널별 추이 응답 크기 제한 (버킷 수 상한 + 선택적 LTTB 합계선) 및 사용한 해상도 표시
+    
+    Args:
+        channel_trends: build_channel_trends 결과
+        resolution: SQL에서 사용한 버킷 단위 ('day' | 'week' | 'month')
+        max_points: 채널당 최대 버킷 수 (0 = 제한 없음)
+        line_points: 전체 합계선 점 수 (0 = 합계선 축소 안 함)
+    """
+    result = {}
+    for channel, trend in channel_trends.items():
+        trend = limit_points(trend, max_points)
+        if line_points:
+            trend = attach_total_line(trend, line_points)
+        trend['resolution'] = resolution
+        result[channel] = trend
+    return result
+
+
+def run_pivot_benchmark(years: int = 3, channels: int = 6, categories: int = 8, repeat: int = 3) -> Dict[str, Any]:
+    """
+    여러 해 / 여러 채널 합성 집계 행으로 피벗 빌더 처리 시간 측정
+    
+    Args:
+        years: 일별 데이터 기간 (년)
+        channels: 채널 수
+        categories: 카테고리 수
+        repeat: 반복 횟수 (최소 시간 사용)
+    
+    Returns:
+        {'rows', 'channels', 'dates', 'categories', 'seconds', 'rows_per_sec'}
+    """
+    rng = random.Random(42)
+    start = date(2020, 1, 1)
+    rows: List[Dict[str, Any]] = []
+    for offset in range(years * 365):
+        day = start + timedelta(days=offset)
+        for ch in range(channels):
+            for cat in range(categories):
+                if rng.random() < 0.7:
+                    rows.append({'channel': f'채널{ch}', 'category_name': f'카테고리{cat}',
+                                 'date': day, 'count': rng.randint(1, 50)})
+    
+    elapsed = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        trends = build_channel_trends(rows)
+        duration = time.perf_counter() - started
+        elapsed = duration if elapsed is None else min(elapsed, duration)
+    
+    report = {
+        'rows': len(rows),
+        'channels': len(trends),
+        'dates': max((len(trend['dates']) for trend in trends.values()), default=0),
+        'categories': categories,
+        'seconds': round(elapsed, 4),
+        'rows_per_sec': round(len(rows) / elapsed, 1) if elapsed else None
+    }
+    logger.info(f"채널별 추이 피벗 벤치마크: {report}")
+    return report
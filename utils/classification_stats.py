@@ -0,0 +1,203 @@
+"""
+분류 결과 단일 패스 집계기
+(ticket, classification) 쌍을 한 번씩만 받아 카테고리/채널/신뢰도/기간 통계를 함께 계산
+샤드별 부분 집계를 merge로 합칠 수 있음 (병렬/증분 분류)
+"""
+from typing import Any, Dict, List, Optional
+from collections import Counter, defaultdict
+from datetime import datetime
+import pandas as pd
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """접수일 값을 datetime으로 변환 (업로드 직후 분류는 문자열, 변환 불가 시 None)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        parsed = pd.to_datetime(value, errors='coerce')
+        return None if pd.isna(parsed) else parsed.to_pydatetime()
+
+
+class ClassificationAggregator:
+    """분류 통계 스트리밍 집계기
+    
+    Note:
+        - add()로 1건씩 누적, merge()로 다른 집계기 결과를 합산
+        - 카테고리/채널 순서는 처음 등장한 순서 (기존 다중 패스 계산과 동일한 출력)
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.category_counts: Dict[Any, int] = defaultdict(int)
+        self.category_keywords: Dict[Any, set] = defaultdict(set)
+        self.channel_category_counts: Dict[str, Dict[Any, int]] = defaultdict(lambda: defaultdict(int))
+        
+        self.confidence_sum = 0.0
+        self.high_confidence = 0    # 0.8 이상
+        self.medium_confidence = 0  # 0.7 ~ 0.8
+        self.low_confidence = 0     # 0.7 미만
+        
+        self.stage_counts: Counter = Counter()
+        self.cluster_sizes: Counter = Counter()
+        self.cluster_categories: Dict[Any, str] = {}
+        
+        self.period_from: Optional[datetime] = None
+        self.period_to: Optional[datetime] = None
+    
+    def add(self, ticket: Dict[str, Any], classification: Dict[str, Any]):
+        """티켓 1건과 분류 결과 누적"""
+        cat_id = classification['category_id']
+        confidence = classification['confidence']
+        
+        self.total += 1
+        self.category_counts[cat_id] += 1
+        self.category_keywords[cat_id].update(classification.get('keywords', []))
+        self.channel_category_counts[ticket.get('channel') or '알 수 없음'][cat_id] += 1
+        
+        self.confidence_sum += confidence
+        if confidence >= 0.8:
+            self.high_confidence += 1
+        elif confidence >= 0.7:
+            self.medium_confidence += 1
+        else:
+            self.low_confidence += 1
+        
+        if 'stage' in classification:
+            self.stage_counts[classification['stage']] += 1
+        if 'cluster_id' in classification:
+            self.cluster_sizes[classification['cluster_id']] += 1
+            self.cluster_categories.setdefault(classification['cluster_id'], classification.get('category_name'))
+        
+        received_at = _to_datetime(ticket.get('received_at')) if ticket.get('received_at') else None
+        if received_at is not None:
+            if self.period_from is None or received_at < self.period_from:
+                self.period_from = received_at
+            if self.period_to is None or received_at > self.period_to:
+                self.period_to = received_at
+    
+    def add_all(self, tickets: List[Dict[str, Any]], classifications: List[Dict[str, Any]]):
+        """티켓/분류 결과 리스트를 순서대로 누적"""
+        for ticket, classification in zip(tickets, classifications):
+            self.add(ticket, classification)
+        return self
+    
+    def merge(self, other: 'ClassificationAggregator') -> 'ClassificationAggregator':
+        """다른 샤드의 부분 집계 합산 (self를 갱신하고 반환)"""
+        self.total += other.total
+        
+        for cat_id, count in other.category_counts.items():
+            self.category_counts[cat_id] += count
+        for cat_id, keywords in other.category_keywords.items():
+            self.category_keywords[cat_id] |= keywords
+        for channel, counts in other.channel_category_counts.items():
+            for cat_id, count in counts.items():
+                self.channel_category_counts[channel][cat_id] += count
+        
+        self.confidence_sum += other.confidence_sum
+        self.high_confidence += other.high_confidence
+        self.medium_confidence += other.medium_confidence
+        self.low_confidence += other.low_confidence
+        
+        self.stage_counts.update(other.stage_counts)
+        self.cluster_sizes.update(other.cluster_sizes)
+        for cluster_id, category_name in other.cluster_categories.items():
+            self.cluster_categories.setdefault(cluster_id, category_name)
+        
+        for value in (other.period_from, other.period_to):
+            if value is None:
+                continue
+            if self.period_from is None or value < self.period_from:
+                self.period_from = value
+            if self.period_to is None or value > self.period_to:
+                self.period_to = value
+        
+        return self
+    
+    __iadd__ = merge
+    
+    # ========================================
+    # 결과
+    # ========================================
+    
+    def period(self) -> tuple:
+        """(period_from, period_to) 날짜"""
+        return (
+            self.period_from.date() if self.period_from else None,
+            self.period_to.date() if self.period_to else None
+        )
+    
+    def category_stats(self, category_mapping: Dict[int, str]) -> List[Dict[str, Any]]:
+        """카테고리별 집계 (count 내림차순)"""
+        results = []
+        for cat_id, count in self.category_counts.items():
+            results.append({
+                'category_id': cat_id,
+                'category_name': category_mapping.get(cat_id, '알 수 없음'),
+                'count': count,
+                'ratio': round(count / self.total, 6) if self.total > 0 else 0,
+                'keywords': list(self.category_keywords[cat_id])[:10]  # 상위 10개
+            })
+        
+        results.sort(key=lambda x: x['count'], reverse=True)
+        return results
+    
+    def channel_stats(self) -> List[Dict[str, Any]]:
+        """채널별 카테고리 분포"""
+        results = []
+        for channel, category_counts in self.channel_category_counts.items():
+            channel_total = sum(category_counts.values())
+            for cat_id, count in category_counts.items():
+                results.append({
+                    'channel': channel,
+                    'category_id': cat_id,
+                    'count': count,
+                    'ratio': round(count / channel_total, 6) if channel_total > 0 else 0
+                })
+        return results
+    
+    def reliability_stats(self) -> Dict[str, Any]:
+        """신뢰도 통계 (규칙 기반에 맞는 실제 지표)"""
+        total = self.total
+        if total == 0:
+            return {
+                'total_tickets': 0,
+                'average_confidence': 0.0,
+                'high_confidence_count': 0,
+                'medium_confidence_count': 0,
+                'low_confidence_count': 0,
+                'needs_review_count': 0
+            }
+        
+        return {
+            'total_tickets': total,
+            'average_confidence': round(self.confidence_sum / total, 3),
+            'high_confidence_count': self.high_confidence,
+            'high_confidence_ratio': round(self.high_confidence / total, 3),
+            'medium_confidence_count': self.medium_confidence,
+            'medium_confidence_ratio': round(self.medium_confidence / total, 3),
+            'low_confidence_count': self.low_confidence,
+            'low_confidence_ratio': round(self.low_confidence / total, 3),
+            'needs_review_count': self.low_confidence,  # 재검토 필요 (신뢰도 낮은 것)
+            'stage_counts': dict(self.stage_counts),  # 단계형 분류: 결정 단계별 건수
+            'duplicate_clusters': self.cluster_stats()
+        }
+    
+    def cluster_stats(self) -> Dict[str, Any]:
+        """근사 중복 클러스터 통계 (클러스터링된 티켓 기준, 없으면 빈 dict)"""
+        clustered = sum(self.cluster_sizes.values())
+        if not clustered:
+            return {}
+        
+        duplicates = clustered - len(self.cluster_sizes)
+        return {
+            'clustered_tickets': clustered,
+            'clusters': len(self.cluster_sizes),
+            'duplicate_tickets': duplicates,
+            'redundancy_ratio': round(duplicates / clustered, 3),
+            'top_clusters': [
+                {'cluster_id': cluster_id, 'size': size, 'category_name': self.cluster_categories[cluster_id]}
+                for cluster_id, size in self.cluster_sizes.most_common(5) if size > 1
+            ]
+        }
@@ -3,7 +3,13 @@
 """
 from .base_classifier import BaseClassifier
 from .rule_based_classifier import RuleBasedClassifier
+from .rule_set import CompiledRuleSet, compile_rule_set, get_active_rule_set, set_active_rule_set
 from .ai_classifier import AIClassifier
+from .onnx_classifier import ONNXClassifier
+from .embedding_classifier import EmbeddingClassifier
+from .cascade_classifier import CascadeClassifier
+from .near_duplicate import DedupClassifier, MinHashLSH
+from .model_registry import ModelRegistry, model_registry
 
-__all__ = ['BaseClassifier', 'RuleBasedClassifier', 'AIClassifier']
+__all__ = ['BaseClassifier', 'RuleBasedClassifier', 'CompiledRuleSet', 'compile_rule_set', 'get_active_rule_set', 'set_active_rule_set', 'AIClassifier', 'ONNXClassifier', 'EmbeddingClassifier', 'CascadeClassifier', 'DedupClassifier', 'MinHashLSH', 'ModelRegistry', 'model_registry']
 
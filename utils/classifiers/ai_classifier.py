@@ -4,6 +4,7 @@ AI 기반 분류 엔진 (Hugging Face Transformers)
 """
 from typing import Dict, List, Any, Optional
 from .base_classifier import BaseClassifier
+from .model_registry import model_registry
 from utils.logger import get_logger
 import re
 
@@ -13,6 +14,9 @@ logger = get_logger(__name__)
 class AIClassifier(BaseClassifier):
     """Hugging Face Transformers 기반 AI 분류 엔진"""
     
+    hypothesis_template = "This text is about {}."  # 영어 템플릿 (모델에 맞춤)
+    method_name = 'ai_huggingface'
+    
     def __init__(self, model_name: str = 'facebook/bart-large-mnli', category_mapping: Dict[int, str] = None):
         """
         Args:
@@ -30,6 +34,7 @@ class AIClassifier(BaseClassifier):
         self.model = None
         self.tokenizer = None
         self.pipeline = None
+        self._entry = None
         
         # 카테고리 레이블 (학습된 순서대로)
         self.category_labels = list(self.reverse_mapping.keys())
@@ -37,26 +42,15 @@ class AIClassifier(BaseClassifier):
         logger.info(f"AIClassifier 초기화: model={model_name}")
     
     def _load_model(self):
-        """모델 로딩 (최초 1회만)"""
+        """모델 조회 (프로세스 전역 레지스트리에서 공유, 최초 1회만 로딩)"""
         if self.pipeline is not None:
             return
         
         try:
-            from transformers import pipeline, AutoModelForSequenceClassification, AutoTokenizer
-            import torch
-            
-            logger.info(f"Hugging Face 모델 로딩 중: {self.model_name}")
-            
             # Zero-shot classification 사용 (레이블 학습 불필요)
             # CPU 메모리 부족 방지를 위해 device=-1 (CPU 전용) 사용
-            self.pipeline = pipeline(
-                "zero-shot-classification",
-                model=self.model_name,
-                device=-1  # CPU 전용 (메모리 효율)
-            )
-            
-            logger.info(f"모델 로딩 완료: {self.model_name}")
-            logger.info(f"디바이스: CPU (메모리 효율 모드)")
+            self._entry = model_registry.get_pipeline("zero-shot-classification", self.model_name)
+            self.pipeline = self._entry.model
             
         except ImportError:
             logger.error("transformers 라이브러리가 설치되지 않았습니다.")
@@ -93,15 +87,11 @@ class AIClassifier(BaseClassifier):
         
         try:
             # Zero-shot classification 실행
-            result = self.pipeline(
-                text,
-                candidate_labels=self.category_labels,
-                hypothesis_template="This text is about {}."  # 영어 템플릿 (모델에 맞춤)
-            )
+            labels, scores = self._predict(text)
             
             # 결과 파싱
-            best_label = result['labels'][0]
-            best_score = result['scores'][0]
+            best_label = labels[0]
+            best_score = scores[0]
             
             category_id = self.reverse_mapping.get(best_label)
             
@@ -115,7 +105,7 @@ class AIClassifier(BaseClassifier):
                 'category_name': best_label,
                 'confidence': float(best_score),
                 'keywords': keywords,
-                'method': 'ai_huggingface',
+                'method': self.method_name,
                 'model_name': self.model_name
             }
             
@@ -123,6 +113,22 @@ class AIClassifier(BaseClassifier):
             logger.error(f"AI 분류 실패: {e}")
             return self._fallback_classification()
     
+    def _predict(self, text: str) -> tuple:
+        """
+        Zero-shot 추론 (백엔드별로 오버라이드)
+        
+        Returns:
+            (labels, scores) - 점수 내림차순
+        """
+        # 공유 모델이므로 추론은 직렬화
+        with self._entry.infer_lock:
+            result = self.pipeline(
+                text,
+                candidate_labels=self.category_labels,
+                hypothesis_template=self.hypothesis_template
+            )
+        return result['labels'], result['scores']
+    
     def _extract_keywords(self, text: str, category: str) -> List[str]:
         """
         본문에서 실제로 발견된 키워드 추출
@@ -0,0 +1,95 @@
+"""
+신뢰도 기반 단계형(cascade) 분류 엔진
+규칙 기반 엔진으로 전체를 먼저 분류하고, 신뢰도가 낮은 티켓만 AI 엔진으로 재분류
+"""
+from typing import Dict, List, Any
+from .base_classifier import BaseClassifier
+from utils.logger import get_logger
+from config import Config
+
+logger = get_logger(__name__)
+
+
+class CascadeClassifier(BaseClassifier):
+    """규칙 기반 → AI 단계형 분류 엔진
+    
+    Note:
+        - AI 연산량은 전체 티켓 수가 아니라 신뢰도 임계값 미만 티켓 수에 비례
+        - 각 결과의 'stage'에 최종 결정 단계('rule' | 'ai') 기록
+        - AI 단계가 실패(ai_fallback)하면 규칙 기반 결과 유지
+    """
+    
+    def __init__(self, rule_classifier: BaseClassifier, ai_classifier: BaseClassifier,
+                 threshold: float = None, ai_batch_size: int = None):
+        """
+        Args:
+            rule_classifier: 1단계 엔진 (RuleBasedClassifier)
+            ai_classifier: 2단계 엔진 (AIClassifier / ONNXClassifier / EmbeddingClassifier)
+            threshold: 이 값 미만인 1단계 결과만 2단계로 전달 (기본값 Config.CASCADE_CONFIDENCE_THRESHOLD)
+            ai_batch_size: 2단계 배치 크기 (기본값 Config.CASCADE_AI_BATCH_SIZE)
+        """
+        self.rule_classifier = rule_classifier
+        self.ai_classifier = ai_classifier
+        self.threshold = Config.CASCADE_CONFIDENCE_THRESHOLD if threshold is None else threshold
+        self.ai_batch_size = ai_batch_size or Config.CASCADE_AI_BATCH_SIZE
+        self.last_stats = {'rule': 0, 'ai': 0, 'ai_failed': 0}
+        
+        logger.info(f"CascadeClassifier 초기화: threshold={self.threshold}, "
+                    f"ai={self.ai_classifier.get_engine_name()}")
+    
+    def classify_ticket(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
+        """티켓 1건 분류"""
+        return self.classify_batch([ticket])[0]
+    
+    def classify_batch(self, tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        단계형 일괄 분류
+        
+        Args:
+            tickets: 티켓 리스트
+        
+        Returns:
+            분류 결과 리스트 (입력 순서 유지, 'stage' 포함)
+        """
+        # 1단계: 규칙 기반 (전체)
+        results = self.rule_classifier.classify_batch(tickets)
+        for result in results:
+            result['stage'] = 'rule'
+        
+        # 2단계: 신뢰도 미달 티켓만 AI로 재분류
+        pending = [i for i, result in enumerate(results) if result['confidence'] < self.threshold]
+        stats = {'rule': len(results) - len(pending), 'ai': 0, 'ai_failed': 0}
+        
+        if pending:
+            logger.info(f"AI 재분류 대상: {len(pending)}/{len(results)}건 (신뢰도 < {self.threshold})")
+        
+        for start in range(0, len(pending), self.ai_batch_size):
+            chunk = pending[start:start + self.ai_batch_size]
+            try:
+                ai_results = self.ai_classifier.classify_batch([tickets[i] for i in chunk])
+            except Exception as e:
+                logger.error(f"AI 단계 분류 실패 (규칙 기반 결과 유지): {e}")
+                ai_results = [None] * len(chunk)
+            
+            for i, ai_result in zip(chunk, ai_results):
+                if not ai_result or ai_result.get('method') == 'ai_fallback':
+                    stats['ai_failed'] += 1
+                    stats['rule'] += 1
+                    continue
+                ai_result['stage'] = 'ai'
+                results[i] = ai_result
+                stats['ai'] += 1
+        
+        self.last_stats = stats
+        logger.info(f"단계형 분류 완료: 규칙 {stats['rule']}건, AI {stats['ai']}건 (AI 실패 {stats['ai_failed']}건)")
+        return results
+    
+    def get_engine_name(self) -> str:
+        """엔진 이름 반환"""
+        return f'cascade_{self.rule_classifier.get_engine_name()}+{self.ai_classifier.get_engine_name()}'
+    
+    def set_category_mapping(self, category_mapping: Dict[int, str]):
+        """카테고리 매핑 업데이트 (두 단계 모두)"""
+        for classifier in (self.rule_classifier, self.ai_classifier):
+            if hasattr(classifier, 'set_category_mapping'):
+                classifier.set_category_mapping(category_mapping)
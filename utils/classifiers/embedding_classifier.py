@@ -0,0 +1,254 @@
+"""
+임베딩 기반 AI 분류 엔진 (nearest-centroid)
+티켓을 한 번만 임베딩하고, 미리 계산한 카테고리 프로토타입 임베딩과 행렬곱 1회로 분류
+"""
+from typing import Dict, List, Any, Optional
+from .base_classifier import BaseClassifier
+from .rule_based_classifier import RuleBasedClassifier
+from .model_registry import model_registry
+from utils.logger import get_logger
+from config import Config
+import numpy as np
+import hashlib
+import json
+import threading
+
+logger = get_logger(__name__)
+
+# 카테고리 프로토타입 임베딩 캐시: {(model_name, mapping_version): (labels, centroids)}
+_centroid_cache: Dict[tuple, tuple] = {}
+_centroid_lock = threading.Lock()
+
+
+class SentenceEncoder:
+    """transformers 인코더 + mean pooling 문장 임베딩 (L2 정규화)"""
+    
+    def __init__(self, model_name: str):
+        from transformers import AutoModel, AutoTokenizer
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModel.from_pretrained(model_name)
+        self.model.eval()
+    
+    def encode(self, texts: List[str], batch_size: int = None, max_length: int = 256) -> np.ndarray:
+        """문장 목록을 (len(texts), dim) 정규화 임베딩으로 변환"""
+        import torch
+        
+        batch_size = batch_size or Config.EMBEDDING_BATCH_SIZE
+        chunks = []
+        
+        with torch.no_grad():
+            for start in range(0, len(texts), batch_size):
+                encoded = self.tokenizer(
+                    texts[start:start + batch_size],
+                    padding=True,
+                    truncation=True,
+                    max_length=max_length,
+                    return_tensors='pt'
+                )
+                hidden = self.model(**encoded).last_hidden_state
+                
+                # 패딩 토큰을 제외한 평균
+                mask = encoded['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+                pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                chunks.append(torch.nn.functional.normalize(pooled, dim=-1).cpu().numpy())
+        
+        if not chunks:
+            return np.zeros((0, self.model.config.hidden_size), dtype=np.float32)
+        return np.vstack(chunks).astype(np.float32)
+
+
+class EmbeddingClassifier(BaseClassifier):
+    """문장 임베딩 nearest-centroid 분류 엔진
+    
+    Note:
+        - 카테고리별 프로토타입 = 카테고리명 + 키워드 패턴(+ 과거 고신뢰 분류 티켓) 임베딩의 평균
+        - 프로토타입 임베딩은 (모델, 카테고리 매핑 버전) 단위로 프로세스 내 캐시
+        - 티켓당 비용은 임베딩 1회 + 행렬곱 1회 (카테고리 수에 거의 무관)
+    """
+    
+    method_name = 'ai_embedding'
+    
+    def __init__(self, model_name: str = None, category_mapping: Dict[int, str] = None,
+                 examples: Dict[str, List[str]] = None):
+        """
+        Args:
+            model_name: 문장 임베딩 모델 (기본값 Config.EMBEDDING_MODEL_NAME)
+            category_mapping: {category_id: category_name} 딕셔너리
+            examples: {category_name: [예시 문장, ...]} 과거 분류 이력 프로토타입 (선택)
+        """
+        self.model_name = model_name or Config.EMBEDDING_MODEL_NAME
+        self.category_mapping = category_mapping or {}
+        self.reverse_mapping = {v: k for k, v in self.category_mapping.items()}
+        self.examples = examples or {}
+        
+        # 키워드 패턴은 규칙 기반 엔진과 공유
+        self.keyword_patterns = RuleBasedClassifier(self.category_mapping).keyword_patterns
+        
+        self.encoder: Optional[SentenceEncoder] = None
+        self._entry = None
+        
+        logger.info(f"EmbeddingClassifier 초기화: model={self.model_name}")
+    
+    def _load_model(self):
+        """인코더 조회 (프로세스 전역 레지스트리에서 공유)"""
+        if self.encoder is not None:
+            return
+        
+        try:
+            self._entry = model_registry.get(
+                f"feature-extraction:{self.model_name}",
+                lambda: SentenceEncoder(self.model_name)
+            )
+            self.encoder = self._entry.model
+        
+        except ImportError:
+            logger.error("transformers 라이브러리가 설치되지 않았습니다.")
+            logger.error("pip install transformers torch 를 실행하세요.")
+            raise
+        except Exception as e:
+            logger.error(f"임베딩 모델 로딩 실패: {e}")
+            raise
+    
+    def _prototype_texts(self) -> Dict[str, List[str]]:
+        """카테고리별 프로토타입 문장"""
+        prototypes = {}
+        for category_name in self.reverse_mapping:
+            texts = [category_name]
+            texts.extend(f"{category_name} {keyword}" for keyword in self.keyword_patterns.get(category_name, []))
+            texts.extend(self.examples.get(category_name, []))
+            prototypes[category_name] = texts
+        return prototypes
+    
+    def mapping_version(self) -> str:
+        """카테고리 매핑 + 프로토타입 내용 해시 (캐시 키)"""
+        payload = json.dumps(
+            [sorted(self.category_mapping.items()), self._prototype_texts()],
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+    
+    def _centroids(self) -> tuple:
+        """(labels, centroids) 조회 (매핑 버전이 같으면 캐시 재사용)"""
+        key = (self.model_name, self.mapping_version())
+        cached = _centroid_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        with _centroid_lock:
+            cached = _centroid_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            prototypes = self._prototype_texts()
+            labels = list(prototypes)
+            texts = [text for label in labels for text in prototypes[label]]
+            owners = np.repeat(np.arange(len(labels)), [len(prototypes[label]) for label in labels])
+            
+            with self._entry.infer_lock:
+                embeddings = self.encoder.encode(texts)
+            
+            # 카테고리별 평균 후 재정규화
+            centroids = np.zeros((len(labels), embeddings.shape[1]), dtype=np.float32)
+            np.add.at(centroids, owners, embeddings)
+            centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-9)
+            
+            # 이전 매핑 버전 캐시 정리
+            for stale in [k for k in _centroid_cache if k[0] == self.model_name]:
+                del _centroid_cache[stale]
+            _centroid_cache[key] = (labels, centroids)
+            
+            logger.info(f"카테고리 프로토타입 임베딩 생성: {len(labels)}개 카테고리, "
+                        f"{len(texts)}개 문장 (version={key[1]})")
+            return labels, centroids
+    
+    def classify_ticket(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
+        """티켓 1건 분류"""
+        return self.classify_batch([ticket])[0]
+    
+    def classify_batch(self, tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        티켓 일괄 분류 (배치 임베딩 후 프로토타입과 행렬곱 1회)
+        
+        Args:
+            tickets: 티켓 리스트
+        
+        Returns:
+            분류 결과 리스트 (입력 순서 유지)
+        """
+        if not tickets:
+            return []
+        
+        self._load_model()
+        
+        texts = [f"{ticket.get('title') or ''} {ticket.get('body') or ''}".strip()[:500] for ticket in tickets]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tickets)
+        
+        valid = [i for i, text in enumerate(texts) if text]
+        for i in range(len(tickets)):
+            if not texts[i]:
+                logger.warning(f"티켓 {tickets[i].get('ticket_id')}의 본문이 비어있습니다.")
+                results[i] = self._fallback_classification()
+        
+        if not valid:
+            return results
+        
+        try:
+            labels, centroids = self._centroids()
+            
+            with self._entry.infer_lock:
+                embeddings = self.encoder.encode([texts[i] for i in valid])
+            
+            # 코사인 유사도 (모두 정규화되어 있으므로 내적) → 온도 softmax로 신뢰도 산출
+            similarities = embeddings @ centroids.T
+            logits = similarities / Config.EMBEDDING_TEMPERATURE
+            logits -= logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            best = probabilities.argmax(axis=1)
+            
+            for row, i in enumerate(valid):
+                label = labels[best[row]]
+                results[i] = {
+                    'category_id': self.reverse_mapping.get(label),
+                    'category_name': label,
+                    'confidence': float(probabilities[row, best[row]]),
+                    'keywords': self._extract_keywords(texts[i], label),
+                    'method': self.method_name,
+                    'model_name': self.model_name
+                }
+        
+        except Exception as e:
+            logger.error(f"임베딩 분류 실패: {e}")
+            for i in valid:
+                results[i] = self._fallback_classification()
+        
+        return results
+    
+    def _extract_keywords(self, text: str, category: str) -> List[str]:
+        """본문에서 실제로 발견된 카테고리 키워드 추출 (최대 5개)"""
+        keywords_found = [keyword for keyword in self.keyword_patterns.get(category, []) if keyword in text][:5]
+        return keywords_found if keywords_found else ['AI분류']
+    
+    def _fallback_classification(self) -> Dict[str, Any]:
+        """분류 실패 시 기본값"""
+        default_category = '기타'
+        category_id = self.reverse_mapping.get(default_category, 6)
+        
+        return {
+            'category_id': category_id,
+            'category_name': default_category,
+            'confidence': 0.3,
+            'keywords': [],
+            'method': 'ai_fallback'
+        }
+    
+    def get_engine_name(self) -> str:
+        """엔진 이름 반환"""
+        return f'ai_embedding_{self.model_name.strip("/").split("/")[-1]}'
+    
+    def set_category_mapping(self, category_mapping: Dict[int, str]):
+        """카테고리 매핑 업데이트 (프로토타입은 다음 분류 시 새 버전으로 계산)"""
+        self.category_mapping = category_mapping
+        self.reverse_mapping = {v: k for k, v in category_mapping.items()}
+        logger.info(f"카테고리 매핑 업데이트: {len(category_mapping)}개")
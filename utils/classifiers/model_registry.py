@@ -0,0 +1,203 @@
+"""
+분류 모델 레지스트리
+프로세스 단위로 모델(transformers pipeline 등)을 한 번만 로딩하여 요청 간 공유
+"""
+from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from utils.logger import get_logger
+from config import Config
+import os
+import threading
+import time
+
+logger = get_logger(__name__)
+
+
+def _current_rss_bytes() -> int:
+    """현재 프로세스 RSS (바이트, 측정 불가 시 0)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, AttributeError):
+        return 0
+
+
+def _model_size_bytes(obj: Any) -> int:
+    """torch 모델 파라미터/버퍼 크기 합계 (pipeline이면 내부 model 기준, 알 수 없으면 0)"""
+    model = getattr(obj, 'model', obj)
+    try:
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except Exception:
+        return 0
+
+
+class ModelEntry:
+    """레지스트리에 적재된 모델 1개"""
+    
+    def __init__(self, key: str):
+        self.key = key
+        self.model = None
+        self.load_lock = threading.Lock()   # 동일 모델 중복 로딩 방지
+        self.infer_lock = threading.Lock()  # 추론 직렬화 (pipeline은 스레드 안전하지 않음)
+        self.load_seconds = 0.0
+        self.memory_bytes = 0
+        self.hits = 0
+        self.loaded_at = None
+        self.last_used = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'key': self.key,
+            'loaded': self.model is not None,
+            'load_seconds': round(self.load_seconds, 2),
+            'memory_mb': round(self.memory_bytes / (1024 * 1024), 1),
+            'hits': self.hits,
+            'loaded_at': self.loaded_at.isoformat() if self.loaded_at else None,
+            'last_used': self.last_used.isoformat() if self.last_used else None
+        }
+
+
+class ModelRegistry:
+    """프로세스 전역 모델 레지스트리 (LRU + 메모리 예산 기반 제거)"""
+    
+    def __init__(self, memory_budget_mb: int = None):
+        self.memory_budget_bytes = (memory_budget_mb if memory_budget_mb is not None
+                                    else Config.MODEL_MEMORY_BUDGET_MB) * 1024 * 1024
+        self._entries: "OrderedDict[str, ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _entry(self, key: str) -> ModelEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = ModelEntry(key)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            return entry
+    
+    def get(self, key: str, loader: Callable[[], Any]) -> ModelEntry:
+        """모델 조회 (없으면 loader로 1회 로딩, 동시 호출자는 로딩 완료까지 대기)
+        
+        Args:
+            key: 모델 식별자 (예: 'zero-shot-classification:facebook/bart-large-mnli')
+            loader: 모델 객체를 반환하는 함수
+        
+        Returns:
+            ModelEntry: entry.model 사용, 추론은 entry.infer_lock 안에서 수행
+        """
+        entry = self._entry(key)
+        
+        if entry.model is None:
+            with entry.load_lock:
+                if entry.model is None:
+                    logger.info(f"모델 로딩 시작: {key}")
+                    rss_before = _current_rss_bytes()
+                    started = time.perf_counter()
+                    
+                    model = loader()
+                    
+                    entry.load_seconds = time.perf_counter() - started
+                    entry.memory_bytes = _model_size_bytes(model) or max(0, _current_rss_bytes() - rss_before)
+                    entry.loaded_at = datetime.now()
+                    entry.model = model
+                    
+                    logger.info(f"모델 로딩 완료: {key} ({entry.load_seconds:.1f}초, "
+                                f"{entry.memory_bytes / (1024 * 1024):.0f}MB)")
+                    self._evict(keep=key)
+        
+        entry.hits += 1
+        entry.last_used = datetime.now()
+        return entry
+    
+    def _evict(self, keep: str):
+        """메모리 예산 초과 시 가장 오래 사용하지 않은 모델부터 제거"""
+        if self.memory_budget_bytes <= 0:
+            return
+        
+        # 제거 대상은 레지스트리 잠금 안에서 선정/분리하고, 추론 대기는 잠금 밖에서 수행
+        # (다른 모델 조회/로딩이 진행 중인 추론 때문에 막히지 않도록)
+        victims = []
+        with self._lock:
+            total = sum(e.memory_bytes for e in self._entries.values() if e.model is not None)
+            for key in list(self._entries):
+                if total <= self.memory_budget_bytes:
+                    break
+                entry = self._entries[key]
+                if key == keep or entry.model is None:
+                    continue
+                total -= entry.memory_bytes
+                victims.append(self._entries.pop(key))
+        
+        for entry in victims:
+            # 진행 중인 추론이 끝날 때까지 대기 후 제거 (사용 중인 참조는 GC 시 해제)
+            with entry.infer_lock:
+                entry.model = None
+            logger.info(f"모델 제거 (메모리 예산 {self.memory_budget_bytes // (1024 * 1024)}MB 초과): {entry.key}")
+    
+    def evict(self, key: str) -> bool:
+        """특정 모델 제거"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        with entry.infer_lock:
+            entry.model = None
+        logger.info(f"모델 제거: {key}")
+        return True
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """적재된 모델의 로딩 시간/메모리/사용 횟수"""
+        with self._lock:
+            return [entry.to_dict() for entry in self._entries.values()]
+    
+    # ========================================
+    # transformers pipeline
+    # ========================================
+    
+    def get_pipeline(self, task: str, model_name: str) -> ModelEntry:
+        """transformers pipeline 조회 (CPU 전용)"""
+        def load():
+            from transformers import pipeline
+            return pipeline(task, model=model_name, device=-1)
+        
+        return self.get(f"{task}:{model_name}", load)
+    
+    def preload(self, model_names: List[str] = None, background: bool = True) -> Optional[threading.Thread]:
+        """설정된 zero-shot 모델 미리 로딩 (기본값 Config.PRELOAD_MODELS)
+        
+        Args:
+            model_names: 모델 이름 목록
+            background: True면 별도 스레드에서 로딩 (앱 시작을 막지 않음)
+        """
+        names = model_names if model_names is not None else [
+            name.strip() for name in Config.PRELOAD_MODELS.split(',') if name.strip()
+        ]
+        if not names:
+            return None
+        
+        def run():
+            for name in names:
+                try:
+                    self.get_pipeline('zero-shot-classification', name)
+                except Exception as e:
+                    logger.error(f"모델 사전 로딩 실패: {name}, {e}")
+        
+        if not background:
+            run()
+            return None
+        
+        thread = threading.Thread(target=run, name='model-preload', daemon=True)
+        thread.start()
+        logger.info(f"모델 사전 로딩 시작 (백그라운드): {names}")
+        return thread
+
+
+# 프로세스 전역 레지스트리
+model_registry = ModelRegistry()
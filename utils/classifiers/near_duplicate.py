@@ -0,0 +1,169 @@
+"""
+MinHash/LSH 기반 근사 중복 티켓 클러스터링
+템플릿/복사-붙여넣기 문의를 묶어서 클러스터당 대표 티켓 1건만 분류
+"""
+from typing import Dict, List, Any
+from .base_classifier import BaseClassifier
+from utils.logger import get_logger
+from config import Config
+import numpy as np
+import re
+import zlib
+
+logger = get_logger(__name__)
+
+# 해시 순열용 메르센 소수 (2^31 - 1)
+_PRIME = (1 << 31) - 1
+
+
+def normalize_text(text: str) -> str:
+    """숫자(주문번호/날짜 등)와 공백 차이를 무시하도록 정규화"""
+    text = re.sub(r'\d+', '0', (text or '').lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def shingle_hashes(text: str, size: int) -> np.ndarray:
+    """문자 단위 k-shingle의 32bit 해시 집합"""
+    if len(text) <= size:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64)
+
+
+class MinHashLSH:
+    """MinHash 서명 + 밴드 LSH로 근사 중복 묶기 (Union-Find)"""
+    
+    def __init__(self, threshold: float = None, num_perm: int = None, bands: int = None,
+                 shingle_size: int = None, seed: int = 42):
+        self.threshold = Config.DEDUP_THRESHOLD if threshold is None else threshold
+        self.num_perm = num_perm or Config.DEDUP_NUM_PERM
+        self.bands = bands or Config.DEDUP_BANDS
+        self.rows = self.num_perm // self.bands
+        self.shingle_size = shingle_size or Config.DEDUP_SHINGLE_SIZE
+        
+        # 고정 seed: 프로세스와 무관하게 같은 텍스트는 같은 서명
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, _PRIME, self.num_perm).astype(np.uint64)
+        self.b = rng.randint(0, _PRIME, self.num_perm).astype(np.uint64)
+    
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 서명 (num_perm,)"""
+        hashes = shingle_hashes(text, self.shingle_size) % np.uint64(_PRIME)
+        permuted = (self.a[:, None] * hashes[None, :] + self.b[:, None]) % np.uint64(_PRIME)
+        return permuted.min(axis=1)
+    
+    def cluster(self, texts: List[str]) -> List[int]:
+        """
+        근사 중복 클러스터링
+        
+        Args:
+            texts: 텍스트 리스트
+        
+        Returns:
+            각 텍스트의 대표 인덱스 (클러스터 내 첫 번째 텍스트, 빈 텍스트는 자기 자신)
+        """
+        parent = list(range(len(texts)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        normalized = [normalize_text(text) for text in texts]
+        indices = [i for i, text in enumerate(normalized) if text]
+        if not indices:
+            return parent
+        
+        signatures = np.vstack([self.signature(normalized[i]) for i in indices])
+        
+        for band in range(self.bands):
+            buckets: Dict[bytes, int] = {}
+            band_rows = signatures[:, band * self.rows:(band + 1) * self.rows]
+            
+            for row, i in enumerate(indices):
+                key = band_rows[row].tobytes()
+                first = buckets.setdefault(key, row)
+                if first == row:
+                    continue
+                
+                root_a, root_b = find(indices[first]), find(i)
+                if root_a == root_b:
+                    continue
+                
+                # 후보 쌍은 추정 Jaccard 유사도로 확인
+                similarity = float(np.mean(signatures[first] == signatures[row]))
+                if similarity >= self.threshold:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+        
+        return [find(i) for i in range(len(texts))]
+
+
+class DedupClassifier(BaseClassifier):
+    """근사 중복 클러스터 대표 티켓만 분류하고 결과를 클러스터 전체에 전파
+    
+    Note:
+        - 결과에 cluster_id(대표 티켓 ID)와 cluster_size 추가
+        - 내부 엔진 호출 수 = 클러스터 수 (중복 비율만큼 연산량 감소)
+    """
+    
+    def __init__(self, classifier: BaseClassifier, lsh: MinHashLSH = None):
+        """
+        Args:
+            classifier: 대표 티켓을 분류할 엔진 (주로 AI 엔진)
+            lsh: 클러스터링 설정 (기본값 Config.DEDUP_*)
+        """
+        self.classifier = classifier
+        self.lsh = lsh or MinHashLSH()
+        self.last_stats = {'tickets': 0, 'clusters': 0, 'duplicates': 0}
+    
+    def classify_ticket(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
+        """티켓 1건 분류 (클러스터링 없음)"""
+        return self.classify_batch([ticket])[0]
+    
+    def classify_batch(self, tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        클러스터링 후 대표 티켓만 분류
+        
+        Args:
+            tickets: 티켓 리스트
+        
+        Returns:
+            분류 결과 리스트 (입력 순서 유지, cluster_id/cluster_size 포함)
+        """
+        if not tickets:
+            return []
+        
+        texts = [f"{ticket.get('title') or ''} {ticket.get('body') or ''}" for ticket in tickets]
+        representatives = self.lsh.cluster(texts)
+        
+        rep_indices = sorted(set(representatives))
+        rep_results = dict(zip(rep_indices, self.classifier.classify_batch([tickets[i] for i in rep_indices])))
+        sizes = np.bincount(representatives, minlength=len(tickets))
+        
+        results = []
+        for i, rep in enumerate(representatives):
+            result = dict(rep_results[rep])
+            result['keywords'] = list(result.get('keywords', []))
+            result['cluster_id'] = tickets[rep].get('ticket_id', rep)
+            result['cluster_size'] = int(sizes[rep])
+            results.append(result)
+        
+        self.last_stats = {
+            'tickets': len(tickets),
+            'clusters': len(rep_indices),
+            'duplicates': len(tickets) - len(rep_indices)
+        }
+        logger.info(f"근사 중복 클러스터링: {len(tickets)}건 → {len(rep_indices)}개 클러스터 "
+                    f"(중복 {self.last_stats['duplicates']}건 분류 생략)")
+        return results
+    
+    def get_engine_name(self) -> str:
+        """엔진 이름 반환"""
+        return f'dedup_{self.classifier.get_engine_name()}'
+    
+    def set_category_mapping(self, category_mapping: Dict[int, str]):
+        """카테고리 매핑 업데이트"""
+        if hasattr(self.classifier, 'set_category_mapping'):
+            self.classifier.set_category_mapping(category_mapping)
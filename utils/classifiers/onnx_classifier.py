@@ -0,0 +1,329 @@
+"""
+ONNX Runtime 기반 AI 분류 엔진 (int8 동적 양자화)
+AIClassifier와 동일한 zero-shot NLI 방식을 PyTorch 대신 ONNX Runtime으로 실행
+"""
+from typing import Dict, List, Any
+from pathlib import Path
+from .ai_classifier import AIClassifier
+from .model_registry import model_registry
+from utils.logger import get_logger
+from config import Config
+import numpy as np
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+
+logger = get_logger(__name__)
+
+# 기본 평가 데이터셋 (더미 CS 데이터)
+DUMMY_DATASET = Path(__file__).resolve().parent.parent / 'dummydata' / '1_raw' / 'from_py' / 'cs_dummy_data_v3_500_prefix7uniq.csv'
+
+
+def export_quantized_model(model_name: str, output_dir: str = None) -> Path:
+    """
+    NLI 모델을 ONNX로 내보내고 int8 동적 양자화 (이미 있으면 재사용)
+    
+    Args:
+        model_name: Hugging Face 모델 이름 또는 로컬 체크포인트 경로
+        output_dir: 저장 위치 (기본값 Config.ONNX_MODEL_DIR)
+    
+    Returns:
+        양자화 모델/토크나이저/설정이 저장된 디렉터리
+    """
+    target = Path(output_dir or Config.ONNX_MODEL_DIR) / model_name.strip('/').replace('/', '__')
+    quantized_path = target / 'model.int8.onnx'
+    if quantized_path.exists():
+        return target
+    
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    import torch
+    
+    logger.info(f"ONNX 내보내기 시작: {model_name} → {target}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    
+    # 같은 위치의 임시 디렉터리에 모두 저장한 뒤 이름 변경 (중단되어도 불완전한 디렉터리가 남지 않음)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    try:
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+    
+        sample = tokenizer("premise", "hypothesis", return_tensors='pt')
+        input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+        dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+        dynamic_axes['logits'] = {0: 'batch'}
+    
+        fp32_path = staging / 'model.onnx'
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                str(fp32_path),
+                input_names=input_names,
+                output_names=['logits'],
+                dynamic_axes=dynamic_axes,
+                opset_version=17,
+                dynamo=False
+            )
+    
+        # 가중치 int8 동적 양자화 (활성값은 런타임에 양자화)
+        quantize_dynamic(str(fp32_path), str(staging / 'model.int8.onnx'), weight_type=QuantType.QInt8)
+        fp32_path.unlink()
+    
+        tokenizer.save_pretrained(staging)
+        model.config.save_pretrained(staging)
+        
+        _replace_dir(staging, target, quantized_path.name)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    
+    logger.info(f"ONNX int8 모델 저장 완료: {quantized_path}")
+    return target
+
+
+def _replace_dir(staging: Path, target: Path, marker: str):
+    """완성된 임시 디렉터리를 target으로 이름 변경
+    
+    - 이전 버전이 남긴 불완전한 target(marker 파일 없음)은 지우고 교체
+    - 동시에 다른 프로세스가 먼저 완성했으면(marker 존재) 그 결과를 사용
+    """
+    if target.exists() and not (target / marker).exists():
+        shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.replace(staging, target)
+    except OSError:
+        if not (target / marker).exists():
+            raise
+
+
+def download_parity_checkpoint(model_name: str = None, output_dir: str = None) -> Path:
+    """
+    정확도 일치 검사용 작은 NLI 체크포인트를 로컬에 저장 (이미 있으면 재사용)
+    
+    Args:
+        model_name: Hugging Face 모델 이름 (기본값 Config.ONNX_PARITY_SOURCE_MODEL)
+        output_dir: 저장 위치 (기본값 Config.ONNX_PARITY_CHECKPOINT)
+    
+    Returns:
+        체크포인트 디렉터리 (config.json / 토크나이저 / 가중치)
+    """
+    model_name = model_name or Config.ONNX_PARITY_SOURCE_MODEL
+    target = Path(output_dir or Config.ONNX_PARITY_CHECKPOINT)
+    if (target / 'config.json').exists():
+        return target
+    
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    
+    logger.info(f"정확도 일치 검사용 체크포인트 다운로드: {model_name} → {target}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    try:
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(staging)
+        AutoModelForSequenceClassification.from_pretrained(model_name).save_pretrained(staging)
+        _replace_dir(staging, target, 'config.json')
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    
+    logger.info(f"체크포인트 저장 완료: {target}")
+    return target
+
+
+class ParityCheckSkipped(Exception):
+    """정확도 일치 검사 실행 조건 미충족 (라이브러리 또는 로컬 체크포인트 없음)"""
+    pass
+
+
+class ONNXNLIModel:
+    """양자화된 NLI 모델 세션 + 토크나이저"""
+    
+    def __init__(self, model_dir: Path, num_threads: int = None):
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or Config.ONNX_THREADS
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        self.session = ort.InferenceSession(
+            str(model_dir / 'model.int8.onnx'),
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        
+        # transformers zero-shot pipeline과 동일한 entailment 인덱스 결정
+        config = AutoConfig.from_pretrained(model_dir)
+        self.entailment_id = -1
+        for label, index in config.label2id.items():
+            if label.lower().startswith('entail'):
+                self.entailment_id = index
+                break
+    
+    def entailment_logits(self, premise: str, hypotheses: List[str]) -> np.ndarray:
+        """(premise, hypothesis) 쌍 전체를 한 번의 세션 실행으로 추론"""
+        encoded = self.tokenizer(
+            [premise] * len(hypotheses),
+            hypotheses,
+            padding=True,
+            truncation='only_first',
+            return_tensors='np'
+        )
+        feeds = {name: encoded[name].astype(np.int64) for name in self.input_names}
+        logits = self.session.run(['logits'], feeds)[0]
+        return logits[:, self.entailment_id]
+
+
+class ONNXClassifier(AIClassifier):
+    """ONNX Runtime int8 기반 AI 분류 엔진 (AIClassifier와 같은 입출력)"""
+    
+    method_name = 'ai_onnx_int8'
+    
+    def _load_model(self):
+        """양자화 모델 조회 (없으면 내보내기 후 레지스트리에 적재)"""
+        if self.pipeline is not None:
+            return
+        
+        try:
+            def load():
+                return ONNXNLIModel(export_quantized_model(self.model_name))
+            
+            self._entry = model_registry.get(f"onnx-int8:{self.model_name}", load)
+            self.pipeline = self._entry.model
+        
+        except ImportError:
+            logger.error("onnxruntime 라이브러리가 설치되지 않았습니다.")
+            logger.error("pip install onnx onnxruntime 를 실행하세요.")
+            raise
+        except Exception as e:
+            logger.error(f"ONNX 모델 로딩 실패: {e}")
+            raise
+    
+    def _predict(self, text: str) -> tuple:
+        """Zero-shot 추론 (레이블 수만큼의 NLI 쌍을 배치 1회로 실행)
+        
+        Note:
+            ONNX Runtime 세션은 동시 실행이 안전하므로 추론 잠금을 사용하지 않음
+        """
+        hypotheses = [self.hypothesis_template.format(label) for label in self.category_labels]
+        logits = self.pipeline.entailment_logits(text, hypotheses)
+        
+        # transformers pipeline(multi_label=False)과 동일: 레이블 간 entailment softmax
+        exp = np.exp(logits - logits.max())
+        scores = exp / exp.sum()
+        
+        order = np.argsort(-scores)
+        return [self.category_labels[i] for i in order], [float(scores[i]) for i in order]
+    
+    def get_engine_name(self) -> str:
+        """엔진 이름 반환"""
+        return f'ai_onnx_int8_{self.model_name.strip("/").split("/")[-1]}'
+
+
+def load_dummy_tickets(limit: int = None, path: Path = DUMMY_DATASET) -> List[Dict[str, Any]]:
+    """더미 CS 데이터셋을 분류기 입력 형식으로 변환"""
+    import pandas as pd
+    
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    if limit:
+        df = df.head(limit)
+    
+    return [
+        {'ticket_id': i + 1, 'title': row.get('title') or '', 'body': row.get('message') or '',
+         'inquiry_type': row.get('category') or '', 'channel': row.get('source') or ''}
+        for i, row in enumerate(df.fillna('').to_dict('records'))
+    ]
+
+
+def run_parity_benchmark(model_name: str, category_mapping: Dict[int, str], limit: int = 100) -> Dict[str, Any]:
+    """
+    PyTorch 경로(AIClassifier)와 ONNX int8 경로의 정확도 일치율/처리량 비교
+    
+    Args:
+        model_name: 비교할 모델 (작은 로컬 체크포인트 경로 권장)
+        category_mapping: {category_id: category_name}
+        limit: 사용할 더미 티켓 수
+    
+    Returns:
+        {'tickets', 'agreement', 'mean_confidence_diff', 'torch_tickets_per_sec', 'onnx_tickets_per_sec', 'speedup'}
+    """
+    tickets = load_dummy_tickets(limit)
+    engines = {
+        'torch': AIClassifier(model_name=model_name, category_mapping=category_mapping),
+        'onnx': ONNXClassifier(model_name=model_name, category_mapping=category_mapping)
+    }
+    
+    results = {}
+    throughput = {}
+    for name, engine in engines.items():
+        engine._load_model()  # 로딩 시간은 처리량에서 제외
+        started = time.perf_counter()
+        results[name] = [engine.classify_ticket(ticket) for ticket in tickets]
+        elapsed = time.perf_counter() - started
+        throughput[name] = len(tickets) / elapsed if elapsed > 0 else 0.0
+    
+    pairs = list(zip(results['torch'], results['onnx']))
+    agreement = sum(1 for a, b in pairs if a['category_id'] == b['category_id']) / len(pairs) if pairs else 0.0
+    confidence_diff = float(np.mean([abs(a['confidence'] - b['confidence']) for a, b in pairs])) if pairs else 0.0
+    
+    report = {
+        'tickets': len(tickets),
+        'agreement': round(agreement, 4),
+        'mean_confidence_diff': round(confidence_diff, 4),
+        'torch_tickets_per_sec': round(throughput['torch'], 2),
+        'onnx_tickets_per_sec': round(throughput['onnx'], 2),
+        'speedup': round(throughput['onnx'] / throughput['torch'], 2) if throughput['torch'] else None
+    }
+    logger.info(f"ONNX 정확도/처리량 비교: {report}")
+    return report
+
+
+def check_parity(category_mapping: Dict[int, str], checkpoint: str = None, limit: int = 100,
+                 min_agreement: float = None, max_confidence_diff: float = None) -> Dict[str, Any]:
+    """
+    작은 로컬 체크포인트로 PyTorch / ONNX int8 경로의 정확도 일치 검사
+    
+    Args:
+        category_mapping: {category_id: category_name}
+        checkpoint: 로컬 NLI 체크포인트 디렉터리 (기본값 Config.ONNX_PARITY_CHECKPOINT)
+        limit: 사용할 더미 티켓 수
+        min_agreement: 최소 카테고리 일치율 (기본값 Config.ONNX_PARITY_MIN_AGREEMENT)
+        max_confidence_diff: 최대 평균 신뢰도 차이 (기본값 Config.ONNX_PARITY_MAX_CONFIDENCE_DIFF)
+    
+    Returns:
+        run_parity_benchmark 결과 + {'passed': bool, 'failures': [기준 미달 항목]}
+    
+    Raises:
+        ParityCheckSkipped: onnxruntime / torch / transformers 또는 로컬 체크포인트가 없을 때
+            (체크포인트는 flask download-onnx-parity-checkpoint로 준비)
+    """
+    checkpoint = checkpoint or Config.ONNX_PARITY_CHECKPOINT
+    min_agreement = Config.ONNX_PARITY_MIN_AGREEMENT if min_agreement is None else min_agreement
+    max_confidence_diff = Config.ONNX_PARITY_MAX_CONFIDENCE_DIFF if max_confidence_diff is None else max_confidence_diff
+    
+    missing = [name for name in ('onnxruntime', 'torch', 'transformers') if importlib.util.find_spec(name) is None]
+    if missing:
+        raise ParityCheckSkipped(f"라이브러리가 설치되지 않았습니다: {', '.join(missing)}")
+    if not Path(checkpoint).is_dir():
+        raise ParityCheckSkipped(f"로컬 체크포인트가 없습니다: {checkpoint} "
+                                 f"(flask download-onnx-parity-checkpoint로 다운로드)")
+    
+    report = run_parity_benchmark(checkpoint, category_mapping, limit)
+    
+    failures = []
+    if report['agreement'] < min_agreement:
+        failures.append(f"agreement {report['agreement']} < {min_agreement}")
+    if report['mean_confidence_diff'] > max_confidence_diff:
+        failures.append(f"mean_confidence_diff {report['mean_confidence_diff']} > {max_confidence_diff}")
+    
+    report['passed'] = not failures
+    report['failures'] = failures
+    
+    if failures:
+        logger.error(f"ONNX 정확도 일치 검사 실패: {', '.join(failures)}")
+    return report
@@ -4,8 +4,11 @@ inquiry_type 필드를 기반으로 카테고리 매핑
 """
 from typing import Dict, List, Any
 from .base_classifier import BaseClassifier
+from .rule_set import CompiledRuleSet, get_active_rule_set
 from utils.logger import get_logger
 import re
+import numpy as np
+import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -13,152 +16,32 @@ logger = get_logger(__name__)
 class RuleBasedClassifier(BaseClassifier):
     """inquiry_type 기반 규칙 분류 엔진"""
     
-    def __init__(self, category_mapping: Dict[int, str] = None):
+    def __init__(self, category_mapping: Dict[int, str] = None, rule_set: CompiledRuleSet = None):
         """
         Args:
             category_mapping: {category_id: category_name} 딕셔너리
+            rule_set: 컴파일된 규칙 세트 (기본값: 현재 활성 규칙 세트)
         """
         self.category_mapping = category_mapping or {}
         self.reverse_mapping = {v: k for k, v in self.category_mapping.items()}
         
-        # inquiry_type -> category_name 매핑 규칙
-        self.inquiry_rules = self._build_inquiry_rules()
-        
-        # 키워드 추출 패턴 (우선순위 기반 - 1순위부터 8순위까지)
-        # 우선순위가 높은 카테고리가 먼저 검사됨
-        self.keyword_patterns = {
-            # 1순위: 품질/하자 (최우선 분류)
-            '품질/하자': [
-                '불량', '하자', '파손', '오작동', '작동안됨', '깨짐', '스크래치', '찢어짐', 
-                '변색', '눌림', '결함', '이상', '고장', '문제있음', '기능이상', '동작불량', 
-                '얼룩', '누수', '냄새남', '부품빠짐', '마감불량', '교환요청', '교체', 
-                '새상품아님', '사용불가', '작동안함', '틀어짐', '불완전', '부식', '기스', 
-                '품질문제', '소리남', '흔들림', '접착불량', '터짐', '불안정', '내부손상', '외관불량'
-            ],
-            
-            # 2순위: 서비스
-            '서비스': [
-                '불친절', '친절', '응대', '태도', '무례', '성의없음', '느림', '처리늦음', 
-                '답변없음', '전화안받음', '상담불만', '대응', '고객센터', '안내미흡', 
-                '소통불가', '대화불편', '통화불가', '불만접수', '기분나쁨', '직원태도', 
-                '안내잘못', '무시당함', '답변지연', '응대속도', '서비스불만', '불성실', 
-                '고객응대', '응답없음', '소극적', '안내부족', '응대태도', '불쾌', '무성의'
-            ],
-            
-            # 3순위: 배송
-            '배송': [
-                '배송', '지연', '늦음', '안옴', '언제와요', '출고', '발송', '물류', '택배', 
-                '택배사', '배송조회', '운송장', '분실', '누락', '미도착', '주소', '수취인', 
-                '배달', '도착', '배송중', '출발', '물건이없어요', '잘못배송', '다른사람에게감', 
-                '반송', '재배송', '기사님', '연락안됨', '배송문자', '배송상태', '물류센터', 
-                '배달사고', '배송오류', '택배지연', '송장오류', '배달지연', '배송누락', '배송불가', '배송문제'
-            ],
-            
-            # 4순위: AS/수리
-            'AS/수리': [
-                'AS', '수리', '보증', '점검', '교체', '서비스센터', '수리요청', '부품', 
-                '무상수리', '유상수리', '고장수리', '방문수리', '수리불가', '센터', 
-                '수리신청', '보증기간', '점검요청', '수리상태', '수리완료', '수리비', 
-                '수리기간', '수리지연', '기술자', '수리센터', '대리점', '교체요청', 
-                '점검필요', '제품수리', '부품교체', '보증서', '고장수리요청', 'A/S요청', 
-                'A/S접수', 'A/S센터'
-            ],
-            
-            # 5순위: 결제
-            '결제': [
-                '결제', '입금', '환불', '취소', '승인', '카드', '이체', '결제실패', 
-                '중복결제', '미결제', '자동결제', '환불요청', '결제취소', '금액틀림', 
-                '금액오류', '포인트', '결제안됨', '결제오류', '입금확인', '환불지연', 
-                '환불처리', '환불안됨', '부분취소', '결제내역', '카드승인', '결제취소요청', 
-                '영수증', '결제완료', '결제취소불가', '환불계좌', '결제확인', '입금오류', '결제문제'
-            ],
-            
-            # 6순위: 이벤트
-            '이벤트': [
-                '이벤트', '쿠폰', '할인', '프로모션', '사은품', '적립금', '경품', '행사', 
-                '이벤트참여', '쿠폰사용', '쿠폰등록', '쿠폰오류', '쿠폰안됨', '이벤트신청', 
-                '응모', '당첨', '미당첨', '혜택', '이벤트기간', '쿠폰발급', '이벤트코드', 
-                '쿠폰만료', '쿠폰지급', '쿠폰문의', '사은품누락', '할인쿠폰', '쿠폰적용', '이벤트참여방법'
-            ],
-            
-            # 7순위: 일반
-            '일반': [
-                '문의', '안내', '확인', '사용법', '방법', '어떻게', '알려주세요', '문의드립니다', 
-                '공지', '단순변심', '변경요청', '확인요청', '사용문의', '제품문의', '정보요청', 
-                '설명서', '매뉴얼', '연락처', '계정문의', '시간문의', '배송문의', '단순문의', 
-                '제품확인', '등록방법', '계정변경', '사용설명', '고객정보', '접속안됨', 
-                '로그인', '로그아웃', '비밀번호', '아이디', '등록안됨'
-            ],
-            
-            # 8순위: 기타 (아무 키워드에도 매칭되지 않을 때)
-            '기타': []
-        }
+        # 키워드 패턴 / inquiry_type 매핑 / 카테고리 우선순위는 버전이 있는 규칙 세트에서 조회
+        self.rule_set = rule_set or get_active_rule_set()
         
-        # 카테고리 우선순위 정의
-        self.category_priority = [
-            '품질/하자',    # 1순위
-            '서비스',       # 2순위
-            '배송',         # 3순위
-            'AS/수리',      # 4순위
-            '결제',         # 5순위
-            '이벤트',       # 6순위
-            '일반',         # 7순위
-            '기타'          # 8순위
-        ]
-    
-    def _build_inquiry_rules(self) -> Dict[str, str]:
-        """inquiry_type 문자열 -> category_name 매핑 규칙 생성"""
-        return {
-            # 품질/하자 관련
-            '품질': '품질/하자',
-            '하자': '품질/하자',
-            '불량': '품질/하자',
-            '파손': '품질/하자',
-            '오작동': '품질/하자',
-            '고장': '품질/하자',
-            '결함': '품질/하자',
-            
-            # 서비스 관련
-            '서비스': '서비스',
-            '응대': '서비스',
-            '상담': '서비스',
-            '고객센터': '서비스',
-            '불친절': '서비스',
-            
-            # 배송 관련
-            '배송': '배송',
-            '배송문의': '배송',
-            '배송지연': '배송',
-            '배송추적': '배송',
-            '택배': '배송',
-            '운송': '배송',
-            '물류': '배송',
+    @property
+    def keyword_patterns(self) -> Dict[str, List[str]]:
+        """카테고리별 키워드 패턴 (우선순위 순)"""
+        return self.rule_set.keyword_patterns
             
-            # AS/수리 관련
-            'AS': 'AS/수리',
-            '수리': 'AS/수리',
-            '보증': 'AS/수리',
-            '점검': 'AS/수리',
-            '서비스센터': 'AS/수리',
+    @property
+    def inquiry_rules(self) -> Dict[str, str]:
+        """inquiry_type -> category_name 매핑 규칙"""
+        return self.rule_set.inquiry_rules
             
-            # 결제 관련
-            '결제': '결제',
-            '입금': '결제',
-            '환불': '결제',
-            '취소': '결제',
-            '결제취소': '결제',
-            
-            # 이벤트 관련
-            '이벤트': '이벤트',
-            '쿠폰': '이벤트',
-            '할인': '이벤트',
-            '프로모션': '이벤트',
-            
-            # 일반 관련
-            '일반문의': '일반',
-            '단순문의': '일반',
-            '확인요청': '일반',
-        }
+    @property
+    def category_priority(self) -> List[str]:
+        """카테고리 우선순위 (키워드 점수 동점 시 사용)"""
+        return self.rule_set.category_priority
     
     def classify_ticket(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -175,6 +58,32 @@ class RuleBasedClassifier(BaseClassifier):
         title = ticket.get('title') or ''
         
         # 1. inquiry_type으로 카테고리 매핑 시도
+        category_name, confidence, matched_keywords = self._resolve_inquiry_type(inquiry_type)
+        
+        # 2. inquiry_type 매칭 실패 시 본문/제목 키워드 기반 추론
+        if not category_name:
+            category_name, confidence, matched_keywords = self._classify_by_keywords(body, title)
+        
+        # 3~5. 기타 대체, category_id 조회, 키워드 정리
+        category_id, category_name, confidence, keywords = self._finalize(category_name, confidence, matched_keywords)
+        
+        return {
+            'category_id': category_id,
+            'category_name': category_name,
+            'confidence': confidence,
+            'keywords': keywords,
+            'method': 'rule_based',
+            'original_inquiry_type': inquiry_type,
+            'rule_version': self.rule_set.version
+        }
+    
+    def _resolve_inquiry_type(self, inquiry_type: str) -> tuple:
+        """
+        inquiry_type 규칙 매칭 (정확 매칭 → 부분 매칭)
+        
+        Returns:
+            (category_name, confidence, matched_keywords) - 실패 시 (None, 0.0, [])
+        """
         category_name = None
         confidence = 0.0
         matched_keywords = []  # 실제로 매칭된 키워드 수집
@@ -186,8 +95,8 @@ class RuleBasedClassifier(BaseClassifier):
             # 부분 매칭 시도
             if not category_name:
                 inquiry_lower = inquiry_type.lower()
-                for rule_key, rule_category in self.inquiry_rules.items():
-                    if rule_key.lower() in inquiry_lower or inquiry_lower in rule_key.lower():
+                for rule_lower, rule_key, rule_category in self.rule_set.inquiry_keys:
+                    if rule_lower in inquiry_lower or inquiry_lower in rule_lower:
                         category_name = rule_category
                         matched_keywords.append(rule_key)  # 매칭된 규칙 저장
                         break
@@ -197,17 +106,22 @@ class RuleBasedClassifier(BaseClassifier):
                 if not matched_keywords:
                     matched_keywords.append(inquiry_type)  # inquiry_type 자체를 키워드로
         
-        # 2. inquiry_type 매칭 실패 시 본문/제목 키워드 기반 추론
-        if not category_name:
-            category_name, confidence, matched_keywords = self._classify_by_keywords(body, title)
+        return category_name, confidence, matched_keywords
+        
+    def _finalize(self, category_name: str, confidence: float, matched_keywords: List[str]) -> tuple:
+        """
+        매칭 결과를 최종 분류 결과로 정리
         
-        # 3. 여전히 실패 시 '기타'로 분류
+        Returns:
+            (category_id, category_name, confidence, keywords)
+        """
+        # 여전히 실패 시 '기타'로 분류
         if not category_name:
             category_name = '기타'
             confidence = 0.5
             matched_keywords = ['미분류']
         
-        # 4. category_id 조회
+        # category_id 조회
         category_id = self.reverse_mapping.get(category_name)
         
         if not category_id:
@@ -217,17 +131,103 @@ class RuleBasedClassifier(BaseClassifier):
             confidence = 0.3
             matched_keywords = ['오류']
         
-        # 5. 키워드 정리 (중복 제거, 상위 5개)
+        # 키워드 정리 (중복 제거, 상위 5개)
         keywords = list(dict.fromkeys(matched_keywords))[:5]  # 중복 제거 + 순서 유지
         
-        return {
-            'category_id': category_id,
-            'category_name': category_name,
-            'confidence': confidence,
+        return category_id, category_name, confidence, keywords
+    
+    def classify_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        컬럼 단위 일괄 분류 (classify_ticket과 동일한 결과)
+        
+        - inquiry_type을 고유값으로 factorize하여 고유값마다 규칙 매칭 1회 후 broadcast
+        - 규칙 매칭에 실패한 행만 본문/제목 키워드 매칭 (동일 텍스트는 1회만 계산)
+        
+        Args:
+            frame: inquiry_type, body, title 컬럼을 가진 DataFrame (없는 컬럼은 빈 값)
+        
+        Returns:
+            frame과 같은 index의 DataFrame
+            - category_id: int64, category_name: object, confidence: float64
+            - keywords: object (List[str]), original_inquiry_type: object
+        """
+        def text_column(name: str) -> pd.Series:
+            if name not in frame:
+                return pd.Series('', index=frame.index, dtype=object)
+            column = frame[name]
+            return column.where(column.notna() & (column != ''), '').astype(str)
+        
+        inquiry_types = text_column('inquiry_type').str.strip()
+        row_count = len(frame)
+        
+        category_names = np.empty(row_count, dtype=object)
+        confidences = np.zeros(row_count, dtype=np.float64)
+        matched = np.empty(row_count, dtype=object)
+        
+        # 1. inquiry_type 고유값별 규칙 매칭 후 broadcast
+        codes, uniques = pd.factorize(inquiry_types, sort=False)
+        resolved = [self._resolve_inquiry_type(value) for value in uniques]
+        
+        unique_names = np.array([r[0] for r in resolved] + [None], dtype=object)
+        unique_confidences = np.array([r[1] for r in resolved] + [0.0], dtype=np.float64)
+        unique_keywords = np.empty(len(resolved) + 1, dtype=object)
+        unique_keywords[:] = [r[2] for r in resolved] + [[]]
+        
+        category_names[:] = unique_names[codes]
+        confidences[:] = unique_confidences[codes]
+        matched[:] = unique_keywords[codes]
+        
+        # 2. 미해결 행만 키워드 매칭 (본문+제목 조합별 1회)
+        unresolved = np.flatnonzero(pd.isna(category_names))
+        if len(unresolved):
+            bodies = text_column('body').to_numpy()[unresolved]
+            titles = text_column('title').to_numpy()[unresolved]
+            cache = {}
+            for position, body, title in zip(unresolved, bodies, titles):
+                key = (body, title)
+                if key not in cache:
+                    cache[key] = self._classify_by_keywords(body, title)
+                category_names[position], confidences[position], matched[position] = cache[key]
+        
+        # 3. 최종 정리 ((카테고리, 신뢰도, 키워드) 조합별 1회)
+        category_ids = np.zeros(row_count, dtype=np.int64)
+        keywords = np.empty(row_count, dtype=object)
+        finalized = {}
+        for position in range(row_count):
+            key = (category_names[position], confidences[position], tuple(matched[position]))
+            if key not in finalized:
+                finalized[key] = self._finalize(category_names[position], confidences[position], matched[position])
+            category_ids[position], category_names[position], confidences[position], result_keywords = finalized[key]
+            keywords[position] = list(result_keywords)
+        
+        logger.info(f"컬럼 단위 분류 완료: {row_count}건 (inquiry_type 고유값 {len(uniques)}개, 키워드 매칭 {len(unresolved)}건)")
+        
+        return pd.DataFrame({
+            'category_id': category_ids,
+            'category_name': category_names,
+            'confidence': confidences,
             'keywords': keywords,
-            'method': 'rule_based',
-            'original_inquiry_type': inquiry_type
-        }
+            'original_inquiry_type': inquiry_types.to_numpy(dtype=object)
+        }, index=frame.index)
+    
+    def classify_batch(self, tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 티켓 일괄 분류 (classify_frame 사용)"""
+        if not tickets:
+            return []
+        
+        results = self.classify_frame(pd.DataFrame.from_records(tickets))
+        return [
+            {
+                'category_id': int(row.category_id),
+                'category_name': row.category_name,
+                'confidence': float(row.confidence),
+                'keywords': row.keywords,
+                'method': 'rule_based',
+                'original_inquiry_type': row.original_inquiry_type,
+                'rule_version': self.rule_set.version
+            }
+            for row in results.itertuples(index=False)
+        ]
     
     def _classify_by_keywords(self, body: str, title: str) -> tuple:
         """
@@ -238,20 +238,9 @@ class RuleBasedClassifier(BaseClassifier):
         """
         text = (body + ' ' + title).lower()
         
-        category_scores = {}
-        category_matched_keywords = {}  # 카테고리별 매칭된 키워드 저장
-        
-        # 모든 카테고리에 대해 매칭 점수 계산
-        for category, keywords in self.keyword_patterns.items():
-            score = 0
-            matched = []
-            for keyword in keywords:
-                if keyword in text:
-                    score += 1
-                    matched.append(keyword)  # 실제로 매칭된 키워드 저장
-            if score > 0:
-                category_scores[category] = score
-                category_matched_keywords[category] = matched
+        # 컴파일된 매칭기로 1회 스캔 (카테고리별 실제로 매칭된 키워드, 점수 = 매칭 키워드 수)
+        category_matched_keywords = self.rule_set.match_keywords(text)
+        category_scores = {category: len(matched) for category, matched in category_matched_keywords.items()}
         
         if category_scores:
             # 우선순위 기반 분류: 동점일 경우 우선순위가 높은 카테고리 선택
@@ -282,8 +271,8 @@ class RuleBasedClassifier(BaseClassifier):
     # 키워드는 분류 과정에서 실시간으로 수집됨
     
     def get_engine_name(self) -> str:
-        """엔진 이름 반환"""
-        return 'rule_based_v1'
+        """엔진 이름 반환 (규칙 세트 버전 포함)"""
+        return f'rule_based_v1@{self.rule_set.version}'
     
     def set_category_mapping(self, category_mapping: Dict[int, str]):
         """카테고리 매핑 업데이트"""
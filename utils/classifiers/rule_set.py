@@ -0,0 +1,353 @@
+"""
+규칙 기반 분류 규칙 세트 (키워드 패턴 / inquiry_type 매핑 / 카테고리 우선순위)
+규칙 내용 해시를 버전으로 사용하고, 컴파일된 매칭기 아티팩트를 디스크에 캐시
+"""
+from typing import Dict, List, Any, Optional
+from pathlib import Path
+from collections import defaultdict
+from utils.logger import get_logger
+from config import Config
+import hashlib
+import json
+import os
+import re
+import threading
+
+logger = get_logger(__name__)
+
+ARTIFACT_FORMAT = 1
+
+# 기본 규칙 (DB 규칙 테이블이 비어 있을 때 사용, seed-rules 명령의 초기값)
+# 키워드 추출 패턴 (우선순위 기반 - 1순위부터 8순위까지)
+DEFAULT_KEYWORD_PATTERNS = {
+    # 1순위: 품질/하자 (최우선 분류)
+    '품질/하자': [
+        '불량', '하자', '파손', '오작동', '작동안됨', '깨짐', '스크래치', '찢어짐',
+        '변색', '눌림', '결함', '이상', '고장', '문제있음', '기능이상', '동작불량',
+        '얼룩', '누수', '냄새남', '부품빠짐', '마감불량', '교환요청', '교체',
+        '새상품아님', '사용불가', '작동안함', '틀어짐', '불완전', '부식', '기스',
+        '품질문제', '소리남', '흔들림', '접착불량', '터짐', '불안정', '내부손상', '외관불량'
+    ],
+    
+    # 2순위: 서비스
+    '서비스': [
+        '불친절', '친절', '응대', '태도', '무례', '성의없음', '느림', '처리늦음',
+        '답변없음', '전화안받음', '상담불만', '대응', '고객센터', '안내미흡',
+        '소통불가', '대화불편', '통화불가', '불만접수', '기분나쁨', '직원태도',
+        '안내잘못', '무시당함', '답변지연', '응대속도', '서비스불만', '불성실',
+        '고객응대', '응답없음', '소극적', '안내부족', '응대태도', '불쾌', '무성의'
+    ],
+    
+    # 3순위: 배송
+    '배송': [
+        '배송', '지연', '늦음', '안옴', '언제와요', '출고', '발송', '물류', '택배',
+        '택배사', '배송조회', '운송장', '분실', '누락', '미도착', '주소', '수취인',
+        '배달', '도착', '배송중', '출발', '물건이없어요', '잘못배송', '다른사람에게감',
+        '반송', '재배송', '기사님', '연락안됨', '배송문자', '배송상태', '물류센터',
+        '배달사고', '배송오류', '택배지연', '송장오류', '배달지연', '배송누락', '배송불가', '배송문제'
+    ],
+    
+    # 4순위: AS/수리
+    'AS/수리': [
+        'AS', '수리', '보증', '점검', '교체', '서비스센터', '수리요청', '부품',
+        '무상수리', '유상수리', '고장수리', '방문수리', '수리불가', '센터',
+        '수리신청', '보증기간', '점검요청', '수리상태', '수리완료', '수리비',
+        '수리기간', '수리지연', '기술자', '수리센터', '대리점', '교체요청',
+        '점검필요', '제품수리', '부품교체', '보증서', '고장수리요청', 'A/S요청',
+        'A/S접수', 'A/S센터'
+    ],
+    
+    # 5순위: 결제
+    '결제': [
+        '결제', '입금', '환불', '취소', '승인', '카드', '이체', '결제실패',
+        '중복결제', '미결제', '자동결제', '환불요청', '결제취소', '금액틀림',
+        '금액오류', '포인트', '결제안됨', '결제오류', '입금확인', '환불지연',
+        '환불처리', '환불안됨', '부분취소', '결제내역', '카드승인', '결제취소요청',
+        '영수증', '결제완료', '결제취소불가', '환불계좌', '결제확인', '입금오류', '결제문제'
+    ],
+    
+    # 6순위: 이벤트
+    '이벤트': [
+        '이벤트', '쿠폰', '할인', '프로모션', '사은품', '적립금', '경품', '행사',
+        '이벤트참여', '쿠폰사용', '쿠폰등록', '쿠폰오류', '쿠폰안됨', '이벤트신청',
+        '응모', '당첨', '미당첨', '혜택', '이벤트기간', '쿠폰발급', '이벤트코드',
+        '쿠폰만료', '쿠폰지급', '쿠폰문의', '사은품누락', '할인쿠폰', '쿠폰적용', '이벤트참여방법'
+    ],
+    
+    # 7순위: 일반
+    '일반': [
+        '문의', '안내', '확인', '사용법', '방법', '어떻게', '알려주세요', '문의드립니다',
+        '공지', '단순변심', '변경요청', '확인요청', '사용문의', '제품문의', '정보요청',
+        '설명서', '매뉴얼', '연락처', '계정문의', '시간문의', '배송문의', '단순문의',
+        '제품확인', '등록방법', '계정변경', '사용설명', '고객정보', '접속안됨',
+        '로그인', '로그아웃', '비밀번호', '아이디', '등록안됨'
+    ],
+    
+    # 8순위: 기타 (아무 키워드에도 매칭되지 않을 때)
+    '기타': []
+}
+
+# inquiry_type 문자열 -> category_name 매핑 규칙 (부분 매칭은 이 순서대로 검사)
+DEFAULT_INQUIRY_RULES = {
+    # 품질/하자 관련
+    '품질': '품질/하자',
+    '하자': '품질/하자',
+    '불량': '품질/하자',
+    '파손': '품질/하자',
+    '오작동': '품질/하자',
+    '고장': '품질/하자',
+    '결함': '품질/하자',
+    
+    # 서비스 관련
+    '서비스': '서비스',
+    '응대': '서비스',
+    '상담': '서비스',
+    '고객센터': '서비스',
+    '불친절': '서비스',
+    
+    # 배송 관련
+    '배송': '배송',
+    '배송문의': '배송',
+    '배송지연': '배송',
+    '배송추적': '배송',
+    '택배': '배송',
+    '운송': '배송',
+    '물류': '배송',
+    
+    # AS/수리 관련
+    'AS': 'AS/수리',
+    '수리': 'AS/수리',
+    '보증': 'AS/수리',
+    '점검': 'AS/수리',
+    '서비스센터': 'AS/수리',
+    
+    # 결제 관련
+    '결제': '결제',
+    '입금': '결제',
+    '환불': '결제',
+    '취소': '결제',
+    '결제취소': '결제',
+    
+    # 이벤트 관련
+    '이벤트': '이벤트',
+    '쿠폰': '이벤트',
+    '할인': '이벤트',
+    '프로모션': '이벤트',
+    
+    # 일반 관련
+    '일반문의': '일반',
+    '단순문의': '일반',
+    '확인요청': '일반',
+}
+
+# 카테고리 우선순위 (키워드 점수 동점 시 앞쪽 카테고리 선택)
+DEFAULT_CATEGORY_PRIORITY = ['품질/하자', '서비스', '배송', 'AS/수리', '결제', '이벤트', '일반', '기타']
+
+
+def rule_set_version(keyword_patterns: Dict[str, List[str]], inquiry_rules: Dict[str, str],
+                     category_priority: List[str]) -> str:
+    """규칙 내용 해시 (순서 포함, 12자리)"""
+    payload = json.dumps(
+        [list(keyword_patterns.items()), list(inquiry_rules.items()), list(category_priority)],
+        ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def _build_trie_pattern(keywords: List[str]) -> str:
+    """키워드 trie를 정규식으로 변환 (각 위치에서 가장 긴 키워드가 매칭됨)"""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # 더 긴 키워드를 먼저 시도하고, 실패하면 현재 위치에서 끝남
+            return f'(?:{body})?'
+        return body
+    
+    return render(trie)
+
+
+def compile_matcher(keyword_patterns: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    키워드 패턴을 매칭기 아티팩트로 컴파일
+    
+    Returns:
+        {'pattern': trie 정규식, 'prefixes': {키워드: [접두 키워드...]}, 'owners': {키워드: [[카테고리, 순번]...]}}
+    
+    Note:
+        - 본문은 소문자로 비교하므로 대문자가 포함된 키워드는 매칭되지 않음 (기존 동작과 동일하게 제외)
+        - 한 위치에서 매칭되는 키워드 = 그 위치의 가장 긴 키워드의 접두사 중 키워드인 것
+    """
+    owners: Dict[str, List[list]] = defaultdict(list)
+    for category, keywords in keyword_patterns.items():
+        for position, keyword in enumerate(keywords):
+            if keyword and keyword == keyword.lower():
+                owners[keyword].append([category, position])
+    
+    keywords = sorted(owners)
+    prefixes = {
+        keyword: [keyword[:length] for length in range(1, len(keyword) + 1) if keyword[:length] in owners]
+        for keyword in keywords
+    }
+    
+    return {
+        'pattern': _build_trie_pattern(keywords) if keywords else '',
+        'prefixes': prefixes,
+        'owners': dict(owners)
+    }
+
+
+class CompiledRuleSet:
+    """버전이 있는 컴파일된 규칙 세트 (키워드 매칭은 trie 정규식 1회 스캔)"""
+    
+    def __init__(self, keyword_patterns: Dict[str, List[str]], inquiry_rules: Dict[str, str],
+                 category_priority: List[str], version: str = None, matcher: Dict[str, Any] = None):
+        self.keyword_patterns = keyword_patterns
+        self.inquiry_rules = inquiry_rules
+        self.category_priority = category_priority
+        self.version = version or rule_set_version(keyword_patterns, inquiry_rules, category_priority)
+        
+        self.matcher = matcher or compile_matcher(keyword_patterns)
+        self._regex = re.compile(self.matcher['pattern']) if self.matcher['pattern'] else None
+        self._category_order = {category: index for index, category in enumerate(keyword_patterns)}
+        
+        # 부분 매칭용 소문자 키 (검사 순서 유지)
+        self.inquiry_keys = [(key.lower(), key, category) for key, category in inquiry_rules.items()]
+    
+    def match_keywords(self, text: str) -> Dict[str, List[str]]:
+        """
+        소문자 텍스트에 포함된 키워드를 카테고리별로 반환
+        
+        Returns:
+            {category: [매칭 키워드...]} - 카테고리는 keyword_patterns 순서, 키워드는 카테고리 내 순서
+        """
+        if self._regex is None:
+            return {}
+        
+        # 매칭 위치마다 가장 긴 키워드를 찾고 다음 글자부터 다시 검색 (겹치는 키워드 포함)
+        # 첫 글자 집합으로 시작하는 패턴이라 매칭되지 않는 위치는 정규식 엔진이 건너뜀
+        prefixes = self.matcher['prefixes']
+        search = self._regex.search
+        found = set()
+        match = search(text)
+        while match is not None:
+            found.update(prefixes[match.group()])
+            match = search(text, match.start() + 1)
+        if not found:
+            return {}
+        
+        owners = self.matcher['owners']
+        hits: Dict[str, List[tuple]] = defaultdict(list)
+        for keyword in found:
+            for category, position in owners[keyword]:
+                hits[category].append((position, keyword))
+        
+        return {
+            category: [keyword for _, keyword in sorted(hits[category])]
+            for category in sorted(hits, key=self._category_order.__getitem__)
+        }
+    
+    def to_artifact(self) -> Dict[str, Any]:
+        """디스크 캐시용 직렬화"""
+        return {
+            'format': ARTIFACT_FORMAT,
+            'version': self.version,
+            'keyword_patterns': self.keyword_patterns,
+            'inquiry_rules': list(self.inquiry_rules.items()),
+            'category_priority': self.category_priority,
+            'matcher': self.matcher
+        }
+    
+    @classmethod
+    def from_artifact(cls, artifact: Dict[str, Any]) -> 'CompiledRuleSet':
+        """디스크 캐시에서 복원 (컴파일 생략)"""
+        return cls(
+            artifact['keyword_patterns'],
+            dict(artifact['inquiry_rules']),
+            artifact['category_priority'],
+            version=artifact['version'],
+            matcher=artifact['matcher']
+        )
+
+
+# 컴파일 결과 프로세스 내 캐시: {version: CompiledRuleSet}
+_compiled_cache: Dict[str, CompiledRuleSet] = {}
+_compile_lock = threading.Lock()
+_active_rule_set: Optional[CompiledRuleSet] = None
+
+
+def compile_rule_set(keyword_patterns: Dict[str, List[str]], inquiry_rules: Dict[str, str],
+                     category_priority: List[str], artifact_dir: str = None) -> CompiledRuleSet:
+    """
+    규칙 세트 컴파일 (프로세스 캐시 → 디스크 아티팩트 → 새로 컴파일 순으로 조회)
+    
+    Args:
+        artifact_dir: 아티팩트 저장 위치 (기본값 Config.RULE_ARTIFACT_DIR)
+    
+    Returns:
+        CompiledRuleSet (같은 내용이면 같은 객체)
+    """
+    version = rule_set_version(keyword_patterns, inquiry_rules, category_priority)
+    cached = _compiled_cache.get(version)
+    if cached is not None:
+        return cached
+    
+    with _compile_lock:
+        cached = _compiled_cache.get(version)
+        if cached is not None:
+            return cached
+        
+        path = Path(artifact_dir or Config.RULE_ARTIFACT_DIR) / f'ruleset-{version}.json'
+        rule_set = None
+        
+        if path.exists():
+            try:
+                artifact = json.loads(path.read_text(encoding='utf-8'))
+                if artifact.get('format') == ARTIFACT_FORMAT and artifact.get('version') == version:
+                    rule_set = CompiledRuleSet.from_artifact(artifact)
+                    logger.info(f"규칙 세트 아티팩트 로드: version={version}")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"규칙 세트 아티팩트 손상 (재컴파일): {path} ({e})")
+        
+        if rule_set is None:
+            rule_set = CompiledRuleSet(keyword_patterns, inquiry_rules, category_priority, version=version)
+            try:
+                # 동시에 시작한 워커와 겹쳐도 안전하도록 임시 파일에 쓴 뒤 교체
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+                temp_path.write_text(json.dumps(rule_set.to_artifact(), ensure_ascii=False), encoding='utf-8')
+                os.replace(temp_path, path)
+                logger.info(f"규칙 세트 컴파일 완료: version={version}, "
+                            f"키워드 {len(rule_set.matcher['owners'])}개 → {path}")
+            except OSError as e:
+                logger.warning(f"규칙 세트 아티팩트 저장 실패 (메모리 캐시만 사용): {e}")
+        
+        _compiled_cache[version] = rule_set
+        return rule_set
+
+
+def default_rule_set() -> CompiledRuleSet:
+    """코드에 정의된 기본 규칙 세트"""
+    return compile_rule_set(DEFAULT_KEYWORD_PATTERNS, DEFAULT_INQUIRY_RULES, DEFAULT_CATEGORY_PRIORITY)
+
+
+def get_active_rule_set() -> CompiledRuleSet:
+    """현재 활성 규칙 세트 (DB 규칙을 아직 불러오지 않았으면 기본 규칙)"""
+    return _active_rule_set or default_rule_set()
+
+
+def set_active_rule_set(rule_set: CompiledRuleSet):
+    """활성 규칙 세트 교체 (이후 생성되는 RuleBasedClassifier에 적용)"""
+    global _active_rule_set
+    if _active_rule_set is None or _active_rule_set.version != rule_set.version:
+        logger.info(f"활성 규칙 세트 변경: version={rule_set.version}")
+    _active_rule_set = rule_set
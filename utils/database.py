@@ -1,6 +1,12 @@
-import mysql.connector
-from mysql.connector import pooling
+import sqlite3
+import re
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, date, timedelta
+from pathlib import Path
 from utils.logger import get_logger
+from utils.query_stats import InstrumentedConnection
+from config import Config
 import os
 from dotenv import load_dotenv
 import time
@@ -12,11 +18,103 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
-class DatabaseManager:
-    """MySQL 데이터베이스 연결 및 관리 클래스 (Connection Pool 사용)"""
+# 프로젝트 루트 (스키마 파일 위치)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class BaseDatabaseManager(ABC):
+    """스토리지 백엔드 인터페이스
+    
+    모든 DB 클래스(services/db/*.py)는 db_manager를 통해 이 인터페이스만 사용함
+    - get_connection(): connection.cursor(dictionary=True), commit(), rollback(),
+      close(), is_connected()를 지원하는 연결 객체 반환
+    - SQL은 MySQL 문법(%s 플레이스홀더) 기준으로 작성
+    """
+    
+    backend_name = 'base'
+    
+    @abstractmethod
+    def get_connection(self, max_retries=3, retry_delay=1):
+        """연결 가져오기"""
+        pass
+    
+    def _instrument(self, connection):
+        """쿼리 계측 래퍼 적용 (Config.QUERY_INSTRUMENTATION)"""
+        if not Config.QUERY_INSTRUMENTATION:
+            return connection
+        return InstrumentedConnection(connection)
+    
+    @contextmanager
+    def get_connection_context(self):
+        """Context Manager를 사용한 안전한 연결 관리
+        
+        사용 예시:
+            with db_manager.get_connection_context() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT ...")
+                # connection은 자동으로 반환됨
+        """
+        connection = None
+        try:
+            connection = self.get_connection()
+            yield connection
+        except Exception as e:
+            if connection:
+                try:
+                    connection.rollback()
+                    logger.warning("트랜잭션 롤백 완료")
+                except:
+                    pass
+            raise
+        finally:
+            if connection and connection.is_connected():
+                try:
+                    connection.close()
+                    logger.debug("DB 연결 반환 완료")
+                except Exception as e:
+                    logger.error(f"연결 반환 중 오류: {e}")
+    
+    def close_all_connections(self):
+        """모든 연결 종료 (애플리케이션 종료 시 호출)"""
+        pass
+    
+    def test_connection(self):
+        """데이터베이스 연결 테스트"""
+        connection = None
+        cursor = None
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            result = cursor.fetchone()
+            
+            if result:
+                logger.info(f"데이터베이스 연결 테스트 성공 (backend={self.backend_name})")
+                return True
+            return False
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 테스트 실패: {e}")
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+            if connection and connection.is_connected():
+                connection.close()
+
+
+class DatabaseManager(BaseDatabaseManager):
+    """MySQL 데이터베이스 연결 및 관리 클래스 (Connection Pool 사용)
+    
+    Note:
+        Connection Pool은 최초 get_connection() 호출 시 생성됨 (import 시점 연결 없음)
+    """
+    
+    backend_name = 'mysql'
     
     def __init__(self):
         self.connection_pool = None
+        self._pool_lock = threading.Lock()
+        self.pool_size = Config.DB_POOL_SIZE
         self.config = {
             'host': os.getenv('DB_HOST', 'localhost'),
             'port': int(os.getenv('DB_PORT', 3306)),
@@ -26,22 +124,38 @@ class DatabaseManager:
             'charset': 'utf8mb4',
             'auth_plugin': 'mysql_native_password'
         }
-        self._create_connection_pool()
     
     def _create_connection_pool(self):
         """Connection Pool 생성 (크기 증가 + 타임아웃 설정)"""
+        try:
+            import mysql.connector
+            from mysql.connector import pooling
+        except ImportError:
+            logger.error("mysql-connector-python 라이브러리가 설치되지 않았습니다.")
+            logger.error("pip install mysql-connector-python 을 실행하거나 DB_BACKEND=sqlite 를 사용하세요.")
+            raise
+        
         try:
             self.connection_pool = pooling.MySQLConnectionPool(
                 pool_name="clara_cs_pool",
-                pool_size=20,  # 5 → 20으로 증가 (동시 작업 대응)
+                pool_size=self.pool_size,  # 동시 작업 대응
                 pool_reset_session=True,  # 세션 재설정 활성화
                 **self.config
             )
-            logger.info("데이터베이스 Connection Pool 생성 완료 (pool_size=20)")
+            logger.info(f"데이터베이스 Connection Pool 생성 완료 (pool_size={self.pool_size})")
         except mysql.connector.Error as e:
             logger.error(f"Connection Pool 생성 실패: {e}")
             raise
     
+    def _ensure_pool(self):
+        """Connection Pool 지연 생성 (최초 1회만)"""
+        if self.connection_pool is not None:
+            return
+        
+        with self._pool_lock:
+            if self.connection_pool is None:
+                self._create_connection_pool()
+    
     def get_connection(self, max_retries=3, retry_delay=1):
         """Connection Pool에서 연결 가져오기 (재시도 로직 추가)
         
@@ -55,6 +169,9 @@ class DatabaseManager:
         Raises:
             Exception: 재시도 후에도 실패 시
         """
+        import mysql.connector
+        
+        self._ensure_pool()
         last_error = None
         
         for attempt in range(max_retries):
@@ -64,11 +181,11 @@ class DatabaseManager:
                 # 연결 상태 확인
                 if connection.is_connected():
                     # logger.debug(f"DB 연결 성공 (attempt {attempt + 1}/{max_retries})")
-                    return connection
+                    return self._instrument(connection)
                 else:
                     logger.warning(f"연결이 끊어져 있습니다. 재연결 시도 {attempt + 1}/{max_retries}...")
                     connection.reconnect(attempts=3, delay=1)
-                    return connection
+                    return self._instrument(connection)
                     
             except mysql.connector.errors.PoolError as e:
                 last_error = e
@@ -94,36 +211,6 @@ class DatabaseManager:
         # 모든 재시도 실패
         raise Exception(f"데이터베이스 연결 실패 ({max_retries}회 재시도): {last_error}")
     
-    @contextmanager
-    def get_connection_context(self):
-        """Context Manager를 사용한 안전한 연결 관리
-        
-        사용 예시:
-            with db_manager.get_connection_context() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT ...")
-                # connection은 자동으로 반환됨
-        """
-        connection = None
-        try:
-            connection = self.get_connection()
-            yield connection
-        except Exception as e:
-            if connection:
-                try:
-                    connection.rollback()
-                    logger.warning("트랜잭션 롤백 완료")
-                except:
-                    pass
-            raise
-        finally:
-            if connection and connection.is_connected():
-                try:
-                    connection.close()
-                    logger.debug("DB 연결 반환 완료")
-                except Exception as e:
-                    logger.error(f"연결 반환 중 오류: {e}")
-    
     def close_all_connections(self):
         """모든 연결 종료 (애플리케이션 종료 시 호출)"""
         try:
@@ -132,28 +219,361 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"연결 종료 중 오류 발생: {e}")
     
-    def test_connection(self):
-        """데이터베이스 연결 테스트"""
-        connection = None
-        cursor = None
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
+
+# ============================================================================
+# SQLite 백엔드 (내장형 - 벤치마크/로컬 실행용)
+# ============================================================================
+
+# MySQL이 반환하는 date/datetime 타입을 흉내내기 위한 패턴 (선언 타입이 없는 계산 컬럼용)
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DATETIME_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d{1,6})?$')
+
+# 선언된 컬럼 타입 → 변환기 (PARSE_DECLTYPES, 타입명 첫 단어 기준)
+_DATE_TYPES = ('DATE',)
+_DATETIME_TYPES = ('DATETIME', 'TIMESTAMP')
+_TEXT_TYPES = ('VARCHAR', 'CHAR', 'TEXT', 'JSON')
+
+
+class _DeclaredText(str):
+    """문자열 타입으로 선언된 컬럼 값 (날짜 모양이어도 변환하지 않음)"""
+
+
+def _convert_declared_date(value: bytes) -> date:
+    return date.fromisoformat(value.decode()[:10])
+
+
+def _convert_declared_datetime(value: bytes) -> datetime:
+    """DATETIME / TIMESTAMP 컬럼은 날짜만 저장된 값도 datetime으로 반환 (mysql-connector와 동일)"""
+    text = value.decode()
+    if _DATE_PATTERN.match(text):
+        return datetime.fromisoformat(text + ' 00:00:00')
+    return datetime.fromisoformat(text)
+
+
+def _convert_declared_text(value: bytes) -> str:
+    return _DeclaredText(value.decode())
+
+
+def _register_converters():
+    for type_name in _DATE_TYPES:
+        sqlite3.register_converter(type_name, _convert_declared_date)
+    for type_name in _DATETIME_TYPES:
+        sqlite3.register_converter(type_name, _convert_declared_datetime)
+    for type_name in _TEXT_TYPES:
+        sqlite3.register_converter(type_name, _convert_declared_text)
+
+
+def _convert_sqlite_value(value):
+    """SQLite 결과값을 mysql-connector 반환 타입에 맞게 변환
+    
+    Note:
+        - 테이블 컬럼은 선언 타입으로 변환됨 (DATE → date, DATETIME/TIMESTAMP → datetime)
+        - 선언 타입이 없는 계산 컬럼(DATE(), MAX() 등)만 값 모양으로 date/datetime 판별
+    """
+    if isinstance(value, _DeclaredText):
+        return str(value)
+    if isinstance(value, str) and len(value) <= 26:
+        if _DATE_PATTERN.match(value):
+            return date.fromisoformat(value)
+        if _DATETIME_PATTERN.match(value):
+            return datetime.fromisoformat(value)
+    return value
+
+
+def _sqlite_now():
+    """MySQL NOW() 대체 함수"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _sqlite_char_length(value):
+    """MySQL CHAR_LENGTH() 대체 함수 (문자 수)"""
+    return None if value is None else len(str(value))
+
+
+def _sqlite_weekday(value):
+    """MySQL WEEKDAY() 대체 함수 (월요일 = 0)"""
+    return None if value is None else date.fromisoformat(str(value)[:10]).weekday()
+
+
+def _sqlite_subdate(value, days):
+    """MySQL SUBDATE(date, days) 대체 함수"""
+    if value is None or days is None:
+        return None
+    return (date.fromisoformat(str(value)[:10]) - timedelta(days=int(days))).isoformat()
+
+
+def _sqlite_date_format(value, fmt):
+    """MySQL DATE_FORMAT() 대체 함수 (%Y, %m, %d 형식 지정자만 사용)"""
+    if value is None or fmt is None:
+        return None
+    return date.fromisoformat(str(value)[:10]).strftime(fmt)
+
+
+class SQLiteCursor:
+    """mysql-connector 커서 인터페이스를 흉내내는 SQLite 커서 래퍼"""
+    
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        self._cursor = cursor
+        self.dictionary = dictionary
+    
+    @staticmethod
+    def _translate(query: str) -> str:
+        """MySQL 문법 → SQLite 문법 (플레이스홀더, ON DUPLICATE KEY UPDATE 변환)"""
+        query = query.replace('%s', '?')
+        head, upsert, tail = query.partition('ON DUPLICATE KEY UPDATE')
+        if not upsert:
+            return query
+        return head + 'ON CONFLICT DO UPDATE SET' + re.sub(r'VALUES\((\w+)\)', r'excluded.\1', tail)
+    
+    def execute(self, query, params=None):
+        self._cursor.execute(self._translate(query), tuple(params) if params else ())
+        return self
+    
+    def executemany(self, query, seq_of_params):
+        self._cursor.executemany(self._translate(query), [tuple(p) for p in seq_of_params])
+        return self
+    
+    def _convert_row(self, row):
+        if row is None:
+            return None
+        values = [_convert_sqlite_value(v) for v in row]
+        if self.dictionary:
+            columns = [col[0] for col in self._cursor.description]
+            return dict(zip(columns, values))
+        return tuple(values)
+    
+    def fetchone(self):
+        return self._convert_row(self._cursor.fetchone())
+    
+    def fetchall(self):
+        return [self._convert_row(row) for row in self._cursor.fetchall()]
+    
+    def fetchmany(self, size=1):
+        return [self._convert_row(row) for row in self._cursor.fetchmany(size)]
+    
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+    
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+    
+    @property
+    def description(self):
+        return self._cursor.description
+    
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """mysql-connector 연결 인터페이스를 흉내내는 SQLite 연결 래퍼"""
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self._closed = False
+    
+    def cursor(self, dictionary: bool = False, **kwargs):
+        return SQLiteCursor(self._connection.cursor(), dictionary=dictionary)
+    
+    def commit(self):
+        self._connection.commit()
+    
+    def rollback(self):
+        self._connection.rollback()
+    
+    def is_connected(self) -> bool:
+        return not self._closed
+    
+    def reconnect(self, attempts=1, delay=0):
+        pass
+    
+    def close(self):
+        if not self._closed:
+            self._connection.close()
+            self._closed = True
+
+
+def translate_mysql_schema(sql_text: str) -> list:
+    """MySQL DDL/DML 스크립트를 SQLite에서 실행 가능한 문장 리스트로 변환
+    
+    - CREATE DATABASE / USE / SELECT / ALTER / VIEW 문은 건너뜀
+    - AUTO_INCREMENT, COMMENT, 테이블 옵션(ENGINE, ROW_FORMAT 등) 제거
+    - 인라인 INDEX / UNIQUE KEY → 별도 CREATE INDEX 문으로 분리
+    """
+    # 주석 제거 (-- 한 줄 주석, /* */ 블록 주석)
+    sql_text = re.sub(r'/\*.*?\*/', '', sql_text, flags=re.S)
+    sql_text = '\n'.join(line for line in sql_text.splitlines() if not line.strip().startswith('--'))
+    
+    statements = []
+    for raw in sql_text.split(';'):
+        stmt = raw.strip()
+        if not stmt:
+            continue
+        
+        head = stmt.split(None, 2)
+        keyword = ' '.join(head[:2]).upper() if head else ''
+        
+        if keyword.startswith('INSERT'):
+            statements.append(stmt)
+            continue
+        
+        if not keyword.startswith('CREATE TABLE'):
+            continue
+        
+        table_match = re.match(r'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?`?(\w+)`?', stmt, re.I)
+        table_name = table_match.group(1)
+        
+        # 첫 줄 "CREATE TABLE `x` (" 와 마지막 ")" 줄(테이블 옵션 포함) 사이가 컬럼 정의
+        lines = stmt.splitlines()
+        closing_idx = max(i for i, line in enumerate(lines) if line.strip().startswith(')'))
+        body_lines = lines[1:closing_idx]
+        
+        columns = []
+        indexes = []
+        for line in body_lines:
+            line = line.strip().rstrip(',')
+            if not line:
+                continue
             
-            if result:
-                logger.info("데이터베이스 연결 테스트 성공")
-                return True
-            return False
+            index_match = re.match(r'(UNIQUE\s+)?(?:INDEX|KEY)\s+`?(\w+)`?\s*\((.+)\)$', line, re.I)
+            if index_match:
+                unique = 'UNIQUE ' if index_match.group(1) else ''
+                indexes.append(
+                    f"CREATE {unique}INDEX IF NOT EXISTS {index_match.group(2)} "
+                    f"ON {table_name} ({index_match.group(3)})"
+                )
+                continue
+            
+            if re.match(r'(CONSTRAINT|FOREIGN KEY)', line, re.I):
+                continue
+            
+            line = re.sub(r"\s+COMMENT\s+'[^']*'", '', line, flags=re.I)
+            line = re.sub(r'\bINT\s+PRIMARY KEY\s+AUTO_INCREMENT\b', 'INTEGER PRIMARY KEY AUTOINCREMENT', line, flags=re.I)
+            line = re.sub(r'\bBIGINT\s+PRIMARY KEY\s+AUTO_INCREMENT\b', 'INTEGER PRIMARY KEY AUTOINCREMENT', line, flags=re.I)
+            line = re.sub(r'\bAUTO_INCREMENT\b', '', line, flags=re.I)
+            line = re.sub(r'DEFAULT\s+\(NOW\(\)\)', 'DEFAULT CURRENT_TIMESTAMP', line, flags=re.I)
+            line = re.sub(r'\s+ON UPDATE CURRENT_TIMESTAMP', '', line, flags=re.I)
+            line = re.sub(r'\bUNSIGNED\b', '', line, flags=re.I)
+            columns.append(line)
+        
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table_name} (\n  " + ',\n  '.join(columns) + "\n)")
+        statements.extend(indexes)
+    
+    return statements
+
+
+class SQLiteDatabaseManager(BaseDatabaseManager):
+    """SQLite 내장 데이터베이스 관리 클래스 (외부 서비스 없이 실행)
+    
+    - database_schema.sql(+ 코드 데이터)을 변환하여 동일한 스키마로 초기화
+    - ':memory:' 사용 시 shared-cache 인메모리 DB (프로세스 내 모든 연결이 공유)
+    - 벤치마크/테스트 용도 (운영은 MySQL 사용)
+    """
+    
+    backend_name = 'sqlite'
+    
+    SCHEMA_FILES = ['database_schema.sql', 'database_insert_code_data.sql']
+    
+    def __init__(self, path: str = None):
+        self.path = path or Config.SQLITE_PATH
+        self._lock = threading.Lock()
+        self._anchor = None  # 인메모리 DB 유지용 연결
+        self._initialized = False
+        
+        if self.path == ':memory:':
+            # 인스턴스별로 독립된 인메모리 DB 사용
+            self._uri = f"file:clara_cs_{id(self)}?mode=memory&cache=shared"
+        else:
+            self._uri = Path(self.path).resolve().as_uri()
+        
+        sqlite3.register_adapter(datetime, lambda value: value.strftime('%Y-%m-%d %H:%M:%S'))
+        sqlite3.register_adapter(date, lambda value: value.isoformat())
+        _register_converters()
+    
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._uri, uri=True, timeout=30, check_same_thread=False,
+                                     detect_types=sqlite3.PARSE_DECLTYPES)
+        connection.create_function('NOW', 0, _sqlite_now)
+        connection.create_function('CHAR_LENGTH', 1, _sqlite_char_length, deterministic=True)
+        connection.create_function('WEEKDAY', 1, _sqlite_weekday, deterministic=True)
+        connection.create_function('SUBDATE', 2, _sqlite_subdate, deterministic=True)
+        connection.create_function('DATE_FORMAT', 2, _sqlite_date_format, deterministic=True)
+        connection.execute('PRAGMA foreign_keys = OFF')
+        return connection
+    
+    def _initialize(self):
+        """스키마 초기화 (최초 1회만)"""
+        if self._initialized:
+            return
+        
+        with self._lock:
+            if self._initialized:
+                return
+            
+            self._anchor = self._connect()
+            exists = self._anchor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'tb_ticket'"
+            ).fetchone()
+            
+            if not exists:
+                for schema_file in self.SCHEMA_FILES:
+                    sql_text = (PROJECT_ROOT / schema_file).read_text(encoding='utf-8')
+                    for statement in translate_mysql_schema(sql_text):
+                        self._anchor.execute(statement)
+                self._anchor.commit()
+                logger.info(f"SQLite 스키마 초기화 완료: {self.path}")
+            
+            self._initialized = True
+    
+    def get_connection(self, max_retries=3, retry_delay=1):
+        """SQLite 연결 가져오기 (mysql-connector 호환 래퍼)"""
+        self._initialize()
+        return self._instrument(SQLiteConnection(self._connect()))
+    
+    def close_all_connections(self):
+        """모든 연결 종료 (인메모리 DB는 데이터가 삭제됨)"""
+        try:
+            if self._anchor:
+                self._anchor.close()
+                self._anchor = None
+                self._initialized = False
+                logger.info("SQLite 데이터베이스 연결 종료")
         except Exception as e:
-            logger.error(f"데이터베이스 연결 테스트 실패: {e}")
-            return False
-        finally:
-            if cursor:
-                cursor.close()
-            if connection and connection.is_connected():
-                connection.close()
+            logger.error(f"연결 종료 중 오류 발생: {e}")
+            
+
+def create_db_manager(backend: str = None) -> BaseDatabaseManager:
+    """설정(Config.DB_BACKEND)에 따라 스토리지 백엔드 생성
+    
+    Args:
+        backend: 'mysql' 또는 'sqlite' (기본값: Config.DB_BACKEND)
+    """
+    backend = (backend or Config.DB_BACKEND).lower()
+    
+    if backend == 'sqlite':
+        return SQLiteDatabaseManager()
+    if backend == 'mysql':
+        return DatabaseManager()
+    
+    raise ValueError(f"지원하지 않는 DB_BACKEND: {backend} (mysql, sqlite 중 선택)")
+
+
+def _retryable_errors() -> tuple:
+    """백엔드별 재시도 대상 예외 목록"""
+    errors = [sqlite3.OperationalError]
+    try:
+        import mysql.connector
+        errors.extend([
+            mysql.connector.errors.PoolError,
+            mysql.connector.errors.OperationalError,
+            mysql.connector.errors.DatabaseError
+        ])
+    except ImportError:
+        pass
+    return tuple(errors)
+
 
 def db_retry_decorator(max_retries=3, retry_delay=1):
     """데이터베이스 작업 재시도 데코레이터
@@ -173,9 +593,7 @@ def db_retry_decorator(max_retries=3, retry_delay=1):
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except (mysql.connector.errors.PoolError, 
-                        mysql.connector.errors.OperationalError,
-                        mysql.connector.errors.DatabaseError) as e:
+                except _retryable_errors() as e:
                     last_error = e
                     logger.warning(f"{func.__name__} 실패 (attempt {attempt + 1}/{max_retries}): {e}")
                     
@@ -191,5 +609,5 @@ def db_retry_decorator(max_retries=3, retry_delay=1):
         return wrapper
     return decorator
 
-# 싱글톤 인스턴스
-db_manager = DatabaseManager()
+# 싱글톤 인스턴스 (Config.DB_BACKEND로 선택)
+db_manager = create_db_manager()
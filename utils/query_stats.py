@@ -0,0 +1,185 @@
+import re
+import time
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from utils.logger import get_logger
+from config import Config
+
+logger = get_logger(__name__)
+slow_query_logger = get_logger('slow_query')
+
+# 실행 시간 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(query: str) -> str:
+    """SQL을 정규화하여 fingerprint 생성
+    
+    - 리터럴/플레이스홀더 → ?
+    - IN (...) 목록, 다중 VALUES 행 → 하나로 축약
+    - 공백 정리 및 소문자화
+    """
+    text = str(query).replace('%s', '?')
+    text = _STRING_LITERAL.sub('?', text)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _WHITESPACE.sub(' ', text).strip()
+    text = _IN_LIST.sub('IN (?+)', text)
+    text = _VALUES_LIST.sub(r'\1 /* ... */', text)
+    return text.lower()
+
+
+class QueryStats:
+    """fingerprint별 쿼리 실행 통계 (프로세스 단위, 스레드 안전)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+    
+    def record(self, query_fingerprint: str, elapsed_ms: float):
+        """실행 1건 기록"""
+        bucket = bisect_left(HISTOGRAM_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            entry = self._stats.get(query_fingerprint)
+            if entry is None:
+                entry = {
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'histogram': [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+                }
+                self._stats[query_fingerprint] = entry
+            entry['count'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+            entry['histogram'][bucket] += 1
+    
+    def snapshot(self, order_by: str = 'total_ms', limit: int = None) -> list:
+        """통계 조회 (기본: 누적 실행 시간 내림차순)
+        
+        Returns:
+            List[Dict]: [{'fingerprint', 'count', 'total_ms', 'avg_ms', 'max_ms', 'histogram'}, ...]
+        """
+        labels = [f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        with self._lock:
+            rows = [
+                {
+                    'fingerprint': fp,
+                    'count': entry['count'],
+                    'total_ms': round(entry['total_ms'], 2),
+                    'avg_ms': round(entry['total_ms'] / entry['count'], 2),
+                    'max_ms': round(entry['max_ms'], 2),
+                    'histogram': [[label, count] for label, count in zip(labels, entry['histogram'])]
+                }
+                for fp, entry in self._stats.items()
+            ]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit] if limit else rows
+    
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self._stats.clear()
+
+
+query_stats = QueryStats()
+
+# 현재 요청의 쿼리 카운터 (요청 밖에서는 None)
+_request_queries = ContextVar('request_queries', default=None)
+# 요청 카운터 갱신 잠금 (fetch_concurrently 등 복사된 컨텍스트의 작업 스레드가 같은 dict를 공유)
+_request_queries_lock = threading.Lock()
+
+
+def begin_request_budget():
+    """요청 단위 쿼리 집계 시작 (before_request에서 호출)"""
+    return _request_queries.set({'count': 0, 'fingerprints': {}})
+
+
+def end_request_budget(endpoint: str, token=None, budget: int = None) -> dict:
+    """요청 단위 쿼리 집계 종료 및 예산 초과 경고
+    
+    Args:
+        endpoint: 요청 식별자 (로그용)
+        token: begin_request_budget() 반환값
+        budget: 요청당 최대 쿼리 수 (기본값 Config.QUERY_BUDGET_PER_REQUEST)
+    
+    Returns:
+        dict: {'count': int, 'fingerprints': {fingerprint: count}} (집계 중이 아니면 None)
+    """
+    usage = _request_queries.get()
+    if token is not None:
+        _request_queries.reset(token)
+    if usage is None:
+        return None
+    
+    with _request_queries_lock:
+        usage = {'count': usage['count'], 'fingerprints': dict(usage['fingerprints'])}
+    
+    budget = budget if budget is not None else Config.QUERY_BUDGET_PER_REQUEST
+    if usage['count'] > budget:
+        # 같은 fingerprint 반복 = N+1 패턴 후보
+        repeated = sorted(usage['fingerprints'].items(), key=lambda item: item[1], reverse=True)[:3]
+        details = "; ".join(f"{count}회: {fp[:120]}" for fp, count in repeated)
+        logger.warning(f"쿼리 예산 초과: {endpoint} - {usage['count']}건 (예산 {budget}건) | {details}")
+    return usage
+
+
+def _track(query, elapsed_ms: float):
+    """실행 통계/슬로우 쿼리/요청 예산 반영"""
+    query_fingerprint = fingerprint(query)
+    query_stats.record(query_fingerprint, elapsed_ms)
+    
+    if elapsed_ms >= Config.SLOW_QUERY_MS:
+        slow_query_logger.warning(f"{elapsed_ms:.1f}ms | {_WHITESPACE.sub(' ', str(query)).strip()[:500]}")
+    
+    usage = _request_queries.get()
+    if usage is not None:
+        with _request_queries_lock:
+            usage['count'] += 1
+            usage['fingerprints'][query_fingerprint] = usage['fingerprints'].get(query_fingerprint, 0) + 1
+
+
+class InstrumentedCursor:
+    """실행 시간을 측정하는 커서 래퍼 (나머지 속성은 원본 커서로 위임)"""
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+    
+    def execute(self, query, params=None, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(query, params, *args, **kwargs)
+        finally:
+            _track(query, (time.perf_counter() - started) * 1000)
+    
+    def executemany(self, query, seq_of_params, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, seq_of_params, *args, **kwargs)
+        finally:
+            _track(query, (time.perf_counter() - started) * 1000)
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """cursor()가 InstrumentedCursor를 반환하는 연결 래퍼"""
+    
+    def __init__(self, connection):
+        self._connection = connection
+    
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs))
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
@@ -0,0 +1,193 @@
+"""
+리포트 데이터 캐시
+(대상 배치/파일, 최신 분류 결과 ID) 단위로 cs_data / 채널별 추이 / 요약 데이터를 재사용
+저장된 리포트 스냅샷은 report_id 단위로 재사용 (PDF 다운로드 / 이메일 발송)
+- 메모리 LRU + 선택적 디스크(pickle) 티어
+- 새 분류 결과가 저장되면 최신 분류 결과 ID가 바뀌어 자동으로 새 키 사용 (해당 대상 엔트리는 즉시 제거)
+"""
+from typing import Any, Callable, Dict, Optional
+from collections import OrderedDict
+from utils.logger import get_logger
+from config import Config
+import copy
+import glob
+import os
+import pickle
+import threading
+
+logger = get_logger(__name__)
+
+
+class ReportDataCache:
+    """리포트 집계 데이터 캐시 (프로세스 전역)"""
+    
+    def __init__(self, max_entries: int = None, cache_dir: str = None):
+        self.max_entries = Config.REPORT_CACHE_SIZE if max_entries is None else max_entries
+        self.cache_dir = Config.REPORT_CACHE_DIR if cache_dir is None else cache_dir
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def _scope(file_id: int = None, batch_id: int = None) -> tuple:
+        return ('batch', batch_id) if batch_id else ('file', file_id)
+    
+    def _path(self, key: tuple) -> str:
+        scope, target_id, version, kind = key
+        return os.path.join(self.cache_dir, f"{scope}-{target_id}-{version}-{kind}.pkl")
+    
+    def get_or_load(self, kind: str, version: Optional[int], loader: Callable[[], Any],
+                    file_id: int = None, batch_id: int = None,
+                    cacheable: Callable[[Any], bool] = bool) -> Any:
+        """
+        캐시 조회 (없으면 loader 실행 후 저장)
+        
+        Args:
+            kind: 데이터 종류 ('cs_data', 'channel_trends', 'summary')
+            version: 대상의 최신 분류 결과 ID (None이면 캐시하지 않음)
+            loader: 실제 집계 조회 함수
+            file_id / batch_id: 대상 (batch_id 우선)
+            cacheable: 저장 여부 판단 (조회 실패 시의 빈 결과는 저장하지 않음)
+        
+        Returns:
+            데이터 사본 (호출 측에서 수정해도 캐시에 영향 없음)
+        """
+        if version is None or self.max_entries <= 0:
+            return loader()
+        
+        key = self._scope(file_id, batch_id) + (version, kind)
+        
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(self._entries[key])
+        
+        value = self._load_from_disk(key)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._store(key, value)
+            return copy.deepcopy(value)
+        
+        with self._lock:
+            self.misses += 1
+        
+        value = loader()
+        if cacheable(value):
+            self._store(key, copy.deepcopy(value))
+            self._save_to_disk(key, value)
+        return value
+    
+    def get_or_load_report(self, report_id: int, loader: Callable[[], Any]) -> Any:
+        """
+        저장된 리포트(스냅샷) 조회 캐시 (메모리 티어만 사용)
+        
+        Note:
+            - 완료(status='completed')된 리포트만 저장 (완료 후에는 스냅샷이 바뀌지 않으므로 버전 없음)
+            - 리포트 대상 파일/배치가 invalidate되면 함께 제거
+        """
+        if self.max_entries <= 0:
+            return loader()
+        
+        key = ('report', report_id, 0, 'snapshot')
+        
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+        
+        value = loader()
+        if value and value.get('status') == 'completed':
+            self._store(key, copy.deepcopy(value))
+        return value
+    
+    @classmethod
+    def _report_scope(cls, key: tuple, value: Any) -> Optional[tuple]:
+        """리포트 엔트리의 대상 (파일/배치) 범위"""
+        if key[0] != 'report':
+            return None
+        return cls._scope(value.get('file_id'), value.get('batch_id'))
+    
+    def _store(self, key: tuple, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def _load_from_disk(self, key: tuple) -> Any:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"리포트 캐시 파일 읽기 실패 (무시): {e}")
+            return None
+    
+    def _save_to_disk(self, key: tuple, value: Any):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"리포트 캐시 파일 저장 실패 (무시): {e}")
+    
+    def invalidate(self, file_id: int = None, batch_id: int = None):
+        """대상(배치 또는 파일)의 모든 버전 엔트리와 대상 리포트 엔트리 제거 (메모리 + 디스크)"""
+        scope = self._scope(file_id, batch_id)
+        if scope[1] is None:
+            return
+        
+        with self._lock:
+            for key in [key for key, value in self._entries.items()
+                        if key[:2] == scope or self._report_scope(key, value) == scope]:
+                del self._entries[key]
+            self.invalidations += 1
+        
+        if self.cache_dir:
+            for path in glob.glob(os.path.join(self.cache_dir, f"{scope[0]}-{scope[1]}-*.pkl")):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        logger.debug(f"리포트 캐시 무효화: {scope[0]}_id={scope[1]}")
+    
+    def clear(self):
+        """메모리 엔트리와 통계 초기화 (디스크 티어는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = self.disk_hits = self.misses = self.invalidations = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'persistent': bool(self.cache_dir),
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(hits / lookups, 3) if lookups else 0.0,
+                'invalidations': self.invalidations
+            }
+
+
+# 전역 싱글톤 인스턴스
+report_cache = ReportDataCache()
@@ -0,0 +1,141 @@
+"""
+층화 표본 추정 (미리보기 리포트)
+티켓 저장 시 부여한 sample_key(0 ~ SAMPLE_KEY_RANGE-1 균등 난수)로 표본 추출
+- sample_key < t 인 티켓 = 포함 확률 t / SAMPLE_KEY_RANGE 의 포아송 표본 ((file_id, sample_key) 인덱스 범위 조회)
+- 층(채널 × 접수월)마다 임계값을 달리 주어 작은 층도 최소 표본 수 확보
+- 층 비중은 균등 1단계 표본, 층 내 비율은 층별 표본으로 추정 (2단계 층화 추정)
+- 신뢰구간은 비율을 선형화한 분산으로 계산
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import math
+import random
+
+SAMPLE_KEY_RANGE = 10000
+Z_SCORE_95 = 1.96
+
+# 표본 추출 키 전용 난수 생성기 (애플리케이션의 random.seed 호출과 무관하게 OS 엔트로피로 초기화)
+_key_random = random.Random()
+
+# 추정 비율 (추정값, 하한, 상한) - 0~1
+Interval = Tuple[float, float, float]
+
+
+def new_sample_key() -> int:
+    """티켓 저장 시 부여할 표본 추출 키"""
+    return _key_random.randrange(SAMPLE_KEY_RANGE)
+
+
+def rate_to_threshold(rate: float) -> int:
+    """표본 비율 → sample_key 임계값 (1 ~ SAMPLE_KEY_RANGE)"""
+    return max(1, min(SAMPLE_KEY_RANGE, math.ceil(rate * SAMPLE_KEY_RANGE)))
+
+
+def required_threshold(sampled: int, threshold: int, target: int) -> int:
+    """
+    임계값 threshold에서 sampled건이 추출되었을 때 target건을 기대할 수 있는 임계값
+    
+    Note:
+        표본이 없으면 규모를 추정할 수 없으므로 전체 범위 반환
+    """
+    if sampled >= target or threshold >= SAMPLE_KEY_RANGE:
+        return threshold
+    if sampled == 0:
+        return SAMPLE_KEY_RANGE
+    return min(SAMPLE_KEY_RANGE, math.ceil(threshold * target / sampled))
+
+
+def stratum_of(row: Dict[str, Any]) -> tuple:
+    """층 (채널, 접수월 'YYYY-MM')"""
+    received_at = row.get('received_at')
+    return row.get('channel'), str(received_at)[:7] if received_at else None
+
+
+class StratifiedSample:
+    """2단계 층화 표본의 건수 / 비율 추정
+    
+    - 1단계: sample_key < base_threshold 인 균등 표본 → 층 비중 W_h, 전체 건수 추정
+    - 2단계: 층마다 sample_key < thresholds[h] 인 행 전체 → 층 내 평균 추정
+      (1단계 결과로 확장한 층도 층 내에서는 균등 표본이므로 층 평균은 편향 없음)
+    
+    Args:
+        rows: 표본 행 (sample_key 포함, stratum_of로 층 판별)
+        thresholds: 층별 sample_key 임계값 (없는 층은 base_threshold)
+        base_threshold: 1단계 임계값
+    """
+    
+    def __init__(self, rows: List[Dict[str, Any]], thresholds: Dict[tuple, int], base_threshold: int):
+        self.rows = rows
+        self.base_threshold = base_threshold
+        
+        self._strata: Dict[tuple, List[Dict[str, Any]]] = {}
+        phase_one: Dict[tuple, int] = {}
+        for row in rows:
+            stratum = stratum_of(row)
+            if row['sample_key'] < thresholds.get(stratum, base_threshold):
+                self._strata.setdefault(stratum, []).append(row)
+            if row['sample_key'] < base_threshold:
+                phase_one[stratum] = phase_one.get(stratum, 0) + 1
+        
+        self.phase_one_size = sum(phase_one.values())
+        self._weights = {
+            stratum: count / self.phase_one_size for stratum, count in phase_one.items()
+        } if self.phase_one_size else {}
+        self._fractions = {
+            stratum: thresholds.get(stratum, base_threshold) / SAMPLE_KEY_RANGE for stratum in self._weights
+        }
+    
+    def _mean(self, stratum: tuple, predicate: Callable[[Dict[str, Any]], bool]) -> float:
+        rows = self._strata[stratum]
+        return sum(1 for row in rows if predicate(row)) / len(rows)
+    
+    def total(self, domain: Optional[Callable[[Dict[str, Any]], bool]] = None) -> float:
+        """모집단 건수 추정"""
+        population = self.phase_one_size * SAMPLE_KEY_RANGE / self.base_threshold
+        if domain is None:
+            return population
+        return population * sum(weight * self._mean(stratum, domain) for stratum, weight in self._weights.items())
+    
+    def ratio(self, numerator: Callable[[Dict[str, Any]], bool],
+              domain: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Interval:
+        """
+        domain 중 numerator를 만족하는 비율과 95% 신뢰구간
+        
+        Note:
+            분산 = 층 내 분산 Σ W_h² (1 - f_h) s_h² / n_h + 층 비중 추정 분산 (1 - f) Σ W_h ū_h² / n'
+            (비율은 u = (1[numerator ∧ domain] - R · 1[domain]) / D 로 선형화)
+            - 두 항 모두 유한 모집단 보정 포함 (f = base_threshold / SAMPLE_KEY_RANGE, f_h ≥ f)
+            - 층 내 항의 (1 - f_h)에 1단계 보정이 이미 포함되어 있으므로 (1 - f)를 다시 곱하지 않음
+            - f = 1 (전수)이면 신뢰구간 폭 0
+        
+        Returns:
+            (추정값, 하한, 상한) - 0~1
+        """
+        domain = domain or (lambda row: True)
+        matches = lambda row: domain(row) and numerator(row)
+        
+        share = sum(weight * self._mean(stratum, domain) for stratum, weight in self._weights.items())
+        if share == 0:
+            return 0.0, 0.0, 0.0
+        estimate = sum(weight * self._mean(stratum, matches) for stratum, weight in self._weights.items()) / share
+        
+        phase_one_fraction = self.base_threshold / SAMPLE_KEY_RANGE
+        within = between = 0.0
+        for stratum, weight in self._weights.items():
+            values = [
+                ((1.0 if matches(row) else 0.0) - estimate * (1.0 if domain(row) else 0.0)) / share
+                for row in self._strata[stratum]
+            ]
+            mean = sum(values) / len(values)
+            if len(values) > 1:
+                variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+                within += weight * weight * (1 - self._fractions[stratum]) * variance / len(values)
+            between += (1 - phase_one_fraction) * weight * mean * mean / self.phase_one_size
+        
+        margin = Z_SCORE_95 * math.sqrt(within + between)
+        return estimate, max(0.0, estimate - margin), min(1.0, estimate + margin)
+
+
+def to_percentage(interval: Interval) -> Tuple[float, List[float]]:
+    """(추정값, 하한, 상한) → (백분율, [하한, 상한]) - 소수점 1자리"""
+    estimate, lower, upper = interval
+    return round(estimate * 100, 1), [round(lower * 100, 1), round(upper * 100, 1)]
@@ -0,0 +1,137 @@
+"""
+작업 의존성 그래프 실행기
+이름 붙은 작업을 (선행 작업, 함수) 형태로 정의하면 선행 작업이 끝나는 즉시 후속 작업을 스레드 풀에서 실행
+- 함수는 선행 작업 결과를 같은 이름의 키워드 인자로 받음
+- 작업별 실행 시간(ms) 기록
+"""
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Tuple
+from utils.logger import get_logger
+from config import Config
+
+logger = get_logger(__name__)
+
+# 작업 정의: {이름: (선행 작업 이름들, 함수)}
+TaskSpec = Tuple[Iterable[str], Callable[..., Any]]
+
+_executor = None
+_background_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_pipeline_executor() -> ThreadPoolExecutor:
+    """파이프라인 전용 스레드 풀 (지연 생성)
+    
+    Note:
+        작업 내부에서 fetch_concurrently 등으로 DB I/O 풀(db-io)을 다시 사용하므로
+        같은 풀을 공유하면 풀이 가득 찼을 때 교착될 수 있어 별도 풀 사용
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.REPORT_PIPELINE_WORKERS,
+                    thread_name_prefix='pipeline'
+                )
+                logger.info(f"파이프라인 스레드 풀 생성 (workers={Config.REPORT_PIPELINE_WORKERS})")
+    return _executor
+
+
+def get_background_executor() -> ThreadPoolExecutor:
+    """백그라운드 작업 전용 스레드 풀 (미리보기 응답 후 전체 리포트 생성, 분류 후 분석 미러 갱신 등, 지연 생성)
+    
+    Note:
+        백그라운드 작업이 run_task_graph로 파이프라인 풀을 다시 사용하므로 별도 풀 사용
+    """
+    global _background_executor
+    if _background_executor is None:
+        with _executor_lock:
+            if _background_executor is None:
+                _background_executor = ThreadPoolExecutor(
+                    max_workers=Config.REPORT_BACKGROUND_WORKERS,
+                    thread_name_prefix='background'
+                )
+                logger.info(f"백그라운드 스레드 풀 생성 (workers={Config.REPORT_BACKGROUND_WORKERS})")
+    return _background_executor
+
+
+def _validate(tasks: Dict[str, TaskSpec]) -> Dict[str, Tuple[str, ...]]:
+    """선행 작업 이름 검증 (없는 작업 / 순환 의존 시 ValueError)"""
+    deps = {name: tuple(spec[0]) for name, spec in tasks.items()}
+    
+    for name, names in deps.items():
+        unknown = [dep for dep in names if dep not in deps]
+        if unknown:
+            raise ValueError(f"작업 '{name}'의 선행 작업이 정의되지 않았습니다: {unknown}")
+    
+    visited = set()
+    remaining = dict(deps)
+    while remaining:
+        ready = [name for name, names in remaining.items() if all(dep in visited for dep in names)]
+        if not ready:
+            raise ValueError(f"작업 그래프에 순환 의존이 있습니다: {sorted(remaining)}")
+        for name in ready:
+            visited.add(name)
+            del remaining[name]
+    
+    return deps
+
+
+def _timed(func: Callable[..., Any], kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = func(**kwargs)
+    return result, round((time.perf_counter() - started) * 1000, 1)
+
+
+def run_task_graph(tasks: Dict[str, TaskSpec], executor: ThreadPoolExecutor = None) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    의존성 그래프 실행 (동기 API)
+    
+    Args:
+        tasks: {이름: (선행 작업 이름들, 함수)} - 함수는 선행 작업 결과를 키워드 인자로 받음
+        executor: 사용할 스레드 풀 (기본값: 파이프라인 전용 풀)
+    
+    Returns:
+        (결과, 실행 시간): ({이름: 반환값}, {이름: ms})
+    
+    Raises:
+        첫 번째로 실패한 작업의 예외
+        (실패 이후 새 작업은 시작하지 않고, 실행 중인 작업은 완료까지 대기)
+    """
+    deps = _validate(tasks)
+    executor = executor or get_pipeline_executor()
+    
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    running = {}
+    pending = set(tasks)
+    error = None
+    
+    while pending or running:
+        if error is None:
+            for name in [name for name in pending if all(dep in results for dep in deps[name])]:
+                pending.discard(name)
+                kwargs = {dep: results[dep] for dep in deps[name]}
+                # 요청 컨텍스트(쿼리 예산 집계 등)를 작업 스레드로 전달
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, _timed, tasks[name][1], kwargs)] = name
+        
+        if not running:
+            break
+        
+        done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+        for future in done:
+            name = running.pop(future)
+            try:
+                results[name], timings[name] = future.result()
+            except Exception as e:
+                logger.error(f"작업 실패: {name}, {e}")
+                error = error or e
+    
+    if error:
+        raise error
+    return results, timings